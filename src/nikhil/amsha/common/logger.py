@@ -33,16 +33,63 @@ Log Rotation (New in Nibandha v1.0.1):
     config = get_rotation_config()
     if config and config.enabled:
         print(f"Rotation enabled: max {config.max_size_mb}MB, {config.rotation_interval_hours}h")
+
+JSON Lines and Sampling:
+    Set AMSHA_LOG_FORMAT=jsonl to write one JSON object per record with the
+    extra fields as keys (takes precedence over AMSHA_STRUCTURED_LOGS). Chatty
+    modules can be sampled or rate limited per logger:
+    
+    from amsha.common.logger import configure_log_sampling
+    
+    configure_log_sampling("crew_monitor.event_breakdown", sample_rate=0.1)
+    configure_log_sampling("crew_forge.orchestrator", max_records=20, per_seconds=1.0)
+
+Asynchronous Logging:
+    Set AMSHA_ASYNC_LOGS=true (or call enable_async_logging()) to move formatting
+    and log I/O to a background listener thread. Records wait in a bounded queue
+    (AMSHA_LOG_QUEUE_SIZE, default 10000); when it is full, AMSHA_LOG_DROP_POLICY
+    decides between dropping the new record ("drop_new", default), discarding the
+    oldest queued one ("drop_oldest") or blocking the caller ("block"). Queued
+    records are written before the interpreter exits.
+    
+    from amsha.common.logger import enable_async_logging, flush_logs
+    
+    enable_async_logging(queue_size=50000, drop_policy="drop_oldest")
+    flush_logs()  # wait until everything queued so far is written
+
+Lazy Initialization:
+    get_logger("module") returns immediately without importing Nibandha or
+    creating any folders; Nibandha is set up when the first record reaches the
+    Amsha logger. get_logger() without a module name (or with log_level)
+    initializes eagerly.
 """
-from nibandha.core import Nibandha, AppConfig, LogRotationConfig
-from typing import Optional, Dict, Any, Callable
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 import time
 import functools
 
-_amsha_nibandha: Optional[Nibandha] = None
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from nibandha.core import Nibandha, LogRotationConfig
+
+_amsha_nibandha: Optional["Nibandha"] = None
+_init_lock = threading.RLock()
 _module_loggers: dict = {}
+_async_pipeline: Optional["_AsyncLogPipeline"] = None
+_async_lock = threading.Lock()
+
+DROP_POLICIES = ("drop_new", "drop_oldest", "block")
 
 
 # ============================================================================
@@ -84,6 +131,170 @@ class StructuredFormatter(logging.Formatter):
         return base_message
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats every record as one JSON object per line.
+    
+    Output: {"timestamp": ..., "logger": ..., "level": ..., "message": ..., <extra fields>}
+    
+    Built for chatty `extra={...}` call sites: the set of standard record
+    attributes is computed once, extras are picked with a single set difference
+    over the record's attributes, and the payload is serialised in one call,
+    through orjson when it is installed. Values JSON cannot represent are
+    written as `str(value)`.
+    """
+    
+    # Every attribute a plain LogRecord carries, plus those set by formatting
+    RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+    
+    _encoder = json.JSONEncoder(default=str, separators=(",", ":"))
+    
+    def __init__(self, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__(datefmt=datefmt)
+        # (second, formatted second) replaced as one tuple, so handlers on other threads read a consistent pair
+        self._second_cache = (-1, "")
+    
+    def _timestamp(self, created: float) -> str:
+        # Records arrive in bursts within the same second; format each second once
+        second = int(created)
+        cached_second, formatted = self._second_cache
+        if second != cached_second:
+            formatted = time.strftime(self.datefmt, self.converter(second))
+            self._second_cache = (second, formatted)
+        return f"{formatted}.{int((created - second) * 1000):03d}"
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self._timestamp(record.created),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        record_attrs = record.__dict__
+        for key in record_attrs.keys() - self.RESERVED_ATTRS:
+            payload[key] = record_attrs[key]
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(payload, default=str).decode("utf-8")
+            except TypeError:
+                # Integers beyond 64 bits and other values orjson rejects
+                pass
+        return self._encoder.encode(payload)
+
+
+class LogSamplingFilter(logging.Filter):
+    """
+    Keeps one in every `round(1 / sample_rate)` records at or below `max_level`.
+    
+    Records above `max_level` (warnings and errors by default) always pass.
+    """
+    
+    def __init__(self, sample_rate: float, max_level: int = logging.INFO):
+        super().__init__()
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Log sample rate must be in (0, 1]")
+        self.every = max(1, round(1 / sample_rate))
+        self.max_level = max_level
+        self._seen = 0
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        with self._lock:
+            self._seen += 1
+            return (self._seen - 1) % self.every == 0
+
+
+class LogRateLimitFilter(logging.Filter):
+    """
+    Lets at most `max_records` records of each message through per `per_seconds` window.
+    
+    Messages are told apart by their unformatted template (`record.msg`). The
+    first record let through after suppression carries `suppressed_records`.
+    Records above `max_level` always pass. Once more than `max_windows`
+    messages are tracked, expired windows are swept, so f-string messages do
+    not accumulate for the life of the process.
+    """
+    
+    def __init__(self, max_records: int, per_seconds: float = 1.0, max_level: int = logging.INFO,
+                 max_windows: int = 1024):
+        super().__init__()
+        if max_records < 1 or per_seconds <= 0:
+            raise ValueError("Log rate limit needs max_records >= 1 and per_seconds > 0")
+        self.max_records = max_records
+        self.per_seconds = per_seconds
+        self.max_level = max_level
+        self.max_windows = max_windows
+        # message template -> [window start, records let through, records suppressed]
+        self._windows: Dict[Any, List[Any]] = {}
+        self._sweep_at = max_windows
+        self._lock = threading.Lock()
+    
+    def _sweep(self, now: float) -> None:
+        """Drops expired windows; call with _lock held."""
+        self._windows = {msg: window for msg, window in self._windows.items()
+                         if now - window[0] < self.per_seconds}
+        # Live windows beyond the bound push the next sweep out, so sweeps stay amortised
+        self._sweep_at = max(self.max_windows, 2 * len(self._windows))
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(record.msg)
+            if window is None or now - window[0] >= self.per_seconds:
+                suppressed = window[2] if window else 0
+                self._windows[record.msg] = [now, 1, 0]
+                if len(self._windows) > self._sweep_at:
+                    self._sweep(now)
+                if suppressed:
+                    record.suppressed_records = suppressed
+                return True
+            if window[1] < self.max_records:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+def configure_log_sampling(module_name: str, sample_rate: Optional[float] = None,
+                           max_records: Optional[int] = None, per_seconds: float = 1.0,
+                           max_level: int = logging.INFO) -> logging.Logger:
+    """
+    Samples and/or rate-limits the records of one module logger.
+    
+    Filters act on records logged through that logger itself, before any
+    handler formats them; records at WARNING and above pass by default.
+    
+    Args:
+        module_name: Module logger name as passed to get_logger (e.g. "crew_forge.orchestrator")
+        sample_rate: Fraction of records kept, e.g. 0.1 for one in ten
+        max_records: Records let through per message template and `per_seconds` window
+        per_seconds: Length of the rate limit window
+        max_level: Highest level that is sampled or rate limited
+        
+    Returns:
+        The configured logger
+    """
+    module_logger = get_logger(module_name)
+    for existing in [f for f in module_logger.filters if isinstance(f, (LogSamplingFilter, LogRateLimitFilter))]:
+        module_logger.removeFilter(existing)
+    if sample_rate is not None:
+        module_logger.addFilter(LogSamplingFilter(sample_rate, max_level))
+    if max_records is not None:
+        module_logger.addFilter(LogRateLimitFilter(max_records, per_seconds, max_level))
+    return module_logger
+
+
 def _configure_structured_logging(logger: logging.Logger) -> None:
     """
     Configure the logger to use structured formatter for all handlers.
@@ -102,35 +313,206 @@ def _configure_structured_logging(logger: logging.Logger) -> None:
 
 
 
-def get_logger(module_name: Optional[str] = None, log_level: Optional[str] = None) -> logging.Logger:
+# ============================================================================
+# Asynchronous Logging
+# ============================================================================
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
     """
-    Get or create a logger instance for Amsha.
+    QueueHandler over a bounded queue that never lets a full queue stall or fail the caller.
     
-    This function initializes Nibandha on first call and returns loggers for specific
-    modules. All logs are written to .Nibandha/Amsha/logs/Amsha.log and console.
+    The drop policy decides what happens when the listener falls behind:
+    "drop_new" discards the incoming record, "drop_oldest" discards the oldest
+    queued record to make room, and "block" waits up to `block_timeout` seconds
+    before dropping the incoming record. Dropped records are counted.
+    """
     
-    **Automatic Default Config**: If no rotation config exists, a sensible default
-    is created automatically. Clients can override this using rotation_setup utilities.
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = "drop_new", block_timeout: float = 1.0):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown log drop policy '{drop_policy}', expected one of {list(DROP_POLICIES)}")
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def _count_drop(self) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.drop_policy == "block":
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self._count_drop()
+            return
+        
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.drop_policy == "drop_new":
+                    self._count_drop()
+                    return
+            # drop_oldest: make room and retry
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._count_drop()
+            except queue.Empty:
+                pass
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop waits for room in a full bounded queue instead of failing."""
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _AsyncLogPipeline:
+    """Bounded queue handler on the Amsha logger feeding its original handlers from a listener thread."""
+    
+    def __init__(self, logger: logging.Logger, queue_size: int, drop_policy: str):
+        self.logger = logger
+        self.handlers: List[logging.Handler] = list(logger.handlers)
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.queue_handler = BoundedQueueHandler(self.queue, drop_policy)
+        self.listener = _DrainingQueueListener(self.queue, *self.handlers, respect_handler_level=True)
+    
+    def start(self) -> None:
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+    
+    def stop(self) -> None:
+        """Writes every queued record, then puts the original handlers back on the logger."""
+        self.logger.removeHandler(self.queue_handler)
+        # Drain first, so records logged from now on cannot overtake queued ones in the handlers
+        self.listener.stop()
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+        if self.queue_handler.dropped:
+            self.logger.warning("Log records dropped by the asynchronous log queue", extra={
+                "dropped_records": self.queue_handler.dropped,
+                "drop_policy": self.queue_handler.drop_policy
+            })
+    
+    def flush(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        for handler in self.handlers:
+            handler.flush()
+        return True
+
+
+def enable_async_logging(queue_size: Optional[int] = None, drop_policy: Optional[str] = None) -> None:
+    """
+    Moves formatting and log I/O of the Amsha logger to a background listener thread.
     
     Args:
-        module_name: Optional module name for hierarchical logging (e.g., "crew_forge")
-        log_level: Optional log level override (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-                  Defaults to environment variable AMSHA_LOG_LEVEL or INFO
-        
+        queue_size: Records buffered before the drop policy applies
+                   (AMSHA_LOG_QUEUE_SIZE or 10000 by default)
+        drop_policy: "drop_new", "drop_oldest" or "block" (AMSHA_LOG_DROP_POLICY or "drop_new")
+    """
+    global _async_pipeline
+    queue_size = queue_size or int(os.getenv("AMSHA_LOG_QUEUE_SIZE", "10000"))
+    drop_policy = drop_policy or os.getenv("AMSHA_LOG_DROP_POLICY", "drop_new")
+    root_logger = get_logger()
+    with _async_lock:
+        if _async_pipeline is not None:
+            _async_pipeline.stop()
+        _async_pipeline = _AsyncLogPipeline(root_logger, queue_size, drop_policy)
+        _async_pipeline.start()
+
+
+def disable_async_logging() -> None:
+    """Writes the queued records and returns the Amsha logger to synchronous handlers."""
+    global _async_pipeline
+    with _async_lock:
+        if _async_pipeline is not None:
+            _async_pipeline.stop()
+            _async_pipeline = None
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """
+    Waits until every record queued so far has been written.
+    
     Returns:
-        Configured logger instance
-        
-    Examples:
-        >>> logger = get_logger()  # Root Amsha logger (auto-creates default config)
-        >>> logger.info("Application started")
-        
-        >>> crew_logger = get_logger("crew_forge")
-        >>> crew_logger.debug("Building crew", extra={"crew_name": "test", "tokens": 1500})
+        False if the queue did not drain within `timeout` seconds, True otherwise
+        (including when asynchronous logging is off)
     """
-    global _amsha_nibandha, _module_loggers
+    pipeline = _async_pipeline
+    return pipeline.flush(timeout) if pipeline is not None else True
+
+
+def get_async_logging_stats() -> Optional[Dict[str, Any]]:
+    """Returns the queue size, backlog, drop policy and dropped record count, or None when logging is synchronous."""
+    pipeline = _async_pipeline
+    if pipeline is None:
+        return None
+    return {
+        "queue_size": pipeline.queue.maxsize,
+        "queued": pipeline.queue.qsize(),
+        "drop_policy": pipeline.queue_handler.drop_policy,
+        "dropped": pipeline.queue_handler.dropped
+    }
+
+
+atexit.register(disable_async_logging)
+
+
+class _LazyInitHandler(logging.Handler):
+    """
+    Placeholder handler on the Amsha logger until Nibandha is initialized.
     
-    # Initialize Nibandha on first call
-    if _amsha_nibandha is None:
+    The first record that reaches it initializes Nibandha and is then handed
+    to the real handlers, so nothing logged before initialization is lost.
+    """
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        nibandha_logger = _initialize_nibandha()
+        for handler in nibandha_logger.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def _install_lazy_init_handler() -> None:
+    root_logger = logging.getLogger("Amsha")
+    with _init_lock:
+        if _amsha_nibandha is not None or any(isinstance(h, _LazyInitHandler) for h in root_logger.handlers):
+            return
+        root_logger.setLevel(os.getenv("AMSHA_LOG_LEVEL", "INFO").upper())
+        root_logger.propagate = False
+        root_logger.addHandler(_LazyInitHandler())
+
+
+def _initialize_nibandha(log_level: Optional[str] = None) -> logging.Logger:
+    """Initializes Nibandha once and returns the Amsha root logger."""
+    global _amsha_nibandha
+    
+    with _init_lock:
+        if _amsha_nibandha is not None:
+            return _amsha_nibandha.logger
+        
+        from nibandha.core import Nibandha, AppConfig
+        
+        # Replace (rather than mutate) the handler list: a record being dispatched
+        # by _LazyInitHandler is iterating over the old list
+        root_logger = logging.getLogger("Amsha")
+        root_logger.handlers = [h for h in root_logger.handlers if not isinstance(h, _LazyInitHandler)]
+        
         # Create default rotation config if none exists
         # This prevents interactive prompts from Nibandha
         _ensure_default_rotation_config()
@@ -140,6 +522,8 @@ def get_logger(module_name: Optional[str] = None, log_level: Optional[str] = Non
         
         # Check if structured logging is enabled
         use_structured = os.getenv("AMSHA_STRUCTURED_LOGS", "false").lower() == "true"
+        use_json_lines = os.getenv("AMSHA_LOG_FORMAT", "").lower() == "jsonl"
+        use_async = os.getenv("AMSHA_ASYNC_LOGS", "false").lower() == "true"
         
         config = AppConfig(
             name="Amsha",
@@ -154,11 +538,60 @@ def get_logger(module_name: Optional[str] = None, log_level: Optional[str] = Non
         _amsha_nibandha = Nibandha(config).bind()
         
         # Apply structured formatter if enabled
-        if use_structured:
+        if use_json_lines:
+            for handler in _amsha_nibandha.logger.handlers:
+                handler.setFormatter(JsonLinesFormatter())
+        elif use_structured:
             _configure_structured_logging(_amsha_nibandha.logger)
         
         _amsha_nibandha.logger.info("Amsha logger initialized via Nibandha")
     
+    if use_async:
+        enable_async_logging()
+    return _amsha_nibandha.logger
+
+
+def _pending_nibandha() -> Optional["Nibandha"]:
+    """Returns the Nibandha instance, initializing it if get_logger() already deferred it."""
+    if _amsha_nibandha is None:
+        if not any(isinstance(h, _LazyInitHandler) for h in logging.getLogger("Amsha").handlers):
+            return None
+        _initialize_nibandha()
+    return _amsha_nibandha
+
+
+def get_logger(module_name: Optional[str] = None, log_level: Optional[str] = None) -> logging.Logger:
+    """
+    Get or create a logger instance for Amsha.
+    
+    Module loggers are returned without initializing Nibandha; it is set up
+    when the first record is emitted. Calling without a module name, or with
+    a log level, initializes Nibandha immediately. All logs are written to
+    .Nibandha/Amsha/logs/Amsha.log and console.
+    
+    **Automatic Default Config**: If no rotation config exists, a sensible default
+    is created automatically. Clients can override this using rotation_setup utilities.
+    
+    Args:
+        module_name: Optional module name for hierarchical logging (e.g., "crew_forge")
+        log_level: Optional log level override (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+                  Defaults to environment variable AMSHA_LOG_LEVEL or INFO
+        
+    Returns:
+        Configured logger instance
+        
+    Examples:
+        >>> logger = get_logger()  # Root Amsha logger (auto-creates default config)
+        >>> logger.info("Application started")
+        
+        >>> crew_logger = get_logger("crew_forge")
+        >>> crew_logger.debug("Building crew", extra={"crew_name": "test", "tokens": 1500})
+    """
+    if module_name is None or log_level is not None:
+        root_logger = _initialize_nibandha(log_level)
+    elif _amsha_nibandha is None:
+        _install_lazy_init_handler()
+    
     # Return module-specific logger or root logger
     if module_name:
         logger_name = f"Amsha.{module_name}"
@@ -169,7 +602,7 @@ def get_logger(module_name: Optional[str] = None, log_level: Optional[str] = Non
             
         return _module_loggers[logger_name]
     
-    return _amsha_nibandha.logger
+    return root_logger
 
 
 def log_execution(logger: logging.Logger, operation_name: str) -> Callable:
@@ -233,13 +666,17 @@ class MetricsLogger:
         """
         Log comprehensive execution metrics.
         
+        One additional record is logged per task of the metrics breakdown.
+        
         Args:
             crew_name: Name of the crew
             execution_id: Unique execution identifier
-            metrics: Dict containing general and gpu metrics
+            metrics: Dict containing general, gpu, resources, breakdown and streaming metrics
             duration: Execution duration in seconds
         """
         general = metrics.get("general", {})
+        resources = metrics.get("resources") or {}
+        streaming = metrics.get("streaming") or {}
         self.logger.info("Execution metrics captured", extra={
             "crew_name": crew_name,
             "execution_id": execution_id,
@@ -249,8 +686,20 @@ class MetricsLogger:
             "completion_tokens": general.get("completion_tokens", 0),
             "cpu_usage_percent": general.get("cpu_usage_end_percent", 0),
             "memory_change_mb": general.get("memory_usage_change_mb", 0),
+            "peak_rss_mb": resources.get("rss_mb", {}).get("peak"),
+            "mean_process_cpu_percent": resources.get("cpu_percent", {}).get("mean"),
+            "process_cpu_time_seconds": resources.get("cpu_time_seconds"),
+            "streamed_llm_calls": streaming.get("streamed_calls", 0),
+            "time_to_first_chunk_p50_seconds": streaming.get("time_to_first_chunk_seconds", {}).get("p50"),
+            "output_tokens_per_second_estimated": streaming.get("output_tokens_per_second_estimated"),
             "has_gpu_metrics": bool(metrics.get("gpu", {}))
         })
+        for task in (metrics.get("breakdown") or {}).get("tasks", []):
+            self.logger.info("Task metrics captured", extra={
+                "crew_name": crew_name,
+                "execution_id": execution_id,
+                **task
+            })
     
     def log_llm_config(self, model_name: str, config: Dict[str, Any]):
         """
@@ -339,12 +788,11 @@ def should_rotate() -> bool:
     Note:
         Returns False if rotation is not enabled or Nibandha is not initialized.
     """
-    global _amsha_nibandha
-    
-    if _amsha_nibandha is None:
+    nibandha = _pending_nibandha()
+    if nibandha is None:
         return False
     
-    return _amsha_nibandha.should_rotate()
+    return nibandha.should_rotate()
 
 
 def rotate_logs() -> None:
@@ -357,13 +805,18 @@ def rotate_logs() -> None:
     Raises:
         Warning if rotation is not enabled or Nibandha is not initialized.
     """
-    global _amsha_nibandha
-    
-    if _amsha_nibandha is None:
+    nibandha = _pending_nibandha()
+    if nibandha is None:
         logging.warning("Cannot rotate logs: Nibandha not initialized")
         return
     
-    _amsha_nibandha.rotate_logs()
+    # Rotation swaps Nibandha's file handler, so the listener is rebuilt around the new handlers
+    pipeline = _async_pipeline
+    if pipeline is not None:
+        disable_async_logging()
+    nibandha.rotate_logs()
+    if pipeline is not None:
+        enable_async_logging(pipeline.queue.maxsize, pipeline.queue_handler.drop_policy)
 
 
 def cleanup_old_archives() -> int:
@@ -382,15 +835,14 @@ def cleanup_old_archives() -> int:
         
         Amsha is a library and does not automatically call cleanup.
     """
-    global _amsha_nibandha
-    
-    if _amsha_nibandha is None:
+    nibandha = _pending_nibandha()
+    if nibandha is None:
         return 0
     
-    return _amsha_nibandha.cleanup_old_archives()
+    return nibandha.cleanup_old_archives()
 
 
-def get_rotation_config() -> Optional[LogRotationConfig]:
+def get_rotation_config() -> Optional["LogRotationConfig"]:
     """
     Get the current log rotation configuration for inspection.
     
@@ -404,12 +856,11 @@ def get_rotation_config() -> Optional[LogRotationConfig]:
             print(f"Interval: {config.rotation_interval_hours}h")
             print(f"Retention: {config.archive_retention_days} days")
     """
-    global _amsha_nibandha
-    
-    if _amsha_nibandha is None:
+    nibandha = _pending_nibandha()
+    if nibandha is None:
         return None
     
-    return _amsha_nibandha.rotation_config
+    return nibandha.rotation_config
 
 
 def reset_logger():
@@ -417,5 +868,8 @@ def reset_logger():
     Reset the logger instance. Primarily for testing purposes.
     """
     global _amsha_nibandha, _module_loggers
+    disable_async_logging()
     _amsha_nibandha = None
     _module_loggers = {}
+    root_logger = logging.getLogger("Amsha")
+    root_logger.handlers = [h for h in root_logger.handlers if not isinstance(h, _LazyInitHandler)]
@@ -0,0 +1,274 @@
+"""
+Lightweight in-process span tracing for Amsha.
+
+Spans time the phases of a crew run (LLM initialisation, YAML parsing, crew
+build, kickoff, streaming, JSON cleaning, state saves) and nest through a
+context variable, so every span knows its parent. Finished spans go to one
+exporter, writing JSON lines or a Chrome trace-event file that loads in
+chrome://tracing or Perfetto.
+
+Tracing is off until enable_tracing() is called or AMSHA_TRACE_FILE is set.
+While off, span() returns a shared no-op span, so instrumented code only pays
+for one global lookup.
+
+Usage:
+    from amsha.common.tracing import enable_tracing, span
+
+    enable_tracing("trace.json", format="chrome")
+    with span("crew.build", crew_name="writer") as build_span:
+        build_span.set_attribute("tasks", 3)
+"""
+import atexit
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+TRACE_FILE_ENV = "AMSHA_TRACE_FILE"
+TRACE_FORMAT_ENV = "AMSHA_TRACE_FORMAT"
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("amsha_current_span", default=None)
+_exporter: Optional["SpanExporter"] = None
+_exporter_lock = threading.Lock()
+
+
+def _attribute_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+class Span:
+    """One timed operation with attributes and a link to its parent span."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "start_time_ns", "duration_ns",
+                 "thread_id", "thread_name", "status", "error", "_start_perf_ns", "_token", "_exporter")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any], exporter: "SpanExporter"):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = {key: _attribute_value(value) for key, value in attributes.items()}
+        self.start_time_ns = 0
+        self.duration_ns = 0
+        self.thread_id = 0
+        self.thread_name = ""
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._start_perf_ns = 0
+        self._token = None
+        self._exporter = exporter
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = _attribute_value(value)
+
+    def set_attributes(self, **attributes: Any) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def __enter__(self) -> "Span":
+        current = threading.current_thread()
+        self.thread_id = current.ident or 0
+        self.thread_name = current.name
+        self.start_time_ns = time.time_ns()
+        self._start_perf_ns = time.perf_counter_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration_ns = time.perf_counter_ns() - self._start_perf_ns
+        if exc_type is not None:
+            self.status = "error"
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._exporter.export(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_ns": self.start_time_ns,
+            "duration_ms": round(self.duration_ns / 1e6, 3),
+            "thread": self.thread_name,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Span handed out while tracing is disabled; every operation does nothing."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(ABC):
+    """Base of the span exporters; export() is called from any thread as spans finish."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "w", encoding="utf-8")
+
+    @abstractmethod
+    def export(self, finished: Span) -> None:
+        ...
+
+    def _write(self, text: str) -> None:
+        with self._lock:
+            self._write_locked(text)
+
+    def _write_locked(self, text: str) -> None:
+        """Writes to the trace file; call with _lock held."""
+        if not self._file.closed:
+            self._file.write(text)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Writes every finished span as one JSON line."""
+
+    def export(self, finished: Span) -> None:
+        self._write(json.dumps(finished.to_dict(), default=str) + "\n")
+
+
+class ChromeTraceExporter(SpanExporter):
+    """
+    Writes finished spans as complete ("X") events of the Chrome trace-event JSON
+    array format. The closing bracket is written on close; viewers also accept
+    the file without it, so a crashed run still loads.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._pid = os.getpid()
+        self._events = 0
+        self._write("[\n")
+
+    def export(self, finished: Span) -> None:
+        event = {
+            "name": finished.name,
+            "cat": finished.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": finished.start_time_ns / 1000,
+            "dur": finished.duration_ns / 1000,
+            "pid": self._pid,
+            "tid": finished.thread_id,
+            "args": {**finished.attributes, "span_id": finished.span_id, "parent_id": finished.parent_id,
+                     "trace_id": finished.trace_id, "status": finished.status, "error": finished.error},
+        }
+        text = json.dumps(event, default=str)
+        # The separator is chosen and written in one critical section, so concurrent spans never interleave
+        with self._lock:
+            self._write_locked((",\n" if self._events else "") + text)
+            self._events += 1
+
+    def close(self) -> None:
+        self._write("\n]\n")
+        super().close()
+
+
+_EXPORTERS = {"jsonl": JsonlSpanExporter, "chrome": ChromeTraceExporter}
+
+
+def enable_tracing(path: str, format: str = "jsonl") -> SpanExporter:
+    """
+    Starts recording spans to a file, replacing any previous exporter.
+
+    Args:
+        path: File the spans are written to (overwritten)
+        format: "jsonl" for one JSON object per span, "chrome" for a Chrome trace-event file
+
+    Returns:
+        The active exporter
+    """
+    global _exporter
+    exporter_type = _EXPORTERS.get(format)
+    if exporter_type is None:
+        raise ValueError(f"Unknown trace format '{format}', expected one of {sorted(_EXPORTERS)}")
+    exporter = exporter_type(path)
+    with _exporter_lock:
+        previous, _exporter = _exporter, exporter
+    if previous is not None:
+        previous.close()
+    return exporter
+
+
+def disable_tracing() -> None:
+    """Stops recording spans and closes the trace file."""
+    global _exporter
+    with _exporter_lock:
+        previous, _exporter = _exporter, None
+    if previous is not None:
+        previous.close()
+
+
+def is_tracing_enabled() -> bool:
+    return _exporter is not None
+
+
+def span(name: str, **attributes: Any):
+    """
+    Returns a context manager timing one operation as a child of the current span.
+
+    Returns the shared no-op span when tracing is disabled.
+    """
+    exporter = _exporter
+    if exporter is None:
+        return NOOP_SPAN
+    return Span(name, _current_span.get(), attributes, exporter)
+
+
+def current_span():
+    """Returns the innermost active span, or the no-op span when there is none."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: str) -> Callable:
+    """Decorator recording every call of the function as a span."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+atexit.register(disable_tracing)
+
+if os.environ.get(TRACE_FILE_ENV):
+    enable_tracing(os.environ[TRACE_FILE_ENV], os.environ.get(TRACE_FORMAT_ENV, "jsonl"))
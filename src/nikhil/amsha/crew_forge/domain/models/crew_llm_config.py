@@ -0,0 +1,10 @@
+# src/nikhil/amsha/crew_forge/domain/models/crew_llm_config.py
+from typing import Any, NamedTuple, Optional
+
+
+class CrewLLMConfig(NamedTuple):
+    """The LLM a crew is built with, and the version of the LLM config it came from."""
+    llm: Any
+    model_name: str
+    output_config: Optional[Any]
+    version: Optional[int]
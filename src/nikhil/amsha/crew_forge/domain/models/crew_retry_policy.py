@@ -0,0 +1,69 @@
+# src/nikhil/amsha/crew_forge/domain/models/crew_retry_policy.py
+import random
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from amsha.llm_factory.service.llm_error_classifier import (
+    PERMANENT_ERROR_NAMES,
+    is_transient_error,
+)
+
+# Failures that will happen again no matter how often the crew is retried
+NON_RETRYABLE_ERROR_NAMES = PERMANENT_ERROR_NAMES + (
+    "CrewConfigurationException", "CrewManagerException", "InputPreparationException",
+    "ContextWindowExceededException",
+)
+
+
+class CrewRetryPolicy(BaseModel):
+    """
+    Retry policy for crew executions.
+
+    Attributes:
+        max_retries: Retries after the initial attempt
+        backoff_base_seconds: Delay before the first retry of a failed execution
+        backoff_multiplier: Growth factor of the delay for every further retry
+        backoff_max_seconds: Upper bound for a single delay
+        jitter: Fraction of the delay that is randomised (0 disables jitter, 1 is full jitter)
+        repair_last_task: Retry validation failures by re-running only the last task,
+            with the validator error and the previous output in its context
+        retryable_errors: Extra exception class names to treat as transient
+    """
+    max_retries: int = Field(0, ge=0, description="Retries after the initial attempt")
+    backoff_base_seconds: float = Field(1.0, ge=0, description="Initial backoff delay in seconds")
+    backoff_multiplier: float = Field(2.0, ge=1, description="Backoff growth factor")
+    backoff_max_seconds: float = Field(30.0, ge=0, description="Maximum backoff delay in seconds")
+    jitter: float = Field(0.5, ge=0, le=1, description="Randomised fraction of each delay")
+    repair_last_task: bool = Field(False, description="Repair validation failures by re-running the last task")
+    retryable_errors: List[str] = Field(default_factory=list, description="Extra transient exception names")
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], **overrides: Any) -> "CrewRetryPolicy":
+        """Creates a policy from a `crew_retry` config block; keyword overrides win over the config."""
+        values = dict(config) if isinstance(config, dict) else {}
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**values)
+
+    def backoff_delay(self, retry_number: int, rng: Optional[random.Random] = None) -> float:
+        """
+        Returns the delay before the given retry (1 for the first retry).
+
+        The exponential delay is capped at backoff_max_seconds, then the jitter
+        fraction of it is replaced by a uniformly random share.
+        """
+        delay = min(
+            self.backoff_max_seconds,
+            self.backoff_base_seconds * self.backoff_multiplier ** max(retry_number - 1, 0)
+        )
+        spread = delay * self.jitter
+        return delay - spread + (rng or random).uniform(0, spread)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Classifies an execution error as transient (worth retrying) or permanent.
+
+        Wrapped exceptions are unwrapped through their cause/context chain, so a
+        CrewExecutionException raised for a provider rate limit is retryable.
+        """
+        return is_transient_error(error, self.retryable_errors, NON_RETRYABLE_ERROR_NAMES)
@@ -8,6 +8,7 @@ module to provide consistent error handling across all Protocol implementations.
 from .crew_forge_exception import CrewForgeException
 from .crew_configuration_exception import CrewConfigurationException
 from .crew_execution_exception import CrewExecutionException
+from .context_window_exceeded_exception import ContextWindowExceededException
 from .crew_manager_exception import CrewManagerException
 from .input_preparation_exception import InputPreparationException
 from .error_context import ErrorContext, ErrorMessageBuilder, wrap_external_exception
@@ -16,6 +17,7 @@ __all__ = [
     'CrewForgeException',
     'CrewConfigurationException',
     'CrewExecutionException',
+    'ContextWindowExceededException',
     'CrewManagerException',
     'InputPreparationException',
     'ErrorContext',
@@ -0,0 +1,34 @@
+"""
+Exception for prompts that do not fit the context window of their model.
+
+This module defines the exception raised by the context-window pre-flight
+check before any LLM call is made.
+"""
+from amsha.crew_forge.exceptions.crew_execution_exception import CrewExecutionException
+
+
+class ContextWindowExceededException(CrewExecutionException):
+    """
+    Raised when the estimated prompt of a crew exceeds the context window of its model.
+    
+    Retrying does not help, so the retry policy treats it as permanent.
+    """
+    
+    def __init__(self, message: str, crew_name: str = None, estimated_tokens: int = None,
+                 context_window: int = None):
+        """
+        Initialize the ContextWindowExceededException.
+        
+        Args:
+            message: The main error message
+            crew_name: Optional name of the crew whose prompt is too large
+            estimated_tokens: Estimated prompt and completion tokens of the largest task
+            context_window: Context window of the model the task would run on
+        """
+        super().__init__(
+            message,
+            crew_name=crew_name,
+            execution_context=f"estimated {estimated_tokens} tokens, context window {context_window}"
+        )
+        self.estimated_tokens = estimated_tokens
+        self.context_window = context_window
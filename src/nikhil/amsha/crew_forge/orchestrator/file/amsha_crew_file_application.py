@@ -6,13 +6,19 @@ from typing import Dict, Any, Optional, List
 from amsha.crew_forge.orchestrator.file.atomic_crew_file_manager import AtomicCrewFileManager
 from amsha.crew_forge.orchestrator.file.file_crew_orchestrator import FileCrewOrchestrator
 from amsha.crew_forge.protocols.crew_application import CrewApplication
+from amsha.crew_forge.domain.models.crew_retry_policy import CrewRetryPolicy
+from amsha.crew_forge.service.context_window_guard import ContextWindowGuard
+from amsha.crew_forge.service.crew_result_cache import CrewResultCache
+from amsha.crew_forge.service.crew_retry_engine import CrewRetryEngine
 from amsha.crew_forge.service.shared_llm_initialization_service import SharedLLMInitializationService
+from amsha.crew_monitor.service.metrics_exporter import MetricsExporter
+from amsha.crew_monitor.service.metrics_store import CrewMetricsStore
 from amsha.execution_runtime.domain import ExecutionMode
-from amsha.execution_state.domain import ExecutionStatus
 from amsha.execution_state.service import StateManager
 from amsha.llm_factory.domain.model.llm_type import LLMType
 from amsha.llm_factory.domain.model.llm_model_config import LLMModelConfig
 from amsha.llm_factory.domain.model.llm_parameters import LLMParameters
+from amsha.llm_factory.settings.llm_settings_source import LLMSettingsSource, VersionedLLMSettings
 from amsha.output_process.optimization.json_cleaner_utils import JsonCleanerUtils
 from amsha.utils.yaml_utils import YamlUtils
 from amsha.common.logger import get_logger
@@ -24,7 +30,8 @@ class AmshaCrewFileApplication(CrewApplication):
 
     """
 
-    def __init__(self, config_paths: Dict[str, str], llm_type: LLMType, inputs: Optional[List[Dict[str, Any]]] = None, llm_config_override: Optional[Dict] = None):
+    def __init__(self, config_paths: Dict[str, str], llm_type: LLMType, inputs: Optional[List[Dict[str, Any]]] = None, llm_config_override: Optional[Dict] = None,
+                 use_llm_cache: bool = True):
         """
         Initializes the application with necessary configuration paths.
 
@@ -33,6 +40,7 @@ class AmshaCrewFileApplication(CrewApplication):
             llm_type: Type of LLM to initialize (CREATIVE or EVALUATION)
             inputs: Optional external inputs
             llm_config_override: Optional dictionary containing LLM configuration overrides
+            use_llm_cache: Set to False to build an LLM of its own instead of sharing the process-wide cached one
         """
         self.logger = get_logger("crew_forge.application")
         self.llm_type = llm_type
@@ -58,7 +66,8 @@ class AmshaCrewFileApplication(CrewApplication):
             config_paths["llm"], 
             llm_type,
             model_config=model_config,
-            llm_params=llm_params
+            llm_params=llm_params,
+            use_cache=use_llm_cache
         )
         self.model_name = model_name
         self.output_config = output_config
@@ -75,10 +84,62 @@ class AmshaCrewFileApplication(CrewApplication):
             app_config_path=config_paths["app"],
             job_config=self.job_config
         )
+        self.retry_policy = CrewRetryPolicy.from_config(manager.app_config.get("crew_retry"))
         self.orchestrator = FileCrewOrchestrator(
             manager=manager,
-            state_manager=self.state_manager
+            state_manager=self.state_manager,
+            retry_policy=self.retry_policy,
+            result_cache=CrewResultCache.from_config(manager.app_config.get("crew_result_cache")),
+            metrics_store=CrewMetricsStore.from_config(manager.app_config.get("metrics_store")),
+            context_guard=self._context_guard_from_config(manager.app_config.get("context_guard"))
         )
+        self.metrics_exporter = MetricsExporter.start_from_config(manager.app_config.get("metrics_export"))
+
+        # Rebuild the LLM of new executions whenever llm_config.yaml changes and still validates
+        self._llm_overrides = (model_config, llm_params)
+        self.llm_settings_source = LLMSettingsSource.watch_from_config(
+            config_paths["llm"], manager.app_config.get("llm_hot_reload")
+        )
+        if self.llm_settings_source:
+            manager.swap_llm(llm, model_name, output_config, self.llm_settings_source.version)
+            self.llm_settings_source.subscribe(self._on_llm_config_reloaded)
+
+    def _context_guard_from_config(self, config: Optional[Dict[str, Any]]) -> Optional[ContextWindowGuard]:
+        """Creates the context guard of the app config; `route` builds the use case's `route_model_key` model."""
+        route_model_key = config.get("route_model_key") if isinstance(config, dict) else None
+        route_llm = None
+        if route_model_key:
+            route_llm = lambda: SharedLLMInitializationService.initialize_llm(
+                self.config_paths["llm"], self.llm_type, model_key=route_model_key
+            )
+        return ContextWindowGuard.from_config(config, route_llm=route_llm)
+
+    def _on_llm_config_reloaded(self, settings: VersionedLLMSettings) -> None:
+        """
+        Swaps in the LLM of a new LLM config version.
+        
+        The LLM is built from the validated snapshot itself, never from the file,
+        which may have changed again since. Executions already built keep their
+        LLM; if the new LLM cannot be built, the current one stays in use.
+        """
+        model_config, llm_params = self._llm_overrides
+        try:
+            llm, model_name, output_config = SharedLLMInitializationService.initialize_llm_from_settings(
+                settings,
+                self.llm_type,
+                model_config=model_config,
+                llm_params=llm_params
+            )
+        except Exception as e:
+            self.logger.error("LLM rebuild after config reload failed, keeping the current LLM", extra={
+                "version": settings.version,
+                "model_name": self.model_name,
+                "error": str(e)
+            })
+            return
+        self.orchestrator.manager.swap_llm(llm, model_name, output_config, settings.version)
+        self.model_name = model_name
+        self.output_config = output_config
 
     def _process_input_item(self, input_item: Dict[str, Any]) -> Any:
         """Standalone logic to transform an input definition into actual data."""
@@ -221,99 +282,53 @@ class AmshaCrewFileApplication(CrewApplication):
         self, 
         crew_name: str, 
         inputs: Dict[str, Any], 
-        max_retries: int = 0,
+        max_retries: Optional[int] = None,
         filename_suffix: Optional[str] = None,
             output_folder: Optional[str] = None,
-            output_json: Any = None
+            output_json: Any = None,
+        mode: ExecutionMode = ExecutionMode.INTERACTIVE
     ) -> Any:
         """
         Executes a crew with retry logic managed by the application.
         
+        Retries follow the `crew_retry` policy of the app config: transient errors
+        are retried with exponential backoff and jitter, retries reuse the crew
+        built for the first attempt, and with `repair_last_task` a validation
+        failure re-runs only the last task with the validation error in context.
+        
         Args:
             crew_name: Name of the crew to run.
             inputs: Input dictionary for the crew.
-            max_retries: Maximum number of retries allowed.
+            max_retries: Maximum number of retries allowed (None falls back to crew_retry.max_retries; 0 disables retries).
             filename_suffix: Optional suffix for output files.
             output_folder: optional output folder to group different generated output
             output_json: Pydantic Json
+            mode: INTERACTIVE runs the attempts inline, BACKGROUND returns an ExecutionHandle
             
         Returns:
-            The result of the successful execution, or the last result if all retries fail.
+            The result of the successful execution, or the last result if all retries fail
+            (an ExecutionHandle in BACKGROUND mode).
         """
-
-
-        attempt = 0
-        success = False
-        last_result = None
-        
-        # Total attempts = initial run (1) + retries
-        while attempt <= max_retries:
-            attempt += 1
-            self.logger.info("Crew execution attempt", extra={
-                "crew_name": crew_name,
-                "attempt": attempt,
-                "max_attempts": max_retries + 1
-            })
-            
-            current_suffix = filename_suffix
-            if attempt > 1:
-                base_suffix = filename_suffix or crew_name
-                current_suffix = f"{base_suffix}_retry_{attempt}"
-            
-            # Run the crew
-            last_result = self.orchestrator.run_crew(
-                crew_name=crew_name,
-                inputs=inputs,
-                filename_suffix=current_suffix,
-                output_json=output_json,
-                mode=ExecutionMode.INTERACTIVE
-            )
-            
-            # Get output file for validation
-            output_file = self.orchestrator.get_last_output_file()
-            
-            # Validate
-            if self.validate_execution(last_result, output_file,output_folder):
-                self.logger.info("Crew validation successful", extra={
-                    "crew_name": crew_name,
-                    "attempt": attempt,
-                    "output_file": output_file,
-                    "model_name": self.model_name,
-                    "llm_type": self.llm_type.value
-                })
-                success = True
-                break
-            
-            self.logger.warning("Crew validation failed", extra={
-                "crew_name": crew_name,
-                "attempt": attempt
-            })
-            
-            # Update State on failure
-            execution_id = self.orchestrator.get_last_execution_id()
-            if execution_id:
-                self.logger.debug("Updating execution state to FAILED", extra={
-                    "execution_id": execution_id,
-                    "attempt": attempt
-                })
-                self.state_manager.update_status(
-                    execution_id, 
-                    ExecutionStatus.FAILED, 
-                    metadata={"reason": "Validation failed", "attempt": attempt}
-                )
-            
-            if attempt > max_retries:
-                self.logger.error("Max retries reached, execution failed", extra={
-                    "crew_name": crew_name,
-                    "attempts": attempt
-                })
-        
-        return last_result
+        if max_retries is None:
+            max_retries = self.retry_policy.max_retries
+        policy = self.retry_policy.model_copy(update={"max_retries": max_retries})
+        engine = CrewRetryEngine(self.orchestrator, policy)
+        return engine.run(
+            crew_name,
+            inputs,
+            filename_suffix=filename_suffix,
+            output_json=output_json,
+            validator=lambda result, output_file: self.validate_execution(result, output_file, output_folder),
+            mode=mode
+        )
 
     def validate_execution(self, result: Any, output_file: Optional[str],output_folder: Optional[str] = None) -> bool:
         """
         Hook for subclasses to implement custom validation logic.
         
+        Subclasses may return a (valid, error message) tuple instead of a bool; the
+        message is given to the agent when the last task is repaired.
+        
         Args:
             result: The result object returned by the crew execution.
             output_file: The path to the output file generated, if any.
@@ -1,9 +1,12 @@
+import threading
 from typing import Optional, Dict, Any
 from crewai import Crew
 
 from amsha.crew_forge.dependency.crew_forge_container import CrewForgeContainer
 from amsha.crew_forge.domain.models.crew_data import CrewData
+from amsha.crew_forge.domain.models.crew_llm_config import CrewLLMConfig
 from amsha.crew_forge.service.atomic_yaml_builder import AtomicYamlBuilderService
+from amsha.crew_forge.service.crew_result_cache import CrewResultCache
 from amsha.crew_forge.exceptions import (
     CrewManagerException,
     CrewConfigurationException,
@@ -25,6 +28,10 @@ class AtomicCrewFileManager(CrewManager):
     Acts as a factory to build specific, atomic crews based on YAML configuration files
     and a job configuration. This implementation conforms to the CrewManager Protocol
     interface for structural typing compatibility.
+    
+    The LLM can be replaced at runtime with `swap_llm` (LLM config hot reload);
+    each crew is built with one consistent LLM config, and crews built earlier
+    keep theirs.
     """
 
     def __init__(self, llm, app_config_path: str, job_config: Dict[str, Any], model_name: str,
@@ -53,11 +60,11 @@ class AtomicCrewFileManager(CrewManager):
         context.add_context("model_name", model_name)
         
         try:
-            self.llm = llm
+            self._llm_lock = threading.Lock()
+            self._llm_config = CrewLLMConfig(llm, model_name, output_config, None)
+            self._built_llm_config: Optional[CrewLLMConfig] = None
             self.job_config = job_config
             self.crew_container = CrewForgeContainer()
-            self._model_name = model_name
-            self._output_config = output_config
             self._output_file: Optional[str] = None
 
             # Load app config for DI with error handling
@@ -78,6 +85,49 @@ class AtomicCrewFileManager(CrewManager):
 
 
 
+    @property
+    def llm(self) -> Any:
+        """LLM new crews are built with."""
+        return self._llm_config.llm
+
+    @property
+    def llm_config(self) -> CrewLLMConfig:
+        """LLM, model name, output config and config version new crews are built with."""
+        return self._llm_config
+
+    @property
+    def built_llm_config(self) -> Optional[CrewLLMConfig]:
+        """LLM config of the last built crew, None before the first build."""
+        return self._built_llm_config
+
+    @property
+    def llm_config_version(self) -> Optional[int]:
+        """Version of the LLM config new crews are built with, None if it is not versioned."""
+        return self._llm_config.version
+
+    def swap_llm(self, llm: Any, model_name: str, output_config: Optional[Any] = None,
+                 version: Optional[int] = None) -> None:
+        """
+        Atomically replaces the LLM used for crews built from now on.
+        
+        Crews already built, including running ones, keep the LLM they were built with.
+        
+        Args:
+            llm: New LLM instance for crew agents
+            model_name: Name of the new model
+            output_config: Output configuration of the new model
+            version: Version of the LLM config the LLM was built from
+        """
+        with self._llm_lock:
+            previous = self._llm_config
+            self._llm_config = CrewLLMConfig(llm, model_name, output_config, version)
+        self.logger.info("LLM swapped", extra={
+            "previous_model_name": previous.model_name,
+            "previous_version": previous.version,
+            "model_name": model_name,
+            "version": version
+        })
+
     def build_atomic_crew(self, crew_name: str, filename_suffix: Optional[str] = None,
                           output_json: Any = None) -> Crew:
         """
@@ -99,9 +149,12 @@ class AtomicCrewFileManager(CrewManager):
             CrewManagerException: If crew building fails
             CrewConfigurationException: If crew configuration is invalid
         """
+        # One snapshot for the whole build, so a concurrent swap never mixes two configs in a crew
+        llm_config = self._llm_config
         self.logger.info("Building atomic crew", extra={
             "crew_name": crew_name,
-            "model_name": self.model_name
+            "model_name": llm_config.model_name,
+            "llm_config_version": llm_config.version
         })
         
         context = ErrorContext("AtomicCrewFileManager", "build_atomic_crew")
@@ -123,7 +176,7 @@ class AtomicCrewFileManager(CrewManager):
 
             # Set up crew data for building
             crew_data = CrewData(
-                llm=self.llm,
+                llm=llm_config.llm,
                 module_name=self.job_config.get("module_name", ""),
                 output_dir_path=self.app_config.get("output_dir_path", f"output/{crew_name}")
             )
@@ -191,9 +244,10 @@ class AtomicCrewFileManager(CrewManager):
                 })
                 
                 # Determine output filename - use alias from output_config if available
-                base_name = self._model_name
-                if self._output_config and hasattr(self._output_config, 'alias') and self._output_config.alias:
-                    base_name = self._output_config.alias
+                base_name = llm_config.model_name
+                output_config = llm_config.output_config
+                if output_config and hasattr(output_config, 'alias') and output_config.alias:
+                    base_name = output_config.alias
                 
                 if filename_suffix:
                     output_filename = f"{base_name}_{filename_suffix}"
@@ -221,6 +275,7 @@ class AtomicCrewFileManager(CrewManager):
             # Store output file reference
             if crew_builder:
                 self._output_file = crew_builder.get_last_file()
+            self._built_llm_config = llm_config
 
             # Handle crew-level knowledge sources
             crew_knowledge_paths = set()
@@ -266,6 +321,36 @@ class AtomicCrewFileManager(CrewManager):
             # Wrap any other unexpected exceptions
             raise wrap_external_exception(e, context, CrewManagerException)
 
+    def get_crew_fingerprint(self, crew_name: str) -> Optional[str]:
+        """
+        Fingerprint the blueprint of a crew for result caching.
+        
+        The fingerprint covers the crew definition in the job configuration and
+        the contents of every agent, task and knowledge file it references, so
+        editing any of them produces a new fingerprint.
+        
+        Args:
+            crew_name: Name of the crew configuration
+            
+        Returns:
+            Hex digest, or None if the crew is not defined
+        """
+        crew_def = self.job_config.get("crews", {}).get(crew_name)
+        if not crew_def:
+            return None
+        
+        referenced_files = list(crew_def.get('knowledge_sources', []))
+        for step in crew_def.get('steps', []):
+            referenced_files.extend(filter(None, [step.get('agent_file'), step.get('task_file')]))
+            referenced_files.extend(step.get('knowledge_sources', []))
+        
+        return CrewResultCache.fingerprint({
+            "crew_def": crew_def,
+            "module_name": self.job_config.get("module_name", ""),
+            "output_alias": getattr(self._llm_config.output_config, 'alias', None),
+            "files": CrewResultCache.fingerprint_files(referenced_files)
+        })
+
     @property
     def model_name(self) -> str:
         """
@@ -274,7 +359,7 @@ class AtomicCrewFileManager(CrewManager):
         Returns:
             String identifier of the LLM model being used
         """
-        return self._model_name
+        return self._llm_config.model_name
     
     @property
     def output_file(self) -> Optional[str]:
@@ -4,11 +4,16 @@ File-based crew orchestrator implementation using BaseCrewOrchestrator.
 This module provides a Protocol-compliant orchestrator for file-based
 crew execution that leverages shared orchestration logic.
 """
-from typing import Dict, Any, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from amsha.crew_forge.service.base_crew_orchestrator import BaseCrewOrchestrator
 from amsha.crew_forge.protocols.crew_manager import CrewManager
+from amsha.crew_forge.domain.models.crew_retry_policy import CrewRetryPolicy
+from amsha.crew_forge.service.context_window_guard import ContextWindowGuard
+from amsha.crew_forge.service.crew_result_cache import CrewResultCache
+from amsha.crew_forge.service.crew_retry_engine import CrewOutputValidator, CrewRetryEngine
 from amsha.crew_monitor.service.crew_performance_monitor import CrewPerformanceMonitor
+from amsha.crew_monitor.service.metrics_store import CrewMetricsStore
 from amsha.execution_runtime.service.runtime_engine import RuntimeEngine
 from amsha.execution_runtime.domain.execution_mode import ExecutionMode
 from amsha.execution_runtime.domain.execution_handle import ExecutionHandle
@@ -28,7 +33,11 @@ class FileCrewOrchestrator(BaseCrewOrchestrator):
         self, 
         manager: CrewManager, 
         runtime: Optional[RuntimeEngine] = None,
-        state_manager: Optional[StateManager] = None
+        state_manager: Optional[StateManager] = None,
+        result_cache: Optional[CrewResultCache] = None,
+        retry_policy: Optional[CrewRetryPolicy] = None,
+        metrics_store: Optional[CrewMetricsStore] = None,
+        context_guard: Optional[ContextWindowGuard] = None
     ):
         """
         Initialize the file-based orchestrator.
@@ -37,8 +46,14 @@ class FileCrewOrchestrator(BaseCrewOrchestrator):
             manager: CrewManager Protocol implementation for building crews
             runtime: Optional RuntimeEngine for execution management
             state_manager: Optional StateManager for execution state tracking
+            result_cache: Optional CrewResultCache to memoise identical crew runs
+            retry_policy: Backoff, jitter and repair settings used when run_crew retries
+            metrics_store: Optional CrewMetricsStore keeping the metrics of every execution
+            context_guard: Optional ContextWindowGuard checking crew prompts before kickoff
         """
-        super().__init__(manager, runtime, state_manager)
+        super().__init__(manager, runtime, state_manager, result_cache, metrics_store=metrics_store,
+                         context_guard=context_guard)
+        self.retry_policy = retry_policy or CrewRetryPolicy()
     
     def run_crew(
         self,
@@ -54,14 +69,16 @@ class FileCrewOrchestrator(BaseCrewOrchestrator):
         Execute a crew with the specified parameters, optionally retrying on validation failure.
         
         Uses the shared BaseCrewOrchestrator logic for consistent execution
-        across all orchestrator implementations.
+        across all orchestrator implementations. Retries are driven by a
+        CrewRetryEngine: transient errors are retried with backoff, retries reuse
+        the crew built for the first attempt, and they work in both modes.
         
         Args:
             crew_name: Name of the crew to execute
             inputs: Dictionary of input parameters for the crew
             filename_suffix: Optional suffix for output filenames
             mode: Execution mode (INTERACTIVE or BACKGROUND)
-            max_retries: Maximum number of retries if validation fails (default: 0)
+            max_retries: Maximum number of retries on validation failure or transient errors (default: 0)
             output_validator: Callable that takes a file path and returns bool (True=Success)
             output_json: Any
         Returns:
@@ -72,54 +89,23 @@ class FileCrewOrchestrator(BaseCrewOrchestrator):
             CrewExecutionException: If crew execution fails
             CrewManagerException: If crew building fails
         """
-        if mode == ExecutionMode.BACKGROUND and (max_retries > 0 or output_validator):
-             # For now, we only support retries in INTERACTIVE mode because BACKGROUND 
-             # requires more complex state management/callbacks.
-             pass 
-
-        attempt = 0
-        success = False
-        last_result = None
-        
-        # Determine effective loop count: 1 initial attempt + max_retries
-        total_attempts = 1 + max_retries
+        if not output_validator and max_retries == 0:
+            return super().run_crew(crew_name, inputs, filename_suffix, mode, output_json)
         
-        while attempt < total_attempts and not success:
-            current_suffix = filename_suffix
-            if attempt > 0:
-                # Append retry count to suffix so output files dont overwrite effectively
-                # or just for clarity. 
-                base_suffix = filename_suffix or crew_name
-                current_suffix = f"{base_suffix}_retry_{attempt}"
-            
-            # Execute via base class
-            last_result = super().run_crew(crew_name, inputs, current_suffix, mode,output_json)
-            
-            # If no validator, success is automatic (unless exception raised, which super handles)
-            if not output_validator:
-                success = True
-                continue
-
-            # Perform Validation
-            # Only strictly applicable in INTERACTIVE mode where we wait for result
-            if mode == ExecutionMode.INTERACTIVE:
-                last_file = self.get_last_output_file()
-                if last_file:
-                    print(f"[FileCrewOrchestrator] Validating output: {last_file}")
-                    if output_validator(last_file):
-                        print("[FileCrewOrchestrator] Validation PASSED.")
-                        success = True
-                    else:
-                        print(f"[FileCrewOrchestrator] Validation FAILED (Attempt {attempt+1}/{total_attempts})")
-                        attempt += 1
-                else:
-                    print(f"[FileCrewOrchestrator] No output file found to validate. (Attempt {attempt+1}/{total_attempts})")
-                    attempt += 1
-            else:
-                 # Background mode validation logic would go here
-                 success = True
-
-        return last_result
+        policy = self.retry_policy.model_copy(update={"max_retries": max_retries})
+        validator = self._file_validator(output_validator) if output_validator else None
+        return CrewRetryEngine(self, policy).run(
+            crew_name, inputs, filename_suffix, output_json, validator, mode
+        )
+    
+    @staticmethod
+    def _file_validator(output_validator: Callable[[str], bool]) -> CrewOutputValidator:
+        """Adapts a validator that only takes the output file path to the retry engine."""
+        def validate(result: Any, output_file: Optional[str]):
+            if not output_file:
+                return False, "No output file was produced."
+            return output_validator(output_file)
+        return validate
     
     def get_last_output_file(self) -> Optional[str]:
         """
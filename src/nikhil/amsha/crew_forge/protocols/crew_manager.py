@@ -6,8 +6,10 @@ This Protocol enables different crew manager implementations to be used
 interchangeably through structural typing.
 """
 
-from typing import Protocol, Optional, runtime_checkable, Any
-from crewai import Crew
+from typing import TYPE_CHECKING, Protocol, Optional, runtime_checkable, Any
+
+if TYPE_CHECKING:
+    from crewai import Crew
 
 
 @runtime_checkable
@@ -26,7 +28,7 @@ class CrewManager(Protocol):
         crew_name: str, 
         filename_suffix: Optional[str] = None,
             output_json: Any = None
-    ) -> Crew:
+    ) -> "Crew":
         """
         Build a configured crew ready for execution.
         
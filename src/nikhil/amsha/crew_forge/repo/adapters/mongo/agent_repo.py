@@ -1,6 +1,5 @@
 # src/nikhil/amsha/toolkit/crew_forge/adapters/mongo/agent_repo.py
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError
 
 from amsha.crew_forge.domain.models.agent_data import AgentResponse, AgentRequest
 from amsha.crew_forge.domain.models.repo_data import RepoData
@@ -16,6 +15,8 @@ class AgentRepository(MongoRepository, IAgentRepository):
 
     def create_agent(self, agent: AgentRequest) -> AgentResponse:
         """Creates a new agent in the database."""
+        from pymongo.errors import DuplicateKeyError
+
         try:
             agent_data = agent.model_dump(by_alias=True, exclude={"id"})
             result = self.insert_one(agent_data)
@@ -2,7 +2,6 @@
 from typing import Optional, List
 
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError
 
 from amsha.crew_forge.domain.models.crew_config_data import CrewConfigRequest, CrewConfigResponse
 from amsha.crew_forge.domain.models.repo_data import RepoData
@@ -16,6 +15,8 @@ class CrewConfigRepository(MongoRepository, ICrewConfigRepository):
         self.create_unique_compound_index(["name", "usecase"])
 
     def create_crew_config(self, crew_config: CrewConfigRequest) -> Optional[CrewConfigResponse]:
+        from pymongo.errors import DuplicateKeyError
+
         try:
             crew_config_data = crew_config.model_dump(by_alias=True, exclude={"id"})
             result = self.insert_one(crew_config_data)
@@ -1,12 +1,13 @@
 # src/nikhil/amsha/toolkit/crew_forge/adapters/mongo/task_repo.py
-import pymongo
-
 from amsha.crew_forge.domain.models.repo_data import RepoData
 from amsha.crew_forge.repo.interfaces.i_repository import IRepository
 
 
 class MongoRepository(IRepository):
     def __init__(self, data:RepoData):
+        # pymongo is imported on first use so the crew_forge package stays cheap to import
+        import pymongo
+
         self.client = pymongo.MongoClient(data.mongo_uri)
         self.db = self.client[data.db_name]
         self.collection = self.db[data.collection_name]
@@ -34,6 +35,8 @@ class MongoRepository(IRepository):
     def create_unique_compound_index(self, keys: list[str]):
         if not keys:
             raise ValueError("List of keys cannot be empty.")
+        import pymongo
+
         index_keys = [(key, pymongo.ASCENDING) for key in keys]
         try:
             self.collection.create_index(index_keys, unique=True)
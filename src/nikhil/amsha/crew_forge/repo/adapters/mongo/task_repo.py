@@ -1,6 +1,5 @@
 # src/nikhil/amsha/toolkit/crew_forge/adapters/mongo/crew_config_repo.py
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError
 
 from amsha.crew_forge.domain.models.repo_data import RepoData
 from amsha.crew_forge.domain.models.task_data import TaskRequest, TaskResponse
@@ -16,6 +15,8 @@ class TaskRepository(MongoRepository, ITaskRepository):
 
     def create_task(self, task: TaskRequest) -> TaskResponse:
         """Creates a new task in the database."""
+        from pymongo.errors import DuplicateKeyError
+
         try:
             result = self.insert_one(task.model_dump())
             return self.get_task_by_id(result.inserted_id)
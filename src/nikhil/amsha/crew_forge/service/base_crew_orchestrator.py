@@ -1,15 +1,22 @@
 import sys
+import threading
 import time
-from typing import Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, Union
 from amsha.execution_runtime.service.runtime_engine import RuntimeEngine
 from amsha.execution_runtime.domain.execution_mode import ExecutionMode
 from amsha.execution_runtime.domain.execution_handle import ExecutionHandle
 from amsha.execution_state.service.state_manager import StateManager
 from amsha.execution_state.domain.enums import ExecutionStatus
+from amsha.crew_monitor.service.crew_metrics import CrewMetrics
 from amsha.crew_monitor.service.crew_performance_monitor import CrewPerformanceMonitor
+from amsha.crew_monitor.service.metrics_store import CrewMetricsStore
+from amsha.crew_forge.domain.models.crew_llm_config import CrewLLMConfig
 from amsha.crew_forge.protocols.crew_manager import CrewManager
-from crewai.crews.crew_output import CrewOutput
+from amsha.crew_forge.service.context_window_guard import ContextWindowGuard
+from amsha.crew_forge.service.crew_result_cache import CrewResultCache
+from amsha.crew_forge.service.execution_registry import ExecutionRecord, ExecutionRegistry
 from amsha.crew_forge.exceptions import (
+    ContextWindowExceededException,
     CrewExecutionException,
     CrewManagerException,
     ErrorContext,
@@ -17,6 +24,11 @@ from amsha.crew_forge.exceptions import (
     wrap_external_exception
 )
 from amsha.common.logger import get_logger, MetricsLogger
+from amsha.common.tracing import current_span, span, traced
+from amsha.llm_factory.service.llm_circuit_breaker import circuit_endpoints, is_endpoint_available
+
+if TYPE_CHECKING:
+    from crewai import Crew
 
 
 class BaseCrewOrchestrator:
@@ -26,7 +38,12 @@ class BaseCrewOrchestrator:
         self, 
         manager: CrewManager, 
         runtime: Optional[RuntimeEngine] = None,
-        state_manager: Optional[StateManager] = None
+        state_manager: Optional[StateManager] = None,
+        result_cache: Optional[CrewResultCache] = None,
+        execution_registry: Optional[ExecutionRegistry] = None,
+        crew_metrics: Optional[CrewMetrics] = None,
+        metrics_store: Optional[CrewMetricsStore] = None,
+        context_guard: Optional[ContextWindowGuard] = None
     ):
         """
         Initialize the base orchestrator with injected dependencies.
@@ -35,6 +52,11 @@ class BaseCrewOrchestrator:
             manager: CrewManager Protocol implementation for building crews
             runtime: Optional RuntimeEngine for execution management
             state_manager: Optional StateManager for execution state tracking
+            result_cache: Optional CrewResultCache to memoise identical crew runs
+            execution_registry: Optional ExecutionRegistry holding per-execution monitors and output files
+            crew_metrics: Optional CrewMetrics fed with every execution (the process-wide one by default)
+            metrics_store: Optional CrewMetricsStore keeping the metrics of every execution for regression checks
+            context_guard: Optional ContextWindowGuard checking the prompts of built crews before kickoff
         """
         self.logger = get_logger("crew_forge.orchestrator")
         self.metrics_logger = MetricsLogger(self.logger)
@@ -44,11 +66,75 @@ class BaseCrewOrchestrator:
         })
         
         self.manager = manager
-        self.runtime = runtime or RuntimeEngine()
+        # Queued crews fail fast on the shared LLM circuit breakers
+        self.runtime = runtime or RuntimeEngine(endpoint_available=is_endpoint_available)
         self.state_manager = state_manager or StateManager()
-        self.last_monitor: Optional[CrewPerformanceMonitor] = None
-        self.last_execution_id: Optional[str] = None
+        self.result_cache = result_cache
+        self.executions = execution_registry or ExecutionRegistry()
+        self.crew_metrics = crew_metrics or CrewMetrics.shared()
+        self.metrics_store = metrics_store
+        self.context_guard = context_guard
+        # The manager keeps the output file of its last build, so builds and the read are serialised
+        self._build_lock = threading.Lock()
+        # "Last" execution per calling thread, so concurrent callers each see their own run
+        self._last = threading.local()
+        self._latest_execution_id: Optional[str] = None
+    
+    @property
+    def last_execution_id(self) -> Optional[str]:
+        """Execution id of the last run started by the calling thread, else of the latest run overall."""
+        if hasattr(self._last, "execution_id"):
+            return self._last.execution_id
+        return self._latest_execution_id
+    
+    @last_execution_id.setter
+    def last_execution_id(self, execution_id: Optional[str]) -> None:
+        self._last.execution_id = execution_id
+        if execution_id is not None:
+            self._latest_execution_id = execution_id
+    
+    @property
+    def last_monitor(self) -> Optional[CrewPerformanceMonitor]:
+        record = self.get_execution(self.last_execution_id)
+        return record.monitor if record else None
+    
+    @property
+    def last_output_file(self) -> Optional[str]:
+        record = self.get_execution(self.last_execution_id)
+        return record.output_file if record else None
+    
+    @property
+    def last_cache_key(self) -> Optional[str]:
+        record = self.get_execution(self.last_execution_id)
+        return record.cache_key if record else None
+    
+    @property
+    def last_crew(self) -> Optional["Crew"]:
+        record = self.get_execution(self.last_execution_id)
+        return record.crew if record else None
+    
+    def get_execution(self, execution_id: Optional[str]) -> Optional[ExecutionRecord]:
+        """
+        Get the record of an execution: its monitor, output file and crew.
+        
+        Args:
+            execution_id: Execution state id, as on `ExecutionHandle.execution_state_id`
+            
+        Returns:
+            The ExecutionRecord, or None if unknown or already evicted from the registry
+        """
+        return self.executions.get(execution_id)
+    
+    def _start_execution(self, crew_name: str, inputs: Dict[str, Any]) -> ExecutionRecord:
+        """Creates the execution state and registers the record of a new execution."""
+        # Cleared first, so a failure below never leaves the previous run as "last"
+        self.last_execution_id = None
+        state = self.state_manager.create_execution(inputs=inputs)
+        record = self.executions.register(state.execution_id, crew_name)
+        self.last_execution_id = state.execution_id
+        return record
     
+    @traced("crew.run")
     def run_crew(
         self,
         crew_name: str,
@@ -88,23 +174,34 @@ class BaseCrewOrchestrator:
         context.add_context("mode", mode.value)
         
         # Create execution state
-        state = self.state_manager.create_execution(inputs=inputs)
-        self.last_execution_id = state.execution_id
+        record = self._start_execution(crew_name, inputs)
         
         self.logger.info("Execution state created", extra={
-            "execution_id": state.execution_id,
+            "execution_id": record.execution_id,
             "crew_name": crew_name
         })
-        context.add_context("execution_id", state.execution_id)
+        context.add_context("execution_id", record.execution_id)
+        current_span().set_attributes(crew_name=crew_name, mode=mode.value, execution_id=record.execution_id)
+        
+        cache_key = self._result_cache_key(crew_name, inputs, filename_suffix, output_json)
+        record.cache_key = cache_key
+        if cache_key:
+            cached = self.result_cache.get(cache_key)
+            if cached:
+                current_span().set_attribute("cache_hit", True)
+                return self._return_cached_result(crew_name, record, cached, mode, execution_start_time)
         
         self.state_manager.update_status(
-            state.execution_id, 
+            record.execution_id, 
             ExecutionStatus.RUNNING, 
             metadata={"crew_name": crew_name, "mode": mode.value}
         )
         
         try:
-            crew_to_run = self.manager.build_atomic_crew(crew_name, filename_suffix,output_json)
+            with self._build_lock, span("crew.build", crew_name=crew_name):
+                crew_to_run = self.manager.build_atomic_crew(crew_name, filename_suffix,output_json)
+                output_file = self.manager.output_file
+                self._pin_llm_config(record, built=True)
         except Exception as e:
             error_message = ErrorMessageBuilder.manager_error(
                 "CrewManager", 
@@ -113,10 +210,11 @@ class BaseCrewOrchestrator:
             )
             
             self.state_manager.update_status(
-                state.execution_id, 
+                record.execution_id, 
                 ExecutionStatus.FAILED, 
                 metadata={"error": error_message}
             )
+            record.finished = True
             
             # Wrap in appropriate exception type
             if isinstance(e, (CrewManagerException, CrewExecutionException)):
@@ -124,31 +222,190 @@ class BaseCrewOrchestrator:
             else:
                 raise wrap_external_exception(e, context, CrewManagerException)
 
+        if self.context_guard is not None:
+            inputs = self._check_context_window(crew_name, crew_to_run, record, inputs)
+
+        record.crew = crew_to_run
+        record.output_file = output_file
+        return self._submit_kickoff(crew_name, crew_to_run, record, inputs, mode, execution_start_time)
+    
+    def _check_context_window(
+        self,
+        crew_name: str,
+        crew: "Crew",
+        record: ExecutionRecord,
+        inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Pre-flight check of the built crew's prompts against the context windows of their LLMs.
+        
+        Returns the inputs to kick off with (trimmed if configured); a crew routed
+        to a bigger-context model records that model on its execution. An error
+        of the check itself is logged and never blocks the execution.
+        
+        Raises:
+            ContextWindowExceededException: If a prompt does not fit and is rejected
+        """
+        try:
+            with span("crew.context_check", crew_name=crew_name) as check_span:
+                checked = self.context_guard.apply(crew_name, crew, inputs)
+                check_span.set_attributes(
+                    max_estimated_tokens=max((e.total_tokens for e in checked.estimates), default=0),
+                    routed=checked.llm is not None
+                )
+        except ContextWindowExceededException as e:
+            self.state_manager.update_status(
+                record.execution_id,
+                ExecutionStatus.FAILED,
+                metadata={"error": str(e)}
+            )
+            record.finished = True
+            raise
+        except Exception as e:
+            self.logger.warning("Context window check failed, running the crew unchecked", extra={
+                "crew_name": crew_name,
+                "execution_id": record.execution_id,
+                "error": str(e)
+            })
+            return inputs
+        if checked.llm is not None:
+            record.llm, record.model_name = checked.llm, checked.model_name
+        return checked.inputs
+    
+    @traced("crew.run_prepared")
+    def run_prepared_crew(
+        self,
+        crew_name: str,
+        crew: "Crew",
+        inputs: Dict[str, Any],
+        output_file: Optional[str] = None,
+        mode: ExecutionMode = ExecutionMode.INTERACTIVE,
+        interpolate_inputs: bool = True
+    ) -> Union[Any, ExecutionHandle]:
+        """
+        Execute an already built crew with the same state tracking and monitoring as run_crew.
+        
+        Used to re-run a copy of a previously built crew without going through the
+        manager again. Results of prepared crews are not memoised.
+        
+        Args:
+            crew_name: Name of the crew the prepared crew was built from
+            crew: Crew instance ready for kickoff
+            inputs: Input parameters recorded for the execution
+            output_file: Output file the crew writes, if any
+            mode: Execution mode (INTERACTIVE or BACKGROUND)
+            interpolate_inputs: Pass inputs to kickoff; disable for crews whose
+                task descriptions are already interpolated
+            
+        Returns:
+            Execution result (direct result for INTERACTIVE, ExecutionHandle for BACKGROUND)
+            
+        Raises:
+            CrewExecutionException: If crew execution fails
+        """
+        execution_start_time = time.time()
+        
+        record = self._start_execution(crew_name, inputs)
+        record.crew = crew
+        record.output_file = output_file
+        self._pin_llm_config(record, built=False)
+        current_span().set_attributes(crew_name=crew_name, mode=mode.value, execution_id=record.execution_id)
+        
+        self.logger.info("Prepared crew execution request received", extra={
+            "crew_name": crew_name,
+            "execution_id": record.execution_id,
+            "mode": mode.value,
+            "output_file": output_file
+        })
+        
+        self.state_manager.update_status(
+            record.execution_id,
+            ExecutionStatus.RUNNING,
+            metadata={"crew_name": crew_name, "mode": mode.value, "prepared_crew": True}
+        )
+        
+        return self._submit_kickoff(
+            crew_name, crew, record,
+            inputs if interpolate_inputs else None,
+            mode, execution_start_time
+        )
+    
+    def _pin_llm_config(self, record: ExecutionRecord, built: bool) -> None:
+        """
+        Records the LLM config an execution runs with.
+        
+        Pinned when the crew is built, so an LLM config hot reload afterwards
+        never changes the model name, endpoints or metrics of a run in flight.
+        Managers without a versioned LLM config are read directly.
+        """
+        llm_config = getattr(self.manager, "built_llm_config" if built else "llm_config", None)
+        if isinstance(llm_config, CrewLLMConfig):
+            record.llm, record.model_name, record.llm_config_version = (
+                llm_config.llm, llm_config.model_name, llm_config.version
+            )
+        else:
+            record.llm, record.model_name = getattr(self.manager, "llm", None), self.manager.model_name
+    
+    def _submit_kickoff(
+        self,
+        crew_name: str,
+        crew_to_run: "Crew",
+        record: ExecutionRecord,
+        kickoff_inputs: Optional[Dict[str, Any]],
+        mode: ExecutionMode,
+        execution_start_time: float
+    ) -> Union[Any, ExecutionHandle]:
+        """Submits the kickoff of a built crew to the runtime and records its outcome."""
+        if mode == ExecutionMode.BACKGROUND and getattr(crew_to_run, "stream", False) is True:
+            # Nobody reads the chunks of a background run, so it skips the streaming kickoff path
+            crew_to_run.stream = False
+        execution_id = record.execution_id
+        model_name = record.model_name
+        endpoints = circuit_endpoints(record.llm)
+        
+        @traced("crew.kickoff")
         def _execute_kickoff():
             """Internal function to execute crew kickoff with monitoring."""
+            from crewai.crews.crew_output import CrewOutput
+
+            current_span().set_attributes(
+                crew_name=crew_name, execution_id=execution_id, model_name=model_name
+            )
             self.logger.info("Initiating crew kickoff", extra={
                 "crew_name": crew_name,
-                "execution_id": state.execution_id,
-                "model_name": self.manager.model_name
+                "execution_id": execution_id,
+                "model_name": model_name,
+                "llm_config_version": record.llm_config_version
             })
             
-            # Initialize monitor with model name from manager
-            self.last_monitor = CrewPerformanceMonitor(model_name=self.manager.model_name)
-            self.last_monitor.start_monitoring()
+            # Initialize a monitor of this execution with the model the crew was built with
+            monitor = CrewPerformanceMonitor(model_name=model_name)
+            record.monitor = monitor
+            monitor.track_crew(crew_to_run)
+            monitor.start_monitoring()
+            monitoring = True
+            self._record_metrics(self.crew_metrics.execution_started, crew_name, model_name)
+            metrics_recorded = False
             
             try:
-                result = crew_to_run.kickoff(inputs=inputs)
+                # A crew queued behind others fails fast here if its LLM endpoints went down meanwhile
+                self.runtime.ensure_available(endpoints)
+                result = crew_to_run.kickoff(inputs=kickoff_inputs)
 
                 # Handle streaming response (CrewAI 1.8.0+)
                 if hasattr(result, '__iter__') and not isinstance(result, (str, dict, list, CrewOutput)):
                     self.logger.info("Streaming output detected, consuming chunks", extra={
-                        "execution_id": state.execution_id
+                        "execution_id": execution_id
                     })
                     final_string = ""
-                    for chunk in result:
-                        sys.__stdout__.write(str(chunk))
-                        sys.__stdout__.flush()
-                        final_string += str(chunk)
+                    with span("crew.stream", execution_id=execution_id) as stream_span:
+                        chunk_count = 0
+                        for chunk in result:
+                            sys.__stdout__.write(str(chunk))
+                            sys.__stdout__.flush()
+                            final_string += str(chunk)
+                            chunk_count += 1
+                        stream_span.set_attributes(chunks=chunk_count, characters=len(final_string))
                     sys.__stdout__.write("\n")
                     sys.__stdout__.flush()
 
@@ -164,13 +421,14 @@ class BaseCrewOrchestrator:
                         tasks_output=[] # Task outputs might be lost in stream iteration if not manually collected
                     )
                 
-                self.last_monitor.stop_monitoring()
-                self.last_monitor.log_usage(result)
-                summary = self.last_monitor.get_summary()
-                metrics = self.last_monitor.get_metrics()
+                monitor.stop_monitoring()
+                monitoring = False
+                monitor.log_usage(result)
+                summary = monitor.get_summary()
+                metrics = monitor.get_metrics()
                 # Log performance summary
                 self.logger.info("Performance summary", extra={
-                    "execution_id": state.execution_id,
+                    "execution_id": execution_id,
                     "summary": summary
                 })
                 
@@ -178,39 +436,67 @@ class BaseCrewOrchestrator:
                 execution_duration = time.time() - execution_start_time
                 self.metrics_logger.log_execution_metrics(
                     crew_name=crew_name,
-                    execution_id=state.execution_id,
+                    execution_id=execution_id,
                     metrics=metrics,
                     duration=execution_duration
                 )
+                metrics_recorded = True
+                self._record_metrics(
+                    self.crew_metrics.execution_finished, crew_name, model_name,
+                    "completed", execution_duration, metrics
+                )
+                self._record_metrics(
+                    self._store_execution_metrics, crew_name, execution_id, "completed", execution_duration, metrics,
+                    record=record
+                )
                 
                 self.logger.info("Crew execution completed successfully", extra={
                     "crew_name": crew_name,
-                    "execution_id": state.execution_id,
+                    "execution_id": execution_id,
                     "duration_seconds": round(execution_duration, 4)
                 })
                 
+                if record.cache_key:
+                    self.result_cache.put(record.cache_key, crew_name, result, record.output_file)
+                
                 # Update state on success
                 self.state_manager.update_status(
-                    state.execution_id, 
+                    execution_id, 
                     ExecutionStatus.COMPLETED, 
                     metadata={"metrics": metrics}
                 )
                 
                 # Store result if serializable
                 if isinstance(result, (str, dict, list, int, float, bool)):
-                    current_state = self.state_manager.get_execution(state.execution_id)
+                    current_state = self.state_manager.get_execution(execution_id)
                     if current_state:
                         current_state.set_output("result", result)
-                        self.state_manager.repository.save(current_state)
+                        with span("state.save_output", execution_id=execution_id):
+                            self.state_manager.repository.save(current_state)
                 # Handle CrewOutput serialization
                 elif isinstance(result, CrewOutput):
-                     current_state = self.state_manager.get_execution(state.execution_id)
+                     current_state = self.state_manager.get_execution(execution_id)
                      if current_state:
                          current_state.set_output("result", result.raw)
-                         self.state_manager.repository.save(current_state)
+                         with span("state.save_output", execution_id=execution_id):
+                             self.state_manager.repository.save(current_state)
                 
+                record.finished = True
                 return result
             except Exception as e:
+                if monitoring:
+                    # Stops the resource sampler and releases the event breakdown of the failed run
+                    monitor.stop_monitoring()
+                if not metrics_recorded:
+                    failed_duration = time.time() - execution_start_time
+                    self._record_metrics(
+                        self.crew_metrics.execution_finished, crew_name, model_name,
+                        "failed", failed_duration
+                    )
+                    self._record_metrics(
+                        self._store_execution_metrics, crew_name, execution_id, "failed", failed_duration,
+                        record=record
+                    )
                 error_message = ErrorMessageBuilder.execution_error(
                     crew_name, 
                     "crew_kickoff", 
@@ -218,16 +504,17 @@ class BaseCrewOrchestrator:
                 )
                 self.logger.error("Crew execution failed", extra={
                     "crew_name": crew_name,
-                    "execution_id": state.execution_id,
+                    "execution_id": execution_id,
                     "error_message": error_message,
                     "error_type": type(e).__name__
                 }, exc_info=True)
                 
                 self.state_manager.update_status(
-                    state.execution_id, 
+                    execution_id, 
                     ExecutionStatus.FAILED, 
                     metadata={"error": error_message}
                 )
+                record.finished = True
                 
                 # Wrap in execution exception
                 if isinstance(e, CrewExecutionException):
@@ -235,24 +522,148 @@ class BaseCrewOrchestrator:
                 else:
                     execution_context = ErrorContext("BaseCrewOrchestrator", "crew_kickoff")
                     execution_context.add_context("crew_name", crew_name)
-                    execution_context.add_context("execution_id", state.execution_id)
+                    execution_context.add_context("execution_id", execution_id)
                     raise wrap_external_exception(e, execution_context, CrewExecutionException)
         
         handle = self.runtime.submit(_execute_kickoff, mode=mode)
         
-        # Attach execution_id to handle for correlation
-        handle.execution_state_id = state.execution_id
+        # Attach execution_id and record to handle for correlation
+        handle.execution_state_id = execution_id
+        handle.execution_record = record
         
         if mode == ExecutionMode.INTERACTIVE:
             return handle.result()
         return handle
     
+    def _record_metrics(self, update: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        """Applies a crew metrics update; a failing update is logged and never fails the execution."""
+        try:
+            update(*args, **kwargs)
+        except Exception as e:
+            self.logger.warning("Crew metrics update failed", extra={
+                "update": getattr(update, "__name__", str(update)),
+                "error": str(e)
+            })
+    
+    def _store_execution_metrics(
+        self,
+        crew_name: str,
+        execution_id: str,
+        status: str,
+        duration: float,
+        metrics: Optional[Dict[str, Any]] = None,
+        record: Optional[ExecutionRecord] = None
+    ) -> None:
+        """Appends an execution to the metrics store and checks the crew for regressions if configured."""
+        if self.metrics_store is None:
+            return
+        get_crew_fingerprint = getattr(self.manager, "get_crew_fingerprint", None)
+        if record is not None and record.model_name is not None:
+            model_name, llm = record.model_name, record.llm
+        else:
+            model_name, llm = self.manager.model_name, getattr(self.manager, "llm", None)
+        self.metrics_store.record(
+            crew_name, model_name, status, duration, metrics,
+            execution_id=execution_id,
+            crew_fingerprint=get_crew_fingerprint(crew_name) if get_crew_fingerprint else None,
+            config_fingerprint=CrewResultCache.fingerprint_llm(llm)
+        )
+        if status == "completed" and self.metrics_store.check_regressions:
+            self.metrics_store.detect_regressions(crew_name, model_name)
+    
+    def _result_cache_key(
+        self,
+        crew_name: str,
+        inputs: Dict[str, Any],
+        filename_suffix: Optional[str],
+        output_json: Any
+    ) -> Optional[str]:
+        """Builds the result cache key, or None if caching is off or the manager cannot fingerprint crews."""
+        if self.result_cache is None:
+            return None
+        get_crew_fingerprint = getattr(self.manager, "get_crew_fingerprint", None)
+        crew_fingerprint = get_crew_fingerprint(crew_name) if get_crew_fingerprint else None
+        if not crew_fingerprint:
+            return None
+        
+        return CrewResultCache.build_key(
+            crew_fingerprint=crew_fingerprint,
+            model_fingerprint=CrewResultCache.fingerprint_llm(getattr(self.manager, "llm", None)),
+            inputs=inputs,
+            variant={
+                "filename_suffix": filename_suffix,
+                "output_json": getattr(output_json, "__name__", output_json)
+            }
+        )
+    
+    def _return_cached_result(
+        self,
+        crew_name: str,
+        record: ExecutionRecord,
+        cached: Any,
+        mode: ExecutionMode,
+        execution_start_time: float
+    ) -> Union[Any, ExecutionHandle]:
+        """Completes an execution from a memoised crew result without building the crew."""
+        execution_id = record.execution_id
+        self.logger.info("Crew result served from cache", extra={
+            "crew_name": crew_name,
+            "execution_id": execution_id,
+            "output_file": cached.output_file
+        })
+        record.output_file = cached.output_file
+        record.finished = True
+        self._record_metrics(
+            self.crew_metrics.execution_finished, crew_name, self.manager.model_name,
+            "cached", time.time() - execution_start_time, running=False
+        )
+        
+        self.state_manager.update_status(
+            execution_id,
+            ExecutionStatus.COMPLETED,
+            metadata={"crew_name": crew_name, "mode": mode.value, "cache_hit": True}
+        )
+        current_state = self.state_manager.get_execution(execution_id)
+        if current_state:
+            current_state.set_output("result", cached.result.raw)
+            self.state_manager.repository.save(current_state)
+        
+        handle = self.runtime.submit(lambda: cached.result, mode=mode)
+        handle.execution_state_id = execution_id
+        handle.execution_record = record
+        
+        if mode == ExecutionMode.INTERACTIVE:
+            return handle.result()
+        return handle
+    
+    def invalidate_cached_results(self, crew_name: Optional[str] = None) -> int:
+        """
+        Drop memoised crew results.
+        
+        Args:
+            crew_name: Only drop results of this crew (all results when omitted)
+            
+        Returns:
+            Number of removed cache entries
+        """
+        if self.result_cache is None:
+            return 0
+        return self.result_cache.invalidate(crew_name=crew_name)
+    
+    def discard_last_cached_result(self) -> None:
+        """Drop the cache entry of the last run, e.g. after its output failed validation."""
+        if self.result_cache is not None and self.last_cache_key:
+            self.result_cache.invalidate(key=self.last_cache_key)
+    
     def get_last_output_file(self) -> Optional[str]:
-        """Get the path to the last generated output file."""
+        """Get the path to the output file of the last run of the calling thread."""
+        record = self.get_execution(self.last_execution_id)
+        if record is not None:
+            return record.output_file
         return self.manager.output_file
     
     def get_last_performance_stats(self) -> Optional[CrewPerformanceMonitor]:
-        """Get performance statistics from the last execution."""
+        """Get performance statistics from the last execution of the calling thread."""
         return self.last_monitor
 
     def get_last_execution_id(self) -> Optional[str]:
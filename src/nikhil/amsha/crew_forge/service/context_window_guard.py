@@ -0,0 +1,232 @@
+"""
+Context-window pre-flight check for crews.
+
+Before a built crew is kicked off, the prompt of every task (agent role, goal
+and backstory, task description and expected output, with the inputs
+interpolated) is estimated locally and compared with the configured context
+window of the task's LLM, leaving room for the completion. Oversized prompts
+are rejected, trimmed or moved to a bigger-context model before any LLM call
+is made, instead of failing after a slow provider round-trip or being
+silently truncated by the provider.
+"""
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from amsha.common.logger import get_logger
+from amsha.crew_forge.exceptions import ContextWindowExceededException
+from amsha.llm_factory.service.llm_context_window import TokenEstimator, context_window_of, get_token_estimator
+
+if TYPE_CHECKING:
+    from crewai import Crew
+
+_logger = get_logger("crew_forge.context_guard")
+
+TRIM_MARKER = "\n[... truncated to fit the context window]"
+
+
+class TaskPromptEstimate(NamedTuple):
+    """Estimated size of the prompt of one task against the context window of its LLM."""
+    task_index: int
+    agent_role: str
+    prompt_tokens: int
+    completion_tokens: int
+    context_window: Optional[int]
+    placeholders: Tuple[str, ...]
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def fits(self) -> bool:
+        return self.context_window is None or self.total_tokens <= self.context_window
+
+
+class ContextCheckResult(NamedTuple):
+    """Inputs to kick the crew off with, and the LLM it was routed to, if any."""
+    inputs: Dict[str, Any]
+    llm: Any
+    model_name: Optional[str]
+    estimates: List[TaskPromptEstimate]
+
+
+class ContextWindowGuard:
+    """
+    Estimates the task prompts of a crew and enforces the context windows of their LLMs.
+
+    Only LLMs built from a model entry with `context_window` are checked. An
+    oversized prompt is handled by the configured action: `reject` raises
+    ContextWindowExceededException, `trim` shortens the largest string inputs
+    of the task until it fits, and `route` rebuilds the crew's agents on the
+    LLM returned by `route_llm` (a model with a larger window). Trimming and
+    routing fall back to rejecting when they cannot make the prompt fit.
+    """
+
+    ACTIONS = ("reject", "trim", "route")
+
+    def __init__(self, action: str = "reject", overhead_tokens: int = 400, completion_reserve_tokens: int = 1024,
+                 estimator: Optional[TokenEstimator] = None,
+                 route_llm: Optional[Callable[[], Tuple[Any, str, Any]]] = None):
+        """
+        Args:
+            action: What to do with an oversized prompt: reject, trim or route
+            overhead_tokens: Tokens added per task for the system prompt and formatting CrewAI wraps around it
+            completion_reserve_tokens: Tokens kept free for the answer when the LLM sets no max_completion_tokens
+            estimator: Token estimator (the process-wide one by default)
+            route_llm: Builds the bigger-context LLM for `route`, returning (llm, model_name, output_config)
+        """
+        if action not in self.ACTIONS:
+            raise ValueError(f"Context guard action must be one of {self.ACTIONS}, got '{action}'")
+        self.action = action
+        self.overhead_tokens = overhead_tokens
+        self.completion_reserve_tokens = completion_reserve_tokens
+        self.estimator = estimator or get_token_estimator()
+        self.route_llm = route_llm
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]],
+                    route_llm: Optional[Callable[[], Tuple[Any, str, Any]]] = None) -> Optional["ContextWindowGuard"]:
+        """Creates a guard from a `context_guard` config block, or None when disabled."""
+        if not isinstance(config, dict) or not config.get("enabled", False):
+            return None
+        return cls(
+            action=config.get("action", "reject"),
+            overhead_tokens=config.get("overhead_tokens", 400),
+            completion_reserve_tokens=config.get("completion_reserve_tokens", 1024),
+            route_llm=route_llm
+        )
+
+    def _completion_tokens(self, llm: Any) -> int:
+        for name in ("max_completion_tokens", "max_tokens"):
+            value = getattr(llm, name, None)
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                return value
+        return self.completion_reserve_tokens
+
+    def estimate(self, crew: "Crew", inputs: Optional[Dict[str, Any]],
+                 llm: Any = None) -> List[TaskPromptEstimate]:
+        """
+        Estimates the prompt of every task of a crew.
+
+        Args:
+            crew: Built crew whose agent and task templates are not interpolated yet
+            inputs: Inputs the crew will be kicked off with
+            llm: Estimate against this LLM instead of the agents' own
+        """
+        input_tokens: Dict[str, int] = {}
+        estimates = []
+        for index, task in enumerate(getattr(crew, "tasks", None) or []):
+            agent = getattr(task, "agent", None)
+            if agent is None:
+                continue
+            task_llm = llm if llm is not None else getattr(agent, "llm", None)
+            templates = [
+                getattr(agent, "role", None), getattr(agent, "goal", None), getattr(agent, "backstory", None),
+                getattr(task, "description", None), getattr(task, "expected_output", None)
+            ]
+            templates = [template for template in templates if isinstance(template, str)]
+            prompt_tokens = self.overhead_tokens + sum(
+                self.estimator.estimate(template, inputs, input_tokens) for template in templates
+            )
+            # Repeated placeholders are kept: each occurrence interpolates the input again
+            placeholders = tuple(
+                name for template in templates for name in self.estimator.analyse(template)[1]
+            )
+            estimates.append(TaskPromptEstimate(
+                index, str(getattr(agent, "role", "")), prompt_tokens,
+                self._completion_tokens(task_llm), context_window_of(task_llm), placeholders
+            ))
+        return estimates
+
+    def apply(self, crew_name: str, crew: "Crew", inputs: Optional[Dict[str, Any]]) -> ContextCheckResult:
+        """
+        Checks a crew before kickoff and applies the configured action to oversized prompts.
+
+        Returns:
+            The inputs to kick off with and, when routed, the LLM and model name now used
+
+        Raises:
+            ContextWindowExceededException: If a prompt does not fit and cannot be made to fit
+        """
+        inputs = dict(inputs or {})
+        estimates = self.estimate(crew, inputs)
+        oversized = [estimate for estimate in estimates if not estimate.fits]
+        if not oversized:
+            return ContextCheckResult(inputs, None, None, estimates)
+
+        largest = max(oversized, key=lambda estimate: estimate.total_tokens)
+        _logger.warning("Crew prompt exceeds the context window", extra={
+            "crew_name": crew_name,
+            "task_index": largest.task_index,
+            "agent_role": largest.agent_role,
+            "estimated_tokens": largest.total_tokens,
+            "context_window": largest.context_window,
+            "action": self.action
+        })
+        if self.action == "trim":
+            return self._trim(crew_name, crew, inputs, estimates)
+        if self.action == "route":
+            return self._route(crew_name, crew, inputs, largest)
+        raise self._exceeded(crew_name, largest)
+
+    def _trim(self, crew_name: str, crew: "Crew", inputs: Dict[str, Any],
+              estimates: List[TaskPromptEstimate]) -> ContextCheckResult:
+        """Shortens the largest string input of each oversized task until every task fits."""
+        # Every round removes at least the overflow of one task, so this terminates quickly
+        for _ in range(4 * max(len(estimates), 1)):
+            oversized = [estimate for estimate in estimates if not estimate.fits]
+            if not oversized:
+                break
+            estimate = max(oversized, key=lambda e: e.total_tokens)
+            trimmable = [name for name in dict.fromkeys(estimate.placeholders)
+                         if isinstance(inputs.get(name), str) and not inputs[name].endswith(TRIM_MARKER)]
+            if not trimmable:
+                raise self._exceeded(crew_name, estimate)
+            name = max(trimmable, key=lambda key: len(inputs[key]))
+            value = inputs[name]
+            value_tokens = self.estimator.count(value)
+            overflow = estimate.total_tokens - estimate.context_window
+            # Repeated placeholders count the value once per occurrence
+            occurrences = max(estimate.placeholders.count(name), 1)
+            keep = max(value_tokens - math.ceil(overflow / occurrences), 0) / max(value_tokens, 1)
+            inputs[name] = value[:max(int(len(value) * keep) - len(TRIM_MARKER), 0)] + TRIM_MARKER
+            _logger.info("Crew input trimmed to fit the context window", extra={
+                "crew_name": crew_name,
+                "input_key": name,
+                "original_characters": len(value),
+                "trimmed_characters": len(inputs[name])
+            })
+            estimates = self.estimate(crew, inputs)
+        else:
+            oversized = [estimate for estimate in estimates if not estimate.fits]
+            if oversized:
+                raise self._exceeded(crew_name, oversized[0])
+        return ContextCheckResult(inputs, None, None, estimates)
+
+    def _route(self, crew_name: str, crew: "Crew", inputs: Dict[str, Any],
+               largest: TaskPromptEstimate) -> ContextCheckResult:
+        """Moves every agent of the crew to the bigger-context LLM if the prompts fit there."""
+        if self.route_llm is None:
+            raise self._exceeded(crew_name, largest)
+        llm, model_name = self.route_llm()[:2]
+        estimates = self.estimate(crew, inputs, llm=llm)
+        oversized = [estimate for estimate in estimates if not estimate.fits]
+        if oversized:
+            raise self._exceeded(crew_name, max(oversized, key=lambda estimate: estimate.total_tokens))
+        for agent in getattr(crew, "agents", None) or []:
+            agent.llm = llm
+        _logger.info("Crew routed to a bigger-context model", extra={
+            "crew_name": crew_name,
+            "model_name": model_name,
+            "context_window": context_window_of(llm)
+        })
+        return ContextCheckResult(inputs, llm, model_name, estimates)
+
+    @staticmethod
+    def _exceeded(crew_name: str, estimate: TaskPromptEstimate) -> ContextWindowExceededException:
+        return ContextWindowExceededException(
+            f"Prompt of task {estimate.task_index} ({estimate.agent_role}) does not fit the context window",
+            crew_name=crew_name,
+            estimated_tokens=estimate.total_tokens,
+            context_window=estimate.context_window
+        )
@@ -83,18 +83,22 @@ class CrewBuilderService:
         self._tasks.append(task)
         return self
 
-    def build(self, process: Process = Process.sequential,knowledge_sources=None) -> Crew:
+    def build(self, process: Process = Process.sequential,knowledge_sources=None,
+              stream: Optional[bool] = None) -> Crew:
         if not self._agents or not self._tasks:
             raise ValueError("A crew must have at least one agent and one task.")
 
-        # CrewAI 1.8.0: stream=True causes immediate return with streaming output object
-        # Remove it to allow normal execution
+        # CrewAI 1.8.0: stream=True causes immediate return with streaming output object.
+        # By default the crew streams only if its LLM was built streaming, which the LLM
+        # factory decides from the model's capabilities (interactive vs batch use)
+        if stream is None:
+            stream = getattr(self.llm, "stream", True) is not False
         crew= Crew(
             agents=self._agents,
             tasks=self._tasks,
             process=process,
             verbose=True,
-            stream=True
+            stream=stream
         )
         if knowledge_sources:
             crew.knowledge_sources = knowledge_sources
@@ -0,0 +1,223 @@
+"""
+Crew-level result memoisation for orchestrators.
+
+Stores the CrewOutput and output file path of a successful crew run under a key
+derived from the crew blueprint, model configuration and inputs, so identical
+re-runs against unchanged configuration can skip execution entirely.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, NamedTuple, Optional
+
+from amsha.common.logger import get_logger
+
+if TYPE_CHECKING:
+    from crewai.crews.crew_output import CrewOutput
+
+_logger = get_logger("crew_forge.result_cache")
+
+# LLM attributes that influence crew output
+_LLM_FINGERPRINT_ATTRS = (
+    "model", "base_url", "api_version", "temperature", "top_p",
+    "max_completion_tokens", "max_tokens", "presence_penalty", "frequency_penalty", "stop",
+)
+_TASK_OUTPUT_FIELDS = {"description", "name", "expected_output", "summary", "raw", "json_dict", "agent", "output_format"}
+
+
+def _digest(payload: Any) -> str:
+    canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CachedCrewResult(NamedTuple):
+    result: "CrewOutput"
+    output_file: Optional[str]
+    created_at: float
+
+
+class CrewResultCache:
+    """
+    Directory-backed store of crew results, one JSON document per cache key.
+    """
+
+    def __init__(self, directory: str = ".Amsha/cache/crew", max_age_hours: Optional[float] = None):
+        """
+        Args:
+            directory: Folder holding the cached results
+            max_age_hours: Optional age after which entries are ignored and removed
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_hours * 3600 if max_age_hours else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["CrewResultCache"]:
+        """Creates a cache from a `crew_result_cache` config block, or None when disabled."""
+        if not isinstance(config, dict) or not config.get("enabled", False):
+            return None
+        return cls(
+            directory=config.get("directory", ".Amsha/cache/crew"),
+            max_age_hours=config.get("max_age_hours")
+        )
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def fingerprint(payload: Any) -> str:
+        """Returns a stable SHA-256 digest of a JSON-serialisable payload."""
+        return _digest(payload)
+
+    @staticmethod
+    def fingerprint_files(paths: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Hashes file contents; missing files are recorded as None so they still affect the key."""
+        hashes = {}
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    hashes[str(path)] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                hashes[str(path)] = None
+        return hashes
+
+    @staticmethod
+    def fingerprint_llm(llm: Any) -> str:
+        """Fingerprints the model configuration of an LLM instance."""
+        return _digest({name: getattr(llm, name, None) for name in _LLM_FINGERPRINT_ATTRS})
+
+    @staticmethod
+    def fingerprint_inputs(inputs: Optional[Dict[str, Any]]) -> str:
+        return _digest(inputs or {})
+
+    @staticmethod
+    def build_key(crew_fingerprint: str, model_fingerprint: str, inputs: Optional[Dict[str, Any]],
+                  variant: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Builds the cache key for a crew run.
+
+        Args:
+            crew_fingerprint: Fingerprint of the crew blueprint (definition and YAML files)
+            model_fingerprint: Fingerprint of the model configuration
+            inputs: Crew inputs
+            variant: Other options that change the output (filename suffix, output schema)
+        """
+        return _digest({
+            "crew": crew_fingerprint,
+            "model": model_fingerprint,
+            "inputs": CrewResultCache.fingerprint_inputs(inputs),
+            "variant": variant or {},
+        })
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CachedCrewResult]:
+        """
+        Returns the cached result, or None on a miss.
+
+        Entries whose output file no longer exists are treated as misses.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        expired = self.max_age_seconds and time.time() - entry["created_at"] > self.max_age_seconds
+        output_file = entry.get("output_file")
+        if expired or (output_file and not os.path.exists(output_file)):
+            self._remove(path)
+            return None
+
+        from crewai.crews.crew_output import CrewOutput
+
+        result = CrewOutput(
+            raw=entry["raw"],
+            json_dict=entry.get("json_dict"),
+            token_usage=entry.get("token_usage") or {},
+            tasks_output=entry.get("tasks_output") or []
+        )
+        return CachedCrewResult(result=result, output_file=output_file, created_at=entry["created_at"])
+
+    def put(self, key: str, crew_name: str, result: Any, output_file: Optional[str]) -> None:
+        """Stores a crew result; results that are neither CrewOutput nor str are skipped."""
+        from crewai.crews.crew_output import CrewOutput
+
+        if isinstance(result, CrewOutput):
+            entry = {
+                "raw": result.raw,
+                "json_dict": result.json_dict,
+                "token_usage": result.token_usage.model_dump() if result.token_usage else {},
+                "tasks_output": [
+                    task.model_dump(include=_TASK_OUTPUT_FIELDS, mode="json") for task in result.tasks_output
+                ],
+            }
+        elif isinstance(result, str):
+            entry = {"raw": result}
+        else:
+            return
+
+        entry.update({"crew_name": crew_name, "output_file": output_file, "created_at": time.time()})
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+
+        _logger.debug("Crew result cached", extra={
+            "crew_name": crew_name,
+            "cache_key": key[:12],
+            "output_file": output_file
+        })
+
+    def invalidate(self, crew_name: Optional[str] = None, key: Optional[str] = None) -> int:
+        """
+        Removes cached results.
+
+        Args:
+            crew_name: Remove every entry for this crew
+            key: Remove a single entry
+            (with neither argument, the whole cache is cleared)
+
+        Returns:
+            Number of removed entries
+        """
+        if key:
+            return self._remove(self._entry_path(key))
+
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            if crew_name:
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        if json.load(f).get("crew_name") != crew_name:
+                            continue
+                except (OSError, json.JSONDecodeError):
+                    pass
+            removed += self._remove(path)
+
+        _logger.info("Crew result cache invalidated", extra={
+            "crew_name": crew_name,
+            "removed_entries": removed
+        })
+        return removed
+
+    def _remove(self, path: Path) -> int:
+        with self._lock:
+            try:
+                path.unlink()
+                return 1
+            except FileNotFoundError:
+                return 0
@@ -0,0 +1,296 @@
+"""
+Retry engine for crew executions.
+
+Retries transient execution errors with exponential backoff and jitter and
+retries outputs rejected by a validator. After the first attempt the crew built
+for it is copied instead of rebuilt, and in repair mode only its last task is
+re-run with the validator error and the rejected output in its context.
+"""
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from crewai import Crew, Task
+from crewai.tasks.task_output import TaskOutput
+
+from amsha.common.logger import get_logger
+from amsha.crew_forge.domain.models.crew_retry_policy import CrewRetryPolicy
+from amsha.execution_runtime.domain.execution_handle import ExecutionHandle
+from amsha.execution_runtime.domain.execution_mode import ExecutionMode
+from amsha.execution_state.domain.enums import ExecutionStatus
+
+# Validators receive (result, output_file) and return a bool or a (bool, error message) tuple
+CrewOutputValidator = Callable[[Any, Optional[str]], Union[bool, Tuple[bool, Optional[str]]]]
+
+_DEFAULT_VALIDATION_ERROR = "The output failed validation."
+
+_REPAIR_FEEDBACK = (
+    "Your previous answer to this task failed validation.\n"
+    "Validation error: {error}\n\n"
+    "Previous answer:\n{previous_output}\n\n"
+    "Produce a complete, corrected answer that fixes the validation error."
+)
+
+
+class CrewRetryEngine:
+    """
+    Runs a crew through an orchestrator according to a CrewRetryPolicy.
+
+    The orchestrator must provide run_crew, run_prepared_crew, last_crew and the
+    last-execution getters of BaseCrewOrchestrator.
+    """
+
+    def __init__(self, orchestrator: Any, policy: CrewRetryPolicy, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            orchestrator: Orchestrator used to execute the attempts
+            policy: Retry policy to apply
+            sleep: Function used to wait between attempts
+        """
+        self.logger = get_logger("crew_forge.retry")
+        self.orchestrator = orchestrator
+        self.policy = policy
+        self._sleep = sleep
+        self.attempts: List[Dict[str, Any]] = []
+
+    def run(
+        self,
+        crew_name: str,
+        inputs: Dict[str, Any],
+        filename_suffix: Optional[str] = None,
+        output_json: Any = None,
+        validator: Optional[CrewOutputValidator] = None,
+        mode: ExecutionMode = ExecutionMode.INTERACTIVE
+    ) -> Union[Any, ExecutionHandle]:
+        """
+        Execute a crew, retrying according to the policy.
+
+        In BACKGROUND mode the whole retry loop runs on the orchestrator's runtime;
+        the returned handle exposes the attempt history as `handle.attempts`.
+
+        Args:
+            crew_name: Name of the crew to execute
+            inputs: Input parameters for the crew
+            filename_suffix: Optional suffix for output files of the first attempt
+            output_json: Optional output schema passed to the crew manager
+            validator: Optional output validator
+            mode: Execution mode (INTERACTIVE or BACKGROUND)
+
+        Returns:
+            The last result (INTERACTIVE) or an ExecutionHandle (BACKGROUND)
+
+        Raises:
+            Exception: The last execution error, if it was not retryable or retries are exhausted
+        """
+        self.attempts = []
+        if mode == ExecutionMode.BACKGROUND:
+            handle = self.orchestrator.runtime.submit(
+                self._run_attempts, crew_name, inputs, filename_suffix, output_json, validator,
+                mode=ExecutionMode.BACKGROUND
+            )
+            handle.attempts = self.attempts
+            return handle
+        return self._run_attempts(crew_name, inputs, filename_suffix, output_json, validator)
+
+    def _run_attempts(
+        self,
+        crew_name: str,
+        inputs: Dict[str, Any],
+        filename_suffix: Optional[str],
+        output_json: Any,
+        validator: Optional[CrewOutputValidator]
+    ) -> Any:
+        total_attempts = self.policy.max_retries + 1
+        base_crew: Optional[Crew] = None
+        base_output_file: Optional[str] = None
+        context_tasks: List[Task] = []
+        validation_error: Optional[str] = None
+        result = None
+
+        for attempt in range(1, total_attempts + 1):
+            self.logger.info("Crew execution attempt", extra={
+                "crew_name": crew_name,
+                "attempt": attempt,
+                "max_attempts": total_attempts
+            })
+            record: Dict[str, Any] = {"attempt": attempt}
+            self.attempts.append(record)
+
+            try:
+                if base_crew is None:
+                    record["strategy"] = "build"
+                    suffix = filename_suffix if attempt == 1 else f"{filename_suffix or crew_name}_retry_{attempt - 1}"
+                    result = self.orchestrator.run_crew(
+                        crew_name=crew_name,
+                        inputs=inputs,
+                        filename_suffix=suffix,
+                        mode=ExecutionMode.INTERACTIVE,
+                        output_json=output_json
+                    )
+                else:
+                    output_file = self.retry_output_file(base_output_file, attempt - 1)
+                    retry_crew = self.prepare_retry_crew(base_crew, output_file)
+                    repair = bool(validation_error and self.policy.repair_last_task and retry_crew.tasks)
+                    if repair:
+                        record["strategy"] = "repair"
+                        retry_crew = self.prepare_repair_crew(retry_crew, context_tasks, result, validation_error)
+                    else:
+                        record["strategy"] = "rerun"
+                    result = self.orchestrator.run_prepared_crew(
+                        crew_name, retry_crew, inputs, output_file, mode=ExecutionMode.INTERACTIVE
+                    )
+                    if not repair:
+                        context_tasks = [task for task in retry_crew.tasks[:-1] if task.output is not None]
+            except Exception as e:
+                record.update({"outcome": "error", "error": str(e)})
+                retryable = self.policy.is_retryable(e)
+                if not retryable or attempt == total_attempts:
+                    self.logger.error("Crew execution failed, not retrying", extra={
+                        "crew_name": crew_name,
+                        "attempt": attempt,
+                        "retryable": retryable,
+                        "error_type": type(e).__name__
+                    })
+                    raise
+                delay = self.policy.backoff_delay(attempt)
+                record["delay_seconds"] = round(delay, 3)
+                self.logger.warning("Transient crew execution error, retrying after backoff", extra={
+                    "crew_name": crew_name,
+                    "attempt": attempt,
+                    "delay_seconds": round(delay, 3),
+                    "error_type": type(e).__name__
+                })
+                self._sleep(delay)
+                validation_error = None
+                continue
+            finally:
+                record["execution_id"] = self.orchestrator.get_last_execution_id()
+                if base_crew is None and isinstance(self.orchestrator.last_crew, Crew):
+                    base_crew = self.orchestrator.last_crew
+                    base_output_file = self.orchestrator.get_last_output_file()
+                    context_tasks = [task for task in base_crew.tasks[:-1] if task.output is not None]
+
+            output_file = self.orchestrator.get_last_output_file()
+            record["output_file"] = output_file
+            if validator is None:
+                record["outcome"] = "success"
+                return result
+
+            valid, validation_error = self._validate(validator, result, output_file)
+            if valid:
+                record["outcome"] = "success"
+                self.logger.info("Crew validation successful", extra={
+                    "crew_name": crew_name,
+                    "attempt": attempt,
+                    "output_file": output_file
+                })
+                return result
+
+            record.update({"outcome": "validation_failed", "error": validation_error})
+            self._record_validation_failure(crew_name, attempt, record["execution_id"], validation_error)
+
+        self.logger.error("Max retries reached, execution failed", extra={
+            "crew_name": crew_name,
+            "attempts": total_attempts
+        })
+        return result
+
+    @staticmethod
+    def _validate(validator: CrewOutputValidator, result: Any, output_file: Optional[str]) -> Tuple[bool, Optional[str]]:
+        outcome = validator(result, output_file)
+        if isinstance(outcome, tuple):
+            valid, message = outcome
+        else:
+            valid, message = bool(outcome), None
+        return bool(valid), None if valid else (message or _DEFAULT_VALIDATION_ERROR)
+
+    def _record_validation_failure(self, crew_name: str, attempt: int, execution_id: Optional[str],
+                                   validation_error: str) -> None:
+        self.logger.warning("Crew validation failed", extra={
+            "crew_name": crew_name,
+            "attempt": attempt,
+            "validation_error": validation_error
+        })
+        self.orchestrator.discard_last_cached_result()
+        if execution_id:
+            self.orchestrator.state_manager.update_status(
+                execution_id,
+                ExecutionStatus.FAILED,
+                metadata={"reason": "Validation failed", "attempt": attempt, "validation_error": validation_error}
+            )
+
+    @staticmethod
+    def retry_output_file(output_file: Optional[str], retry_number: int) -> Optional[str]:
+        """Derives the output file of a retry so earlier outputs are kept for inspection."""
+        if not output_file:
+            return None
+        root, extension = os.path.splitext(output_file)
+        return f"{root}_retry_{retry_number}{extension}"
+
+    @staticmethod
+    def prepare_retry_crew(crew: Crew, output_file: Optional[str] = None) -> Crew:
+        """
+        Copy a built crew for another kickoff.
+
+        Kickoff interpolates inputs into agents and tasks in place, so the copy gets
+        the original templates back and is interpolated again on its own kickoff.
+
+        Args:
+            crew: Crew built (and possibly kicked off) for an earlier attempt
+            output_file: Output file for the last task of the copy
+
+        Returns:
+            Fresh Crew instance sharing the LLM and knowledge sources of the original
+        """
+        retry_crew = crew.copy()
+        for copied, original in zip(retry_crew.agents, crew.agents):
+            for field in ("role", "goal", "backstory"):
+                template = getattr(original, f"_original_{field}", None)
+                if template:
+                    setattr(copied, field, template)
+        for copied, original in zip(retry_crew.tasks, crew.tasks):
+            for field in ("description", "expected_output"):
+                template = getattr(original, f"_original_{field}", None)
+                if template:
+                    setattr(copied, field, template)
+        if output_file and retry_crew.tasks:
+            retry_crew.tasks[-1].output_file = output_file
+        return retry_crew
+
+    @staticmethod
+    def prepare_repair_crew(retry_crew: Crew, context_tasks: List[Task], previous_result: Any,
+                            validation_error: str) -> Crew:
+        """
+        Reduce a retry crew to its last task, with the rejected answer and validator error as context.
+
+        Outputs of the earlier tasks are passed as context instead of being produced again.
+
+        Args:
+            retry_crew: Crew prepared by prepare_retry_crew
+            context_tasks: Completed earlier tasks whose outputs the last task depends on
+            previous_result: The rejected crew result
+            validation_error: Error reported by the validator
+
+        Returns:
+            Single-task Crew
+        """
+        task = retry_crew.tasks[-1]
+        previous_output = getattr(previous_result, "raw", previous_result)
+        feedback_task = Task(
+            description="Output validation feedback",
+            expected_output="Validation feedback for the previous answer",
+            output=TaskOutput(
+                description="Output validation feedback",
+                agent="validator",
+                raw=_REPAIR_FEEDBACK.format(error=validation_error, previous_output=previous_output)
+            )
+        )
+        task.context = [*context_tasks, feedback_task]
+        return Crew(
+            agents=[task.agent],
+            tasks=[task],
+            process=retry_crew.process,
+            verbose=retry_crew.verbose,
+            stream=retry_crew.stream,
+            knowledge_sources=retry_crew.knowledge_sources
+        )
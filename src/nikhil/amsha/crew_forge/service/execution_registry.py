@@ -0,0 +1,111 @@
+"""
+Per-execution bookkeeping for orchestrators.
+
+Every crew execution gets an ExecutionRecord holding its monitor, output file
+and built crew, so concurrent runs of one orchestrator never report each
+other's metrics or files.
+"""
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from amsha.common.logger import get_logger
+from amsha.crew_monitor.service.crew_performance_monitor import CrewPerformanceMonitor
+
+if TYPE_CHECKING:
+    from crewai import Crew
+
+_logger = get_logger("crew_forge.execution_registry")
+
+
+class ExecutionRecord:
+    """
+    What one crew execution produced, keyed by its execution state id.
+
+    Attributes:
+        execution_id: Id of the execution state
+        crew_name: Name of the executed crew
+        crew: Crew instance that was kicked off, None for cached results or failed builds
+        output_file: Output file written by the crew, if any
+        cache_key: Result cache key of the execution, if results are memoised
+        monitor: Performance monitor of the kickoff, set once the kickoff starts
+        model_name: Model the crew was built with
+        llm: LLM the crew was built with
+        llm_config_version: Version of the LLM config the crew was built with, None if not versioned
+        finished: Whether the execution has completed or failed
+    """
+
+    def __init__(self, execution_id: str, crew_name: str):
+        self.execution_id = execution_id
+        self.crew_name = crew_name
+        self.crew: Optional["Crew"] = None
+        self.output_file: Optional[str] = None
+        self.cache_key: Optional[str] = None
+        self.monitor: Optional[CrewPerformanceMonitor] = None
+        self.model_name: Optional[str] = None
+        self.llm: Any = None
+        self.llm_config_version: Optional[int] = None
+        self.finished = False
+
+    def __repr__(self) -> str:
+        return (f"ExecutionRecord(execution_id={self.execution_id!r}, crew_name={self.crew_name!r}, "
+                f"output_file={self.output_file!r}, finished={self.finished})")
+
+
+class ExecutionRegistry:
+    """
+    Bounded, thread-safe map of execution ids to their records.
+
+    When full, the oldest finished execution is evicted first; running
+    executions are only evicted if every held record is still running.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Number of execution records kept
+        """
+        if max_entries < 1:
+            raise ValueError("Execution registry must hold at least one record")
+        self.max_entries = max_entries
+        self._records: "OrderedDict[str, ExecutionRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def __contains__(self, execution_id: str) -> bool:
+        with self._lock:
+            return execution_id in self._records
+
+    def register(self, execution_id: str, crew_name: str) -> ExecutionRecord:
+        """Creates the record of a new execution, evicting old records beyond max_entries."""
+        record = ExecutionRecord(execution_id, crew_name)
+        with self._lock:
+            self._records[execution_id] = record
+            while len(self._records) > self.max_entries:
+                evicted = next(
+                    (key for key, held in self._records.items() if held.finished),
+                    next(iter(self._records))
+                )
+                del self._records[evicted]
+                _logger.debug("Execution record evicted", extra={"execution_id": evicted})
+        return record
+
+    def get(self, execution_id: Optional[str]) -> Optional[ExecutionRecord]:
+        """Returns the record of an execution, or None if unknown or evicted."""
+        if execution_id is None:
+            return None
+        with self._lock:
+            return self._records.get(execution_id)
+
+    def records(self) -> List[ExecutionRecord]:
+        """Returns the held records, oldest first."""
+        with self._lock:
+            return list(self._records.values())
+
+    def running(self) -> List[ExecutionRecord]:
+        """Returns the records of executions that have not finished yet."""
+        return [record for record in self.records() if not record.finished]
+
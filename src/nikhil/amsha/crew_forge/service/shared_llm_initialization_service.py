@@ -1,12 +1,23 @@
 """
 Shared LLM initialization utilities for all application implementations.
+
+Parsed LLM settings and built LLM instances are cached per process, so
+constructing many applications against one llm_config.yaml parses the file
+once and shares one LLM per use case, model and override set. Editing the
+file (a new mtime or size) invalidates its entries.
 """
+import hashlib
+import json
+import threading
 from pathlib import Path
-from typing import Any, Tuple, Optional, TYPE_CHECKING
-from amsha.llm_factory.dependency.llm_container import LLMContainer
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
+import yaml
 from amsha.llm_factory.domain.model.llm_type import LLMType
+from amsha.llm_factory.domain.model.llm_model_metadata import LLMModelMetadata
+from amsha.llm_factory.settings.llm_settings import LLMSettings
 
 if TYPE_CHECKING:
+    from amsha.llm_factory.settings.llm_settings_source import VersionedLLMSettings
     from amsha.llm_factory.domain.model.llm_model_config import LLMModelConfig
     from amsha.llm_factory.domain.model.llm_parameters import LLMParameters
     from amsha.llm_factory.domain.model.llm_output_config import LLMOutputConfig
@@ -18,23 +29,69 @@ from amsha.crew_forge.exceptions import (
     wrap_external_exception
 )
 from amsha.common.logger import get_logger, MetricsLogger
+from amsha.common.tracing import current_span, traced
+
+# (resolved config path, mtime_ns, size) -> validated LLMSettings
+_settings_cache: Dict[Tuple[str, int, int], Any] = {}
+# settings key + (use case, model key, override fingerprint) -> (llm_instance, model_name, output_config)
+_llm_cache: Dict[Tuple, Tuple[Any, str, Optional["LLMOutputConfig"]]] = {}
+_build_locks: Dict[Tuple, threading.Lock] = {}
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _override_fingerprint(model_config: Optional["LLMModelConfig"],
+                          llm_params: Optional["LLMParameters"]) -> Optional[str]:
+    """Digest of the override models, None when no override is given."""
+    if model_config is None and llm_params is None:
+        return None
+    payload = [override.model_dump(mode="json") if override is not None else None
+               for override in (model_config, llm_params)]
+    canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _evict_stale(settings_key: Tuple[str, int, int]) -> None:
+    """
+    Drops the entries of earlier versions of a config file; call with _cache_lock held.
+
+    A build lock is only dropped while nobody holds it, so a caller still building
+    an earlier version keeps the lock its waiters share.
+    """
+    path = settings_key[0]
+    for cache in (_settings_cache, _llm_cache):
+        for key in [key for key in cache if key[0] == path and key[1:3] != settings_key[1:3]]:
+            del cache[key]
+    for key in [key for key, lock in _build_locks.items()
+                if key[0] == path and key[1:3] != settings_key[1:3] and not lock.locked()]:
+        del _build_locks[key]
 
 
 class SharedLLMInitializationService:
     """Shared LLM initialization logic for all application implementations."""
     
     @staticmethod
+    @traced("llm.initialize")
     def initialize_llm(llm_config_path: str, llm_type: LLMType,
                        model_config: Optional["LLMModelConfig"] = None,
-                       llm_params: Optional["LLMParameters"] = None) -> Tuple[Any, str, Optional["LLMOutputConfig"]]:
+                       llm_params: Optional["LLMParameters"] = None,
+                       model_key: Optional[str] = None,
+                       use_cache: bool = True) -> Tuple[Any, str, Optional["LLMOutputConfig"]]:
         """
         Initialize LLM instance using the LLM factory with consistent patterns.
         
+        Repeated calls with the same config file version, use case, model key
+        and overrides return the same LLM instance. Like the LLM of one
+        application, which every crew it builds shares, the cached instance is
+        used by concurrent crews of all applications in the process.
+        
         Args:
             llm_config_path: Path to the LLM configuration file (used as fallback or for container init)
             llm_type: Type of LLM to build (CREATIVE or EVALUATION)
             model_config: Optional specific model configuration to use
             llm_params: Optional specific LLM parameters to use
+            model_key: Optional model of the use case to build instead of its default
+            use_cache: Set to False to parse the config and build a new LLM regardless of the cache
             
         Returns:
             Tuple of (llm_instance, model_name, output_config)
@@ -43,7 +100,6 @@ class SharedLLMInitializationService:
             CrewConfigurationException: If LLM configuration is invalid or file not found
         """
         logger = get_logger("llm_factory.initialization")
-        metrics_logger = MetricsLogger(logger)
         
         logger.info("LLM initialization requested", extra={
             "llm_type": llm_type.value,
@@ -70,65 +126,41 @@ class SharedLLMInitializationService:
                     config_details=f"LLM config file does not exist: {llm_config_path}"
                 )
             
-            # Set up the DI container for the LLM
-            llm_container = LLMContainer()
-            llm_container.config.llm.yaml_path.from_value(str(config_path))
-            
-            # Build the LLM based on type
-            llm_builder = llm_container.llm_builder()
-            
-            if llm_type == LLMType.CREATIVE:
-                logger.debug("Building CREATIVE LLM instance", extra={
-                    "llm_type": "CREATIVE"
-                })
-                build_llm = llm_builder.build_creative(
-                    model_config_override=model_config,
-                    params_override=llm_params
+            stat = config_path.stat()
+            settings_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            if not use_cache:
+                built, _ = SharedLLMInitializationService._build_llm(
+                    config_path, llm_type, model_config, llm_params, model_key, None
                 )
-            elif llm_type == LLMType.EVALUATION:
-                logger.debug("Building EVALUATION LLM instance", extra={
-                    "llm_type": "EVALUATION"
-                })
-                build_llm = llm_builder.build_evaluation(
-                    model_config_override=model_config,
-                    params_override=llm_params
-                )
-            else:
-                raise CrewConfigurationException(
-                    message=ErrorMessageBuilder.configuration_error(
-                        "LLM", 
-                        f"invalid LLM type: {llm_type}. Must be CREATIVE or EVALUATION"
-                    ),
-                    config_details=f"Received LLM type: {llm_type}"
-                )
-            
-            provider = build_llm.provider
-            model_name = provider.model_name
-            # CrewAI 1.8.0 expects LLM wrapper instances, not the raw provider
-            llm_instance = provider.get_raw_llm()
-            
-            # Get output_config from model_config for custom aliases/folder organization
-            output_config = model_config.output_config if model_config else None
+                return built
             
-            # Log successful initialization with configuration details
-            llm_config_dict = {
-                "llm_type": llm_type.value,  # CREATIVE or EVALUATION
-                "model": model_config.model if model_config else "from_config",
-                "temperature": llm_params.temperature if llm_params else "from_config",
-                "top_p": llm_params.top_p if llm_params else "from_config",
-                "max_tokens": llm_params.max_completion_tokens if llm_params else "from_config",
-                "has_base_url": bool(model_config.base_url) if model_config else False,
-            }
+            llm_key = settings_key + (llm_type.value, model_key, _override_fingerprint(model_config, llm_params))
+            with _cache_lock:
+                build_lock = _build_locks.setdefault(llm_key, threading.Lock())
+            # One build per key; concurrent callers of the same key wait for it and share the result
+            with build_lock:
+                with _cache_lock:
+                    cached = _llm_cache.get(llm_key)
+                    settings = _settings_cache.get(settings_key)
+                    _cache_stats["hits" if cached else "misses"] += 1
+                if cached is None:
+                    cached, settings = SharedLLMInitializationService._build_llm(
+                        config_path, llm_type, model_config, llm_params, model_key, settings
+                    )
+                    with _cache_lock:
+                        _evict_stale(settings_key)
+                        _settings_cache[settings_key] = settings
+                        _llm_cache[llm_key] = cached
+                    current_span().set_attributes(cache_hit=False)
+                    return cached
             
-            metrics_logger.log_llm_config(model_name, llm_config_dict)
-            
-            logger.info("LLM initialized successfully", extra={
+            model_name = cached[1]
+            current_span().set_attributes(llm_type=llm_type.value, model_name=model_name, cache_hit=True)
+            logger.debug("LLM served from the initialization cache", extra={
                 "model_name": model_name,
-                "llm_type": llm_type.value,
-                "has_output_config": output_config is not None
+                "llm_type": llm_type.value
             })
-            
-            return llm_instance, model_name, output_config
+            return cached
             
         except CrewConfigurationException:
             # Re-raise crew_forge exceptions as-is
@@ -138,13 +170,209 @@ class SharedLLMInitializationService:
             raise wrap_external_exception(e, context, CrewConfigurationException)
     
     @staticmethod
-    def get_model_name_from_config(llm_config_path: str, llm_type: LLMType) -> str:
+    @traced("llm.initialize")
+    def initialize_llm_from_settings(settings: "VersionedLLMSettings", llm_type: LLMType,
+                                     model_config: Optional["LLMModelConfig"] = None,
+                                     llm_params: Optional["LLMParameters"] = None,
+                                     model_key: Optional[str] = None) -> Tuple[Any, str, Optional["LLMOutputConfig"]]:
+        """
+        Builds an LLM from an already validated settings snapshot, bypassing the cache.
+        
+        The config file is not read again, so the LLM matches the snapshot's
+        version even if the file changed or is being rewritten meanwhile.
+        
+        Returns:
+            Tuple of (llm_instance, model_name, output_config)
+            
+        Raises:
+            CrewConfigurationException: If the LLM cannot be built from the settings
+        """
+        context = ErrorContext("SharedLLMInitializationService", "initialize_llm_from_settings")
+        context.add_context("llm_config_path", settings.path)
+        context.add_context("llm_type", llm_type.value)
+        context.add_context("version", settings.version)
+        try:
+            built, _ = SharedLLMInitializationService._build_llm(
+                Path(settings.path), llm_type, model_config, llm_params, model_key, settings.settings
+            )
+            return built
+        except CrewConfigurationException:
+            raise
+        except Exception as e:
+            raise wrap_external_exception(e, context, CrewConfigurationException)
+    
+    @staticmethod
+    def _build_llm(config_path: Path, llm_type: LLMType,
+                   model_config: Optional["LLMModelConfig"], llm_params: Optional["LLMParameters"],
+                   model_key: Optional[str], settings: Any) -> Tuple[Tuple[Any, str, Optional["LLMOutputConfig"]], Any]:
+        """Builds the LLM through a new container, reusing already parsed settings if given."""
+        # The container imports the builder and crewai; metadata lookups never get here
+        from dependency_injector import providers
+        from amsha.llm_factory.dependency.llm_container import LLMContainer
+        
+        logger = get_logger("llm_factory.initialization")
+        metrics_logger = MetricsLogger(logger)
+        
+        # Set up the DI container for the LLM
+        llm_container = LLMContainer()
+        llm_container.config.llm.yaml_path.from_value(str(config_path))
+        if settings is not None:
+            llm_container.llm_settings.override(providers.Object(settings))
+        
+        # Build the LLM based on type
+        llm_builder = llm_container.llm_builder()
+        
+        if llm_type == LLMType.CREATIVE:
+            logger.debug("Building CREATIVE LLM instance", extra={
+                "llm_type": "CREATIVE"
+            })
+            build_llm = llm_builder.build_creative(
+                model_key=model_key,
+                model_config_override=model_config,
+                params_override=llm_params
+            )
+        elif llm_type == LLMType.EVALUATION:
+            logger.debug("Building EVALUATION LLM instance", extra={
+                "llm_type": "EVALUATION"
+            })
+            build_llm = llm_builder.build_evaluation(
+                model_key=model_key,
+                model_config_override=model_config,
+                params_override=llm_params
+            )
+        else:
+            raise CrewConfigurationException(
+                message=ErrorMessageBuilder.configuration_error(
+                    "LLM", 
+                    f"invalid LLM type: {llm_type}. Must be CREATIVE or EVALUATION"
+                ),
+                config_details=f"Received LLM type: {llm_type}"
+            )
+        
+        provider = build_llm.provider
+        model_name = provider.model_name
+        # CrewAI 1.8.0 expects LLM wrapper instances, not the raw provider
+        llm_instance = provider.get_raw_llm()
+        
+        # Get output_config from model_config for custom aliases/folder organization
+        output_config = model_config.output_config if model_config else None
+        
+        # Log successful initialization with configuration details
+        llm_config_dict = {
+            "llm_type": llm_type.value,  # CREATIVE or EVALUATION
+            "model": model_config.model if model_config else "from_config",
+            "temperature": llm_params.temperature if llm_params else "from_config",
+            "top_p": llm_params.top_p if llm_params else "from_config",
+            "max_tokens": llm_params.max_completion_tokens if llm_params else "from_config",
+            "has_base_url": bool(model_config.base_url) if model_config else False,
+        }
+        
+        metrics_logger.log_llm_config(model_name, llm_config_dict)
+        current_span().set_attributes(llm_type=llm_type.value, model_name=model_name)
+        
+        logger.info("LLM initialized successfully", extra={
+            "model_name": model_name,
+            "llm_type": llm_type.value,
+            "has_output_config": output_config is not None
+        })
+        
+        return (llm_instance, model_name, output_config), llm_container.llm_settings()
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drops every cached settings object and LLM instance; the next initialization parses and builds anew."""
+        with _cache_lock:
+            _settings_cache.clear()
+            _llm_cache.clear()
+            for key in [key for key, lock in _build_locks.items() if not lock.locked()]:
+                del _build_locks[key]
+            _cache_stats.update(hits=0, misses=0)
+    
+    @staticmethod
+    def get_cache_stats() -> Dict[str, int]:
+        """Returns the hits and misses of the initialization cache and the number of cached entries."""
+        with _cache_lock:
+            return dict(_cache_stats, settings=len(_settings_cache), llms=len(_llm_cache))
+    
+    @staticmethod
+    def load_settings(llm_config_path: str) -> LLMSettings:
+        """
+        Returns the parsed settings of an LLM config file from the initialization cache.
+        
+        Only the file is parsed and validated; no LLM is built and telemetry is
+        left alone. The parsed settings are cached like those of `initialize_llm`,
+        so a later initialization of the same file version reuses them.
+        
+        Raises:
+            CrewConfigurationException: If the file is not found or is not a valid LLM configuration
+        """
+        context = ErrorContext("SharedLLMInitializationService", "load_settings")
+        context.add_context("llm_config_path", llm_config_path)
+        config_path = Path(llm_config_path)
+        if not config_path.exists():
+            raise CrewConfigurationException(
+                message=ErrorMessageBuilder.configuration_error(
+                    "LLM",
+                    "configuration file not found",
+                    llm_config_path
+                ),
+                config_details=f"LLM config file does not exist: {llm_config_path}"
+            )
+        
+        stat = config_path.stat()
+        settings_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with _cache_lock:
+            settings = _settings_cache.get(settings_key)
+        if isinstance(settings, LLMSettings):
+            return settings
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                settings = LLMSettings(**(yaml.safe_load(f) or {}))
+        except Exception as e:
+            raise wrap_external_exception(e, context, CrewConfigurationException)
+        with _cache_lock:
+            _evict_stale(settings_key)
+            _settings_cache[settings_key] = settings
+        return settings
+    
+    @staticmethod
+    def get_model_metadata(llm_config_path: str, llm_type: Optional[LLMType] = None,
+                           model_key: Optional[str] = None) -> List[LLMModelMetadata]:
+        """
+        Returns the names, aliases, output folders and capabilities of configured models without building them.
+        
+        Args:
+            llm_config_path: Path to the LLM configuration file
+            llm_type: Only list the models of this use case (all use cases by default)
+            model_key: Only return this model of the use case
+            
+        Raises:
+            CrewConfigurationException: If the configuration is invalid or the use case or model is unknown
+        """
+        settings = SharedLLMInitializationService.load_settings(llm_config_path)
+        try:
+            if model_key is not None and llm_type is not None:
+                return [settings.get_model_metadata(llm_type.value, model_key)]
+            return settings.list_model_metadata(llm_type.value if llm_type is not None else None)
+        except ValueError as e:
+            raise CrewConfigurationException(
+                message=ErrorMessageBuilder.configuration_error("LLM", str(e), llm_config_path),
+                config_details=str(e)
+            )
+    
+    @staticmethod
+    def get_model_name_from_config(llm_config_path: str, llm_type: LLMType,
+                                   model_key: Optional[str] = None) -> str:
         """
         Get model name without fully initializing the LLM (for lightweight operations).
         
+        The name is the one `initialize_llm` reports for the same use case and
+        model key, resolved from the cached settings alone.
+        
         Args:
             llm_config_path: Path to the LLM configuration file
             llm_type: Type of LLM to check (CREATIVE or EVALUATION)
+            model_key: Optional model of the use case instead of its default
             
         Returns:
             Model name string
@@ -152,8 +380,11 @@ class SharedLLMInitializationService:
         Raises:
             CrewConfigurationException: If LLM configuration is invalid or file not found
         """
-        # For now, we'll use the full initialization since the LLM factory
-        # doesn't provide a lightweight way to get just the model name
-        # This could be optimized in the future if needed
-        _, model_name = SharedLLMInitializationService.initialize_llm(llm_config_path, llm_type)
-        return model_name
\ No newline at end of file
+        settings = SharedLLMInitializationService.load_settings(llm_config_path)
+        try:
+            return settings.get_model_name(llm_type.value, model_key)
+        except ValueError as e:
+            raise CrewConfigurationException(
+                message=ErrorMessageBuilder.configuration_error("LLM", str(e), llm_config_path),
+                config_details=str(e)
+            )
@@ -1,7 +1,5 @@
 # analyzer.py
 import os
-
-import pandas as pd
 from typing import Dict, Any
 
 from amsha.utils.json_utils import JsonUtils
@@ -83,6 +81,8 @@ class ContributionAnalyzer:
             processed_data: Dict[str, Any], output_filename: str, feature_list_key: str
     ):
         """Saves the key information to an XLSX file."""
+        import pandas as pd
+
         try:
             features_list = processed_data.get(feature_list_key, [])
             if not features_list:
@@ -0,0 +1,349 @@
+import functools
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from amsha.common.logger import get_logger
+
+# Rough characters-per-token ratio used to estimate the size of individual LLM calls
+_CHARS_PER_TOKEN = 4
+
+# Upper bound on the LLM calls listed individually in a breakdown
+MAX_LISTED_LLM_CALLS = 200
+
+_logger = get_logger("crew_monitor.breakdown")
+
+# Task id -> breakdown of the execution the task belongs to
+_breakdowns_by_task: Dict[str, "CrewEventBreakdown"] = {}
+_registry_lock = threading.Lock()
+_handlers_registered = False
+
+
+def _estimate_tokens(payload: Any) -> int:
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload) // _CHARS_PER_TOKEN
+    if isinstance(payload, dict):
+        return _estimate_tokens(payload.get("content"))
+    if isinstance(payload, (list, tuple)):
+        return sum(_estimate_tokens(item) for item in payload)
+    return _estimate_tokens(str(payload))
+
+
+def _seconds(start: datetime, end: datetime) -> float:
+    return max((end - start).total_seconds(), 0.0)
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def percentile(p: float) -> float:
+        return ordered[min(int(round(p / 100.0 * (len(ordered) - 1))), len(ordered) - 1)]
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": round(percentile(50), 4),
+        "p95": round(percentile(95), 4),
+        "p99": round(percentile(99), 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def _streaming_summary(calls: int, ttfc: List[float], gaps: List[float], chunks: int,
+                       tokens: int, generation_seconds: float) -> Dict[str, Any]:
+    return {
+        "streamed_calls": calls,
+        "chunks": chunks,
+        "time_to_first_chunk_seconds": _distribution(ttfc),
+        "inter_chunk_gap_seconds": _distribution(gaps),
+        "output_tokens_estimated": tokens,
+        "output_tokens_per_second_estimated": round(tokens / generation_seconds, 2) if generation_seconds > 0 else None,
+    }
+
+
+def _task_id(event: Any) -> Optional[str]:
+    if getattr(event, "task_id", None):
+        return event.task_id
+    task = getattr(event, "task", None)
+    return str(task.id) if getattr(task, "id", None) is not None else None
+
+
+def _dispatch(source: Any, event: Any) -> None:
+    task_id = _task_id(event)
+    if task_id is None:
+        return
+    with _registry_lock:
+        breakdown = _breakdowns_by_task.get(task_id)
+    if breakdown is not None:
+        breakdown.handle(event)
+
+
+@functools.lru_cache(maxsize=None)
+def _event_types() -> SimpleNamespace:
+    """Imports the CrewAI event classes on first use; importing crewai takes seconds."""
+    from crewai.events.event_bus import crewai_event_bus
+    from crewai.events.types.agent_events import (
+        AgentExecutionCompletedEvent,
+        AgentExecutionErrorEvent,
+        AgentExecutionStartedEvent,
+    )
+    from crewai.events.types.llm_events import (
+        LLMCallCompletedEvent,
+        LLMCallFailedEvent,
+        LLMCallStartedEvent,
+        LLMStreamChunkEvent,
+    )
+    from crewai.events.types.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+    from crewai.events.types.tool_usage_events import ToolUsageErrorEvent, ToolUsageFinishedEvent
+
+    return SimpleNamespace(**locals())
+
+
+def _register_handlers() -> None:
+    """Subscribes the dispatcher to the CrewAI event bus once per process."""
+    global _handlers_registered
+    with _registry_lock:
+        if _handlers_registered:
+            return
+        events = _event_types()
+        for event_type in (
+            events.TaskStartedEvent, events.TaskCompletedEvent, events.TaskFailedEvent,
+            events.AgentExecutionStartedEvent, events.AgentExecutionCompletedEvent, events.AgentExecutionErrorEvent,
+            events.LLMCallStartedEvent, events.LLMCallCompletedEvent, events.LLMCallFailedEvent, events.LLMStreamChunkEvent,
+            events.ToolUsageFinishedEvent, events.ToolUsageErrorEvent,
+        ):
+            events.crewai_event_bus.on(event_type)(_dispatch)
+        _handlers_registered = True
+
+
+class CrewEventBreakdown:
+    """
+    Per-task, per-agent and per-LLM-call timing of one crew execution, built from CrewAI events.
+
+    Events are attributed through the ids of the crew's tasks, so concurrent
+    executions of different crew instances in one process do not mix. Durations
+    come from the event timestamps, which are taken when CrewAI emits the events;
+    event handlers themselves run later on CrewAI's thread pool. Token counts per
+    call are estimated from the message and response sizes, since CrewAI events
+    carry no usage; the crew-wide totals of the monitor remain the exact figures.
+
+    Stream chunk events give the streaming latency of every streamed call: time
+    from the call start to its first chunk, the gaps between chunks and the
+    output rate from the first chunk to the end of the call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Condition()
+        self._task_ids: List[str] = []
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._agent_runs: Dict[str, Dict[str, List[datetime]]] = {}
+        self._llm_starts: Dict[str, List[Any]] = {}
+        self._llm_ends: Dict[str, List[Any]] = {}
+        self._tool_calls: Dict[str, List[Dict[str, Any]]] = {}
+        # Task id -> (timestamp, characters) of every stream chunk
+        self._chunks: Dict[str, List[Tuple[datetime, int]]] = {}
+        self._pending = 0
+
+    def attach(self, crew: Any) -> "CrewEventBreakdown":
+        """Starts collecting the events of the tasks of a crew."""
+        _register_handlers()
+        self._task_ids = [str(task.id) for task in getattr(crew, "tasks", [])]
+        with _registry_lock:
+            for task_id in self._task_ids:
+                _breakdowns_by_task[task_id] = self
+        return self
+
+    def detach(self, timeout: float = 1.0) -> None:
+        """
+        Stops collecting events.
+
+        Waits up to `timeout` seconds for handlers of events already emitted, i.e.
+        until every started task and LLM call has been seen to finish.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while self._pending > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    _logger.debug("Crew event breakdown detached with events pending", extra={
+                        "pending": self._pending
+                    })
+                    break
+                self._lock.wait(remaining)
+        with _registry_lock:
+            for task_id in self._task_ids:
+                if _breakdowns_by_task.get(task_id) is self:
+                    del _breakdowns_by_task[task_id]
+
+    def _task(self, task_id: str, event: Any) -> Dict[str, Any]:
+        task = self._tasks.get(task_id)
+        if task is None:
+            task = self._tasks[task_id] = {"task_name": None, "agent_role": None, "started": None,
+                                           "finished": None, "status": "running"}
+        task["task_name"] = task["task_name"] or getattr(event, "task_name", None)
+        task["agent_role"] = task["agent_role"] or getattr(event, "agent_role", None)
+        return task
+
+    def handle(self, event: Any) -> None:
+        """Records one CrewAI event of a tracked task."""
+        events = _event_types()
+        task_id = _task_id(event)
+        if isinstance(event, events.LLMStreamChunkEvent):
+            # Chunk handlers run inline with the LLM call, so they only append
+            with self._lock:
+                self._chunks.setdefault(task_id, []).append((event.timestamp, len(event.chunk or "")))
+            return
+        with self._lock:
+            task = self._task(task_id, event)
+            if isinstance(event, events.TaskStartedEvent):
+                task["started"] = event.timestamp
+                task_obj = getattr(event, "task", None)
+                task["task_name"] = getattr(task_obj, "name", None) or task["task_name"]
+                task["agent_role"] = getattr(getattr(task_obj, "agent", None), "role", None) or task["agent_role"]
+                self._pending += 1
+            elif isinstance(event, (events.TaskCompletedEvent, events.TaskFailedEvent)):
+                task["finished"] = event.timestamp
+                task["status"] = "completed" if isinstance(event, events.TaskCompletedEvent) else "failed"
+                self._pending -= 1
+            elif isinstance(event, events.AgentExecutionStartedEvent):
+                self._agent_runs.setdefault(task_id, {"starts": [], "ends": []})["starts"].append(event.timestamp)
+                task["agent_role"] = getattr(event.agent, "role", None) or task["agent_role"]
+            elif isinstance(event, (events.AgentExecutionCompletedEvent, events.AgentExecutionErrorEvent)):
+                self._agent_runs.setdefault(task_id, {"starts": [], "ends": []})["ends"].append(event.timestamp)
+            elif isinstance(event, events.LLMCallStartedEvent):
+                self._llm_starts.setdefault(task_id, []).append(event)
+                self._pending += 1
+            elif isinstance(event, (events.LLMCallCompletedEvent, events.LLMCallFailedEvent)):
+                self._llm_ends.setdefault(task_id, []).append(event)
+                self._pending -= 1
+            elif isinstance(event, (events.ToolUsageFinishedEvent, events.ToolUsageErrorEvent)):
+                started = getattr(event, "started_at", None)
+                finished = getattr(event, "finished_at", None)
+                self._tool_calls.setdefault(task_id, []).append({
+                    "tool_name": event.tool_name,
+                    "seconds": _seconds(started, finished) if started and finished else 0.0,
+                    "status": "completed" if isinstance(event, events.ToolUsageFinishedEvent) else "failed",
+                })
+            self._lock.notify_all()
+
+    def _paired_calls(self, task_id: str) -> List[Tuple[Any, Any, List[Tuple[datetime, int]]]]:
+        """Pairs the start and end events of the LLM calls of a task with the chunks streamed in between."""
+        # Calls of one task are sequential, so starts and ends pair up in timestamp order
+        starts = sorted(self._llm_starts.get(task_id, []), key=lambda e: e.timestamp)
+        ends = sorted(self._llm_ends.get(task_id, []), key=lambda e: e.timestamp)
+        chunks = sorted(self._chunks.get(task_id, []))
+        paired = []
+        for start, end in zip(starts, ends):
+            paired.append((start, end, [chunk for chunk in chunks if start.timestamp <= chunk[0] <= end.timestamp]))
+        return paired
+
+    def _llm_calls(self, task_id: str, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        events = _event_types()
+        calls = []
+        for start, end, chunks in self._paired_calls(task_id):
+            calls.append({
+                "task_name": task["task_name"],
+                "agent_role": task["agent_role"],
+                "model": getattr(start, "model", None),
+                "seconds": round(_seconds(start.timestamp, end.timestamp), 4),
+                "status": "completed" if isinstance(end, events.LLMCallCompletedEvent) else "failed",
+                "prompt_tokens_estimated": _estimate_tokens(start.messages),
+                "completion_tokens_estimated": _estimate_tokens(getattr(end, "response", None)),
+                "chunks": len(chunks),
+                "time_to_first_chunk_seconds": round(_seconds(start.timestamp, chunks[0][0]), 4) if chunks else None,
+            })
+        return calls
+
+    def get_breakdown(self) -> Dict[str, Any]:
+        """
+        Returns the nested breakdown: tasks in execution order, agents aggregated over
+        their tasks and the individual LLM calls (capped at MAX_LISTED_LLM_CALLS).
+        """
+        with self._lock:
+            ordered = sorted(
+                (item for item in self._tasks.items() if item[1]["started"] is not None),
+                key=lambda item: item[1]["started"]
+            )
+            tasks, agents, all_calls = [], {}, []
+            for task_id, task in ordered:
+                calls = self._llm_calls(task_id, task)
+                tools = self._tool_calls.get(task_id, [])
+                runs = self._agent_runs.get(task_id, {"starts": [], "ends": []})
+                agent_seconds = sum(_seconds(start, end) for start, end in zip(sorted(runs["starts"]), sorted(runs["ends"])))
+                entry = {
+                    "task_name": task["task_name"],
+                    "agent_role": task["agent_role"],
+                    "status": task["status"],
+                    "seconds": round(_seconds(task["started"], task["finished"]), 4) if task["finished"] else None,
+                    "agent_seconds": round(agent_seconds, 4),
+                    "llm_calls": len(calls),
+                    "llm_seconds": round(sum(call["seconds"] for call in calls), 4),
+                    "tool_calls": len(tools),
+                    "tool_seconds": round(sum(tool["seconds"] for tool in tools), 4),
+                    "prompt_tokens_estimated": sum(call["prompt_tokens_estimated"] for call in calls),
+                    "completion_tokens_estimated": sum(call["completion_tokens_estimated"] for call in calls),
+                }
+                tasks.append(entry)
+                all_calls.extend(calls)
+
+                agent = agents.setdefault(entry["agent_role"], {
+                    "agent_role": entry["agent_role"], "tasks": 0, "seconds": 0.0, "llm_calls": 0,
+                    "llm_seconds": 0.0, "tool_calls": 0, "tool_seconds": 0.0,
+                    "prompt_tokens_estimated": 0, "completion_tokens_estimated": 0,
+                })
+                agent["tasks"] += 1
+                agent["seconds"] = round(agent["seconds"] + entry["agent_seconds"], 4)
+                for key in ("llm_calls", "tool_calls", "prompt_tokens_estimated", "completion_tokens_estimated"):
+                    agent[key] += entry[key]
+                for key in ("llm_seconds", "tool_seconds"):
+                    agent[key] = round(agent[key] + entry[key], 4)
+
+        return {
+            "tasks": tasks,
+            "agents": list(agents.values()),
+            "llm_calls": all_calls[:MAX_LISTED_LLM_CALLS],
+            "llm_calls_truncated": len(all_calls) > MAX_LISTED_LLM_CALLS,
+        }
+
+    def get_streaming_metrics(self) -> Dict[str, Any]:
+        """
+        Returns time to first chunk, inter-chunk gap distribution, chunk count and
+        estimated output tokens per second over all streamed LLM calls, overall and
+        per model. Calls that streamed no chunks are left out.
+        """
+        per_model: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for task_id in self._tasks:
+                for start, end, chunks in self._paired_calls(task_id):
+                    if not chunks:
+                        continue
+                    model = per_model.setdefault(getattr(start, "model", None) or "unknown", {
+                        "calls": 0, "ttfc": [], "gaps": [], "chunks": 0, "tokens": 0, "generation_seconds": 0.0
+                    })
+                    model["calls"] += 1
+                    model["ttfc"].append(_seconds(start.timestamp, chunks[0][0]))
+                    model["gaps"].extend(_seconds(a[0], b[0]) for a, b in zip(chunks, chunks[1:]))
+                    model["chunks"] += len(chunks)
+                    model["tokens"] += sum(size for _, size in chunks) // _CHARS_PER_TOKEN
+                    model["generation_seconds"] += _seconds(chunks[0][0], end.timestamp)
+
+        if not per_model:
+            return {}
+        overall = _streaming_summary(
+            sum(m["calls"] for m in per_model.values()),
+            [value for m in per_model.values() for value in m["ttfc"]],
+            [value for m in per_model.values() for value in m["gaps"]],
+            sum(m["chunks"] for m in per_model.values()),
+            sum(m["tokens"] for m in per_model.values()),
+            sum(m["generation_seconds"] for m in per_model.values()),
+        )
+        overall["models"] = {
+            name: _streaming_summary(m["calls"], m["ttfc"], m["gaps"], m["chunks"], m["tokens"], m["generation_seconds"])
+            for name, m in per_model.items()
+        }
+        return overall
@@ -0,0 +1,95 @@
+import threading
+from typing import Any, Dict, Optional
+
+from amsha.crew_monitor.service.metrics_registry import MetricsRegistry
+
+_LLM_CALL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+_FIRST_CHUNK_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+_TOKEN_BUCKETS = (100, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000)
+
+
+class CrewMetrics:
+    """
+    Crew and LLM metrics aggregated in a MetricsRegistry, labelled by crew, model and status.
+
+    Fed by the orchestrator once per execution from the metrics of its
+    CrewPerformanceMonitor, so latency and token burn can be aggregated and
+    alerted on from the OpenMetrics exposition instead of parsing log lines.
+    """
+
+    _shared: Optional["CrewMetrics"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """
+        Args:
+            registry: Registry holding the metrics (the process-wide one when omitted)
+        """
+        self.registry = registry or MetricsRegistry.shared()
+        labels = ("crew", "model", "status")
+        self.executions = self.registry.counter(
+            "amsha_crew_executions", "Crew executions by outcome", labels)
+        self.execution_duration = self.registry.histogram(
+            "amsha_crew_execution_duration_seconds", "Wall-clock duration of crew executions", labels)
+        self.execution_tokens = self.registry.histogram(
+            "amsha_crew_execution_tokens", "Total LLM tokens used per crew execution", labels,
+            buckets=_TOKEN_BUCKETS)
+        self.tokens = self.registry.counter(
+            "amsha_llm_tokens", "LLM tokens used by crew executions", ("crew", "model", "kind"))
+        self.in_progress = self.registry.gauge(
+            "amsha_crew_executions_in_progress", "Crew executions currently running", ("crew", "model"))
+        self.llm_call_duration = self.registry.histogram(
+            "amsha_llm_call_duration_seconds", "Duration of individual LLM calls", labels,
+            buckets=_LLM_CALL_BUCKETS)
+        self.time_to_first_chunk = self.registry.histogram(
+            "amsha_llm_time_to_first_chunk_seconds", "Time from the start of a streamed LLM call to its first chunk",
+            ("crew", "model"), buckets=_FIRST_CHUNK_BUCKETS)
+        self.peak_rss = self.registry.gauge(
+            "amsha_process_peak_rss_bytes", "Peak resident set size during the last execution of a crew",
+            ("crew", "model"))
+
+    @classmethod
+    def shared(cls) -> "CrewMetrics":
+        """Returns the crew metrics of the process-wide registry."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def execution_started(self, crew_name: str, model: Optional[str]) -> None:
+        self.in_progress.inc(crew=crew_name, model=model)
+
+    def execution_finished(self, crew_name: str, model: Optional[str], status: str, duration: float,
+                           metrics: Optional[Dict[str, Any]] = None, running: bool = True) -> None:
+        """
+        Records the outcome of an execution.
+
+        Args:
+            crew_name: Name of the crew
+            model: Model name of the crew's LLM
+            status: Outcome label, e.g. "completed", "failed" or "cached"
+            duration: Execution duration in seconds
+            metrics: `CrewPerformanceMonitor.get_metrics()` of the execution, if monitored
+            running: Whether execution_started was called for this execution
+        """
+        if running:
+            self.in_progress.dec(crew=crew_name, model=model)
+        self.executions.inc(crew=crew_name, model=model, status=status)
+        self.execution_duration.observe(duration, crew=crew_name, model=model, status=status)
+        if not metrics:
+            return
+
+        general = metrics.get("general", {})
+        self.execution_tokens.observe(general.get("total_tokens", 0), crew=crew_name, model=model, status=status)
+        for kind in ("prompt", "completion"):
+            self.tokens.inc(general.get(f"{kind}_tokens", 0), crew=crew_name, model=model, kind=kind)
+
+        for call in (metrics.get("breakdown") or {}).get("llm_calls", []):
+            call_model = call.get("model") or model
+            self.llm_call_duration.observe(call["seconds"], crew=crew_name, model=call_model, status=call["status"])
+            if call.get("time_to_first_chunk_seconds") is not None:
+                self.time_to_first_chunk.observe(call["time_to_first_chunk_seconds"], crew=crew_name, model=call_model)
+
+        peak_rss_mb = (metrics.get("resources") or {}).get("rss_mb", {}).get("peak")
+        if peak_rss_mb is not None:
+            self.peak_rss.set(round(peak_rss_mb * 1024 * 1024), crew=crew_name, model=model)
@@ -1,7 +1,8 @@
 import time
-import psutil
 from typing import Any, Dict, Optional
 from amsha.common.logger import get_logger
+from amsha.crew_monitor.service.crew_event_breakdown import CrewEventBreakdown
+from amsha.crew_monitor.service.resource_sampler import ResourceSampler
 
 try:
     import pynvml
@@ -10,9 +11,20 @@ except ImportError:
     GPU_AVAILABLE = False
 
 class CrewPerformanceMonitor:
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, sample_interval_seconds: Optional[float] = 0.5,
+                 sample_capacity: int = 1024):
+        """
+        Args:
+            model_name: Name of the model used by the execution
+            sample_interval_seconds: Seconds between background resource samples (None disables sampling)
+            sample_capacity: Number of resource samples kept for percentiles
+        """
         self.logger = get_logger("crew_monitor.performance")
         self.model_name = model_name
+        self.sample_interval_seconds = sample_interval_seconds
+        self.sample_capacity = sample_capacity
+        self.resource_sampler: Optional[ResourceSampler] = None
+        self.event_breakdown: Optional[CrewEventBreakdown] = None
         self.total_tokens = 0
         self.prompt_tokens = 0
         self.completion_tokens = 0
@@ -26,13 +38,23 @@ class CrewPerformanceMonitor:
         # GPU stats
         self.gpu_stats = {}
 
+    def track_crew(self, crew: Any):
+        """Collects the per-task, per-agent and per-LLM-call breakdown of a crew from CrewAI events."""
+        self.event_breakdown = CrewEventBreakdown().attach(crew)
+
     def start_monitoring(self):
         """Starts the monitoring of time and resources."""
+        import psutil
+
         self.start_time = time.time()
         # Get initial CPU and memory usage
         self.start_cpu_percent = psutil.cpu_percent(interval=None) 
         self.start_memory_usage = psutil.virtual_memory().used
         
+        if self.sample_interval_seconds:
+            self.resource_sampler = ResourceSampler(self.sample_interval_seconds, self.sample_capacity)
+            self.resource_sampler.start()
+        
         if GPU_AVAILABLE:
             try:
                 pynvml.nvmlInit()
@@ -48,10 +70,17 @@ class CrewPerformanceMonitor:
 
     def stop_monitoring(self):
         """Stops the monitoring of time and resources."""
+        import psutil
+
         self.end_time = time.time()
         self.end_cpu_percent = psutil.cpu_percent(interval=None)
         self.end_memory_usage = psutil.virtual_memory().used
         
+        if self.resource_sampler is not None:
+            self.resource_sampler.stop()
+        if self.event_breakdown is not None:
+            self.event_breakdown.detach()
+        
         if GPU_AVAILABLE:
             try:
                 device_count = pynvml.nvmlDeviceGetCount()
@@ -113,7 +142,10 @@ class CrewPerformanceMonitor:
                 "memory_usage_start_bytes": self.start_memory_usage,
                 "memory_usage_end_bytes": self.end_memory_usage,
             },
-            "gpu": {}
+            "gpu": {},
+            "resources": self.resource_sampler.get_metrics() if self.resource_sampler else {},
+            "breakdown": self.event_breakdown.get_breakdown() if self.event_breakdown else {},
+            "streaming": self.event_breakdown.get_streaming_metrics() if self.event_breakdown else {}
         }
 
         if GPU_AVAILABLE and self.gpu_stats:
@@ -150,6 +182,29 @@ class CrewPerformanceMonitor:
 
         model_info = f"Model: {gen['model_name']}\n" if gen['model_name'] else ""
 
+        resources = metrics["resources"]
+        resource_summary = ""
+        if resources:
+            resource_summary = (
+                f"\nProcess Resources ({resources['samples']} samples):\n"
+                f"  - RSS: peak {resources['rss_mb']['peak']} MB, mean {resources['rss_mb']['mean']} MB\n"
+                f"  - CPU: mean {resources['cpu_percent']['mean']}%, p95 {resources['cpu_percent']['p95']}%, "
+                f"{resources['cpu_time_seconds']} s CPU time\n"
+                f"  - Threads: peak {int(resources['threads']['peak'])}, "
+                f"Open FDs: peak {int(resources['open_fds']['peak'])}\n"
+            )
+
+        streaming = metrics["streaming"]
+        streaming_summary = ""
+        if streaming:
+            ttfc = streaming["time_to_first_chunk_seconds"]
+            tokens_per_second = streaming["output_tokens_per_second_estimated"]
+            streaming_summary = (
+                f"\nStreaming ({streaming['streamed_calls']} calls, {streaming['chunks']} chunks):\n"
+                f"  - Time to First Chunk: p50 {ttfc['p50']} s, p95 {ttfc['p95']} s\n"
+                f"  - Output Rate: ~{tokens_per_second if tokens_per_second is not None else 'n/a'} tokens/s\n"
+            )
+
         summary = (
             f"\n--- Execution Performance Summary ---\n"
             f"{model_info}"
@@ -159,6 +214,8 @@ class CrewPerformanceMonitor:
             f"Time Taken: {gen['duration_seconds']:.2f} seconds\n"
             f"CPU Usage: {gen['cpu_usage_end_percent']}% (End)\n"
             f"Memory Usage Change: {gen['memory_usage_change_mb']} MB"
+            f"{resource_summary}"
+            f"{streaming_summary}"
             f"{gpu_summary}"
             f"-------------------------------------\n"
         )
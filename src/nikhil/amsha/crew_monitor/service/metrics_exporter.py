@@ -0,0 +1,171 @@
+import atexit
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from amsha.common.logger import get_logger
+from amsha.crew_monitor.service.metrics_registry import MetricsRegistry
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_logger = get_logger("crew_monitor.metrics_exporter")
+
+# (host, port, file path) -> running exporter, so applications sharing settings share one exporter
+_running: Dict[Tuple[Optional[str], Optional[int], Optional[str]], "MetricsExporter"] = {}
+_running_lock = threading.Lock()
+
+
+class MetricsExporter:
+    """
+    Exposes a MetricsRegistry as OpenMetrics text over a local HTTP endpoint,
+    a periodically rewritten file, or both.
+
+    The HTTP server answers GET requests on `/metrics` (and `/`) from a daemon
+    thread. The file is replaced atomically every `interval_seconds` and once more
+    on stop, so scrapers such as node_exporter's textfile collector never read a
+    partial exposition.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, port: Optional[int] = None,
+                 host: str = "127.0.0.1", file_path: Optional[str] = None, interval_seconds: float = 15.0):
+        """
+        Args:
+            registry: Registry to expose (the process-wide one when omitted)
+            port: Port of the HTTP endpoint, 0 for any free port, None to disable it
+            host: Interface the HTTP endpoint binds to
+            file_path: File the exposition is written to, None to disable it
+            interval_seconds: Seconds between file writes
+        """
+        if port is None and not file_path:
+            raise ValueError("Metrics exporter needs a port, a file path or both")
+        if interval_seconds <= 0:
+            raise ValueError("Metrics file interval must be positive")
+        self.registry = registry or MetricsRegistry.shared()
+        self.host = host
+        self.port = port
+        self.file_path = file_path
+        self.interval_seconds = interval_seconds
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._threads = []
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]],
+                    registry: Optional[MetricsRegistry] = None) -> Optional["MetricsExporter"]:
+        """Creates an exporter from a `metrics_export` config block, or None when disabled."""
+        if not isinstance(config, dict) or not config.get("enabled", False):
+            return None
+        return cls(
+            registry=registry,
+            port=config.get("http_port"),
+            host=config.get("http_host", "127.0.0.1"),
+            file_path=config.get("file_path"),
+            interval_seconds=config.get("interval_seconds", 15.0)
+        )
+
+    @classmethod
+    def start_from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["MetricsExporter"]:
+        """
+        Starts the exporter of a `metrics_export` config block for the process-wide registry.
+
+        Applications configured with the same endpoint and file share one running
+        exporter, which is stopped when the interpreter exits. Metrics are optional:
+        if the HTTP endpoint cannot be bound (a busy port, for example) the error is
+        logged and only the file is exported, or nothing when no file is configured.
+        """
+        exporter = cls.from_config(config)
+        if exporter is None:
+            return None
+        key = (exporter.host, exporter.port, exporter.file_path)
+        with _running_lock:
+            if key in _running:
+                return _running[key]
+            try:
+                exporter.start()
+            except OSError as e:
+                _logger.error("Metrics endpoint could not be started", extra={
+                    "http_endpoint": f"http://{exporter.host}:{exporter.port}/metrics",
+                    "file_path": exporter.file_path,
+                    "error": str(e)
+                })
+                if not exporter.file_path:
+                    return None
+                exporter.port = None
+                exporter.start()
+            _running[key] = exporter
+        atexit.register(exporter.stop)
+        return exporter
+
+    def start(self) -> "MetricsExporter":
+        """Starts the HTTP endpoint and/or the file writer on daemon threads."""
+        self._stop_event.clear()
+        if self.port is not None:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+            self._spawn(self._server.serve_forever, "amsha-metrics-http")
+        if self.file_path:
+            self._spawn(self._write_periodically, "amsha-metrics-file")
+        _logger.info("Metrics exporter started", extra={
+            "http_endpoint": f"http://{self.host}:{self.port}/metrics" if self._server else None,
+            "file_path": self.file_path
+        })
+        return self
+
+    def stop(self) -> None:
+        """Stops the endpoint and writer; the file receives a final exposition."""
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=self.interval_seconds + 1.0)
+        self._threads = []
+        if self.file_path:
+            self.write_file()
+
+    def write_file(self) -> None:
+        """Atomically replaces the metrics file with the current exposition."""
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.registry.render())
+            os.replace(temp_path, self.file_path)
+        except OSError as e:
+            _logger.warning("Metrics file write failed", extra={"file_path": self.file_path, "error": str(e)})
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _spawn(self, target, name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _write_periodically(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.write_file()
+
+    def _handler(self) -> type:
+        registry = self.registry
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                _logger.debug("Metrics scrape", extra={"client": self.client_address[0], "request": format % args})
+
+        return _MetricsHandler
@@ -0,0 +1,226 @@
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_NAME_PATTERN = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# Seconds; suits crew executions from a cached hit up to long multi-agent runs
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(ABC):
+    """Base of a labelled metric family; every label combination is one time series."""
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        for label in labelnames:
+            if not _LABEL_PATTERN.match(label) or label == "le":
+                raise ValueError(f"Invalid label name for metric {name}: {label}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}")
+        return tuple("" if labels[name] is None else str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        ...
+
+    def render(self) -> str:
+        """Returns the OpenMetrics text of the family."""
+        lines = [f"# TYPE {self.name} {self.TYPE}", f"# HELP {self.name} {_escape(self.documentation)}"]
+        lines.extend(self._samples())
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonically increasing total, exposed as `<name>_total`."""
+
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._series.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            series = sorted(self._series.items())
+        return [f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in series]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    TYPE = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._series.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            series = sorted(self._series.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in series]
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observations over fixed buckets, exposed as cumulative
+    `<name>_bucket` series plus `<name>_count` and `<name>_sum`.
+    """
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(bound) for bound in buckets if not math.isinf(bound))
+        if not bounds:
+            raise ValueError(f"Histogram {name} needs at least one finite bucket")
+        self.buckets = tuple(bounds)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        # Index of the first bucket whose upper bound holds the value; len(buckets) is +Inf
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def snapshot(self, **labels: Any) -> Dict[str, Any]:
+        """Returns the cumulative bucket counts, count and sum of one series."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            if series is None:
+                return {"buckets": {}, "count": 0, "sum": 0.0}
+            counts, total, count = list(series["counts"]), series["sum"], series["count"]
+        cumulative, running = {}, 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            running += bucket_count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "count": count, "sum": total}
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            keys = sorted(self._series)
+        lines = []
+        for key in keys:
+            labels = dict(zip(self.labelnames, key))
+            snapshot = self.snapshot(**labels)
+            for bound, count in snapshot["buckets"].items():
+                lines.append(f"{self.name}_bucket"
+                             f"{_format_labels(self.labelnames, key, ('le', _format_value(bound)))} {count}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {snapshot['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(snapshot['sum'])}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metric families rendered together as one OpenMetrics exposition.
+
+    Families are created on first use and returned on later lookups by name, so
+    every component can declare the metrics it feeds without coordination.
+    """
+
+    _shared: Optional["MetricsRegistry"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "MetricsRegistry":
+        """Returns the process-wide registry."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _get_or_create(self, metric_type: type, name: str, documentation: str,
+                       labelnames: Sequence[str], **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not metric_type or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a {metric.TYPE} "
+                                 f"with labels {list(metric.labelnames)}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Returns the OpenMetrics text exposition of every family, terminated by `# EOF`."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "".join(metric.render() for metric in metrics) + "# EOF\n"
@@ -0,0 +1,298 @@
+"""
+Persistent store of crew execution metrics with run-over-run regression detection.
+
+Every execution's `CrewPerformanceMonitor.get_metrics()` is appended to a local
+SQLite database together with the crew, model and configuration fingerprints,
+so a prompt or config change that quietly doubles token usage shows up when the
+latest runs are compared against the runs before them.
+"""
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from amsha.common.logger import get_logger
+
+_logger = get_logger("crew_monitor.metrics_store")
+
+# Comparable metric columns; higher values are worse for all of them
+_METRIC_COLUMNS = ("duration_seconds", "total_tokens", "prompt_tokens", "completion_tokens", "peak_rss_mb")
+DEFAULT_COMPARED_METRICS = _METRIC_COLUMNS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crew_executions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT,
+    crew_name TEXT NOT NULL,
+    model_name TEXT,
+    crew_fingerprint TEXT,
+    config_fingerprint TEXT,
+    status TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    duration_seconds REAL,
+    total_tokens INTEGER,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    peak_rss_mb REAL,
+    metrics_json TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_crew_executions_crew ON crew_executions (crew_name, model_name, recorded_at);
+"""
+
+
+class MetricComparison(NamedTuple):
+    """Comparison of one metric between the baseline and the recent window."""
+    metric: str
+    baseline_runs: int
+    recent_runs: int
+    baseline_mean: Optional[float]
+    recent_mean: Optional[float]
+    relative_change: Optional[float]
+    p_value: Optional[float]
+    regressed: bool
+    crew_fingerprint_changed: bool
+    config_fingerprint_changed: bool
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction of the regularized incomplete beta function (modified Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 201):
+        m2 = 2 * m
+        for numerator in (m * (b - m) * x / ((a + m2 - 1.0) * (a + m2)),
+                          -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1.0 - x)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _betacf(b, a, 1.0 - x) / b
+
+
+def welch_t_test(baseline: Sequence[float], recent: Sequence[float]) -> Optional[float]:
+    """
+    One-sided Welch's t-test that the recent mean is greater than the baseline mean.
+
+    Returns:
+        The p-value, or None when either sample has fewer than two values
+    """
+    n_base, n_recent = len(baseline), len(recent)
+    if n_base < 2 or n_recent < 2:
+        return None
+    mean_base, mean_recent = sum(baseline) / n_base, sum(recent) / n_recent
+    var_base = sum((value - mean_base) ** 2 for value in baseline) / (n_base - 1)
+    var_recent = sum((value - mean_recent) ** 2 for value in recent) / (n_recent - 1)
+    se_base, se_recent = var_base / n_base, var_recent / n_recent
+    if se_base + se_recent == 0:
+        # Constant samples: any increase is certain, no change is not significant
+        return 0.0 if mean_recent > mean_base else 1.0
+    t = (mean_recent - mean_base) / math.sqrt(se_base + se_recent)
+    dof = (se_base + se_recent) ** 2 / (
+        (se_base ** 2 / (n_base - 1) if se_base else 0.0) + (se_recent ** 2 / (n_recent - 1) if se_recent else 0.0))
+    # Upper tail of Student's t distribution
+    tail = 0.5 * _betainc(dof / 2.0, 0.5, dof / (dof + t * t))
+    return tail if t > 0 else 1.0 - tail
+
+
+class CrewMetricsStore:
+    """
+    SQLite-backed history of crew execution metrics.
+
+    One row per execution holds the headline numbers as columns (duration,
+    tokens, peak memory) for comparisons and the full metrics document as JSON.
+    """
+
+    def __init__(self, path: str = ".Amsha/metrics/crew_metrics.db", check_regressions: bool = False,
+                 comparison: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            path: SQLite database file, created with its folder when missing
+            check_regressions: Whether orchestrators run detect_regressions after recording an execution
+            comparison: Keyword arguments of compare() used by those checks
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.check_regressions = check_regressions
+        self.comparison = comparison or {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["CrewMetricsStore"]:
+        """Creates a store from a `metrics_store` config block, or None when disabled."""
+        if not isinstance(config, dict) or not config.get("enabled", False):
+            return None
+        return cls(
+            path=config.get("path", ".Amsha/metrics/crew_metrics.db"),
+            check_regressions=config.get("check_regressions", False),
+            comparison=config.get("comparison")
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def record(self, crew_name: str, model_name: Optional[str], status: str, duration: float,
+               metrics: Optional[Dict[str, Any]] = None, execution_id: Optional[str] = None,
+               crew_fingerprint: Optional[str] = None, config_fingerprint: Optional[str] = None,
+               recorded_at: Optional[float] = None) -> None:
+        """
+        Appends the metrics of one execution.
+
+        Args:
+            crew_name: Name of the crew
+            model_name: Model name of the crew's LLM
+            status: Outcome of the execution, e.g. "completed" or "failed"
+            duration: Execution duration in seconds
+            metrics: `CrewPerformanceMonitor.get_metrics()` of the execution, if monitored
+            execution_id: Execution state id
+            crew_fingerprint: Fingerprint of the crew definition and its prompt files
+            config_fingerprint: Fingerprint of the model configuration
+            recorded_at: Epoch seconds of the execution (now when omitted)
+        """
+        metrics = metrics or {}
+        general = metrics.get("general", {})
+        peak_rss_mb = (metrics.get("resources") or {}).get("rss_mb", {}).get("peak")
+        if peak_rss_mb is None and general.get("memory_usage_end_bytes") is not None:
+            peak_rss_mb = general["memory_usage_end_bytes"] / (1024 * 1024)
+        row = (
+            execution_id, crew_name, model_name, crew_fingerprint, config_fingerprint, status,
+            recorded_at if recorded_at is not None else time.time(), duration,
+            general.get("total_tokens"), general.get("prompt_tokens"), general.get("completion_tokens"),
+            peak_rss_mb, json.dumps(metrics, default=str) if metrics else None
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO crew_executions (execution_id, crew_name, model_name, crew_fingerprint, "
+                "config_fingerprint, status, recorded_at, duration_seconds, total_tokens, prompt_tokens, "
+                "completion_tokens, peak_rss_mb, metrics_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+
+    def history(self, crew_name: str, model_name: Optional[str] = None, status: Optional[str] = "completed",
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Returns recorded executions of a crew, oldest first.
+
+        Args:
+            crew_name: Name of the crew
+            model_name: Only executions of this model, all models when omitted
+            status: Only executions with this outcome, all outcomes when None
+            limit: Only the latest `limit` executions
+        """
+        query = "SELECT * FROM crew_executions WHERE crew_name = ?"
+        params: List[Any] = [crew_name]
+        if model_name is not None:
+            query += " AND model_name = ?"
+            params.append(model_name)
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY recorded_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        records = []
+        for row in reversed(rows):
+            record = dict(row)
+            record["metrics"] = json.loads(record.pop("metrics_json")) if record["metrics_json"] else {}
+            records.append(record)
+        return records
+
+    def compare(self, crew_name: str, model_name: Optional[str] = None, recent_runs: int = 5,
+                baseline_runs: int = 20, metrics: Sequence[str] = DEFAULT_COMPARED_METRICS,
+                min_relative_change: float = 0.1, max_p_value: float = 0.05) -> List[MetricComparison]:
+        """
+        Compares the latest completed executions of a crew against the ones before them.
+
+        A metric regresses when its recent mean exceeds the baseline mean by at
+        least `min_relative_change` and a one-sided Welch's t-test rejects "no
+        increase" at `max_p_value`. Both windows need two runs with the metric.
+
+        Args:
+            crew_name: Name of the crew
+            model_name: Only executions of this model, all models when omitted
+            recent_runs: Size of the window under test (the latest executions)
+            baseline_runs: Size of the baseline window preceding it
+            metrics: Metric columns to compare
+            min_relative_change: Smallest relative increase reported as a regression
+            max_p_value: Significance level of the t-test
+
+        Returns:
+            One comparison per metric
+        """
+        unknown = set(metrics) - set(_METRIC_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown metrics {sorted(unknown)}, expected some of {list(_METRIC_COLUMNS)}")
+        if recent_runs < 1 or baseline_runs < 1:
+            raise ValueError("Recent and baseline windows need at least one run")
+
+        records = self.history(crew_name, model_name, limit=recent_runs + baseline_runs)
+        recent, baseline = records[-recent_runs:], records[:-recent_runs]
+        crew_changed = bool(baseline) and {r["crew_fingerprint"] for r in recent} != {r["crew_fingerprint"] for r in baseline}
+        config_changed = bool(baseline) and {r["config_fingerprint"] for r in recent} != {r["config_fingerprint"] for r in baseline}
+
+        comparisons = []
+        for metric in metrics:
+            baseline_values = [r[metric] for r in baseline if r[metric] is not None]
+            recent_values = [r[metric] for r in recent if r[metric] is not None]
+            baseline_mean = sum(baseline_values) / len(baseline_values) if baseline_values else None
+            recent_mean = sum(recent_values) / len(recent_values) if recent_values else None
+            relative_change = None
+            if baseline_mean and recent_mean is not None:
+                relative_change = (recent_mean - baseline_mean) / baseline_mean
+            p_value = welch_t_test(baseline_values, recent_values)
+            regressed = (p_value is not None and relative_change is not None
+                         and relative_change >= min_relative_change and p_value <= max_p_value)
+            comparisons.append(MetricComparison(
+                metric=metric,
+                baseline_runs=len(baseline_values),
+                recent_runs=len(recent_values),
+                baseline_mean=baseline_mean,
+                recent_mean=recent_mean,
+                relative_change=round(relative_change, 4) if relative_change is not None else None,
+                p_value=round(p_value, 6) if p_value is not None else None,
+                regressed=regressed,
+                crew_fingerprint_changed=crew_changed,
+                config_fingerprint_changed=config_changed
+            ))
+        return comparisons
+
+    def detect_regressions(self, crew_name: str, model_name: Optional[str] = None,
+                           **kwargs: Any) -> List[MetricComparison]:
+        """Returns the regressed metrics of `compare()`, logging a warning for each."""
+        options = {**self.comparison, **kwargs}
+        regressions = [c for c in self.compare(crew_name, model_name, **options) if c.regressed]
+        for comparison in regressions:
+            _logger.warning("Crew metric regression detected", extra={
+                "crew_name": crew_name,
+                "model_name": model_name,
+                **comparison._asdict()
+            })
+        return regressions
@@ -1,6 +1,5 @@
 # reporter.py
 import os
-import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -41,6 +40,8 @@ class ReportingTool:
 
     def _generate_single_report(self, job_config: Dict[str, Any]):
         """Generates a single Excel report from a directory of JSON files."""
+        import pandas as pd
+
         job_name = job_config.get('name', 'Unnamed Generate Job')
         print(f"\nProcessing Job: '{job_name}'")
 
@@ -93,6 +94,8 @@ class ReportingTool:
 
     def _combine_reports(self, job_config: Dict[str, Any]):
         """Combines multiple Excel files into a single report."""
+        import pandas as pd
+
         job_name = job_config.get('name', 'Unnamed Combine Job')
         print(f"\nProcessing Job: '{job_name}'")
 
@@ -0,0 +1,167 @@
+import threading
+import time
+from array import array
+from typing import Any, Dict, Optional
+
+from amsha.common.logger import get_logger
+
+# Sampled series, in the order they are stored
+SERIES = ("rss_bytes", "cpu_percent", "threads", "open_fds")
+
+
+class ResourceRingBuffer:
+    """
+    Fixed-size ring buffer of resource samples, one preallocated array per series.
+
+    Peak, mean and count cover every sample ever added; percentiles are computed
+    over the samples still held, i.e. the most recent `capacity` ones.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be at least 1")
+        self.capacity = capacity
+        self._series = {name: array("d", bytes(8 * capacity)) for name in SERIES}
+        self._next = 0
+        self._held = 0
+        self._count = 0
+        self._peaks = {name: 0.0 for name in SERIES}
+        self._sums = {name: 0.0 for name in SERIES}
+
+    def __len__(self) -> int:
+        return self._held
+
+    @property
+    def count(self) -> int:
+        """Total number of samples added, including overwritten ones."""
+        return self._count
+
+    def add(self, **sample: float) -> None:
+        for name in SERIES:
+            value = float(sample.get(name, 0.0))
+            self._series[name][self._next] = value
+            self._sums[name] += value
+            if self._count == 0 or value > self._peaks[name]:
+                self._peaks[name] = value
+        self._next = (self._next + 1) % self.capacity
+        self._held = min(self._held + 1, self.capacity)
+        self._count += 1
+
+    def stats(self, name: str) -> Dict[str, float]:
+        """Returns peak, mean, p50, p95 and p99 of a series (empty if nothing was sampled)."""
+        if not self._count:
+            return {}
+        ordered = sorted(self._series[name][:self._held])
+
+        def percentile(p: float) -> float:
+            return ordered[min(int(round(p / 100.0 * (len(ordered) - 1))), len(ordered) - 1)]
+
+        return {
+            "peak": self._peaks[name],
+            "mean": self._sums[name] / self._count,
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+        }
+
+
+class ResourceSampler:
+    """
+    Samples the resources of the current process on a background daemon thread.
+
+    Every sample records the resident set size, the CPU utilisation since the
+    previous sample (from process CPU time, so it is independent of other
+    processes), the thread count and the number of open file descriptors
+    (handles on Windows). Samples from concurrent executions in the same process
+    necessarily overlap, since these are per-process figures.
+    """
+
+    def __init__(self, interval_seconds: float = 0.5, capacity: int = 1024):
+        """
+        Args:
+            interval_seconds: Seconds between samples
+            capacity: Number of samples kept for percentiles
+        """
+        if interval_seconds <= 0:
+            raise ValueError("Sampling interval must be positive")
+        self.logger = get_logger("crew_monitor.resources")
+        self.interval_seconds = interval_seconds
+        self.buffer = ResourceRingBuffer(capacity)
+        import psutil
+
+        self._process = psutil.Process()
+        self._process_errors = (psutil.Error, OSError)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_cpu_time = 0.0
+        self._end_cpu_time = 0.0
+        self._last_cpu_time = 0.0
+        self._last_wall = 0.0
+
+    def _cpu_time(self) -> float:
+        times = self._process.cpu_times()
+        return times.user + times.system
+
+    def _open_fds(self) -> int:
+        if hasattr(self._process, "num_fds"):
+            return self._process.num_fds()
+        return self._process.num_handles()
+
+    def sample(self) -> None:
+        """Takes one sample immediately."""
+        try:
+            with self._process.oneshot():
+                wall = time.perf_counter()
+                cpu_time = self._cpu_time()
+                elapsed = wall - self._last_wall
+                cpu_percent = (cpu_time - self._last_cpu_time) / elapsed * 100.0 if elapsed > 0 else 0.0
+                sample = {
+                    "rss_bytes": self._process.memory_info().rss,
+                    "cpu_percent": cpu_percent,
+                    "threads": self._process.num_threads(),
+                    "open_fds": self._open_fds(),
+                }
+        except self._process_errors as e:
+            self.logger.debug("Resource sample failed", extra={"error": str(e)})
+            return
+        with self._lock:
+            self._last_wall, self._last_cpu_time = wall, cpu_time
+            self._end_cpu_time = cpu_time
+            self.buffer.add(**sample)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.sample()
+
+    def start(self) -> None:
+        """Starts sampling on a daemon thread."""
+        self._last_wall = time.perf_counter()
+        self._start_cpu_time = self._end_cpu_time = self._last_cpu_time = self._cpu_time()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="amsha-resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and takes a final sample, so short executions get at least one."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + 1.0)
+            self._thread = None
+        self.sample()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns peak, mean and percentiles of every series together with the total CPU time used."""
+        with self._lock:
+            if not self.buffer.count:
+                return {}
+            rss = self.buffer.stats("rss_bytes")
+            return {
+                "samples": self.buffer.count,
+                "sample_interval_seconds": self.interval_seconds,
+                "cpu_time_seconds": round(self._end_cpu_time - self._start_cpu_time, 4),
+                "rss_mb": {key: round(value / (1024 * 1024), 2) for key, value in rss.items()},
+                "cpu_percent": {key: round(value, 2) for key, value in self.buffer.stats("cpu_percent").items()},
+                "threads": {key: round(value, 2) for key, value in self.buffer.stats("threads").items()},
+                "open_fds": {key: round(value, 2) for key, value in self.buffer.stats("open_fds").items()},
+            }
@@ -1,2 +1,3 @@
 from .execution_mode import ExecutionMode
 from .execution_handle import ExecutionHandle
+from .endpoint_unavailable_error import EndpointUnavailableError
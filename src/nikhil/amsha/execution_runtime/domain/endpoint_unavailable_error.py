@@ -0,0 +1,10 @@
+from typing import List
+
+
+class EndpointUnavailableError(ConnectionError):
+    """
+    Raised when a task cannot reach any of the endpoints it depends on.
+    """
+    def __init__(self, endpoints: List[str]):
+        super().__init__(f"No available endpoint among: {', '.join(endpoints)}")
+        self.endpoints = list(endpoints)
@@ -1,10 +1,12 @@
 import concurrent.futures
-from typing import Any, Callable, Dict, Optional
+import contextvars
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from uuid import uuid4
 
 from amsha.execution_state.domain.enums import ExecutionStatus
 from amsha.execution_runtime.domain.execution_handle import ExecutionHandle
 from amsha.execution_runtime.domain.execution_mode import ExecutionMode
+from amsha.execution_runtime.domain.endpoint_unavailable_error import EndpointUnavailableError
 
 class LocalExecutionHandle(ExecutionHandle):
     def __init__(self, execution_id: str, future: Optional[concurrent.futures.Future] = None, result_value: Any = None):
@@ -59,9 +61,36 @@ class LocalExecutionHandle(ExecutionHandle):
 class RuntimeEngine:
     """
     Executes tasks based on the requested mode.
+
+    Tasks that depend on remote endpoints can query their health through
+    `available_endpoints()` / `ensure_available()` to fail fast, or pick another
+    endpoint, instead of waiting for calls to an endpoint that is down. The
+    health query is injected by the caller (the crew orchestrator passes the
+    LLM circuit breakers); without one every endpoint counts as available.
     """
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, endpoint_available: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            max_workers: Threads running background tasks
+            endpoint_available: Health query of an endpoint (every endpoint is available by default)
+        """
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._endpoint_available = endpoint_available or (lambda endpoint: True)
+
+    def available_endpoints(self, endpoints: Iterable[str]) -> List[str]:
+        """Returns the given endpoints the health query reports as available, in order."""
+        return [endpoint for endpoint in endpoints if self._endpoint_available(endpoint)]
+
+    def ensure_available(self, endpoints: Iterable[str]) -> None:
+        """
+        Fails fast when a task cannot reach any of the endpoints it may call.
+
+        Raises:
+            EndpointUnavailableError: If no given endpoint is available (an empty list passes)
+        """
+        endpoints = list(endpoints)
+        if endpoints and not self.available_endpoints(endpoints):
+            raise EndpointUnavailableError(endpoints)
         
     def submit(self, task: Callable[..., Any], *args, mode: ExecutionMode = ExecutionMode.BACKGROUND, **kwargs) -> ExecutionHandle:
         """
@@ -81,8 +110,10 @@ class RuntimeEngine:
                 # Sync execution usually expects immediate failure feedback.
                 raise e 
         else:
-            # Run in background
-            future = self._executor.submit(task, *args, **kwargs)
+            # Run in background; the task runs in a copy of the caller's context so
+            # tracing spans started there stay parented across the thread hop
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, task, *args, **kwargs)
             return LocalExecutionHandle(execution_id, future=future)
             
     def shutdown(self):
@@ -1,5 +1,6 @@
 from typing import Dict, Optional, Protocol
 
+from amsha.common.tracing import span
 from amsha.execution_state.domain.execution_state import ExecutionState
 from amsha.execution_state.domain.enums import ExecutionStatus
 
@@ -33,7 +34,8 @@ class StateManager:
         Creates a new execution state and persists it.
         """
         state = ExecutionState(inputs=inputs or {})
-        self.repository.save(state)
+        with span("state.create", execution_id=state.execution_id):
+            self.repository.save(state)
         return state
         
     def get_execution(self, execution_id: str) -> Optional[ExecutionState]:
@@ -46,10 +48,11 @@ class StateManager:
         """
         Updates the status of an execution and perists the change.
         """
-        state = self.repository.get(execution_id)
-        if not state:
-            return None
-            
-        state.update_status(status, metadata)
-        self.repository.save(state)
-        return state
+        with span("state.update", execution_id=execution_id, status=status):
+            state = self.repository.get(execution_id)
+            if not state:
+                return None
+
+            state.update_status(status, metadata)
+            self.repository.save(state)
+            return state
@@ -0,0 +1,50 @@
+# src/nikhil/amsha/llm_factory/adapters/batching_llm.py
+import asyncio
+from typing import Any
+
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.service.llm_micro_batcher import MicroBatcher
+
+
+class BatchingLLM(DelegatingLLM):
+    """
+    Sends every call through the model's shared MicroBatcher.
+
+    Concurrent callers (crews run in the background, parallel evaluation
+    threads, ...) are grouped into batches that reach the model server
+    together; each caller still receives only its own result.
+    """
+
+    def __init__(self, inner: Any, batcher: MicroBatcher):
+        super().__init__(inner)
+        self._batcher = batcher
+
+    @property
+    def batcher(self) -> MicroBatcher:
+        return self._batcher
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        return self._batcher.call(lambda: self._inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        ))
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        # Batched calls run on the batcher's workers, so the event loop only awaits the result
+        future = self._batcher.submit(lambda: self._inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        ))
+        return await asyncio.wrap_future(future)
@@ -0,0 +1,112 @@
+# src/nikhil/amsha/llm_factory/adapters/caching_llm.py
+from typing import Any, Dict, Optional
+
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+    LLMStreamChunkEvent,
+)
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.service.llm_response_cache import LLMResponseCache
+
+_logger = get_logger("llm_factory.cache")
+
+# Generation parameters that change the response and therefore belong in the cache key
+_KEY_PARAMS = (
+    "temperature", "top_p", "max_completion_tokens", "max_tokens",
+    "presence_penalty", "frequency_penalty", "stop", "seed", "response_format",
+)
+
+
+class CachingLLM(DelegatingLLM):
+    """
+    Serves repeated identical LLM calls from an LLMResponseCache.
+
+    Calls that carry tools are always forwarded, since their results depend on
+    side effects. With deterministic_only, calls are cached only at temperature 0.
+    """
+
+    def __init__(self, inner: Any, cache: LLMResponseCache, deterministic_only: bool = True):
+        super().__init__(inner)
+        self._cache = cache
+        self._deterministic_only = deterministic_only
+
+    @property
+    def cache(self) -> LLMResponseCache:
+        return self._cache
+
+    def _generation_params(self) -> Dict[str, Any]:
+        return {name: getattr(self._inner, name, None) for name in _KEY_PARAMS}
+
+    def _endpoint(self) -> str:
+        """Identifies the model and the endpoint serving it, as the shared limiters and batchers do."""
+        base_url = getattr(self._inner, "base_url", None) or getattr(self._inner, "api_base", None)
+        return f"{self._inner.model}@{base_url or 'default'}"
+
+    def _cache_key(self, messages, tools, available_functions, response_model) -> Optional[str]:
+        if tools or available_functions:
+            return None
+        if self._deterministic_only and getattr(self._inner, "temperature", None) != 0:
+            return None
+        extra = {"api_version": getattr(self._inner, "api_version", None)}
+        if response_model:
+            extra["response_model"] = response_model.__name__
+        return LLMResponseCache.build_key(self._endpoint(), self._generation_params(), messages, extra)
+
+    def _emit_cached_response(self, messages, response: str, from_task, from_agent) -> None:
+        """Replays the events CrewAI listeners expect from a real call."""
+        crewai_event_bus.emit(self, event=LLMCallStartedEvent(
+            messages=messages, from_task=from_task, from_agent=from_agent, model=self._inner.model
+        ))
+        if getattr(self._inner, "stream", False):
+            crewai_event_bus.emit(self, event=LLMStreamChunkEvent(
+                chunk=response, from_task=from_task, from_agent=from_agent, call_type=LLMCallType.LLM_CALL
+            ))
+        crewai_event_bus.emit(self, event=LLMCallCompletedEvent(
+            messages=messages, response=response, call_type=LLMCallType.LLM_CALL,
+            from_task=from_task, from_agent=from_agent, model=self._inner.model
+        ))
+
+    def _lookup(self, key: Optional[str], messages, from_task, from_agent) -> Optional[str]:
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            _logger.debug("LLM response served from cache", extra={
+                "model": self._inner.model,
+                "cache_key": key[:12]
+            })
+            self._emit_cached_response(messages, cached, from_task, from_agent)
+        return cached
+
+    def _store(self, key: Optional[str], result: Any) -> None:
+        if key is not None and isinstance(result, str) and result:
+            self._cache.put(key, result)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        key = self._cache_key(messages, tools, available_functions, response_model)
+        cached = self._lookup(key, messages, from_task, from_agent)
+        if cached is not None:
+            return cached
+
+        result = super().call(messages, tools, callbacks, available_functions,
+                              from_task, from_agent, response_model)
+        self._store(key, result)
+        return result
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        key = self._cache_key(messages, tools, available_functions, response_model)
+        cached = self._lookup(key, messages, from_task, from_agent)
+        if cached is not None:
+            return cached
+
+        result = await super().acall(messages, tools, callbacks, available_functions,
+                                     from_task, from_agent, response_model)
+        self._store(key, result)
+        return result
@@ -0,0 +1,60 @@
+# src/nikhil/amsha/llm_factory/adapters/circuit_breaker_llm.py
+from typing import Any
+
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.service.llm_circuit_breaker import CircuitBreaker, CircuitOpenError
+from amsha.llm_factory.service.llm_error_classifier import is_transient_error
+
+
+class CircuitBreakerLLM(DelegatingLLM):
+    """
+    Guards every call with the circuit breaker of the LLM's endpoint.
+
+    While the circuit is open a call raises CircuitOpenError at once instead of
+    waiting for the endpoint to time out; behind a RoutingLLM that error fails the
+    call over to the next model straight away. Only transport failures count
+    against the endpoint; bad requests, auth and validation errors do not.
+    """
+
+    def __init__(self, inner: Any, breaker: CircuitBreaker):
+        super().__init__(inner)
+        self._breaker = breaker
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def _admit(self) -> None:
+        if not self._breaker.allow():
+            raise CircuitOpenError(self._breaker.key)
+
+    def _record_error(self, error: Exception) -> None:
+        # Transient provider failures (timeouts, connection errors, 429, 5xx) are the ones that say the endpoint is unhealthy
+        if is_transient_error(error):
+            self._breaker.record_failure()
+        else:
+            self._breaker.release()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        self._admit()
+        try:
+            result = super().call(messages, tools, callbacks, available_functions,
+                                  from_task, from_agent, response_model)
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self._breaker.record_success()
+        return result
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        self._admit()
+        try:
+            result = await super().acall(messages, tools, callbacks, available_functions,
+                                         from_task, from_agent, response_model)
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self._breaker.record_success()
+        return result
@@ -0,0 +1,87 @@
+# src/nikhil/amsha/llm_factory/adapters/delegating_llm.py
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM
+
+
+class DelegatingLLM(BaseLLM):
+    """
+    Base class for CrewAI LLM wrappers that add behaviour around an existing LLM.
+
+    Every public attribute read or written on the wrapper (model, stop, stream,
+    temperature, ...) is forwarded to the wrapped LLM, so CrewAI agents can keep
+    mutating the LLM as usual. Wrapper state must be stored under names starting
+    with an underscore; those stay on the wrapper itself.
+    """
+
+    def __init__(self, inner: Any):
+        # BaseLLM.__init__ is intentionally not called: its attributes live on the inner LLM.
+        object.__setattr__(self, "_inner", inner)
+
+    @property
+    def inner(self) -> Any:
+        """Returns the wrapped LLM instance."""
+        return self._inner
+
+    @property
+    def is_litellm(self) -> bool:
+        return getattr(self._inner, "is_litellm", False)
+
+    @property
+    def provider(self) -> str:
+        return self._inner.provider
+
+    def __getattr__(self, name: str) -> Any:
+        inner = self.__dict__.get("_inner")
+        if inner is None or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._inner, name, value)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        return self._inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        return await self._inner.acall(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+
+    def supports_function_calling(self) -> bool:
+        return self._inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self._inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self._inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        return self._inner.get_token_usage_summary()
+
+    def unwrap(self) -> Any:
+        """Returns the innermost LLM, skipping any nested wrappers."""
+        llm = self._inner
+        while isinstance(llm, DelegatingLLM):
+            llm = llm.inner
+        return llm
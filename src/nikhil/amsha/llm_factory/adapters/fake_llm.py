@@ -0,0 +1,46 @@
+# src/nikhil/amsha/llm_factory/adapters/fake_llm.py
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+
+from amsha.llm_factory.adapters.scripted_llm import ScriptedLLM
+from amsha.llm_factory.service.llm_response_cache import LLMResponseCache
+
+_FINAL_ANSWER_PREFIX = "Thought: I now can give a great answer\nFinal Answer: "
+
+
+class FakeLLM(ScriptedLLM):
+    """
+    CrewAI LLM that returns a synthetic answer after a fixed latency.
+
+    Used to benchmark the orchestration stack without a model server. Unless a
+    fixed response is configured, the answer is a fenced JSON document of roughly
+    `completion_tokens` tokens, in the final-answer format CrewAI agents parse.
+    """
+
+    def __init__(self, model: str, latency_seconds: float = 0.0, completion_tokens: int = 256,
+                 response: Optional[str] = None, temperature: Optional[float] = None, stream: bool = False,
+                 chunk_size: int = 64, sleep: Callable[[float], None] = time.sleep, **kwargs: Any):
+        super().__init__(model=model, temperature=temperature, stream=stream, chunk_size=chunk_size,
+                         sleep=sleep, **kwargs)
+        self.latency_seconds = latency_seconds
+        self.completion_tokens = completion_tokens
+        self._response = self._final_answer(response if response is not None else self._synthetic_answer())
+
+    def _synthetic_answer(self) -> str:
+        words = " ".join(f"token{i}" for i in range(max(self.completion_tokens - 8, 1)))
+        document = {"status": "ok", "model": self.model, "content": words}
+        return f"```json\n{json.dumps(document)}\n```"
+
+    @staticmethod
+    def _final_answer(response: str) -> str:
+        return response if "Final Answer:" in response else _FINAL_ANSWER_PREFIX + response
+
+    def _next_exchange(self, messages, from_task, from_agent, response_model) -> Dict[str, Any]:
+        prompt_chars = sum(len(str(message.get("content", "")))
+                           for message in LLMResponseCache.normalize_messages(messages))
+        return {
+            "response": self._response,
+            "latency_seconds": self.latency_seconds,
+            "usage": {"prompt_tokens": prompt_chars // 4 + 1, "completion_tokens": self.completion_tokens},
+        }
@@ -0,0 +1,73 @@
+# src/nikhil/amsha/llm_factory/adapters/rate_limited_llm.py
+import asyncio
+from typing import Any, Optional, Tuple
+
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.service.llm_rate_limiter import TokenBucketRateLimiter
+
+# Rough characters-per-token ratio used to size calls before they are sent
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(payload: Any) -> int:
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload) // _CHARS_PER_TOKEN + 1
+    if isinstance(payload, dict):
+        return _estimate_tokens(payload.get("content"))
+    if isinstance(payload, (list, tuple)):
+        return sum(_estimate_tokens(item) for item in payload)
+    return _estimate_tokens(str(payload))
+
+
+class RateLimitedLLM(DelegatingLLM):
+    """
+    Holds every call back until the deployment's shared rate limiter admits it.
+
+    A call reserves its estimated prompt tokens plus a fixed completion reserve;
+    once the response is known the reservation is settled against its real size.
+    """
+
+    def __init__(self, inner: Any, limiter: TokenBucketRateLimiter, completion_token_reserve: int = 512,
+                 max_wait_seconds: Optional[float] = None):
+        super().__init__(inner)
+        self._limiter = limiter
+        self._completion_token_reserve = completion_token_reserve
+        self._max_wait_seconds = max_wait_seconds
+
+    @property
+    def limiter(self) -> TokenBucketRateLimiter:
+        return self._limiter
+
+    def _reserve(self, messages) -> Tuple[int, int]:
+        prompt_tokens = _estimate_tokens(messages)
+        reserved = prompt_tokens + self._completion_token_reserve
+        self._limiter.acquire(reserved, timeout=self._max_wait_seconds)
+        return prompt_tokens, reserved
+
+    def _settle(self, prompt_tokens: int, reserved: int, result: Any) -> None:
+        self._limiter.settle(prompt_tokens + _estimate_tokens(result) - reserved)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        prompt_tokens, reserved = self._reserve(messages)
+        result = None
+        try:
+            result = super().call(messages, tools, callbacks, available_functions,
+                                  from_task, from_agent, response_model)
+            return result
+        finally:
+            self._settle(prompt_tokens, reserved, result)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        # acquire blocks, so it runs outside the event loop
+        prompt_tokens, reserved = await asyncio.to_thread(self._reserve, messages)
+        result = None
+        try:
+            result = await super().acall(messages, tools, callbacks, available_functions,
+                                         from_task, from_agent, response_model)
+            return result
+        finally:
+            self._settle(prompt_tokens, reserved, result)
@@ -0,0 +1,63 @@
+# src/nikhil/amsha/llm_factory/adapters/recording_llm.py
+import time
+from typing import Any, Dict
+
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.service.llm_cassette import LLMCassette
+
+_USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens", "cached_prompt_tokens")
+
+
+class RecordingLLM(DelegatingLLM):
+    """
+    Forwards every call to the real LLM and appends the exchange to a cassette.
+
+    Only text responses are recorded; calls carrying tools are forwarded untouched,
+    since their results depend on tool execution.
+    """
+
+    def __init__(self, inner: Any, cassette: LLMCassette):
+        super().__init__(inner)
+        self._cassette = cassette
+
+    @property
+    def cassette(self) -> LLMCassette:
+        return self._cassette
+
+    def _usage(self) -> Dict[str, int]:
+        try:
+            summary = self._inner.get_token_usage_summary()
+        except Exception:
+            return {}
+        return {field: int(getattr(summary, field, 0) or 0) for field in _USAGE_FIELDS}
+
+    def _record(self, messages, tools, available_functions, response_model, result: Any,
+                started: float, usage_before: Dict[str, int]) -> None:
+        if tools or available_functions or not isinstance(result, str):
+            return
+        usage_after = self._usage()
+        usage = {field: usage_after[field] - usage_before.get(field, 0) for field in usage_after}
+        self._cassette.record(
+            self._inner.model, messages, result,
+            latency_seconds=time.perf_counter() - started,
+            usage=usage,
+            response_model=response_model
+        )
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        usage_before = self._usage()
+        started = time.perf_counter()
+        result = super().call(messages, tools, callbacks, available_functions,
+                              from_task, from_agent, response_model)
+        self._record(messages, tools, available_functions, response_model, result, started, usage_before)
+        return result
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        usage_before = self._usage()
+        started = time.perf_counter()
+        result = await super().acall(messages, tools, callbacks, available_functions,
+                                     from_task, from_agent, response_model)
+        self._record(messages, tools, available_functions, response_model, result, started, usage_before)
+        return result
@@ -0,0 +1,46 @@
+# src/nikhil/amsha/llm_factory/adapters/replay_llm.py
+import time
+from typing import Any, Callable, Dict, Optional
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.adapters.scripted_llm import ScriptedLLM
+from amsha.llm_factory.service.llm_cassette import LLMCassette
+
+_logger = get_logger("llm_factory.transport")
+
+
+class ReplayLLM(ScriptedLLM):
+    """
+    CrewAI LLM that answers every call from a cassette instead of the network.
+
+    Recorded latencies are only reproduced when replay_latency is enabled.
+    """
+
+    def __init__(self, model: str, cassette: LLMCassette, temperature: Optional[float] = None,
+                 stream: bool = False, replay_latency: bool = False, latency_scale: float = 1.0,
+                 chunk_size: int = 64, sleep: Callable[[float], None] = time.sleep, **kwargs: Any):
+        super().__init__(model=model, temperature=temperature, stream=stream, chunk_size=chunk_size,
+                         sleep=sleep, **kwargs)
+        self._cassette = cassette
+        self._replay_latency = replay_latency
+        self._latency_scale = latency_scale
+
+    @property
+    def cassette(self) -> LLMCassette:
+        return self._cassette
+
+    def _next_exchange(self, messages, from_task, from_agent, response_model) -> Dict[str, Any]:
+        entry = self._cassette.next_response(self.model, messages, response_model)
+        if entry is None:
+            error = ValueError(
+                f"No recorded response for this '{self.model}' call in cassette '{self._cassette.path}'. "
+                "Record it first with transport mode 'record'."
+            )
+            self._emit_call_failed_event(str(error), from_task=from_task, from_agent=from_agent)
+            _logger.error("Replay cassette miss", extra={
+                "model": self.model,
+                "cassette": self._cassette.path
+            })
+            raise error
+        latency = float(entry.get("latency_seconds") or 0.0) * self._latency_scale if self._replay_latency else 0.0
+        return {**entry, "latency_seconds": latency}
@@ -0,0 +1,120 @@
+# src/nikhil/amsha/llm_factory/adapters/routing_llm.py
+from typing import Any, Dict, List, Optional
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.service.llm_router import LLMRouter
+
+_logger = get_logger("llm_factory.routing")
+
+
+class RoutingLLM(DelegatingLLM):
+    """
+    Sends every call to one of several LLMs, chosen by an LLMRouter.
+
+    Attribute reads come from the first model; attribute writes (stop words,
+    callbacks, ...) go to every model so all of them stay configured alike. A
+    call that raises is retried on the router's next candidate when failover
+    is enabled; the last error is raised once the attempts are used up.
+    """
+
+    def __init__(self, models: Dict[str, Any], router: LLMRouter, failover: bool = True,
+                 max_attempts: Optional[int] = None):
+        super().__init__(next(iter(models.values())))
+        self._models = dict(models)
+        self._router = router
+        self._failover = failover
+        self._max_attempts = max_attempts
+
+    @property
+    def models(self) -> Dict[str, Any]:
+        return dict(self._models)
+
+    @property
+    def router(self) -> LLMRouter:
+        return self._router
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            for model in self._models.values():
+                setattr(model, name, value)
+
+    def _attempts(self) -> List[str]:
+        keys = self._router.candidates()
+        if not self._failover:
+            return keys[:1]
+        return keys[:self._max_attempts] if self._max_attempts else keys
+
+    def _failed(self, key: str, started: float, error: Exception, remaining: int) -> None:
+        self._router.end(key, started, success=False)
+        _logger.warning("Routed LLM call failed", extra={
+            "model_key": key,
+            "error": str(error),
+            "failing_over": remaining > 0
+        })
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        attempts = self._attempts()
+        for index, key in enumerate(attempts):
+            started = self._router.begin(key)
+            try:
+                result = self._models[key].call(
+                    messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                    response_model=response_model,
+                )
+            except Exception as e:
+                self._failed(key, started, e, len(attempts) - index - 1)
+                if index == len(attempts) - 1:
+                    raise
+                continue
+            self._router.end(key, started, success=True)
+            return result
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        attempts = self._attempts()
+        for index, key in enumerate(attempts):
+            started = self._router.begin(key)
+            try:
+                result = await self._models[key].acall(
+                    messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                    response_model=response_model,
+                )
+            except Exception as e:
+                self._failed(key, started, e, len(attempts) - index - 1)
+                if index == len(attempts) - 1:
+                    raise
+                continue
+            self._router.end(key, started, success=True)
+            return result
+
+    def supports_function_calling(self) -> bool:
+        return all(model.supports_function_calling() for model in self._models.values())
+
+    def supports_stop_words(self) -> bool:
+        return all(model.supports_stop_words() for model in self._models.values())
+
+    def get_context_window_size(self) -> int:
+        # A call may land on any model, so prompts must fit the smallest window
+        return min(model.get_context_window_size() for model in self._models.values())
+
+    def get_token_usage_summary(self) -> Any:
+        from crewai.types.usage_metrics import UsageMetrics
+
+        usage = UsageMetrics()
+        for model in self._models.values():
+            usage.add_usage_metrics(model.get_token_usage_summary())
+        return usage
@@ -0,0 +1,22 @@
+# src/nikhil/amsha/llm_factory/adapters/routing_provider.py
+from typing import Any, Dict
+
+from amsha.llm_factory.adapters.crewai_adapter import CrewAIProviderAdapter
+from amsha.llm_factory.adapters.routing_llm import RoutingLLM
+from amsha.llm_factory.service.llm_router import LLMRouter
+
+
+class RoutingProviderAdapter(CrewAIProviderAdapter):
+    """
+    ILLMProvider of a routed use case: the raw LLM is a RoutingLLM spreading calls across its models.
+    """
+    def __init__(self, routing_llm: RoutingLLM, model_name: str):
+        super().__init__(crewai_llm=routing_llm, model_name=model_name)
+
+    @property
+    def router(self) -> LLMRouter:
+        return self._llm.router
+
+    def get_routing_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the per-model call counts, failures and latency averages of the router."""
+        return self._llm.router.get_metrics()
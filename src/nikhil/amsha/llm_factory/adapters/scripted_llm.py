@@ -0,0 +1,78 @@
+# src/nikhil/amsha/llm_factory/adapters/scripted_llm.py
+import asyncio
+import time
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from crewai.events.types.llm_events import LLMCallType
+from crewai.llms.base_llm import BaseLLM
+
+
+class ScriptedLLM(BaseLLM):
+    """
+    Base class for CrewAI LLMs that answer calls locally instead of over the network.
+
+    Subclasses provide the exchange for a call as a dict with the response text,
+    a latency in seconds and the token usage. This class emits the same started,
+    stream-chunk and completed events as a real call and tracks the token usage,
+    so crews, monitors and the streaming orchestrator behave as they do against a
+    real model. The latency is spread evenly over the stream chunks.
+    """
+
+    def __init__(self, model: str, temperature: Optional[float] = None, stream: bool = False,
+                 chunk_size: int = 64, sleep: Callable[[float], None] = time.sleep, **kwargs: Any):
+        super().__init__(model=model, temperature=temperature, **kwargs)
+        self.stream = stream
+        self._chunk_size = chunk_size
+        self._sleep = sleep
+
+    @abstractmethod
+    def _next_exchange(self, messages, from_task, from_agent, response_model) -> Dict[str, Any]:
+        """Returns the exchange answering a call: {"response", "latency_seconds", "usage"}."""
+        ...
+
+    def _chunks(self, response: str) -> List[str]:
+        if not self.stream or not response:
+            return [response]
+        return [response[i:i + self._chunk_size] for i in range(0, len(response), self._chunk_size)]
+
+    def _complete(self, messages, exchange: Dict[str, Any], from_task, from_agent) -> str:
+        response = exchange["response"]
+        self._track_token_usage_internal(exchange.get("usage") or {})
+        self._emit_call_completed_event(
+            response=response, call_type=LLMCallType.LLM_CALL,
+            from_task=from_task, from_agent=from_agent, messages=messages
+        )
+        return response
+
+    def _emit_chunk(self, chunk: str, from_task, from_agent) -> None:
+        if self.stream:
+            self._emit_stream_chunk_event(chunk, from_task=from_task, from_agent=from_agent,
+                                          call_type=LLMCallType.LLM_CALL)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        self._emit_call_started_event(messages, tools, callbacks, available_functions, from_task, from_agent)
+        exchange = self._next_exchange(messages, from_task, from_agent, response_model)
+        chunks = self._chunks(exchange["response"])
+        delay = max(float(exchange.get("latency_seconds") or 0.0), 0.0) / len(chunks)
+        for chunk in chunks:
+            if delay:
+                self._sleep(delay)
+            self._emit_chunk(chunk, from_task, from_agent)
+        return self._complete(messages, exchange, from_task, from_agent)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        self._emit_call_started_event(messages, tools, callbacks, available_functions, from_task, from_agent)
+        exchange = self._next_exchange(messages, from_task, from_agent, response_model)
+        chunks = self._chunks(exchange["response"])
+        delay = max(float(exchange.get("latency_seconds") or 0.0), 0.0) / len(chunks)
+        for chunk in chunks:
+            if delay:
+                await asyncio.sleep(delay)
+            self._emit_chunk(chunk, from_task, from_agent)
+        return self._complete(messages, exchange, from_task, from_agent)
+
+    def supports_function_calling(self) -> bool:
+        return False
@@ -22,6 +22,9 @@ class LLMContainer(containers.DeclarativeContainer):
         yaml_data,
     )
 
+    # Names, output settings and capabilities of every configured model; builds no LLM
+    model_metadata = llm_settings.provided.list_model_metadata.call()
+
     # This part remains the same.
     llm_builder = providers.Factory(
         LLMBuilder,
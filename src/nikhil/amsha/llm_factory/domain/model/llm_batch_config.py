@@ -0,0 +1,25 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_batch_config.py
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class LLMBatchConfig(BaseModel):
+    """
+    Configuration for micro-batching concurrent calls to the same model.
+
+    Calls arriving within `max_wait_ms` of the first one are collected into a
+    batch that is sent to the model as one wave of parallel requests, which
+    local servers with continuous batching process in the same forward passes.
+
+    Attributes:
+        enabled: Turns micro-batching on for the listed use cases
+        use_cases: Use cases (e.g. "evaluation") whose LLMs batch their calls
+        max_batch_size: Calls collected into one batch at most
+        max_wait_ms: How long the first call of a batch waits for others to join
+        max_parallel: Provider calls in flight at once per model
+    """
+    enabled: bool = Field(False, description="Enable micro-batching")
+    use_cases: List[str] = Field(default_factory=lambda: ["evaluation"], description="Use cases to batch")
+    max_batch_size: int = Field(8, ge=1, description="Maximum calls per batch")
+    max_wait_ms: float = Field(10.0, ge=0, description="Batch collection window in milliseconds")
+    max_parallel: int = Field(8, ge=1, description="Concurrent provider calls per model")
@@ -0,0 +1,23 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_cache_config.py
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class LLMCacheConfig(BaseModel):
+    """
+    Configuration for the opt-in on-disk LLM response cache.
+
+    Attributes:
+        enabled: Turns the cache on for the listed use cases
+        use_cases: Use cases (e.g. "evaluation") whose LLMs are wrapped with the cache
+        directory: Folder holding the SQLite cache database
+        max_size_mb: Upper bound for stored responses; least recently used entries are evicted first
+        max_age_hours: Entries older than this are treated as misses and evicted
+        deterministic_only: Only cache calls made with temperature 0
+    """
+    enabled: bool = Field(False, description="Enable the response cache")
+    use_cases: List[str] = Field(default_factory=lambda: ["evaluation"], description="Use cases to cache")
+    directory: str = Field(".Amsha/cache/llm", description="Cache directory")
+    max_size_mb: float = Field(256.0, description="Maximum cache size in MB")
+    max_age_hours: float = Field(168.0, description="Maximum entry age in hours")
+    deterministic_only: bool = Field(True, description="Only cache temperature 0 calls")
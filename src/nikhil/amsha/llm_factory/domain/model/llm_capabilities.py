@@ -0,0 +1,31 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_capabilities.py
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+# Connection settings that are passed to every LLM regardless of its declared parameters
+CONNECTION_PARAMS = ("model", "api_key", "api_version", "base_url", "endpoint")
+
+
+class LLMCapabilities(BaseModel):
+    """
+    What a model and its provider support, used to negotiate how it is built.
+
+    Attributes:
+        streaming: "unsupported" never streams, "supported" streams interactive
+            builds only, "preferred" streams every build
+        supported_params: Generation parameters the provider accepts (e.g. temperature,
+            top_p, max_completion_tokens); others are not sent. None keeps the blanket
+            drop_params behaviour, which lets the provider client discard unknown ones
+        json_mode: Whether the model has a native JSON output mode
+    """
+    streaming: Literal["unsupported", "supported", "preferred"] = Field(
+        "supported", description="Streaming support of the model"
+    )
+    supported_params: Optional[List[str]] = Field(None, description="Generation parameters the provider accepts")
+    json_mode: bool = Field(False, description="Native JSON output mode")
+
+    def stream_for(self, interactive: bool) -> bool:
+        """Whether a build for interactive (or batch) use streams its responses."""
+        if self.streaming == "unsupported":
+            return False
+        return self.streaming == "preferred" or interactive
@@ -0,0 +1,32 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_circuit_breaker_config.py
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class LLMCircuitBreakerConfig(BaseModel):
+    """
+    Configuration for the per-endpoint circuit breakers and their health probes.
+
+    An endpoint is the model's base_url (e.g. a local LM Studio server) or, for
+    hosted models without one, the model string. Every model served by the
+    endpoint shares its breaker.
+
+    Attributes:
+        enabled: Wrap every built LLM with its endpoint's circuit breaker
+        failure_threshold: Consecutive failed calls that open the circuit
+        open_seconds: How long an open circuit rejects calls before letting a trial call through
+        half_open_max_calls: Trial calls allowed at once while the circuit is half-open
+        probe_interval_seconds: Seconds between background health probes of endpoints with a
+            base_url (None disables probing)
+        probe_timeout_seconds: Timeout of a single health probe
+        probe_path: Path requested on the base_url by a probe
+        probe_failure_threshold: Consecutive failed probes that open the circuit
+    """
+    enabled: bool = Field(False, description="Enable the circuit breakers")
+    failure_threshold: int = Field(5, ge=1, description="Consecutive failures that open the circuit")
+    open_seconds: float = Field(30.0, gt=0, description="Time an open circuit rejects calls")
+    half_open_max_calls: int = Field(1, ge=1, description="Concurrent trial calls while half-open")
+    probe_interval_seconds: Optional[float] = Field(15.0, gt=0, description="Seconds between health probes")
+    probe_timeout_seconds: float = Field(2.0, gt=0, description="Timeout of a health probe")
+    probe_path: str = Field("/models", description="Path requested by a health probe")
+    probe_failure_threshold: int = Field(2, ge=1, description="Consecutive failed probes that open the circuit")
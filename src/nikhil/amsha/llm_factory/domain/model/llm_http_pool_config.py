@@ -0,0 +1,43 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_http_pool_config.py
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class LLMHTTPPoolLimits(BaseModel):
+    """
+    Connection limits of the keep-alive pool of a single endpoint.
+
+    Attributes:
+        max_connections: Maximum open connections to the endpoint (None for unlimited)
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry_seconds: How long an idle connection is kept before it is closed
+    """
+    max_connections: Optional[int] = Field(20, gt=0, description="Maximum open connections")
+    max_keepalive_connections: Optional[int] = Field(10, ge=0, description="Idle connections kept open")
+    keepalive_expiry_seconds: Optional[float] = Field(30.0, gt=0, description="Idle connection lifetime")
+
+
+class LLMHTTPPoolConfig(LLMHTTPPoolLimits):
+    """
+    Configuration for the HTTP connection pools shared by every built LLM.
+
+    Requests are pooled per endpoint (scheme, host and port), so all LLMs that
+    target the same base_url or hosted API reuse the same keep-alive connections
+    and TLS sessions. The top-level limits apply to every endpoint; entries in
+    `endpoints`, keyed by origin (e.g. "https://generativelanguage.googleapis.com"),
+    override them.
+
+    Attributes:
+        enabled: Route the HTTP traffic of built LLMs through the shared pools
+        endpoints: Per-endpoint limit overrides
+    """
+    enabled: bool = Field(False, description="Enable the shared connection pools")
+    endpoints: Dict[str, LLMHTTPPoolLimits] = Field(default_factory=dict, description="Per-endpoint overrides")
+
+    def limits_for(self, origin: str) -> LLMHTTPPoolLimits:
+        """Returns the limits of an endpoint, falling back to the top-level limits."""
+        return self.endpoints.get(origin) or LLMHTTPPoolLimits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry_seconds=self.keepalive_expiry_seconds
+        )
@@ -1,8 +1,10 @@
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # Import LLMOutputConfig outside TYPE_CHECKING so Pydantic can use it at runtime
 from amsha.llm_factory.domain.model.llm_output_config import LLMOutputConfig
+from amsha.llm_factory.domain.model.llm_transport_config import LLMTransportConfig
+from amsha.llm_factory.domain.model.llm_capabilities import LLMCapabilities
 
 
 class LLMModelConfig(BaseModel):
@@ -10,4 +12,9 @@ class LLMModelConfig(BaseModel):
     model: str
     api_key: Optional[str] = None
     api_version: Optional[str] = None
-    output_config: Optional[LLMOutputConfig] = None
\ No newline at end of file
+    output_config: Optional[LLMOutputConfig] = None
+    transport: Optional[LLMTransportConfig] = None
+    # Tokens the model accepts per call (prompt and completion); enables the context-window pre-flight check
+    context_window: Optional[int] = Field(None, gt=0)
+    # Streaming, parameter and JSON mode support; defaults stream interactive builds only
+    capabilities: LLMCapabilities = Field(default_factory=LLMCapabilities)
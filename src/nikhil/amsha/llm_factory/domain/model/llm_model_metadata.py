@@ -0,0 +1,24 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_model_metadata.py
+from typing import NamedTuple, Optional
+
+from amsha.llm_factory.domain.model.llm_capabilities import LLMCapabilities
+
+
+class LLMModelMetadata(NamedTuple):
+    """What tooling needs to know about a configured model, read from the settings alone."""
+    use_case: str
+    model_key: str
+    model: str
+    model_name: str
+    is_default: bool
+    alias: Optional[str]
+    folder_name: Optional[str]
+    structure: Optional[str]
+    display_name: Optional[str]
+    context_window: Optional[int]
+    capabilities: LLMCapabilities
+
+    @property
+    def output_name(self) -> str:
+        """Base name of the model's output files: its alias, or the clean model name."""
+        return self.alias or self.model_name
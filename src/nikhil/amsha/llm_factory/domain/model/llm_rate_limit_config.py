@@ -0,0 +1,45 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_rate_limit_config.py
+from typing import Dict, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class LLMRateLimit(BaseModel):
+    """
+    Request and token budget of a single model deployment.
+
+    Attributes:
+        requests_per_minute: Maximum requests per minute (None for unlimited)
+        tokens_per_minute: Maximum prompt plus completion tokens per minute (None for unlimited)
+    """
+    requests_per_minute: Optional[int] = Field(None, gt=0, description="Requests per minute")
+    tokens_per_minute: Optional[int] = Field(None, gt=0, description="Tokens per minute")
+
+
+class LLMRateLimitConfig(LLMRateLimit):
+    """
+    Configuration for the shared token-bucket rate limiter.
+
+    The top-level limits apply to every model; entries in `models`, keyed by the
+    model string (e.g. "gemini/gemini-2.5-flash"), override them per deployment.
+
+    Attributes:
+        enabled: Wrap every built LLM with the limiter
+        backend: "process" shares buckets between threads, "sqlite" also between processes
+        directory: Folder holding the SQLite bucket database for the "sqlite" backend
+        completion_token_reserve: Completion tokens reserved per call until the response size is known
+        max_wait_seconds: Fail a call that would have to wait longer than this (None waits indefinitely)
+        models: Per-model limit overrides
+    """
+    enabled: bool = Field(False, description="Enable the rate limiter")
+    backend: Literal["process", "sqlite"] = Field("process", description="Bucket storage backend")
+    directory: str = Field(".Amsha/ratelimit", description="Directory of the SQLite backend")
+    completion_token_reserve: int = Field(512, ge=0, description="Completion tokens reserved per call")
+    max_wait_seconds: Optional[float] = Field(None, gt=0, description="Maximum time a call may wait")
+    models: Dict[str, LLMRateLimit] = Field(default_factory=dict, description="Per-model overrides")
+
+    def limits_for(self, model: str) -> LLMRateLimit:
+        """Returns the limits of a model, falling back to the top-level limits."""
+        return self.models.get(model) or LLMRateLimit(
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute
+        )
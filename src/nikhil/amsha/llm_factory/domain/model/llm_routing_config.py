@@ -0,0 +1,31 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_routing_config.py
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class LLMRoutingConfig(BaseModel):
+    """
+    Spreads the calls of a use case across several of its models.
+
+    Attributes:
+        enabled: Route the use case's default build through the router
+        policy: "weighted_round_robin" cycles through the models in proportion to their weights,
+            "least_outstanding" picks the model with the fewest calls in flight,
+            "ewma_latency" picks the lowest moving-average latency scaled by the calls in flight
+        models: Model keys of the use case to route across (empty routes across all of them)
+        weights: Per-model weight of the round-robin policy (default 1)
+        failover: Retry a failed call on the next model
+        max_attempts: Models tried per call when failing over (None tries every model once)
+        failure_cooldown_seconds: How long a model that failed is skipped while others are available
+        ewma_alpha: Weight of the newest latency in the moving average
+    """
+    enabled: bool = Field(False, description="Enable routing for the use case")
+    policy: Literal["weighted_round_robin", "least_outstanding", "ewma_latency"] = Field(
+        "weighted_round_robin", description="Model selection policy"
+    )
+    models: List[str] = Field(default_factory=list, description="Model keys to route across")
+    weights: Dict[str, int] = Field(default_factory=dict, description="Per-model round-robin weights")
+    failover: bool = Field(True, description="Retry failed calls on another model")
+    max_attempts: Optional[int] = Field(None, gt=0, description="Models tried per call")
+    failure_cooldown_seconds: float = Field(30.0, ge=0, description="Skip period of a failed model")
+    ewma_alpha: float = Field(0.3, gt=0, le=1, description="Smoothing factor of the latency average")
@@ -0,0 +1,29 @@
+# src/nikhil/amsha/llm_factory/domain/model/llm_transport_config.py
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class LLMTransportConfig(BaseModel):
+    """
+    Alternative transport for a model entry, used for benchmarking and CI.
+
+    Attributes:
+        mode: "record" calls the real model and appends every exchange to the cassette,
+            "replay" serves responses from the cassette without any network access,
+            "fake" answers every call with a synthetic response
+        cassette: JSON-lines file holding the recorded exchanges
+        replay_latency: Sleep for the recorded latency of each exchange when replaying
+        latency_scale: Multiplier applied to recorded latencies
+        chunk_size: Characters per stream chunk emitted for a streaming call
+        latency_seconds: Duration of every fake call
+        completion_tokens: Completion tokens of every fake call (sizes the synthetic response)
+        response: Fixed response of fake calls instead of the synthetic JSON document
+    """
+    mode: Literal["record", "replay", "fake"] = Field(..., description="Transport mode")
+    cassette: str = Field(".Amsha/cassettes/llm_cassette.jsonl", description="Cassette file")
+    replay_latency: bool = Field(False, description="Reproduce recorded latencies on replay")
+    latency_scale: float = Field(1.0, ge=0, description="Multiplier for recorded latencies")
+    chunk_size: int = Field(64, gt=0, description="Characters per replayed stream chunk")
+    latency_seconds: float = Field(0.0, ge=0, description="Latency of fake calls")
+    completion_tokens: int = Field(256, gt=0, description="Completion tokens of fake calls")
+    response: Optional[str] = Field(None, description="Fixed response of fake calls")
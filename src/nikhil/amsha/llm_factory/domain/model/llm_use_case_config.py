@@ -1,9 +1,11 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from amsha.llm_factory.domain.model.llm_model_config import LLMModelConfig
+from amsha.llm_factory.domain.model.llm_routing_config import LLMRoutingConfig
 from pydantic import BaseModel
 
 
 class LLMUseCaseConfig(BaseModel):
     default: str
-    models: Dict[str, LLMModelConfig]
\ No newline at end of file
+    models: Dict[str, LLMModelConfig]
+    routing: Optional[LLMRoutingConfig] = None
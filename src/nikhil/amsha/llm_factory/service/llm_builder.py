@@ -1,6 +1,7 @@
 # src/nikhil/amsha/llm_factory/service/llm_builder.py
 from typing import Optional, TYPE_CHECKING
 
+from amsha.common.tracing import current_span, traced
 from amsha.llm_factory.domain.model.llm_type import LLMType
 from amsha.llm_factory.domain.model.llm_build_result import LLMBuildResult
 from amsha.llm_factory.settings.llm_settings import LLMSettings
@@ -13,85 +14,233 @@ if TYPE_CHECKING:
     from amsha.llm_factory.domain.model.llm_parameters import LLMParameters
 
 from amsha.llm_factory.adapters.crewai_adapter import CrewAIProviderAdapter
+from amsha.llm_factory.adapters.caching_llm import CachingLLM
+from amsha.llm_factory.domain.model.llm_cache_config import LLMCacheConfig
+from amsha.llm_factory.service.llm_response_cache import LLMResponseCache
+from amsha.llm_factory.adapters.rate_limited_llm import RateLimitedLLM
+from amsha.llm_factory.domain.model.llm_rate_limit_config import LLMRateLimitConfig
+from amsha.llm_factory.service.llm_rate_limiter import TokenBucketRateLimiter
+from amsha.llm_factory.adapters.recording_llm import RecordingLLM
+from amsha.llm_factory.adapters.replay_llm import ReplayLLM
+from amsha.llm_factory.adapters.fake_llm import FakeLLM
+from amsha.llm_factory.adapters.scripted_llm import ScriptedLLM
+from amsha.llm_factory.domain.model.llm_transport_config import LLMTransportConfig
+from amsha.llm_factory.service.llm_cassette import LLMCassette
+from amsha.llm_factory.adapters.routing_llm import RoutingLLM
+from amsha.llm_factory.adapters.routing_provider import RoutingProviderAdapter
+from amsha.llm_factory.domain.model.llm_routing_config import LLMRoutingConfig
+from amsha.llm_factory.service.llm_router import LLMRouter
+from amsha.llm_factory.adapters.circuit_breaker_llm import CircuitBreakerLLM
+from amsha.llm_factory.domain.model.llm_circuit_breaker_config import LLMCircuitBreakerConfig
+from amsha.llm_factory.service.llm_circuit_breaker import CircuitBreaker, endpoint_key
+from amsha.llm_factory.adapters.delegating_llm import DelegatingLLM
+from amsha.llm_factory.domain.model.llm_http_pool_config import LLMHTTPPoolConfig
+from amsha.llm_factory.service.llm_http_pool import LLMHTTPPool
+from amsha.llm_factory.adapters.batching_llm import BatchingLLM
+from amsha.llm_factory.domain.model.llm_batch_config import LLMBatchConfig
+from amsha.llm_factory.domain.model.llm_capabilities import CONNECTION_PARAMS, LLMCapabilities
+from amsha.llm_factory.service.llm_micro_batcher import MicroBatcher
 
 
 class LLMBuilder:
     def __init__(self, settings: LLMSettings):
         self.settings: LLMSettings = settings
 
+    @traced("llm.build")
     def build(self, llm_type: LLMType, model_key: str = None, 
               model_config_override: "LLMModelConfig" = None, 
-              params_override: "LLMParameters" = None) -> LLMBuildResult:
-        
+              params_override: "LLMParameters" = None,
+              interactive: Optional[bool] = None) -> LLMBuildResult:
+        """
+        Builds the LLM of a use case.
+
+        `interactive` selects streaming for models whose capabilities support it
+        (None: every use case except evaluation is interactive).
+        """
+
         if model_config_override and params_override:
             model_config = model_config_override
             params = params_override
         else:
+            routing_config = None if model_key or model_config_override else \
+                self.settings.get_routing_config(llm_type.value)
+            if isinstance(routing_config, LLMRoutingConfig):
+                return self._build_routed(llm_type, routing_config, params_override, interactive)
             model_config = self.settings.get_model_config(llm_type.value, model_key)
             params = self.settings.get_parameters(llm_type.value)
 
         clean_model_name = LLMUtils.extract_model_name(model_config.model)
-        if model_config.base_url is None:
-            # Build base kwargs for LLM
-            llm_kwargs = {
-                'api_key': model_config.api_key,
-                'api_version': model_config.api_version,
-                'model': model_config.model,
-                'temperature': params.temperature,
-                'top_p': params.top_p,
-                'max_completion_tokens': params.max_completion_tokens,
-                'presence_penalty': params.presence_penalty,
-                'frequency_penalty': params.frequency_penalty,
-                'stream': True
-            }
-            
-            # Apply deprecated compatibility workaround
-            llm_kwargs = apply_drop_params_workaround(llm_kwargs)
-            
-            llm_instance = LLM(**llm_kwargs)
-        else:
+        current_span().set_attributes(llm_type=llm_type.value, model_name=clean_model_name)
+        llm_instance = self._build_llm_instance(llm_type, model_config, params, interactive)
+
+        provider = CrewAIProviderAdapter(crewai_llm=llm_instance, model_name=clean_model_name)
+        
+        # Return result with backward compatible llm and new provider
+        return LLMBuildResult(provider=provider)
+
+    def _build_llm_instance(self, llm_type: LLMType, model_config: "LLMModelConfig",
+                            params: "LLMParameters", interactive: Optional[bool] = None) -> LLM:
+        """Creates the LLM of one model entry together with its configured wrappers."""
+        capabilities = model_config.capabilities
+        if not isinstance(capabilities, LLMCapabilities):
+            capabilities = LLMCapabilities()
+        if interactive is None:
+            # Evaluation is batch scoring; the other use cases serve interactive runs
+            interactive = llm_type != LLMType.EVALUATION
+
+        llm_kwargs = {
+            'api_key': model_config.api_key,
+            'api_version': model_config.api_version,
+            'model': model_config.model,
+            'temperature': params.temperature,
+            'top_p': params.top_p,
+            'max_completion_tokens': params.max_completion_tokens,
+            'presence_penalty': params.presence_penalty,
+            'frequency_penalty': params.frequency_penalty,
+        }
+        # Batch builds skip streaming, so kickoff returns the result without the chunk-consuming path
+        if capabilities.stream_for(interactive):
+            llm_kwargs['stream'] = True
+        if model_config.base_url is not None:
             # CrewAI 1.8.0: Azure models require 'endpoint' parameter instead of 'base_url'
-            # Detect Azure models and map base_url to endpoint
-            is_azure = model_config.model.startswith('azure/')
-            llm_kwargs = {
-                'api_key': model_config.api_key,
-                'api_version': model_config.api_version,
-                'model': model_config.model,
-                'temperature': params.temperature,
-                'top_p': params.top_p,
-                'max_completion_tokens': params.max_completion_tokens,
-                'presence_penalty': params.presence_penalty,
-                'frequency_penalty': params.frequency_penalty,
-                'stream': True
-            }
-            
-            # Use 'endpoint' for Azure, 'base_url' for others
-            if is_azure:
+            if model_config.model.startswith('azure/'):
                 llm_kwargs['endpoint'] = model_config.base_url
             else:
                 llm_kwargs['base_url'] = model_config.base_url
-            
+
+        llm_instance = self._create_llm(self._negotiate_params(llm_kwargs, capabilities), model_config)
+
+        if model_config.context_window:
+            # Read by context_window_of(); kept on the LLM itself so it survives wrapping and routing
+            llm_instance._context_window = model_config.context_window
+
+        pool_config = self.settings.get_http_pool_config()
+        if isinstance(pool_config, LLMHTTPPoolConfig):
+            # Recording transports wrap the real LLM, whose client is the one to pool
+            LLMHTTPPool.shared(pool_config).attach(
+                llm_instance.unwrap() if isinstance(llm_instance, DelegatingLLM) else llm_instance
+            )
+
+        return self._wrap_llm(llm_type, llm_instance, model_config)
+
+    @staticmethod
+    def _negotiate_params(llm_kwargs: dict, capabilities: LLMCapabilities) -> dict:
+        """Keeps the parameters the provider declares, or falls back to drop_params for undeclared ones."""
+        if capabilities.supported_params is None:
             # Apply deprecated compatibility workaround
-            llm_kwargs = apply_drop_params_workaround(llm_kwargs)
-            
-            llm_instance = LLM(**llm_kwargs)
+            return apply_drop_params_workaround(llm_kwargs)
+        supported = set(CONNECTION_PARAMS) | set(capabilities.supported_params) | {'stream'}
+        return {key: value for key, value in llm_kwargs.items() if key in supported}
 
+    def _build_routed(self, llm_type: LLMType, routing_config: LLMRoutingConfig,
+                      params_override: "LLMParameters" = None, interactive: Optional[bool] = None) -> LLMBuildResult:
+        """Builds every routed model of the use case behind one RoutingLLM."""
+        params = params_override or self.settings.get_parameters(llm_type.value)
+        model_configs = self.settings.get_routed_model_configs(llm_type.value)
+        models = {key: self._build_llm_instance(llm_type, model_config, params, interactive)
+                  for key, model_config in model_configs.items()}
+        routing_llm = RoutingLLM(
+            models,
+            router=LLMRouter.from_config(routing_config, list(models)),
+            failover=routing_config.failover,
+            max_attempts=routing_config.max_attempts
+        )
+        model_name = "+".join(LLMUtils.extract_model_name(config.model) for config in model_configs.values())
+        current_span().set_attributes(llm_type=llm_type.value, model_name=model_name, routed_models=len(models))
+        return LLMBuildResult(provider=RoutingProviderAdapter(routing_llm, model_name=model_name))
 
-        provider = CrewAIProviderAdapter(crewai_llm=llm_instance, model_name=clean_model_name)
-        
-        # Return result with backward compatible llm and new provider
-        return LLMBuildResult(provider=provider)
+    @staticmethod
+    def _create_llm(llm_kwargs: dict, model_config: "LLMModelConfig") -> LLM:
+        """Creates the CrewAI LLM, honouring a record-and-replay or fake transport on the model entry."""
+        transport = model_config.transport
+        if not isinstance(transport, LLMTransportConfig):
+            return LLM(**llm_kwargs)
+
+        if transport.mode == "fake":
+            return FakeLLM(
+                model=llm_kwargs['model'],
+                latency_seconds=transport.latency_seconds,
+                completion_tokens=transport.completion_tokens,
+                response=transport.response,
+                temperature=llm_kwargs.get('temperature'),
+                stream=llm_kwargs.get('stream', False),
+                chunk_size=transport.chunk_size
+            )
+        cassette = LLMCassette.shared(transport.cassette)
+        if transport.mode == "replay":
+            return ReplayLLM(
+                model=llm_kwargs['model'],
+                cassette=cassette,
+                temperature=llm_kwargs.get('temperature'),
+                stream=llm_kwargs.get('stream', False),
+                replay_latency=transport.replay_latency,
+                latency_scale=transport.latency_scale,
+                chunk_size=transport.chunk_size
+            )
+        return RecordingLLM(LLM(**llm_kwargs), cassette=cassette)
+
+    def _wrap_llm(self, llm_type: LLMType, llm_instance: LLM, model_config: "LLMModelConfig" = None) -> LLM:
+        """Applies the opt-in wrappers configured for the use case."""
+        # The circuit breaker sits right on the LLM so only endpoint errors count, not limiter timeouts
+        breaker_config = self.settings.get_circuit_breaker_config()
+        if isinstance(breaker_config, LLMCircuitBreakerConfig) and not isinstance(llm_instance, ScriptedLLM):
+            base_url = model_config.base_url if model_config else None
+            llm_instance = CircuitBreakerLLM(
+                llm_instance,
+                breaker=CircuitBreaker.shared(
+                    breaker_config,
+                    endpoint=endpoint_key(model_config.model if model_config else llm_instance.model, base_url),
+                    probe_url=base_url.rstrip("/") + breaker_config.probe_path if base_url else None
+                )
+            )
+
+        # Rate limiting wraps the LLM next so cache hits never wait for the limiter
+        rate_limit_config = self.settings.get_rate_limit_config()
+        if isinstance(rate_limit_config, LLMRateLimitConfig) and not isinstance(llm_instance, ScriptedLLM):
+            llm_instance = RateLimitedLLM(
+                llm_instance,
+                limiter=TokenBucketRateLimiter.shared(
+                    rate_limit_config,
+                    model=model_config.model if model_config else llm_instance.model,
+                    base_url=model_config.base_url if model_config else None
+                ),
+                completion_token_reserve=rate_limit_config.completion_token_reserve,
+                max_wait_seconds=rate_limit_config.max_wait_seconds
+            )
+
+        # Batching sits inside the cache so cache hits are answered without joining a batch
+        batch_config = self.settings.get_batch_config(llm_type.value)
+        if isinstance(batch_config, LLMBatchConfig):
+            llm_instance = BatchingLLM(
+                llm_instance,
+                batcher=MicroBatcher.shared(
+                    batch_config,
+                    model=model_config.model if model_config else llm_instance.model,
+                    base_url=model_config.base_url if model_config else None
+                )
+            )
+
+        cache_config = self.settings.get_cache_config(llm_type.value)
+        if isinstance(cache_config, LLMCacheConfig):
+            llm_instance = CachingLLM(
+                llm_instance,
+                cache=LLMResponseCache.shared(cache_config),
+                deterministic_only=cache_config.deterministic_only
+            )
+        return llm_instance
 
     def build_creative(self, model_key: str = None, 
                        model_config_override: "LLMModelConfig" = None, 
-                       params_override: "LLMParameters" = None) -> LLMBuildResult:
+                       params_override: "LLMParameters" = None,
+                       interactive: Optional[bool] = None) -> LLMBuildResult:
         LLMUtils.disable_telemetry()
-        return self.build(LLMType.CREATIVE, model_key, model_config_override, params_override)
+        return self.build(LLMType.CREATIVE, model_key, model_config_override, params_override, interactive)
 
     def build_evaluation(self, model_key: str = None, 
                          model_config_override: "LLMModelConfig" = None, 
-                         params_override: "LLMParameters" = None) -> LLMBuildResult:
+                         params_override: "LLMParameters" = None,
+                         interactive: Optional[bool] = None) -> LLMBuildResult:
         LLMUtils.disable_telemetry()
-        return self.build(LLMType.EVALUATION, model_key, model_config_override, params_override)
+        return self.build(LLMType.EVALUATION, model_key, model_config_override, params_override, interactive)
 
 
@@ -0,0 +1,114 @@
+# src/nikhil/amsha/llm_factory/service/llm_cassette.py
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.service.llm_response_cache import LLMResponseCache
+
+_logger = get_logger("llm_factory.transport")
+
+_shared_cassettes: Dict[str, "LLMCassette"] = {}
+_shared_lock = threading.Lock()
+
+
+class LLMCassette:
+    """
+    JSON-lines file of recorded LLM exchanges used by the record-and-replay transport.
+
+    Each line holds one exchange: its key, the model, the normalised messages, the
+    response, the observed latency and the reported token usage. Exchanges are
+    matched on the model, the normalised messages and the requested response
+    model. When the same call was recorded several times the recordings are
+    served in order, and the last one is repeated once they are used up.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._load()
+
+    @classmethod
+    def shared(cls, path: str) -> "LLMCassette":
+        """Returns the process-wide cassette for a file, loading it on first use."""
+        path = os.path.abspath(path)
+        with _shared_lock:
+            cassette = _shared_cassettes.get(path)
+            if cassette is None:
+                cassette = cls(path)
+                _shared_cassettes[path] = cassette
+            return cassette
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    entry = None
+                # Valid JSON that is not a recorded exchange is as unusable as a broken line
+                if not isinstance(entry, dict) or not isinstance(entry.get("key"), str) or "response" not in entry:
+                    _logger.warning("Skipping malformed cassette line", extra={
+                        "cassette": self.path,
+                        "line": line_number
+                    })
+                    continue
+                self._entries.setdefault(entry["key"], []).append(entry)
+
+    @staticmethod
+    def build_key(model: str, messages: Any, response_model: Any = None) -> str:
+        """Builds the key an exchange is recorded and looked up under."""
+        extra = {"response_model": response_model.__name__} if response_model else None
+        return LLMResponseCache.build_key(model, {}, messages, extra)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+    def record(self, model: str, messages: Any, response: str, latency_seconds: float = 0.0,
+               usage: Optional[Dict[str, int]] = None, response_model: Any = None) -> None:
+        """
+        Appends an exchange to the cassette file.
+
+        Args:
+            model: Model string of the LLM that produced the response
+            messages: Message payload of the call
+            response: Text response
+            latency_seconds: Observed duration of the call
+            usage: Token usage reported for the call
+            response_model: Response model requested by the call, if any
+        """
+        entry = {
+            "key": self.build_key(model, messages, response_model),
+            "model": model,
+            "messages": LLMResponseCache.normalize_messages(messages),
+            "response": response,
+            "latency_seconds": round(latency_seconds, 4),
+            "usage": usage or {},
+            "recorded_at": time.time(),
+        }
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._entries.setdefault(entry["key"], []).append(entry)
+
+    def next_response(self, model: str, messages: Any, response_model: Any = None) -> Optional[Dict[str, Any]]:
+        """Returns the next recorded exchange matching a call, or None if none was recorded."""
+        key = self.build_key(model, messages, response_model)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = min(cursor + 1, len(entries) - 1)
+            return entries[cursor]
@@ -0,0 +1,322 @@
+# src/nikhil/amsha/llm_factory/service/llm_circuit_breaker.py
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.domain.model.llm_circuit_breaker_config import LLMCircuitBreakerConfig
+
+_logger = get_logger("llm_factory.circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_shared_breakers: Dict[str, "CircuitBreaker"] = {}
+_shared_lock = threading.Lock()
+_prober: Optional["EndpointHealthProber"] = None
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str):
+        super().__init__(f"Circuit for LLM endpoint '{endpoint}' is open")
+        self.endpoint = endpoint
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker of one LLM endpoint.
+
+    Closed, every call goes through and consecutive failures are counted; reaching
+    the threshold opens the circuit. Open, calls are rejected at once until
+    `open_seconds` have passed (or a health probe succeeds), after which the
+    circuit is half-open and lets a limited number of trial calls through: a
+    successful trial closes it again, a failed one reopens it. Thread-safe.
+    """
+
+    def __init__(self, key: str, failure_threshold: int = 5, open_seconds: float = 30.0,
+                 half_open_max_calls: int = 1, probe_failure_threshold: int = 2,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            key: Identifier of the endpoint (used in logs, metrics and registry lookups)
+            failure_threshold: Consecutive failed calls that open the circuit
+            open_seconds: How long an open circuit rejects calls
+            half_open_max_calls: Trial calls allowed at once while half-open
+            probe_failure_threshold: Consecutive failed health probes that open the circuit
+            clock: Monotonic clock used for the open period
+        """
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.probe_failure_threshold = probe_failure_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._consecutive_probe_failures = 0
+        self._trials = 0
+        self._metrics = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+            "probes": 0,
+            "failed_probes": 0,
+        }
+
+    @classmethod
+    def shared(cls, config: LLMCircuitBreakerConfig, endpoint: str,
+               probe_url: Optional[str] = None) -> "CircuitBreaker":
+        """
+        Returns the process-wide breaker of an endpoint, creating it on first use.
+
+        The first config seen for an endpoint sets its thresholds. With a probe URL
+        and a probe interval configured, the endpoint is also registered with the
+        background health prober.
+        """
+        global _prober
+        with _shared_lock:
+            breaker = _shared_breakers.get(endpoint)
+            if breaker is None:
+                breaker = cls(endpoint, config.failure_threshold, config.open_seconds,
+                              config.half_open_max_calls, config.probe_failure_threshold)
+                _shared_breakers[endpoint] = breaker
+                if probe_url and config.probe_interval_seconds:
+                    if _prober is None:
+                        _prober = EndpointHealthProber(config.probe_interval_seconds,
+                                                       config.probe_timeout_seconds)
+                    _prober.register(breaker, probe_url)
+            return breaker
+
+    def _current_state(self) -> str:
+        # Called with the lock held; an expired open period turns into half-open
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._half_open()
+        return self._state
+
+    def _half_open(self) -> None:
+        self._state = HALF_OPEN
+        self._trials = 0
+        _logger.info("LLM endpoint circuit half-open", extra={"endpoint": self.key})
+
+    def _open(self, reason: str) -> None:
+        if self._state != OPEN:
+            self._metrics["opened"] += 1
+            _logger.warning("LLM endpoint circuit opened", extra={
+                "endpoint": self.key,
+                "reason": reason,
+                "open_seconds": self.open_seconds
+            })
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._trials = 0
+
+    def _close(self) -> None:
+        if self._state != CLOSED:
+            _logger.info("LLM endpoint circuit closed", extra={"endpoint": self.key})
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def is_available(self) -> bool:
+        """Returns whether calls may currently reach the endpoint, without taking a trial slot."""
+        return self.state != OPEN
+
+    def allow(self) -> bool:
+        """Admits a call; returns False if it must be rejected because the circuit is open."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            self._metrics["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        """Registers a successful call."""
+        with self._lock:
+            self._metrics["successes"] += 1
+            self._consecutive_failures = 0
+            if self._state == HALF_OPEN:
+                self._close()
+
+    def record_failure(self) -> None:
+        """Registers a failed call."""
+        with self._lock:
+            self._metrics["failures"] += 1
+            self._consecutive_failures += 1
+            state = self._current_state()
+            if state == HALF_OPEN:
+                self._open("trial call failed")
+            elif state == CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._open(f"{self._consecutive_failures} consecutive failures")
+
+    def release(self) -> None:
+        """
+        Registers a call that failed for a reason other than the endpoint (a bad request,
+        for example): it counts neither way, but gives its half-open trial slot back.
+        """
+        with self._lock:
+            if self._current_state() == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def record_probe(self, healthy: bool) -> None:
+        """
+        Registers the outcome of a health probe.
+
+        A healthy probe ends the open period early; enough failed probes open the
+        circuit, or keep an open one open, without waiting for calls to fail.
+        """
+        with self._lock:
+            self._metrics["probes"] += 1
+            state = self._current_state()
+            if healthy:
+                self._consecutive_probe_failures = 0
+                if state == OPEN:
+                    self._half_open()
+                return
+            self._metrics["failed_probes"] += 1
+            self._consecutive_probe_failures += 1
+            if self._consecutive_probe_failures >= self.probe_failure_threshold:
+                self._open(f"{self._consecutive_probe_failures} consecutive failed health probes")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns the state, call outcomes, rejections and probe outcomes of the endpoint."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "endpoint": self.key,
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+            })
+            return metrics
+
+
+def _http_probe(url: str, timeout: float) -> bool:
+    """Returns whether the endpoint answers; any HTTP response below 500 means the server is up."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status < 500
+    except urllib.error.HTTPError as e:
+        return e.code < 500
+    except Exception:
+        return False
+
+
+class EndpointHealthProber:
+    """
+    Background thread that periodically probes registered endpoints.
+
+    A probe is a single GET with a short timeout (by default `<base_url>/models`,
+    which OpenAI-compatible servers such as LM Studio answer without loading a
+    model), so it costs the endpoint next to nothing.
+    """
+
+    def __init__(self, interval_seconds: float, timeout_seconds: float = 2.0,
+                 probe: Callable[[str, float], bool] = _http_probe):
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self._probe = probe
+        self._targets: List[tuple] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, breaker: CircuitBreaker, url: str) -> None:
+        """Adds an endpoint to the probe rounds, starting the thread on first registration."""
+        with self._lock:
+            self._targets.append((breaker, url))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="amsha-llm-health-prober", daemon=True)
+                self._thread.start()
+
+    def probe_once(self) -> None:
+        """Probes every registered endpoint once."""
+        with self._lock:
+            targets = list(self._targets)
+        for breaker, url in targets:
+            healthy = self._probe(url, self.timeout_seconds)
+            breaker.record_probe(healthy)
+            if not healthy:
+                _logger.debug("LLM endpoint health probe failed", extra={"endpoint": breaker.key, "url": url})
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.probe_once()
+            except Exception as e:
+                _logger.warning("LLM endpoint health probing failed", extra={"error": str(e)})
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + self.timeout_seconds)
+
+
+def endpoint_key(model: str, base_url: Optional[str] = None) -> str:
+    """Returns the breaker key of a model: its base_url, or the model string for hosted models."""
+    return base_url.rstrip("/") if base_url else model
+
+
+def get_circuit_breaker(endpoint: str) -> Optional[CircuitBreaker]:
+    """Returns the shared breaker of an endpoint, or None if none was created."""
+    with _shared_lock:
+        return _shared_breakers.get(endpoint)
+
+
+def is_endpoint_available(endpoint: str) -> bool:
+    """Returns whether calls may reach an endpoint; endpoints without a breaker always may."""
+    breaker = get_circuit_breaker(endpoint)
+    return breaker is None or breaker.is_available()
+
+
+def get_circuit_breaker_metrics() -> Dict[str, Dict[str, Any]]:
+    """Returns the metrics of every shared breaker, keyed by endpoint."""
+    with _shared_lock:
+        breakers = list(_shared_breakers.values())
+    return {breaker.key: breaker.get_metrics() for breaker in breakers}
+
+
+def circuit_endpoints(llm: Any) -> List[str]:
+    """
+    Returns the endpoints an LLM may call: the breaker keys of the circuit-breaking
+    wrappers inside it, including those of every model behind a RoutingLLM.
+    """
+    endpoints: List[str] = []
+    pending = [llm]
+    while pending:
+        # Instance dicts are read directly so wrappers never forward the lookup to the wrapped LLM
+        state = getattr(pending.pop(), "__dict__", {})
+        breaker = state.get("_breaker")
+        if isinstance(breaker, CircuitBreaker) and breaker.key not in endpoints:
+            endpoints.append(breaker.key)
+        if state.get("_inner") is not None:
+            pending.append(state["_inner"])
+        models = state.get("_models")
+        if isinstance(models, dict):
+            pending.extend(models.values())
+    return endpoints
+
+
+def reset_circuit_breakers() -> None:
+    """Drops every shared breaker and stops the health prober (used by tests)."""
+    global _prober
+    with _shared_lock:
+        _shared_breakers.clear()
+        prober, _prober = _prober, None
+    if prober is not None:
+        prober.stop()
@@ -0,0 +1,128 @@
+# src/nikhil/amsha/llm_factory/service/llm_context_window.py
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Placeholders CrewAI interpolates into agent and task templates
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_\-]*)\}")
+# Words, numbers and single punctuation marks: each is at least one token
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+
+class TokenEstimator:
+    """
+    Fast, local and deliberately conservative prompt token estimate.
+
+    A text counts as the larger of its characters divided by
+    `chars_per_token` and its number of words and punctuation marks, which
+    stays above real BPE counts for prose, code and JSON alike without a
+    tokenizer download. Templates are analysed once and cached: the tokens of
+    their static text and the placeholders they contain, so estimating a
+    prompt only counts the interpolated input values.
+    """
+
+    def __init__(self, chars_per_token: float = 3.5, max_templates: int = 1024):
+        """
+        Args:
+            chars_per_token: Average characters per token assumed for plain text
+            max_templates: Analysed templates kept, least recently used first out
+        """
+        self.chars_per_token = chars_per_token
+        self.max_templates = max_templates
+        self._templates: "OrderedDict[str, Tuple[int, Tuple[str, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {"template_hits": 0, "template_misses": 0}
+
+    def count(self, text: Any) -> int:
+        """Estimated tokens of a text (non-strings are counted in their string form)."""
+        if text is None:
+            return 0
+        text = text if isinstance(text, str) else str(text)
+        if not text:
+            return 0
+        return max(math.ceil(len(text) / self.chars_per_token), len(_PIECE.findall(text)))
+
+    def analyse(self, template: Optional[str]) -> Tuple[int, Tuple[str, ...]]:
+        """
+        Returns the tokens of a template without its placeholders, and the placeholder
+        names in order of appearance (repeated placeholders appear repeatedly).
+        """
+        if not template:
+            return 0, ()
+        with self._lock:
+            cached = self._templates.get(template)
+            if cached is not None:
+                self._templates.move_to_end(template)
+                self._metrics["template_hits"] += 1
+                return cached
+            self._metrics["template_misses"] += 1
+        analysed = (self.count(_PLACEHOLDER.sub(" ", template)), tuple(_PLACEHOLDER.findall(template)))
+        with self._lock:
+            self._templates[template] = analysed
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return analysed
+
+    def estimate(self, template: Optional[str], inputs: Optional[Mapping[str, Any]] = None,
+                 input_tokens: Optional[Dict[str, int]] = None) -> int:
+        """
+        Estimated tokens of a template once the inputs are interpolated.
+
+        Args:
+            template: Agent or task template with {placeholders}
+            inputs: Values interpolated into the placeholders
+            input_tokens: Optional memo of input token counts shared across the templates of one prompt
+
+        Placeholders without an input keep their literal text.
+        """
+        static_tokens, placeholders = self.analyse(template)
+        inputs = inputs or {}
+        memo = input_tokens if input_tokens is not None else {}
+        tokens = static_tokens
+        for name in placeholders:
+            if name not in inputs:
+                tokens += self.count("{" + name + "}")
+                continue
+            if name not in memo:
+                memo[name] = self.count(inputs[name])
+            tokens += memo[name]
+        return tokens
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Returns the template cache hits, misses and size."""
+        with self._lock:
+            return dict(self._metrics, cached_templates=len(self._templates))
+
+
+_default_estimator = TokenEstimator()
+
+
+def get_token_estimator() -> TokenEstimator:
+    """Returns the process-wide estimator, whose template cache every guard shares."""
+    return _default_estimator
+
+
+def context_window_of(llm: Any) -> Optional[int]:
+    """
+    Returns the configured context window of a built LLM, None if it has none.
+
+    Wrappers are looked through; behind a RoutingLLM any model may serve the
+    call, so the smallest configured window of its models applies.
+    """
+    windows = []
+    pending = [llm]
+    while pending:
+        # Instance dicts are read directly so wrappers never forward the lookup to the wrapped LLM
+        state = getattr(pending.pop(), "__dict__", {})
+        window = state.get("_context_window")
+        if isinstance(window, int):
+            windows.append(window)
+            continue
+        if state.get("_inner") is not None:
+            pending.append(state["_inner"])
+        models = state.get("_models")
+        if isinstance(models, dict):
+            pending.extend(models.values())
+    return min(windows) if windows else None
@@ -0,0 +1,50 @@
+# src/nikhil/amsha/llm_factory/service/llm_error_classifier.py
+from typing import Collection, Iterator
+
+# HTTP status codes that indicate a transient provider failure
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Fragments of exception class names raised by LLM clients for transient failures
+RETRYABLE_ERROR_MARKERS = (
+    "RateLimit", "Timeout", "APIConnection", "ServiceUnavailable",
+    "InternalServer", "Overloaded", "BadGateway",
+)
+
+# Provider failures that will happen again no matter how often the call is repeated
+PERMANENT_ERROR_NAMES = (
+    "AuthenticationError", "PermissionDeniedError", "NotFoundError", "ContextWindowExceededError",
+)
+
+
+def exception_chain(error: BaseException) -> Iterator[BaseException]:
+    """Yields the error and every exception it was raised from, following __cause__ / __context__."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def is_transient_error(error: BaseException,
+                       transient_names: Collection[str] = (),
+                       permanent_names: Collection[str] = PERMANENT_ERROR_NAMES) -> bool:
+    """
+    Classifies an LLM call error as transient (timeouts, connection errors, 429, 5xx) or permanent.
+
+    Wrapped exceptions are unwrapped through their cause/context chain; the first
+    exception in the chain that can be classified decides.
+    """
+    for exc in exception_chain(error):
+        name = type(exc).__name__
+        if name in transient_names:
+            return True
+        if name in permanent_names:
+            return False
+        if isinstance(exc, (TimeoutError, ConnectionError)):
+            return True
+        status = getattr(exc, "status_code", None)
+        if isinstance(status, int):
+            return status in RETRYABLE_STATUS_CODES
+        if any(marker in name for marker in RETRYABLE_ERROR_MARKERS):
+            return True
+    return False
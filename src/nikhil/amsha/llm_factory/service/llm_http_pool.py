@@ -0,0 +1,184 @@
+# src/nikhil/amsha/llm_factory/service/llm_http_pool.py
+import threading
+from typing import Any, Dict
+
+import httpx
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.domain.model.llm_http_pool_config import LLMHTTPPoolConfig
+
+_logger = get_logger("llm_factory.http_pool")
+
+_shared_pools: Dict[str, "LLMHTTPPool"] = {}
+_shared_lock = threading.Lock()
+
+# Provider SDKs pass their own timeouts per request; this only applies to requests that don't
+_DEFAULT_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+
+def _origin(url: httpx.URL) -> str:
+    return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+
+class PooledTransport(httpx.BaseTransport):
+    """
+    HTTP transport that keeps one keep-alive connection pool per endpoint.
+
+    Every request is dispatched by origin (scheme, host and port) to that
+    endpoint's pool, which is created on first use with the configured limits.
+    New connections and TLS handshakes are counted from httpcore's trace events,
+    so the metrics show how often a request reused a pooled connection.
+    """
+
+    def __init__(self, config: LLMHTTPPoolConfig):
+        self._config = config
+        self._transports: Dict[str, httpx.HTTPTransport] = {}
+        self._metrics: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _transport_for(self, origin: str) -> httpx.HTTPTransport:
+        with self._lock:
+            transport = self._transports.get(origin)
+            if transport is None:
+                limits = self._config.limits_for(origin)
+                transport = httpx.HTTPTransport(limits=httpx.Limits(
+                    max_connections=limits.max_connections,
+                    max_keepalive_connections=limits.max_keepalive_connections,
+                    keepalive_expiry=limits.keepalive_expiry_seconds
+                ))
+                self._transports[origin] = transport
+                self._metrics[origin] = {"requests": 0, "new_connections": 0, "tls_handshakes": 0, "errors": 0}
+            return transport
+
+    def _count(self, origin: str, metric: str) -> None:
+        with self._lock:
+            self._metrics[origin][metric] += 1
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        origin = _origin(request.url)
+        transport = self._transport_for(origin)
+        caller_trace = request.extensions.get("trace")
+
+        def trace(event: str, info: Dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                self._count(origin, "new_connections")
+            elif event == "connection.start_tls.complete":
+                self._count(origin, "tls_handshakes")
+            if caller_trace is not None:
+                caller_trace(event, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        self._count(origin, "requests")
+        try:
+            return transport.handle_request(request)
+        except Exception:
+            self._count(origin, "errors")
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        for transport in transports:
+            transport.close()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns requests, new connections, reused connections and TLS handshakes per endpoint."""
+        with self._lock:
+            snapshot = {origin: dict(metrics) for origin, metrics in self._metrics.items()}
+        for origin, metrics in snapshot.items():
+            reused = max(metrics["requests"] - metrics["new_connections"], 0)
+            limits = self._config.limits_for(origin)
+            metrics.update({
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / metrics["requests"], 4) if metrics["requests"] else 0.0,
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+            })
+        return snapshot
+
+
+class LLMHTTPPool:
+    """
+    Process-wide HTTP client whose per-endpoint pools are shared by every built LLM.
+
+    `attach()` points an LLM's synchronous HTTP traffic at the shared client:
+    native OpenAI-SDK clients are rebound to it, and LiteLLM-backed models use
+    it as LiteLLM's client session. Asynchronous clients are left alone, since
+    their connections are bound to the event loop that opened them.
+    """
+
+    def __init__(self, config: LLMHTTPPoolConfig):
+        self.config = config
+        self.transport = PooledTransport(config)
+        self.client = httpx.Client(transport=self.transport, timeout=_DEFAULT_TIMEOUT, follow_redirects=True)
+
+    @classmethod
+    def shared(cls, config: LLMHTTPPoolConfig) -> "LLMHTTPPool":
+        """Returns the process-wide pool of a configuration, creating it on first use."""
+        key = config.model_dump_json(exclude={"enabled"})
+        with _shared_lock:
+            pool = _shared_pools.get(key)
+            if pool is None:
+                pool = cls(config)
+                _shared_pools[key] = pool
+            return pool
+
+    def attach(self, llm: Any) -> bool:
+        """
+        Routes the HTTP requests of a CrewAI LLM through the shared pools.
+
+        Returns:
+            True if the LLM now uses the shared client, False if its transport is not poolable
+        """
+        try:
+            import openai
+        except ImportError:
+            openai = None
+
+        client = getattr(llm, "client", None)
+        if openai is not None and isinstance(client, openai.OpenAI):
+            llm.client = client.with_options(http_client=self.client)
+            return True
+        if getattr(llm, "is_litellm", False):
+            return self._install_litellm_session()
+        return False
+
+    def _install_litellm_session(self) -> bool:
+        try:
+            import litellm
+        except ImportError:
+            return False
+        with _shared_lock:
+            if litellm.client_session is None:
+                litellm.client_session = self.client
+            elif litellm.client_session is not self.client:
+                # An application-provided session wins over the pool
+                _logger.debug("LiteLLM client session already set, not replacing it with the shared pool")
+                return False
+        return True
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        return self.transport.get_metrics()
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def get_http_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Returns the connection metrics of every shared pool, keyed by endpoint origin."""
+    with _shared_lock:
+        pools = list(_shared_pools.values())
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for pool in pools:
+        metrics.update(pool.get_metrics())
+    return metrics
+
+
+def reset_http_pools() -> None:
+    """Closes and drops every shared pool (used by tests)."""
+    with _shared_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.close()
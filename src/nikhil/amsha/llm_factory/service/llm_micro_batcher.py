@@ -0,0 +1,156 @@
+# src/nikhil/amsha/llm_factory/service/llm_micro_batcher.py
+import concurrent.futures
+import contextvars
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.domain.model.llm_batch_config import LLMBatchConfig
+
+_logger = get_logger("llm_factory.batching")
+
+_shared_batchers: Dict[Tuple[str, int, float, int], "MicroBatcher"] = {}
+_shared_lock = threading.Lock()
+
+
+class MicroBatcher:
+    """
+    Collects concurrent calls to one model into batches and fans the results back out.
+
+    A dispatcher thread takes the first waiting call, keeps collecting calls
+    until the batch is full or `max_wait_seconds` have passed, then submits the
+    whole batch at once to a pool of `max_parallel` workers. Every caller blocks
+    on its own future, so results and errors reach the call that caused them.
+    Calls run in a copy of the caller's context, keeping tracing spans parented.
+    """
+
+    def __init__(self, key: str, max_batch_size: int = 8, max_wait_seconds: float = 0.01,
+                 max_parallel: int = 8, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            key: Identifier of the batched model (used in logs, metrics and the thread names)
+            max_batch_size: Calls collected into one batch at most
+            max_wait_seconds: How long the first call of a batch waits for others to join
+            max_parallel: Provider calls in flight at once
+            clock: Monotonic clock used for the collection window and wait metrics
+        """
+        self.key = key
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_parallel = max_parallel
+        self._clock = clock
+        self._queue: "queue.Queue[Optional[Tuple[Callable[[], Any], concurrent.futures.Future, float]]]" = \
+            queue.Queue()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_parallel, thread_name_prefix=f"amsha-llm-batch-{key}"
+        )
+        self._lock = threading.Lock()
+        self._metrics = {
+            "calls": 0,
+            "batches": 0,
+            "max_batch_size_seen": 0,
+            "total_queue_wait_seconds": 0.0,
+        }
+        self._closed = False
+        self._dispatcher = threading.Thread(target=self._dispatch, name=f"amsha-llm-batcher-{key}", daemon=True)
+        self._dispatcher.start()
+
+    @classmethod
+    def shared(cls, config: LLMBatchConfig, model: str, base_url: Optional[str] = None) -> "MicroBatcher":
+        """Returns the process-wide batcher of a model deployment, creating it on first use."""
+        key = f"{model}@{base_url or 'default'}"
+        registry_key = (key, config.max_batch_size, config.max_wait_ms, config.max_parallel)
+        with _shared_lock:
+            batcher = _shared_batchers.get(registry_key)
+            if batcher is None:
+                batcher = cls(key, config.max_batch_size, config.max_wait_ms / 1000.0, config.max_parallel)
+                _shared_batchers[registry_key] = batcher
+            return batcher
+
+    def submit(self, call: Callable[[], Any]) -> concurrent.futures.Future:
+        """Queues a call for the next batch and returns the future of its result."""
+        if self._closed:
+            raise RuntimeError(f"Micro-batcher '{self.key}' is closed")
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        context = contextvars.copy_context()
+        self._queue.put((lambda: context.run(call), future, self._clock()))
+        return future
+
+    def call(self, call: Callable[[], Any]) -> Any:
+        """Runs a call as part of a batch and returns its result, raising its error."""
+        return self.submit(call).result()
+
+    def _collect(self, first) -> List[tuple]:
+        batch = [first]
+        deadline = self._clock() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - self._clock()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Keep the shutdown marker for the dispatcher loop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _dispatch(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            dispatched_at = self._clock()
+            with self._lock:
+                self._metrics["calls"] += len(batch)
+                self._metrics["batches"] += 1
+                self._metrics["max_batch_size_seen"] = max(self._metrics["max_batch_size_seen"], len(batch))
+                self._metrics["total_queue_wait_seconds"] += sum(dispatched_at - queued for _, _, queued in batch)
+            _logger.debug("Dispatching LLM call batch", extra={"batch_key": self.key, "batch_size": len(batch)})
+            for call, future, _ in batch:
+                self._executor.submit(self._run, call, future)
+
+    @staticmethod
+    def _run(call: Callable[[], Any], future: concurrent.futures.Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(call())
+        except BaseException as e:
+            future.set_exception(e)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns the calls, batches and average batch size and queue wait of the model."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics["mean_batch_size"] = round(metrics["calls"] / metrics["batches"], 4) if metrics["batches"] else 0.0
+        metrics["mean_queue_wait_seconds"] = (
+            round(metrics["total_queue_wait_seconds"] / metrics["calls"], 6) if metrics["calls"] else 0.0
+        )
+        metrics.update({
+            "batch_key": self.key,
+            "waiting": self._queue.qsize(),
+            "max_batch_size": self.max_batch_size,
+            "max_parallel": self.max_parallel,
+        })
+        return metrics
+
+    def close(self) -> None:
+        """Dispatches the calls already queued, then stops the dispatcher and the workers."""
+        self._closed = True
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+
+def reset_micro_batchers() -> None:
+    """Closes and drops every shared batcher (used by tests)."""
+    with _shared_lock:
+        batchers = list(_shared_batchers.values())
+        _shared_batchers.clear()
+    for batcher in batchers:
+        batcher.close()
@@ -0,0 +1,272 @@
+# src/nikhil/amsha/llm_factory/service/llm_rate_limiter.py
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.domain.model.llm_rate_limit_config import LLMRateLimitConfig
+
+_logger = get_logger("llm_factory.rate_limit")
+
+_shared_limiters: Dict[Tuple[str, str, Optional[int], Optional[int]], "TokenBucketRateLimiter"] = {}
+_shared_lock = threading.Lock()
+
+
+class TokenBucketRateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+
+    Each budget is a bucket holding up to one minute's allowance that refills
+    continuously. Callers are served strictly in arrival order: only the caller at
+    the head of the queue may take from the buckets, so a large request is not
+    starved by a stream of small ones.
+    """
+
+    def __init__(self, key: str, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            key: Identifier of the rate-limited deployment (used in logs and metrics)
+            requests_per_minute: Request budget (None for unlimited)
+            tokens_per_minute: Token budget (None for unlimited)
+            clock: Monotonic clock used for refills and wait times
+            sleep: Function used to wait for the buckets to refill
+        """
+        self.key = key
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._queue: deque = deque()
+        self._queue_cond = threading.Condition()
+        self._state_lock = threading.Lock()
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated_at = clock()
+        self._metrics = {
+            "acquisitions": 0,
+            "throttled": 0,
+            "timeouts": 0,
+            "tokens_consumed": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    @classmethod
+    def shared(cls, config: LLMRateLimitConfig, model: str, base_url: Optional[str] = None) -> "TokenBucketRateLimiter":
+        """Returns the process-wide limiter of a deployment, creating it on first use."""
+        limits = config.limits_for(model)
+        key = f"{model}@{base_url or 'default'}"
+        registry_key = (config.backend, key, limits.requests_per_minute, limits.tokens_per_minute)
+        with _shared_lock:
+            limiter = _shared_limiters.get(registry_key)
+            if limiter is None:
+                if config.backend == "sqlite":
+                    limiter = SQLiteTokenBucketRateLimiter(
+                        os.path.join(config.directory, SQLiteTokenBucketRateLimiter.DB_FILENAME),
+                        key, limits.requests_per_minute, limits.tokens_per_minute
+                    )
+                else:
+                    limiter = cls(key, limits.requests_per_minute, limits.tokens_per_minute)
+                _shared_limiters[registry_key] = limiter
+            return limiter
+
+    def _clamp(self, tokens: int) -> int:
+        # A request larger than the whole bucket could never be served otherwise
+        return min(tokens, self.tokens_per_minute) if self.tokens_per_minute else tokens
+
+    def _refill(self, requests: float, tokens: float, elapsed: float) -> Tuple[float, float]:
+        if self.requests_per_minute:
+            requests = min(float(self.requests_per_minute), requests + elapsed * self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            tokens = min(float(self.tokens_per_minute), tokens + elapsed * self.tokens_per_minute / 60.0)
+        return requests, tokens
+
+    def _take(self, requests: float, tokens: float, cost: int) -> Tuple[float, float, float]:
+        """Returns the bucket levels after taking one request and `cost` tokens, or the wait needed."""
+        wait = 0.0
+        if self.requests_per_minute and requests < 1:
+            wait = max(wait, (1 - requests) * 60.0 / self.requests_per_minute)
+        if self.tokens_per_minute and tokens < cost:
+            wait = max(wait, (cost - tokens) * 60.0 / self.tokens_per_minute)
+        if wait > 0:
+            return requests, tokens, wait
+        if self.requests_per_minute:
+            requests -= 1
+        if self.tokens_per_minute:
+            tokens -= cost
+        return requests, tokens, 0.0
+
+    def _try_consume(self, tokens: int) -> float:
+        """Takes from the buckets if possible; returns 0 on success or the seconds to wait."""
+        with self._state_lock:
+            now = self._clock()
+            self._requests, self._tokens = self._refill(self._requests, self._tokens, now - self._updated_at)
+            self._updated_at = now
+            self._requests, self._tokens, wait = self._take(self._requests, self._tokens, tokens)
+            return wait
+
+    def _adjust_tokens(self, delta: int) -> None:
+        with self._state_lock:
+            limit = float(self.tokens_per_minute)
+            self._tokens = min(limit, self._tokens - delta)
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """
+        Blocks until one request and `tokens` tokens are available, then takes them.
+
+        Args:
+            tokens: Estimated tokens of the call
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the budget is not available within the timeout
+        """
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return 0.0
+
+        tokens = self._clamp(tokens)
+        start = self._clock()
+        deadline = start + timeout if timeout is not None else None
+        ticket = object()
+        throttled = False
+
+        with self._queue_cond:
+            self._queue.append(ticket)
+            while self._queue[0] is not ticket:
+                remaining = deadline - self._clock() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    self._queue.remove(ticket)
+                    self._queue_cond.notify_all()
+                    self._raise_timeout(tokens)
+                self._queue_cond.wait(remaining)
+                throttled = True
+
+        try:
+            while True:
+                wait = self._try_consume(tokens)
+                if wait <= 0:
+                    break
+                if deadline is not None and self._clock() + wait > deadline:
+                    self._raise_timeout(tokens)
+                self._sleep(wait)
+                throttled = True
+        finally:
+            with self._queue_cond:
+                self._queue.popleft()
+                self._queue_cond.notify_all()
+
+        waited = self._clock() - start
+        with self._state_lock:
+            self._metrics["acquisitions"] += 1
+            self._metrics["tokens_consumed"] += tokens
+            self._metrics["total_wait_seconds"] += waited
+            self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], waited)
+            if throttled:
+                self._metrics["throttled"] += 1
+        if throttled:
+            _logger.debug("LLM call throttled by rate limiter", extra={
+                "limiter_key": self.key,
+                "wait_seconds": round(waited, 4),
+                "tokens": tokens
+            })
+        return waited
+
+    def _raise_timeout(self, tokens: int) -> None:
+        with self._state_lock:
+            self._metrics["timeouts"] += 1
+        raise TimeoutError(f"Rate limit budget for '{self.key}' not available in time ({tokens} tokens requested)")
+
+    def settle(self, token_delta: int) -> None:
+        """
+        Corrects the token bucket once the real size of a call is known.
+
+        Args:
+            token_delta: Actual minus reserved tokens (negative values refund the bucket)
+        """
+        if not self.tokens_per_minute or not token_delta:
+            return
+        self._adjust_tokens(token_delta)
+        with self._state_lock:
+            self._metrics["tokens_consumed"] += token_delta
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns acquisition and wait-time statistics together with the current queue length."""
+        with self._state_lock:
+            metrics = dict(self._metrics)
+        with self._queue_cond:
+            metrics["waiting"] = len(self._queue)
+        metrics["mean_wait_seconds"] = (
+            round(metrics["total_wait_seconds"] / metrics["acquisitions"], 4) if metrics["acquisitions"] else 0.0
+        )
+        metrics.update({
+            "limiter_key": self.key,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+        })
+        return metrics
+
+
+class SQLiteTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """
+    Token-bucket limiter whose buckets live in a local SQLite database.
+
+    Every process using the same database file shares the buckets; updates run in
+    IMMEDIATE transactions, so SQLite's file lock serialises them. Within a
+    process callers are still queued in arrival order.
+    """
+
+    DB_FILENAME = "llm_rate_limits.sqlite3"
+
+    def __init__(self, db_path: str, key: str, requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None, sleep: Callable[[float], None] = time.sleep):
+        # Wall-clock time, since the bucket timestamps are compared across processes
+        super().__init__(key, requests_per_minute, tokens_per_minute, clock=time.time, sleep=sleep)
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, requests REAL NOT NULL, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    def _transaction(self, update: Callable[[float, float, float], Tuple[float, float, Any]]) -> Any:
+        with self._state_lock:
+            now = self._clock()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT requests, tokens, updated_at FROM buckets WHERE key = ?", (self.key,)
+                ).fetchone()
+                if row is None:
+                    requests, tokens = float(self.requests_per_minute or 0), float(self.tokens_per_minute or 0)
+                else:
+                    requests, tokens = self._refill(row[0], row[1], max(now - row[2], 0.0))
+                requests, tokens, outcome = update(requests, tokens, now)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (key, requests, tokens, updated_at) VALUES (?, ?, ?, ?)",
+                    (self.key, requests, tokens, now)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return outcome
+
+    def _try_consume(self, tokens: int) -> float:
+        return self._transaction(lambda requests, available, now: self._take(requests, available, tokens))
+
+    def _adjust_tokens(self, delta: int) -> None:
+        limit = float(self.tokens_per_minute)
+        self._transaction(lambda requests, tokens, now: (requests, min(limit, tokens - delta), None))
+
+    def close(self) -> None:
+        with self._state_lock:
+            self._conn.close()
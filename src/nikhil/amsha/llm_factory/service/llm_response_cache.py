@@ -0,0 +1,171 @@
+# src/nikhil/amsha/llm_factory/service/llm_response_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.domain.model.llm_cache_config import LLMCacheConfig
+
+_logger = get_logger("llm_factory.cache")
+
+_MESSAGE_KEYS = ("role", "content", "name", "tool_call_id")
+
+_shared_caches: Dict[str, "LLMResponseCache"] = {}
+_shared_lock = threading.Lock()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed store for LLM responses with size- and age-based eviction.
+
+    Entries are keyed by a SHA-256 fingerprint of the model, its generation
+    parameters and the normalised message payload. The store is safe to share
+    between threads, and SQLite locking makes it safe to share between processes.
+    """
+
+    DB_FILENAME = "llm_response_cache.sqlite3"
+
+    def __init__(self, directory: str, max_size_mb: float = 256.0, max_age_hours: float = 168.0):
+        os.makedirs(directory, exist_ok=True)
+        self.db_path = os.path.join(directory, self.DB_FILENAME)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_hours * 3600
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._metrics = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @classmethod
+    def shared(cls, config: LLMCacheConfig) -> "LLMResponseCache":
+        """Returns the process-wide cache instance for the configured directory."""
+        directory = os.path.abspath(config.directory)
+        with _shared_lock:
+            cache = _shared_caches.get(directory)
+            if cache is None:
+                cache = cls(directory, config.max_size_mb, config.max_age_hours)
+                _shared_caches[directory] = cache
+            return cache
+
+    @staticmethod
+    def normalize_messages(messages: Any) -> List[Dict[str, Any]]:
+        """Converts a CrewAI message payload into a stable, comparable structure."""
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        normalized = []
+        for message in messages or []:
+            entry = {}
+            for key in _MESSAGE_KEYS:
+                value = message.get(key)
+                if value is None:
+                    continue
+                if isinstance(value, str):
+                    value = value.replace("\r\n", "\n").strip()
+                entry[key] = value
+            normalized.append(entry)
+        return normalized
+
+    @staticmethod
+    def build_key(model: str, params: Dict[str, Any], messages: Any, extra: Optional[Dict[str, Any]] = None) -> str:
+        """Builds the cache key for a call."""
+        payload = {
+            "model": model,
+            "params": params,
+            "messages": LLMResponseCache.normalize_messages(messages),
+            "extra": extra or {},
+        }
+        canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached response or None on a miss (expired entries count as misses)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age_seconds:
+                self._metrics["misses"] += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._metrics["hits"] += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """Stores a response and evicts entries that exceed the size or age limits."""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now),
+            )
+            self._conn.commit()
+            self._metrics["stores"] += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Removes expired entries, then least recently used entries until the size limit is met.
+
+        Returns:
+            Number of evicted entries
+        """
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            evicted = self._conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,)).rowcount
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_size_bytes:
+                rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+                stale_keys = []
+                for key, size in rows:
+                    if total <= self.max_size_bytes:
+                        break
+                    stale_keys.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+                evicted += len(stale_keys)
+            self._conn.commit()
+            self._metrics["evictions"] += evicted
+
+        if evicted:
+            _logger.debug("LLM response cache eviction", extra={
+                "evicted_entries": evicted,
+                "cache_path": self.db_path
+            })
+        return evicted
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns hit/miss counters together with the current store size."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            metrics = dict(self._metrics)
+        lookups = metrics["hits"] + metrics["misses"]
+        metrics["hit_ratio"] = round(metrics["hits"] / lookups, 4) if lookups else 0.0
+        metrics["entries"] = entries
+        metrics["size_bytes"] = size
+        return metrics
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,135 @@
+# src/nikhil/amsha/llm_factory/service/llm_router.py
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from amsha.llm_factory.domain.model.llm_routing_config import LLMRoutingConfig
+
+POLICIES = ("weighted_round_robin", "least_outstanding", "ewma_latency")
+
+
+class _RoutedModel:
+    __slots__ = ("key", "weight", "current_weight", "outstanding", "ewma_latency", "calls", "failures", "failed_at")
+
+    def __init__(self, key: str, weight: int):
+        self.key = key
+        self.weight = weight
+        self.current_weight = 0
+        self.outstanding = 0
+        self.ewma_latency: Optional[float] = None
+        self.calls = 0
+        self.failures = 0
+        self.failed_at: Optional[float] = None
+
+
+class LLMRouter:
+    """
+    Chooses the model of every call among the routed models of a use case.
+
+    `candidates()` returns the models in the order a call should try them: the
+    policy's pick first, then the remaining models as failover targets. Models
+    that failed within the cooldown go last, unless every model is cooling down.
+    Callers report each attempt through `begin()` / `end()`, which feed the
+    in-flight counts and latency averages of the policies. Thread-safe.
+    """
+
+    def __init__(self, keys: Sequence[str], policy: str = "weighted_round_robin",
+                 weights: Optional[Dict[str, int]] = None, failure_cooldown_seconds: float = 30.0,
+                 ewma_alpha: float = 0.3, clock: Callable[[], float] = time.monotonic):
+        if not keys:
+            raise ValueError("At least one model is required for routing")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown routing policy '{policy}'. Expected one of {', '.join(POLICIES)}")
+        weights = weights or {}
+        self.policy = policy
+        self.failure_cooldown_seconds = failure_cooldown_seconds
+        self.ewma_alpha = ewma_alpha
+        self._clock = clock
+        self._models = [_RoutedModel(key, max(int(weights.get(key, 1)), 1)) for key in keys]
+        self._by_key = {model.key: model for model in self._models}
+        self._tiebreak = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: LLMRoutingConfig, keys: Sequence[str]) -> "LLMRouter":
+        return cls(keys, policy=config.policy, weights=config.weights,
+                   failure_cooldown_seconds=config.failure_cooldown_seconds, ewma_alpha=config.ewma_alpha)
+
+    @property
+    def keys(self) -> List[str]:
+        return [model.key for model in self._models]
+
+    def _load(self, model: _RoutedModel) -> float:
+        if self.policy == "least_outstanding":
+            return model.outstanding
+        # Unmeasured models score 0 so every model gets probed once
+        return (model.ewma_latency or 0.0) * (model.outstanding + 1)
+
+    def _pick(self, pool: List[_RoutedModel]) -> _RoutedModel:
+        if self.policy == "weighted_round_robin":
+            # Smooth weighted round robin: interleaves models instead of sending bursts to the heaviest
+            total = sum(model.weight for model in pool)
+            for model in pool:
+                model.current_weight += model.weight
+            chosen = max(pool, key=lambda model: model.current_weight)
+            chosen.current_weight -= total
+            return chosen
+        lowest = min(self._load(model) for model in pool)
+        tied = [model for model in pool if self._load(model) == lowest]
+        # Rotate among equally loaded models rather than always favouring the first one
+        self._tiebreak += 1
+        return tied[self._tiebreak % len(tied)]
+
+    def candidates(self) -> List[str]:
+        """Returns the model keys in the order a call should try them."""
+        with self._lock:
+            now = self._clock()
+            healthy = [model for model in self._models
+                       if model.failed_at is None or now - model.failed_at >= self.failure_cooldown_seconds]
+            cooling = sorted((model for model in self._models if model not in healthy), key=lambda m: m.failed_at)
+            pool = healthy or cooling
+            chosen = self._pick(pool)
+            if self.policy == "weighted_round_robin":
+                rest = [model for model in pool if model is not chosen]
+            else:
+                rest = sorted((model for model in pool if model is not chosen), key=self._load)
+            if pool is healthy:
+                rest += cooling
+            return [chosen.key] + [model.key for model in rest]
+
+    def begin(self, key: str) -> float:
+        """Registers a call in flight on a model and returns its start time."""
+        with self._lock:
+            self._by_key[key].outstanding += 1
+        return self._clock()
+
+    def end(self, key: str, started: float, success: bool) -> None:
+        """Registers the outcome of a call started with `begin()`."""
+        now = self._clock()
+        with self._lock:
+            model = self._by_key[key]
+            model.outstanding -= 1
+            model.calls += 1
+            if success:
+                latency = now - started
+                model.ewma_latency = latency if model.ewma_latency is None else (
+                    self.ewma_alpha * latency + (1 - self.ewma_alpha) * model.ewma_latency
+                )
+                model.failed_at = None
+            else:
+                model.failures += 1
+                model.failed_at = now
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns calls, failures, calls in flight and the latency average of every model."""
+        with self._lock:
+            return {
+                model.key: {
+                    "calls": model.calls,
+                    "failures": model.failures,
+                    "outstanding": model.outstanding,
+                    "ewma_latency_seconds": round(model.ewma_latency, 4) if model.ewma_latency is not None else None,
+                    "weight": model.weight,
+                }
+                for model in self._models
+            }
@@ -1,17 +1,30 @@
 # src/nikhil/amsha/llm_factory/settings/llm_settings.py
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
 from amsha.llm_factory.domain.model.llm_use_case_config import LLMUseCaseConfig
 from amsha.llm_factory.domain.model.llm_parameters import LLMParameters
 from amsha.llm_factory.domain.model.llm_model_config import LLMModelConfig
+from amsha.llm_factory.domain.model.llm_cache_config import LLMCacheConfig
+from amsha.llm_factory.domain.model.llm_rate_limit_config import LLMRateLimitConfig
+from amsha.llm_factory.domain.model.llm_routing_config import LLMRoutingConfig
+from amsha.llm_factory.domain.model.llm_circuit_breaker_config import LLMCircuitBreakerConfig
+from amsha.llm_factory.domain.model.llm_http_pool_config import LLMHTTPPoolConfig
+from amsha.llm_factory.domain.model.llm_batch_config import LLMBatchConfig
+from amsha.llm_factory.domain.model.llm_model_metadata import LLMModelMetadata
+from amsha.llm_factory.utils.llm_utils import LLMUtils
 
 
 class LLMSettings(BaseModel):
     llm: Dict[str, LLMUseCaseConfig]  # creative, evaluation, etc.
     llm_parameters: Dict[str, LLMParameters]
+    llm_cache: Optional[LLMCacheConfig] = None
+    llm_rate_limit: Optional[LLMRateLimitConfig] = None
+    llm_circuit_breaker: Optional[LLMCircuitBreakerConfig] = None
+    llm_http_pool: Optional[LLMHTTPPoolConfig] = None
+    llm_batching: Optional[LLMBatchConfig] = None
 
     def get_model_config(self, use_case: str, model_key: Optional[str] = None) -> LLMModelConfig:
         use_case_config = self.llm.get(use_case)
@@ -28,3 +41,85 @@ class LLMSettings(BaseModel):
 
     def get_parameters(self, use_case: str) -> LLMParameters:
         return self.llm_parameters.get(use_case, LLMParameters())
+
+    def get_cache_config(self, use_case: str) -> Optional[LLMCacheConfig]:
+        """Returns the response cache config if caching is enabled for the use case."""
+        if self.llm_cache and self.llm_cache.enabled and use_case in self.llm_cache.use_cases:
+            return self.llm_cache
+        return None
+
+    def get_batch_config(self, use_case: str) -> Optional[LLMBatchConfig]:
+        """Returns the micro-batching config if batching is enabled for the use case."""
+        if self.llm_batching and self.llm_batching.enabled and use_case in self.llm_batching.use_cases:
+            return self.llm_batching
+        return None
+
+    def get_rate_limit_config(self) -> Optional[LLMRateLimitConfig]:
+        """Returns the rate limiter config if rate limiting is enabled."""
+        if self.llm_rate_limit and self.llm_rate_limit.enabled:
+            return self.llm_rate_limit
+        return None
+
+    def get_circuit_breaker_config(self) -> Optional[LLMCircuitBreakerConfig]:
+        """Returns the circuit breaker config if circuit breaking is enabled."""
+        if self.llm_circuit_breaker and self.llm_circuit_breaker.enabled:
+            return self.llm_circuit_breaker
+        return None
+
+    def get_http_pool_config(self) -> Optional[LLMHTTPPoolConfig]:
+        """Returns the shared connection pool config if pooling is enabled."""
+        if self.llm_http_pool and self.llm_http_pool.enabled:
+            return self.llm_http_pool
+        return None
+
+    def get_routing_config(self, use_case: str) -> Optional[LLMRoutingConfig]:
+        """Returns the routing config of a use case if routing is enabled for it."""
+        use_case_config = self.llm.get(use_case)
+        if use_case_config and use_case_config.routing and use_case_config.routing.enabled:
+            return use_case_config.routing
+        return None
+
+    def get_routed_model_configs(self, use_case: str) -> Dict[str, LLMModelConfig]:
+        """Returns the models a routed use case spreads its calls across, keyed by model key."""
+        use_case_config = self.llm.get(use_case)
+        if not use_case_config:
+            raise ValueError(f"Use case '{use_case}' not found.")
+        keys = (use_case_config.routing.models if use_case_config.routing else None) or list(use_case_config.models)
+        return {key: self.get_model_config(use_case, key) for key in keys}
+
+    def get_model_name(self, use_case: str, model_key: Optional[str] = None) -> str:
+        """
+        Returns the clean model name a build of the use case reports, without building it.
+
+        A routed use case built without a model key is named after all of its routed models.
+        """
+        if model_key is None and self.get_routing_config(use_case):
+            return "+".join(LLMUtils.extract_model_name(config.model)
+                            for config in self.get_routed_model_configs(use_case).values())
+        return LLMUtils.extract_model_name(self.get_model_config(use_case, model_key).model)
+
+    def get_model_metadata(self, use_case: str, model_key: Optional[str] = None) -> LLMModelMetadata:
+        """Returns the names, output settings and capabilities of a configured model."""
+        selected_model_key = model_key or (self.llm[use_case].default if use_case in self.llm else None)
+        model_config = self.get_model_config(use_case, selected_model_key)
+        output_config = model_config.output_config
+        return LLMModelMetadata(
+            use_case=use_case,
+            model_key=selected_model_key,
+            model=model_config.model,
+            model_name=LLMUtils.extract_model_name(model_config.model),
+            is_default=selected_model_key == self.llm[use_case].default,
+            alias=output_config.alias if output_config else None,
+            folder_name=output_config.folder_name if output_config else None,
+            structure=output_config.structure if output_config else None,
+            display_name=output_config.display_name if output_config else None,
+            context_window=model_config.context_window,
+            capabilities=model_config.capabilities
+        )
+
+    def list_model_metadata(self, use_case: Optional[str] = None) -> List[LLMModelMetadata]:
+        """Returns the metadata of every configured model, or of the models of one use case."""
+        if use_case is not None and use_case not in self.llm:
+            raise ValueError(f"Use case '{use_case}' not found.")
+        use_cases = [use_case] if use_case is not None else list(self.llm)
+        return [self.get_model_metadata(name, model_key) for name in use_cases for model_key in self.llm[name].models]
@@ -0,0 +1,210 @@
+# src/nikhil/amsha/llm_factory/settings/llm_settings_source.py
+import hashlib
+import inspect
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import yaml
+
+from amsha.common.logger import get_logger
+from amsha.llm_factory.settings.llm_settings import LLMSettings
+
+_logger = get_logger("llm_factory.settings_source")
+
+_shared_sources: Dict[str, "LLMSettingsSource"] = {}
+_shared_lock = threading.Lock()
+
+
+class VersionedLLMSettings(NamedTuple):
+    """An immutable snapshot of validated LLM settings."""
+    version: int
+    settings: LLMSettings
+    path: str
+    digest: str
+    loaded_at: float
+
+
+class LLMSettingsSource:
+    """
+    Watched llm_config.yaml whose validated settings are swapped in atomically.
+
+    `current()` returns the latest snapshot. `refresh()` re-reads the file when
+    its mtime or size changed; if the content is different and validates as
+    LLMSettings it becomes the next version, otherwise the current version stays
+    in place and the error is logged, so a broken edit never takes a worker down.
+    Holders of an older snapshot keep using it undisturbed, which lets in-flight
+    work finish on the config it started with. Subscribers are notified of every
+    new version; `start_watching()` refreshes on a background thread.
+    Bound methods are subscribed weakly, so a subscribed object can still be
+    garbage collected.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path of the LLM configuration file
+
+        Raises:
+            FileNotFoundError, yaml.YAMLError, pydantic.ValidationError: If the initial load fails
+        """
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], Optional[Callable[[VersionedLLMSettings], None]]]] = []
+        self._signature = self._stat()
+        self._failed_signature = None
+        self._metrics = {"reloads": 0, "failed_reloads": 0}
+        settings, digest = self._load()
+        self._current = VersionedLLMSettings(1, settings, self.path, digest, time.time())
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    @classmethod
+    def watch_from_config(cls, path: str, config: Optional[Dict[str, Any]]) -> Optional["LLMSettingsSource"]:
+        """
+        Starts watching the shared source of a config file as set by an `llm_hot_reload` block.
+
+        Returns:
+            The watched source, or None if hot reload is not enabled
+        """
+        if not isinstance(config, dict) or not config.get("enabled", False):
+            return None
+        source = cls.shared(path)
+        # Catches up with edits made before the watcher of an existing source polls again
+        source.refresh()
+        return source.start_watching(config.get("poll_interval_seconds", 2.0))
+
+    @classmethod
+    def shared(cls, path: str) -> "LLMSettingsSource":
+        """Returns the process-wide source of a config file, loading it on first use."""
+        key = os.path.abspath(path)
+        with _shared_lock:
+            source = _shared_sources.get(key)
+            if source is None:
+                source = cls(key)
+                _shared_sources[key] = source
+            return source
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            content = f.read()
+        data = yaml.safe_load(content) or {}
+        return LLMSettings(**data), hashlib.sha256(content).hexdigest()
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    def current(self) -> VersionedLLMSettings:
+        """Returns the latest validated snapshot."""
+        return self._current
+
+    def subscribe(self, listener: Callable[[VersionedLLMSettings], None]) -> None:
+        """Registers a callback invoked with every new version."""
+        ref = weakref.WeakMethod(listener) if inspect.ismethod(listener) else (lambda: listener)
+        with self._lock:
+            self._listeners.append(ref)
+
+    def unsubscribe(self, listener: Callable[[VersionedLLMSettings], None]) -> None:
+        with self._lock:
+            self._listeners = [ref for ref in self._listeners if ref() not in (None, listener)]
+
+    def _live_listeners(self) -> List[Callable[[VersionedLLMSettings], None]]:
+        """Resolves the listeners and forgets collected ones; call with _lock held."""
+        self._listeners = [ref for ref in self._listeners if ref() is not None]
+        return [listener for listener in (ref() for ref in self._listeners) if listener is not None]
+
+    def refresh(self) -> bool:
+        """
+        Reloads the file if it changed on disk.
+
+        Returns:
+            True if a new version was swapped in
+        """
+        with self._lock:
+            try:
+                signature = self._stat()
+            except OSError as e:
+                _logger.warning("LLM config file unavailable, keeping the current version", extra={
+                    "path": self.path, "version": self._current.version, "error": str(e)
+                })
+                return False
+            if signature == self._signature or signature == self._failed_signature:
+                return False
+            try:
+                settings, digest = self._load()
+            except Exception as e:
+                # Remembered so the broken file is not re-parsed on every check
+                self._failed_signature = signature
+                self._metrics["failed_reloads"] += 1
+                _logger.error("LLM config reload rejected, keeping the current version", extra={
+                    "path": self.path,
+                    "version": self._current.version,
+                    "error": str(e)
+                })
+                return False
+            self._signature = signature
+            self._failed_signature = None
+            if digest == self._current.digest:
+                return False
+            previous = self._current
+            self._current = VersionedLLMSettings(previous.version + 1, settings, self.path, digest, time.time())
+            self._metrics["reloads"] += 1
+            listeners = self._live_listeners()
+            current = self._current
+
+        _logger.info("LLM config reloaded", extra={
+            "path": self.path,
+            "previous_version": previous.version,
+            "version": current.version
+        })
+        for listener in listeners:
+            try:
+                listener(current)
+            except Exception as e:
+                _logger.error("LLM config reload listener failed", extra={
+                    "path": self.path, "version": current.version, "error": str(e)
+                }, exc_info=True)
+        return True
+
+    def start_watching(self, interval_seconds: float = 2.0) -> "LLMSettingsSource":
+        """Refreshes the source every `interval_seconds` on a daemon thread (idempotent)."""
+        with self._lock:
+            if self._watcher is None:
+                self._stop.clear()
+                self._watcher = threading.Thread(
+                    target=self._watch, args=(interval_seconds,), name="amsha-llm-config-watcher", daemon=True
+                )
+                self._watcher.start()
+        return self
+
+    def _watch(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            self.refresh()
+
+    def stop_watching(self) -> None:
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            self._stop.set()
+            watcher.join()
+
+    def get_metrics(self) -> Dict[str, object]:
+        """Returns the current version and the number of accepted and rejected reloads."""
+        with self._lock:
+            return dict(self._metrics, version=self._current.version, path=self.path)
+
+
+def reset_llm_settings_sources() -> None:
+    """Stops and drops every shared source (used by tests)."""
+    with _shared_lock:
+        sources = list(_shared_sources.values())
+        _shared_sources.clear()
+    for source in sources:
+        source.stop_watching()
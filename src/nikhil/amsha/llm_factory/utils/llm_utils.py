@@ -3,8 +3,6 @@
 import os
 from amsha.common.logger import get_logger
 
-from crewai.telemetry import Telemetry
-
 _logger = get_logger("llm_factory.utils")
 
 
@@ -19,6 +17,8 @@ class LLMUtils:
     def disable_telemetry():
         os.environ["OTEL_SDK_DISABLED"] = "true"
         try:
+            # crewai.telemetry imports the whole of crewai, so it is only loaded here
+            from crewai.telemetry import Telemetry
             for attr in dir(Telemetry):
                 if callable(getattr(Telemetry, attr)) and not attr.startswith("__"):
                     setattr(Telemetry, attr, LLMUtils.noop)
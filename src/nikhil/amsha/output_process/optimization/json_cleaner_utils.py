@@ -4,6 +4,7 @@ import os
 from pathlib import Path  # Import the Path object
 from typing import Any, Optional
 from amsha.common.logger import get_logger
+from amsha.common.tracing import span
 
 
 class JsonCleanerUtils:
@@ -161,8 +162,9 @@ class JsonCleanerUtils:
         """
         Main method to execute the full read, clean, and write process.
         """
-
-        parsed_data = self._clean_and_parse_string(content)
+        with span("output.json_clean", input_file=str(self.input_file_path), characters=len(content)) as clean_span:
+            parsed_data = self._clean_and_parse_string(content)
+            clean_span.set_attribute("parsed", bool(parsed_data))
 
         if parsed_data:
             self.output_file_path.write_text(json.dumps(parsed_data, indent=4), encoding='utf-8')
@@ -2,6 +2,8 @@ from typing import Dict, Any
 
 import yaml
 
+from amsha.common.tracing import span
+
 
 class YamlUtils:
 
@@ -9,7 +11,7 @@ class YamlUtils:
     def yaml_safe_load(config_path: str) -> Dict[str, Any]:
         """Loads and validates the YAML configuration file."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with span("yaml.parse", path=config_path), open(config_path, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
         except FileNotFoundError:
             print(f"❌ Error: Configuration file not found at '{config_path}'")
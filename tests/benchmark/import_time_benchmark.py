@@ -0,0 +1,91 @@
+"""
+Import-time benchmark of the Amsha public entry points.
+
+Imports each module in a fresh interpreter with `-X importtime` and reports
+the cumulative import time, best of `--repeat` runs, together with the heavy
+third-party packages (crewai, pandas, pymongo, ...) the import pulled in.
+Short-lived workers and CLI tools pay this on every start, so modules that
+do not build crews or LLMs should stay free of the heavy packages.
+
+    python tests/benchmark/import_time_benchmark.py --repeat 3
+    python tests/benchmark/import_time_benchmark.py amsha.common.logger
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+# Entry points that load no crew or LLM machinery on import
+LIGHT_ENTRY_POINTS = (
+    "amsha.common.logger",
+    "amsha.common.tracing",
+    "amsha.execution_state.service.state_manager",
+    "amsha.execution_runtime.service.runtime_engine",
+    "amsha.crew_monitor.service.crew_performance_monitor",
+    "amsha.crew_monitor.service.metrics_store",
+    "amsha.crew_monitor.service.reporting_tool",
+    "amsha.crew_forge.service.base_crew_orchestrator",
+    "amsha.crew_forge.service.shared_llm_initialization_service",
+    "amsha.crew_forge.repo.adapters.mongo.crew_config_repo",
+    "amsha.llm_factory.utils.llm_utils",
+)
+
+# Entry points that build crews or LLMs and therefore import crewai
+CREW_ENTRY_POINTS = (
+    "amsha.llm_factory.service.llm_builder",
+    "amsha.crew_forge.orchestrator.file.amsha_crew_file_application",
+)
+
+HEAVY_PACKAGES = ("crewai", "litellm", "pandas", "pymongo", "psutil", "nibandha")
+
+
+def _import_once(module: str) -> Dict[str, Any]:
+    """Imports `module` in a new interpreter and parses the -X importtime report."""
+    # The child sees the same packages as this process, however they were put on the path
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=False
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+    seconds = None
+    packages = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        name = name.strip()
+        packages.add(name.split(".")[0])
+        if name == module:
+            seconds = int(cumulative) / 1e6
+    return {"seconds": seconds, "heavy": sorted(packages.intersection(HEAVY_PACKAGES))}
+
+
+def measure(module: str, repeat: int = 3) -> Dict[str, Any]:
+    """Returns the best cumulative import time of `module` and the heavy packages it loads."""
+    runs = [_import_once(module) for _ in range(repeat)]
+    return {"seconds": round(min(run["seconds"] for run in runs), 4), "heavy": runs[0]["heavy"]}
+
+
+def run_benchmark(modules: Optional[Sequence[str]] = None, repeat: int = 3) -> Dict[str, Any]:
+    modules = list(modules or LIGHT_ENTRY_POINTS + CREW_ENTRY_POINTS)
+    return {"repeat": repeat, "python": sys.version.split()[0],
+            "modules": {module: measure(module, repeat) for module in modules}}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("modules", nargs="*")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.modules, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
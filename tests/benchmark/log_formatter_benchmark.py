@@ -0,0 +1,85 @@
+"""
+Micro-benchmark of the Amsha log formatters.
+
+Formats the same records with StructuredFormatter and JsonLinesFormatter and
+reports the cost per record. The records mirror the orchestrator's call sites:
+a short message with a handful of `extra` fields, and a metrics record with
+many of them. JsonLinesFormatter serialises with orjson when it is installed;
+the report says whether it was.
+
+    python tests/benchmark/log_formatter_benchmark.py --records 20000 --repeat 5
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from amsha.common.logger import ORJSON_AVAILABLE, JsonLinesFormatter, StructuredFormatter
+
+RECORD_SHAPES = {
+    "small_extra": {
+        "crew_name": "writer", "execution_id": "0b6f2c1e-6d4a-4a57-9d7e-4e0d3f1f6a21",
+        "mode": "interactive", "has_inputs": True, "filename_suffix": None,
+    },
+    "metrics_extra": {
+        "crew_name": "writer", "execution_id": "0b6f2c1e-6d4a-4a57-9d7e-4e0d3f1f6a21",
+        "duration_seconds": 12.3456, "total_tokens": 15234, "prompt_tokens": 12000,
+        "completion_tokens": 3234, "cpu_usage_percent": 12.5, "memory_change_mb": 4.25,
+        "peak_rss_mb": 312.5, "mean_process_cpu_percent": 8.1, "process_cpu_time_seconds": 1.9,
+        "streamed_llm_calls": 3, "time_to_first_chunk_p50_seconds": 0.41,
+        "output_tokens_per_second_estimated": 55.2, "has_gpu_metrics": False,
+    },
+}
+
+
+def make_record(extra: Dict[str, Any]) -> logging.LogRecord:
+    logger = logging.getLogger("Amsha.crew_forge.orchestrator")
+    return logger.makeRecord(logger.name, logging.INFO, __file__, 42, "Execution metrics captured",
+                             None, None, extra=extra)
+
+
+def formatters() -> Dict[str, logging.Formatter]:
+    return {
+        "structured": StructuredFormatter(fmt='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
+                                          datefmt='%Y-%m-%d %H:%M:%S'),
+        "json_lines": JsonLinesFormatter(),
+    }
+
+
+def time_formatter(formatter: logging.Formatter, record: logging.LogRecord, records: int, repeat: int) -> Dict[str, float]:
+    """Returns the best and median microseconds per record over `repeat` runs of `records` formats."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(records):
+            formatter.format(record)
+        runs.append((time.perf_counter() - start) / records * 1e6)
+    return {"best_us": round(min(runs), 3), "median_us": round(statistics.median(runs), 3)}
+
+
+def run_benchmark(records: int = 20000, repeat: int = 5) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for shape, extra in RECORD_SHAPES.items():
+        record = make_record(extra)
+        timings = {name: time_formatter(formatter, record, records, repeat)
+                   for name, formatter in formatters().items()}
+        timings["speedup"] = round(timings["structured"]["best_us"] / timings["json_lines"]["best_us"], 2)
+        results[shape] = timings
+    return {"records": records, "repeat": repeat, "python": sys.version.split()[0],
+            "orjson": ORJSON_AVAILABLE, "shapes": results}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.records, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""
+End-to-end benchmark of the file-based orchestration stack.
+
+Runs AmshaCrewFileApplication -> FileCrewOrchestrator -> AtomicCrewFileManager ->
+CrewBuilderService against the fake LLM transport, so no model server is needed
+and the LLM's share of every run is known exactly. For each concurrency level,
+every worker owns an application with an LLM of its own (not the process-wide
+cached one), so LLM call counts and streaming are per worker, and repeats
+these phases:
+
+    llm_init             building the application and an uncached LLM from the YAML configs
+    crew_build           AtomicCrewFileManager.build_atomic_crew
+    kickoff              non-streaming kickoff of a built crew, minus the fake LLM latency
+    streaming_overhead   streaming kickoff minus non-streaming kickoff of the same crew
+    json_clean           JsonCleanerUtils on the produced output file
+    state_persistence    the StateManager calls the orchestrator makes for one run
+    end_to_end           run_crew followed by clean_json
+
+Results are written as JSON and can be compared against a baseline file:
+
+    python tests/benchmark/orchestrator_benchmark.py --concurrency 1 4 8 --output bench.json
+    python tests/benchmark/orchestrator_benchmark.py --compare baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+import yaml
+
+from amsha.crew_forge.orchestrator.file.amsha_crew_file_application import AmshaCrewFileApplication
+from amsha.execution_state.domain.enums import ExecutionStatus
+from amsha.llm_factory.domain.model.llm_type import LLMType
+from amsha.llm_factory.utils.llm_utils import LLMUtils
+from amsha.output_process.optimization.json_cleaner_utils import JsonCleanerUtils
+
+SCHEMA_VERSION = 1
+CREW_NAME = "benchmark"
+
+PHASES = (
+    "llm_init", "crew_build", "kickoff", "streaming_overhead",
+    "json_clean", "state_persistence", "end_to_end",
+)
+
+
+def write_scenario(directory: str, tasks: int = 1, latency_seconds: float = 0.0,
+                   completion_tokens: int = 256) -> Dict[str, str]:
+    """
+    Writes the LLM, app and job configs of a benchmark crew with `tasks` steps.
+
+    AtomicCrewFileManager parses every step but builds the crew from the last one,
+    so more steps add configuration parsing work to crew_build, not LLM calls.
+
+    Returns:
+        The config_paths dictionary expected by AmshaCrewFileApplication
+    """
+    transport = {"mode": "fake", "latency_seconds": latency_seconds, "completion_tokens": completion_tokens}
+    llm_config = {
+        "llm": {
+            "creative": {"default": "fake", "models": {"fake": {"model": "benchmark-fake", "transport": transport}}},
+        },
+        "llm_parameters": {"creative": {"temperature": 0.7, "top_p": 0.9}},
+    }
+    app_config = {"output_dir_path": os.path.join(directory, "intermediate")}
+    steps = []
+    for index in range(tasks):
+        agent_file = os.path.join(directory, f"agent_{index}.yaml")
+        task_file = os.path.join(directory, f"task_{index}.yaml")
+        _dump(agent_file, {"agent": {
+            "role": f"Analyst {index}",
+            "goal": "Summarise {topic} as JSON",
+            "backstory": "A meticulous analyst who always answers in valid JSON.",
+        }})
+        _dump(task_file, {"task": {
+            "name": f"summarise_{index}",
+            "description": "Summarise {topic} for step " + str(index) + ".",
+            "expected_output": "A JSON document with the summary.",
+        }})
+        steps.append({"agent_file": agent_file, "task_file": task_file})
+    job_config = {"module_name": "benchmark", "crews": {CREW_NAME: {"steps": steps}}}
+
+    paths = {name: os.path.join(directory, f"{name}_config.yaml") for name in ("llm", "app", "job")}
+    _dump(paths["llm"], llm_config)
+    _dump(paths["app"], app_config)
+    _dump(paths["job"], job_config)
+    return paths
+
+
+def _dump(path: str, data: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False)
+
+
+def _silence_stdout() -> TextIO:
+    """
+    Sends file descriptor 1 to /dev/null for the rest of the process and returns a stream on the original stdout.
+
+    Crews print verbose panels and stream chunks there, and CrewAI event handlers
+    keep printing from a thread pool, even at exit, after a run has returned.
+    """
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    return os.fdopen(saved, "w", encoding="utf-8")
+
+
+def _timed(samples: Dict[str, List[float]], phase: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    samples[phase].append(time.perf_counter() - start)
+    return result
+
+
+def _llm_calls(llm: Any) -> int:
+    return int(llm.get_token_usage_summary().successful_requests)
+
+
+def _kickoff(app: AmshaCrewFileApplication, inputs: Dict[str, Any], streaming: bool) -> float:
+    """
+    Builds a crew and kicks it off; returns the kickoff duration minus the fake LLM latency.
+
+    The LLM belongs to this worker alone, so its call count only grows with this worker's calls.
+    """
+    manager = app.orchestrator.manager
+    crew = manager.build_atomic_crew(CREW_NAME, "kickoff")
+    crew.stream = streaming
+    llm = manager.llm
+    calls_before = _llm_calls(llm)
+    start = time.perf_counter()
+    app.orchestrator.run_prepared_crew(CREW_NAME, crew, inputs, manager.output_file)
+    elapsed = time.perf_counter() - start
+    return elapsed - (_llm_calls(llm) - calls_before) * llm.latency_seconds
+
+
+def _persist_state(app: AmshaCrewFileApplication, inputs: Dict[str, Any]) -> None:
+    """Replays the state transitions and saves of one successful orchestrator run."""
+    state_manager = app.state_manager
+    state = state_manager.create_execution(inputs=inputs)
+    state_manager.update_status(state.execution_id, ExecutionStatus.RUNNING, metadata={"crew_name": CREW_NAME})
+    state_manager.update_status(state.execution_id, ExecutionStatus.COMPLETED, metadata={"metrics": {}})
+    current = state_manager.get_execution(state.execution_id)
+    current.set_output("result", "benchmark result")
+    state_manager.repository.save(current)
+
+
+def _worker(config_paths: Dict[str, str], iterations: int, worker_index: int,
+            samples: Dict[str, List[float]], errors: List[str]) -> None:
+    try:
+        app = _timed(samples, "llm_init",
+                     lambda: AmshaCrewFileApplication(config_paths, LLMType.CREATIVE, use_llm_cache=False))
+        manager = app.orchestrator.manager
+        for iteration in range(iterations):
+            inputs = {"topic": f"benchmark topic {worker_index}-{iteration}"}
+            _timed(samples, "crew_build", lambda: manager.build_atomic_crew(CREW_NAME, "build"))
+
+            non_streaming = _kickoff(app, inputs, streaming=False)
+            streaming = _kickoff(app, inputs, streaming=True)
+            samples["kickoff"].append(non_streaming)
+            samples["streaming_overhead"].append(streaming - non_streaming)
+
+            output_file = manager.output_file
+            _timed(samples, "json_clean", lambda: JsonCleanerUtils(output_file).process_file())
+            _timed(samples, "state_persistence", lambda: _persist_state(app, inputs))
+
+            def end_to_end():
+                app.orchestrator.run_crew(CREW_NAME, inputs, filename_suffix="e2e")
+                app.clean_json(app.orchestrator.get_last_output_file())
+
+            _timed(samples, "end_to_end", end_to_end)
+    except Exception as e:
+        errors.append(f"worker {worker_index}: {type(e).__name__}: {e}")
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Returns count, mean, min, max and percentiles (in seconds) of a list of samples."""
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def percentile(p: float) -> float:
+        return ordered[min(int(round(p / 100.0 * (len(ordered) - 1))), len(ordered) - 1)]
+
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "min": ordered[0],
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "max": ordered[-1],
+    }
+
+
+def run_level(config_paths: Dict[str, str], concurrency: int, iterations: int) -> Dict[str, Any]:
+    """Runs one concurrency level and returns its phase statistics and throughput."""
+    worker_samples = [{phase: [] for phase in PHASES} for _ in range(concurrency)]
+    errors: List[str] = []
+    threads = [
+        threading.Thread(target=_worker, args=(config_paths, iterations, index, worker_samples[index], errors))
+        for index in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - start
+
+    phases = {phase: summarize([value for samples in worker_samples for value in samples[phase]])
+              for phase in PHASES}
+    completed = phases["end_to_end"]["count"]
+    return {
+        "concurrency": concurrency,
+        "iterations_per_worker": iterations,
+        "wall_seconds": wall_seconds,
+        "end_to_end_runs_per_second": completed / wall_seconds if wall_seconds else 0.0,
+        "errors": errors,
+        "phases": phases,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(concurrency_levels: List[int], iterations: int = 3, tasks: int = 1,
+                  latency_seconds: float = 0.0, completion_tokens: int = 256,
+                  warmup: bool = True) -> Dict[str, Any]:
+    """
+    Runs the benchmark at every concurrency level.
+
+    Args:
+        concurrency_levels: Numbers of concurrent workers to measure
+        iterations: Iterations per worker and level
+        tasks: Steps of the benchmark crew
+        latency_seconds: Latency of every fake LLM call
+        completion_tokens: Completion tokens of every fake LLM call
+        warmup: Run one untimed iteration first, so import and first-use costs are excluded
+
+    Returns:
+        Machine-readable benchmark report
+    """
+    # Keeps CrewAI's first-run trace collection and its interactive prompt out of the measurements
+    os.environ.setdefault("CREWAI_TESTING", "true")
+    LLMUtils.disable_telemetry()
+
+    with tempfile.TemporaryDirectory(prefix="amsha_bench_") as directory:
+        config_paths = write_scenario(directory, tasks, latency_seconds, completion_tokens)
+        if warmup:
+            run_level(config_paths, 1, 1)
+        levels = [run_level(config_paths, level, iterations) for level in concurrency_levels]
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "concurrency_levels": concurrency_levels,
+            "iterations": iterations,
+            "tasks": tasks,
+            "latency_seconds": latency_seconds,
+            "completion_tokens": completion_tokens,
+        },
+        "levels": levels,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.2,
+            statistic: str = "p50") -> List[Dict[str, Any]]:
+    """
+    Lists the phases whose statistic grew by more than `threshold` relative to the baseline.
+
+    Only concurrency levels present in both reports are compared.
+    """
+    baseline_levels = {level["concurrency"]: level for level in baseline.get("levels", [])}
+    regressions = []
+    for level in current.get("levels", []):
+        reference = baseline_levels.get(level["concurrency"])
+        if reference is None:
+            continue
+        for phase, stats in level["phases"].items():
+            before = reference["phases"].get(phase, {}).get(statistic)
+            after = stats.get(statistic)
+            if not before or after is None or before <= 0:
+                continue
+            change = (after - before) / before
+            if change > threshold:
+                regressions.append({
+                    "concurrency": level["concurrency"],
+                    "phase": phase,
+                    "statistic": statistic,
+                    "baseline": before,
+                    "current": after,
+                    "change": change,
+                })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake LLM latency per call in seconds")
+    parser.add_argument("--completion-tokens", type=int, default=256)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline report to check the new report against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown")
+    parser.add_argument("--verbose", action="store_true", help="Show crew console output")
+    args = parser.parse_args(argv)
+
+    stdout = sys.stdout if args.verbose else _silence_stdout()
+    report = run_benchmark(args.concurrency, args.iterations, args.tasks, args.latency, args.completion_tokens)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        stdout.write(text + "\n")
+        stdout.flush()
+
+    failed = any(level["errors"] for level in report["levels"])
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION concurrency={regression['concurrency']} phase={regression['phase']} "
+                f"{regression['statistic']} {regression['baseline']:.6f}s -> {regression['current']:.6f}s "
+                f"(+{regression['change']:.0%})",
+                file=sys.stderr
+            )
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""
+Smoke tests for the import-time benchmark.
+"""
+import unittest
+
+from import_time_benchmark import LIGHT_ENTRY_POINTS, run_benchmark
+
+
+class TestImportTimeBenchmark(unittest.TestCase):
+    """Imports the light entry points once each and checks they stay light."""
+
+    def test_light_entry_points_load_no_heavy_packages(self):
+        report = run_benchmark(LIGHT_ENTRY_POINTS, repeat=1)
+
+        self.assertEqual(set(report["modules"]), set(LIGHT_ENTRY_POINTS))
+        for module, result in report["modules"].items():
+            with self.subTest(module=module):
+                self.assertGreater(result["seconds"], 0)
+                self.assertEqual(result["heavy"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
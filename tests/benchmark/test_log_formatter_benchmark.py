@@ -0,0 +1,23 @@
+"""
+Smoke tests for the log formatter micro-benchmark.
+"""
+import unittest
+
+from log_formatter_benchmark import RECORD_SHAPES, run_benchmark
+
+
+class TestLogFormatterBenchmark(unittest.TestCase):
+    """Runs the benchmark at a tiny size and checks the report."""
+
+    def test_report_covers_every_shape_and_formatter(self):
+        report = run_benchmark(records=50, repeat=2)
+
+        self.assertEqual(set(report["shapes"]), set(RECORD_SHAPES))
+        for timings in report["shapes"].values():
+            self.assertGreater(timings["structured"]["best_us"], 0)
+            self.assertGreater(timings["json_lines"]["best_us"], 0)
+            self.assertGreater(timings["speedup"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
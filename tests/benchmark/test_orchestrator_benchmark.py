@@ -0,0 +1,42 @@
+"""
+Smoke tests for the orchestrator benchmark suite.
+"""
+import json
+import unittest
+
+from orchestrator_benchmark import PHASES, compare, run_benchmark, summarize
+
+
+class TestOrchestratorBenchmark(unittest.TestCase):
+    """Runs the benchmark at its smallest size and checks the report."""
+
+    def test_report_covers_every_phase(self):
+        report = run_benchmark([1, 2], iterations=1, warmup=False)
+
+        json.dumps(report)
+        self.assertEqual([level["concurrency"] for level in report["levels"]], [1, 2])
+        for level in report["levels"]:
+            self.assertEqual(level["errors"], [])
+            self.assertEqual(set(level["phases"]), set(PHASES))
+            self.assertEqual(level["phases"]["end_to_end"]["count"], level["concurrency"])
+
+    def test_summarize(self):
+        stats = summarize([0.4, 0.1, 0.3, 0.2])
+
+        self.assertEqual(stats["count"], 4)
+        self.assertAlmostEqual(stats["mean"], 0.25)
+        self.assertEqual(stats["min"], 0.1)
+        self.assertEqual(stats["max"], 0.4)
+
+    def test_compare_reports_slower_phases(self):
+        baseline = {"levels": [{"concurrency": 1, "phases": {"crew_build": {"p50": 0.010}, "json_clean": {"p50": 0.002}}}]}
+        current = {"levels": [{"concurrency": 1, "phases": {"crew_build": {"p50": 0.015}, "json_clean": {"p50": 0.002}}},
+                              {"concurrency": 4, "phases": {"crew_build": {"p50": 0.050}}}]}
+
+        regressions = compare(baseline, current, threshold=0.2)
+
+        self.assertEqual([(r["concurrency"], r["phase"]) for r in regressions], [(1, "crew_build")])
+
+
+if __name__ == '__main__':
+    unittest.main()
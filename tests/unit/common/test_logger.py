@@ -0,0 +1,258 @@
+import json
+import logging
+import queue
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+from amsha.common import logger as amsha_logger
+from amsha.common.logger import (
+    BoundedQueueHandler,
+    JsonLinesFormatter,
+    LogRateLimitFilter,
+    LogSamplingFilter,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, gate: threading.Event = None):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("Amsha.test", level, __file__, 1, message, None, None)
+
+
+class TestLazyInitialization(unittest.TestCase):
+    def setUp(self):
+        self.root = logging.getLogger("Amsha")
+        saved = (amsha_logger._amsha_nibandha, self.root.handlers, self.root.level, self.root.propagate)
+        self.addCleanup(self._restore, *saved)
+        amsha_logger._amsha_nibandha = None
+        self.root.handlers = []
+
+    def _restore(self, nibandha, handlers, level, propagate):
+        amsha_logger._amsha_nibandha = nibandha
+        self.root.handlers = handlers
+        self.root.setLevel(level)
+        self.root.propagate = propagate
+
+    def test_module_logger_initializes_on_first_record(self):
+        target = _ListHandler()
+
+        def initialize(log_level=None):
+            self.root.handlers = [target]
+            return self.root
+
+        with patch.object(amsha_logger, "_initialize_nibandha", side_effect=initialize) as init:
+            module_logger = amsha_logger.get_logger("lazy_test")
+            init.assert_not_called()
+
+            module_logger.info("first")
+            module_logger.info("second")
+
+        init.assert_called_once()
+        self.assertEqual([record.getMessage() for record in target.records], ["first", "second"])
+
+    def test_rotation_utilities_initialize_a_deferred_logger(self):
+        with patch.object(amsha_logger, "_initialize_nibandha") as init:
+            self.assertIsNone(amsha_logger.get_rotation_config())
+            init.assert_not_called()
+
+            amsha_logger.get_logger("lazy_test")
+            amsha_logger.get_rotation_config()
+
+        init.assert_called_once()
+
+
+class TestJsonLinesFormatter(unittest.TestCase):
+    def _format(self, record, use_orjson=True):
+        with patch.object(amsha_logger, "ORJSON_AVAILABLE", use_orjson and amsha_logger.ORJSON_AVAILABLE):
+            return JsonLinesFormatter().format(record)
+
+    def test_extras_become_json_fields(self):
+        logger = logging.getLogger("Amsha.crew_forge.orchestrator")
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 1, "Crew %s done", ("writer",), None,
+                                   extra={"execution_id": "exec-1", "tokens": 1500, "path": object()})
+
+        for use_orjson in (True, False):
+            line = self._format(record, use_orjson)
+            payload = json.loads(line)
+            self.assertNotIn("\n", line)
+            self.assertEqual(payload["message"], "Crew writer done")
+            self.assertEqual(payload["logger"], "Amsha.crew_forge.orchestrator")
+            self.assertEqual(payload["level"], "INFO")
+            self.assertEqual(payload["tokens"], 1500)
+            self.assertTrue(payload["path"].startswith("<object object"))
+            self.assertEqual(set(payload), {"timestamp", "logger", "level", "message", "execution_id", "tokens", "path"})
+
+    def test_exception_and_oversized_integers(self):
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord("Amsha.test", logging.ERROR, __file__, 1, "failed", None,
+                                       sys.exc_info())
+        record.big = 2 ** 70
+
+        payload = json.loads(self._format(record))
+
+        self.assertIn("RuntimeError: boom", payload["exception"])
+        self.assertEqual(payload["big"], 2 ** 70)
+
+
+class TestLogFilters(unittest.TestCase):
+    def test_sampling_keeps_one_in_n_below_warning(self):
+        sampler = LogSamplingFilter(0.25)
+
+        kept = [sampler.filter(_record(f"m{index}")) for index in range(8)]
+
+        self.assertEqual(kept, [True, False, False, False, True, False, False, False])
+        self.assertTrue(sampler.filter(_record("w", logging.WARNING)))
+        with self.assertRaises(ValueError):
+            LogSamplingFilter(0)
+
+    def test_rate_limit_per_message_reports_suppressed(self):
+        limiter = LogRateLimitFilter(max_records=2, per_seconds=10.0)
+
+        with patch("amsha.common.logger.time.monotonic", return_value=100.0):
+            kept = [limiter.filter(_record("chunk")) for _ in range(5)]
+            self.assertTrue(limiter.filter(_record("other")))
+        with patch("amsha.common.logger.time.monotonic", return_value=111.0):
+            next_window = _record("chunk")
+            self.assertTrue(limiter.filter(next_window))
+
+        self.assertEqual(kept, [True, True, False, False, False])
+        self.assertEqual(next_window.suppressed_records, 3)
+
+    def test_rate_limit_sweeps_expired_windows(self):
+        limiter = LogRateLimitFilter(max_records=1, per_seconds=1.0, max_windows=4)
+
+        with patch("amsha.common.logger.time.monotonic", return_value=100.0):
+            for index in range(4):
+                limiter.filter(_record(f"step {index} completed"))
+        with patch("amsha.common.logger.time.monotonic", return_value=102.0):
+            limiter.filter(_record("step 4 completed"))
+
+        self.assertEqual(list(limiter._windows), ["step 4 completed"])
+
+    def test_configure_log_sampling_replaces_filters(self):
+        module_logger = logging.getLogger("Amsha.sampling_test")
+        with patch.object(amsha_logger, "get_logger", return_value=module_logger):
+            amsha_logger.configure_log_sampling("sampling_test", sample_rate=0.5, max_records=10)
+            amsha_logger.configure_log_sampling("sampling_test", sample_rate=0.1)
+
+        self.assertEqual([type(f) for f in module_logger.filters], [LogSamplingFilter])
+        self.assertEqual(module_logger.filters[0].every, 10)
+
+
+class TestBoundedQueueHandler(unittest.TestCase):
+    def test_drop_new_keeps_queued_records(self):
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, "drop_new")
+
+        for index in range(4):
+            handler.emit(_record(f"m{index}"))
+
+        self.assertEqual([log_queue.get_nowait().msg for _ in range(2)], ["m0", "m1"])
+        self.assertEqual(handler.dropped, 2)
+
+    def test_drop_oldest_keeps_latest_records(self):
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, "drop_oldest")
+
+        for index in range(4):
+            handler.emit(_record(f"m{index}"))
+
+        self.assertEqual([log_queue.get_nowait().msg for _ in range(2)], ["m2", "m3"])
+        self.assertEqual(handler.dropped, 2)
+        self.assertEqual(log_queue.unfinished_tasks, 2)
+
+    def test_block_gives_up_after_timeout(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(log_queue, "block", block_timeout=0.01)
+
+        handler.emit(_record("m0"))
+        handler.emit(_record("m1"))
+
+        self.assertEqual(handler.dropped, 1)
+
+    def test_rejects_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(queue.Queue(), "drop_random")
+
+
+class TestAsyncLogging(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("AmshaAsyncTest")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.gate = threading.Event()
+        self.target = _ListHandler(self.gate)
+        self.logger.addHandler(self.target)
+        patcher = patch.object(amsha_logger, "get_logger", return_value=self.logger)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(amsha_logger.disable_async_logging)
+        self.addCleanup(self.logger.removeHandler, self.target)
+
+    def test_records_are_written_off_the_calling_thread(self):
+        amsha_logger.enable_async_logging(queue_size=100)
+
+        # The handler is blocked, yet logging returns immediately
+        self.logger.info("Crew kickoff", extra={"crew_name": "writer"})
+        self.assertEqual(self.target.records, [])
+        self.assertEqual(amsha_logger.get_async_logging_stats()["drop_policy"], "drop_new")
+
+        self.gate.set()
+        self.assertTrue(amsha_logger.flush_logs(timeout=5))
+        self.assertEqual(self.target.records[0].getMessage(), "Crew kickoff")
+        self.assertEqual(self.target.records[0].crew_name, "writer")
+        self.assertNotIn(threading.current_thread().name, self.target.threads)
+
+    def test_disable_drains_queue_and_restores_handlers(self):
+        amsha_logger.enable_async_logging(queue_size=2, drop_policy="drop_new")
+        for index in range(5):
+            self.logger.info(f"m{index}")
+        self.gate.set()
+
+        amsha_logger.disable_async_logging()
+
+        self.assertEqual(self.logger.handlers, [self.target])
+        self.assertIsNone(amsha_logger.get_async_logging_stats())
+        messages = [record.getMessage() for record in self.target.records]
+        # m0 may already be with the blocked listener, so two or three records were kept
+        self.assertEqual(messages[-1], "Log records dropped by the asynchronous log queue")
+        self.assertIn(len(messages), (3, 4))
+
+    def test_queued_records_are_written_before_handlers_are_restored(self):
+        attached_while_draining = []
+        emit = self.target.emit
+
+        def recording_emit(record):
+            attached_while_draining.append(self.target in self.logger.handlers)
+            emit(record)
+
+        self.target.emit = recording_emit
+        amsha_logger.enable_async_logging(queue_size=100)
+        for index in range(3):
+            self.logger.info(f"m{index}")
+
+        self.gate.set()
+        amsha_logger.disable_async_logging()
+
+        self.assertEqual([record.getMessage() for record in self.target.records], ["m0", "m1", "m2"])
+        self.assertEqual(attached_while_draining, [False, False, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
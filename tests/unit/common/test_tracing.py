@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from amsha.common import tracing
+from amsha.common.tracing import current_span, disable_tracing, enable_tracing, span, traced
+from amsha.execution_runtime.domain.execution_mode import ExecutionMode
+from amsha.execution_runtime.service.runtime_engine import RuntimeEngine
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "trace.jsonl")
+
+    def tearDown(self):
+        disable_tracing()
+        shutil.rmtree(self.test_dir)
+
+    def _spans(self):
+        disable_tracing()
+        with open(self.path, encoding="utf-8") as f:
+            return {record["name"]: record for record in map(json.loads, f)}
+
+    def test_disabled_tracing_hands_out_noop_span(self):
+        self.assertIs(span("crew.run", crew_name="writer"), tracing.NOOP_SPAN)
+        with span("crew.run") as active:
+            active.set_attribute("ignored", 1)
+            self.assertIs(current_span(), tracing.NOOP_SPAN)
+
+    def test_nested_spans_link_to_parent_with_attributes(self):
+        enable_tracing(self.path)
+
+        with span("crew.run", crew_name="writer") as root:
+            with span("crew.build") as build:
+                build.set_attribute("tasks", 2)
+            with self.assertRaises(RuntimeError):
+                with span("crew.kickoff"):
+                    raise RuntimeError("boom")
+
+        spans = self._spans()
+        self.assertIsNone(spans["crew.run"]["parent_id"])
+        self.assertEqual(spans["crew.run"]["attributes"], {"crew_name": "writer"})
+        self.assertEqual(spans["crew.build"]["parent_id"], root.span_id)
+        self.assertEqual(spans["crew.build"]["trace_id"], root.trace_id)
+        self.assertEqual(spans["crew.build"]["attributes"], {"tasks": 2})
+        self.assertEqual(spans["crew.kickoff"]["status"], "error")
+        self.assertEqual(spans["crew.kickoff"]["error"], "RuntimeError: boom")
+
+    def test_traced_decorator_and_background_runtime_keep_parent(self):
+        enable_tracing(self.path)
+
+        @traced("crew.kickoff")
+        def kickoff():
+            current_span().set_attribute("thread", threading.current_thread().name)
+            return "done"
+
+        engine = RuntimeEngine(max_workers=1)
+        try:
+            with span("crew.run") as root:
+                handle = engine.submit(kickoff, mode=ExecutionMode.BACKGROUND)
+                self.assertEqual(handle.result(timeout=5), "done")
+        finally:
+            engine.shutdown()
+
+        kickoff_span = self._spans()["crew.kickoff"]
+        self.assertEqual(kickoff_span["parent_id"], root.span_id)
+        self.assertNotEqual(kickoff_span["attributes"]["thread"], threading.current_thread().name)
+
+    def test_chrome_exporter_writes_trace_event_array(self):
+        path = os.path.join(self.test_dir, "trace.json")
+        enable_tracing(path, format="chrome")
+
+        with span("crew.run"):
+            with span("yaml.parse", path="job.yaml"):
+                pass
+        disable_tracing()
+
+        with open(path, encoding="utf-8") as f:
+            events = json.load(f)
+        self.assertEqual([event["name"] for event in events], ["yaml.parse", "crew.run"])
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+        self.assertEqual(events[0]["cat"], "yaml")
+        self.assertEqual(events[0]["args"]["path"], "job.yaml")
+        self.assertEqual(events[0]["args"]["parent_id"], events[1]["args"]["span_id"])
+
+    def test_chrome_exporter_stays_valid_under_concurrent_spans(self):
+        path = os.path.join(self.test_dir, "trace.json")
+        enable_tracing(path, format="chrome")
+
+        def worker():
+            for _ in range(50):
+                with span("llm.call"):
+                    pass
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        disable_tracing()
+
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 400)
+
+    def test_exporter_base_is_abstract(self):
+        with self.assertRaises(TypeError):
+            tracing.SpanExporter(self.path)
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            enable_tracing(self.path, format="zipkin")
+        self.assertFalse(tracing.is_tracing_enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,11 +8,13 @@ from amsha.crew_forge.domain.models.agent_data import AgentRequest, AgentRespons
 from amsha.crew_forge.domain.models.task_data import TaskRequest, TaskResponse
 from amsha.crew_forge.domain.models.crew_config_data import CrewConfigRequest, CrewConfigResponse
 from amsha.crew_forge.domain.models.crew_data import CrewData
+from amsha.crew_forge.domain.models.crew_retry_policy import CrewRetryPolicy
 from amsha.crew_forge.domain.models.repo_data import RepoData
 from amsha.crew_forge.domain.models.sync_config import SyncConfigData
 from amsha.crew_forge.repo.interfaces.i_agent_repository import IAgentRepository
 from amsha.crew_forge.repo.interfaces.i_task_repository import ITaskRepository
 from amsha.crew_forge.repo.interfaces.i_crew_config_repository import ICrewConfigRepository
+from amsha.crew_forge.exceptions import CrewConfigurationException, CrewExecutionException
 from crewai import LLM
 
 
@@ -108,5 +110,48 @@ class TestDomain(unittest.TestCase):
         self.assertEqual(data.domain_root_path, "/root")
 
 
+    def test_crew_retry_policy_backoff(self):
+        """Test exponential backoff with cap and jitter bounds."""
+        policy = CrewRetryPolicy(backoff_base_seconds=1.0, backoff_multiplier=2.0, backoff_max_seconds=5.0, jitter=0)
+        self.assertEqual([policy.backoff_delay(n) for n in (1, 2, 3, 4)], [1.0, 2.0, 4.0, 5.0])
+
+        jittered = CrewRetryPolicy(backoff_base_seconds=4.0, jitter=0.5)
+        for _ in range(20):
+            self.assertTrue(2.0 <= jittered.backoff_delay(1) <= 4.0)
+
+    def test_crew_retry_policy_classification(self):
+        """Test retryable error classification through wrapped exceptions."""
+        policy = CrewRetryPolicy()
+
+        class RateLimitError(Exception):
+            pass
+
+        try:
+            try:
+                raise RateLimitError("429")
+            except RateLimitError:
+                raise CrewExecutionException("kickoff failed")
+        except CrewExecutionException as wrapped:
+            self.assertTrue(policy.is_retryable(wrapped))
+
+        self.assertTrue(policy.is_retryable(TimeoutError()))
+        self.assertFalse(policy.is_retryable(CrewConfigurationException("bad config")))
+        self.assertFalse(policy.is_retryable(ValueError("bad value")))
+        self.assertTrue(CrewRetryPolicy(retryable_errors=["ValueError"]).is_retryable(ValueError()))
+
+        status_error = Exception()
+        status_error.status_code = 503
+        self.assertTrue(policy.is_retryable(status_error))
+        status_error.status_code = 401
+        self.assertFalse(policy.is_retryable(status_error))
+
+    def test_crew_retry_policy_from_config(self):
+        """Test building a policy from config with overrides."""
+        policy = CrewRetryPolicy.from_config({"max_retries": 2, "repair_last_task": True}, max_retries=4)
+        self.assertEqual(policy.max_retries, 4)
+        self.assertTrue(policy.repair_last_task)
+        self.assertEqual(CrewRetryPolicy.from_config(None).max_retries, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -47,6 +47,61 @@ class TestAmshaCrewFileApplication(unittest.TestCase):
         mock_manager.assert_called_once()
         mock_orchestrator.assert_called_once()
 
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.SharedLLMInitializationService')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.AtomicCrewFileManager')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.FileCrewOrchestrator')
+    def test_configured_retry_policy_reaches_the_orchestrator(self, mock_orchestrator, mock_manager, mock_service):
+        mock_service.initialize_llm.return_value = (MagicMock(), "test-model", None)
+        mock_manager.return_value.app_config = {"crew_retry": {"max_retries": 3, "repair_last_task": True}}
+
+        app = AmshaCrewFileApplication(self.config_paths, LLMType.CREATIVE)
+
+        self.assertIs(mock_orchestrator.call_args.kwargs["retry_policy"], app.retry_policy)
+        self.assertTrue(app.retry_policy.repair_last_task)
+
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.CrewRetryEngine')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.SharedLLMInitializationService')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.AtomicCrewFileManager')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.FileCrewOrchestrator')
+    def test_explicit_zero_retries_overrides_config(self, mock_orchestrator, mock_manager, mock_service, mock_engine):
+        mock_service.initialize_llm.return_value = (MagicMock(), "test-model", None)
+        mock_manager.return_value.app_config = {"crew_retry": {"max_retries": 3}}
+        app = AmshaCrewFileApplication(self.config_paths, LLMType.CREATIVE)
+
+        app.execute_crew_with_retry("test_crew", {"topic": "AI"}, max_retries=0)
+        self.assertEqual(mock_engine.call_args.args[1].max_retries, 0)
+        app.execute_crew_with_retry("test_crew", {"topic": "AI"})
+        self.assertEqual(mock_engine.call_args.args[1].max_retries, 3)
+
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.SharedLLMInitializationService')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.AtomicCrewFileManager')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.FileCrewOrchestrator')
+    def test_uncached_llm(self, mock_orchestrator, mock_manager, mock_service):
+        mock_service.initialize_llm.return_value = (MagicMock(), "test-model", None)
+        mock_manager.return_value.app_config = {}
+
+        AmshaCrewFileApplication(self.config_paths, LLMType.CREATIVE, use_llm_cache=False)
+
+        self.assertFalse(mock_service.initialize_llm.call_args.kwargs["use_cache"])
+
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.SharedLLMInitializationService')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.AtomicCrewFileManager')
+    @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.FileCrewOrchestrator')
+    def test_llm_config_reload_builds_from_the_snapshot(self, mock_orchestrator, mock_manager, mock_service):
+        mock_service.initialize_llm.return_value = (MagicMock(), "test-model", None)
+        mock_manager.return_value.app_config = {}
+        app = AmshaCrewFileApplication(self.config_paths, LLMType.CREATIVE)
+        new_llm = MagicMock()
+        mock_service.initialize_llm_from_settings.return_value = (new_llm, "new-model", None)
+        snapshot = MagicMock(version=2)
+
+        app._on_llm_config_reloaded(snapshot)
+
+        self.assertIs(mock_service.initialize_llm_from_settings.call_args.args[0], snapshot)
+        self.assertEqual(mock_service.initialize_llm.call_count, 1)
+        app.orchestrator.manager.swap_llm.assert_called_once_with(new_llm, "new-model", None, 2)
+        self.assertEqual(app.model_name, "new-model")
+
     @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.LLMContainer')
     @patch('amsha.crew_forge.orchestrator.file.amsha_crew_file_application.AtomicCrewFileManager')
     def test_prepare_inputs_direct(self, mock_manager, mock_container):
@@ -386,6 +441,18 @@ class TestAtomicCrewFileManager(unittest.TestCase):
         manager._output_file = "last.json"
         self.assertEqual(manager.output_file, "last.json")
 
+    def test_swap_llm_applies_to_crews_built_afterwards(self):
+        old_llm, new_llm = MagicMock(), MagicMock()
+        manager = AtomicCrewFileManager(old_llm, self.app_config_path, self.job_config, "gpt-4")
+        self.assertIsNone(manager.llm_config_version)
+
+        manager.swap_llm(new_llm, "gpt-4o", version=2)
+
+        self.assertIs(manager.llm, new_llm)
+        self.assertEqual(manager.model_name, "gpt-4o")
+        self.assertEqual(manager.llm_config.version, 2)
+        self.assertIsNone(manager.built_llm_config)
+
     @patch('amsha.crew_forge.orchestrator.file.atomic_crew_file_manager.YamlUtils.yaml_safe_load')
     def test_init_failure(self, mock_load):
         mock_load.side_effect = Exception("Failed")
@@ -7,7 +7,16 @@ from amsha.crew_forge.service.base_crew_orchestrator import BaseCrewOrchestrator
 from amsha.execution_runtime.domain.execution_mode import ExecutionMode
 from amsha.execution_runtime.domain.execution_handle import ExecutionHandle
 from amsha.execution_state.domain.enums import ExecutionStatus
-from amsha.crew_forge.exceptions import CrewManagerException, CrewExecutionException
+from amsha.crew_forge.domain.models.crew_llm_config import CrewLLMConfig
+from amsha.crew_forge.exceptions import (
+    ContextWindowExceededException,
+    CrewManagerException,
+    CrewExecutionException
+)
+from amsha.crew_forge.service.context_window_guard import ContextCheckResult
+from amsha.crew_monitor.service.crew_metrics import CrewMetrics
+from amsha.crew_monitor.service.metrics_registry import MetricsRegistry
+from amsha.crew_monitor.service.metrics_store import CrewMetricsStore
 
 
 class TestBaseCrewOrchestrator(unittest.TestCase):
@@ -72,6 +81,118 @@ class TestBaseCrewOrchestrator(unittest.TestCase):
             metadata=unittest.mock.ANY
         )
 
+    @patch('amsha.crew_forge.service.base_crew_orchestrator.is_endpoint_available')
+    def test_default_runtime_queries_llm_circuit_breakers(self, mock_available):
+        """Test that the default runtime is given the LLM circuit breakers as its health query."""
+        mock_available.return_value = False
+        orchestrator = BaseCrewOrchestrator(manager=self.mock_manager, state_manager=self.mock_state_manager)
+        self.addCleanup(orchestrator.runtime.shutdown)
+
+        self.assertEqual(orchestrator.runtime.available_endpoints(["http://localhost:1234/v1"]), [])
+        mock_available.assert_called_once_with("http://localhost:1234/v1")
+
+    @patch('amsha.crew_forge.service.base_crew_orchestrator.circuit_endpoints')
+    @patch('amsha.crew_forge.service.base_crew_orchestrator.CrewPerformanceMonitor')
+    def test_run_crew_fails_fast_when_llm_endpoints_are_down(self, mock_monitor_class, mock_endpoints):
+        """Test that a crew whose LLM endpoints all have open circuits fails without kicking off."""
+        from amsha.execution_runtime.domain.endpoint_unavailable_error import EndpointUnavailableError
+
+        mock_endpoints.return_value = ["http://localhost:1234/v1"]
+        mock_state = MagicMock()
+        mock_state.execution_id = "exec-123"
+        self.mock_state_manager.create_execution.return_value = mock_state
+        mock_crew = MagicMock()
+        self.mock_manager.build_atomic_crew.return_value = mock_crew
+        self.mock_runtime.ensure_available.side_effect = EndpointUnavailableError(["http://localhost:1234/v1"])
+
+        self.orchestrator.run_crew("test_crew", {}, mode=ExecutionMode.BACKGROUND)
+        exec_func = self.mock_runtime.submit.call_args[0][0]
+
+        with self.assertRaises(CrewExecutionException):
+            exec_func()
+        self.mock_runtime.ensure_available.assert_called_once_with(["http://localhost:1234/v1"])
+        mock_crew.kickoff.assert_not_called()
+        self.mock_state_manager.update_status.assert_any_call(
+            "exec-123", ExecutionStatus.FAILED, metadata=unittest.mock.ANY
+        )
+
+    @patch('amsha.crew_forge.service.base_crew_orchestrator.CrewPerformanceMonitor')
+    def test_in_flight_execution_keeps_the_llm_config_it_was_built_with(self, mock_monitor_class):
+        """A swap after the build does not change the model an execution reports."""
+        mock_state = MagicMock()
+        mock_state.execution_id = "exec-123"
+        self.mock_state_manager.create_execution.return_value = mock_state
+        mock_crew = MagicMock()
+        mock_crew.kickoff.return_value = "Success result"
+        self.mock_manager.build_atomic_crew.return_value = mock_crew
+        self.mock_manager.built_llm_config = CrewLLMConfig(MagicMock(), "gemma", None, 1)
+
+        handle = self.orchestrator.run_crew("test_crew", {}, mode=ExecutionMode.BACKGROUND)
+        # The config is reloaded while the execution waits in the queue
+        self.mock_manager.model_name = "qwen"
+        self.mock_manager.built_llm_config = CrewLLMConfig(MagicMock(), "qwen", None, 2)
+        exec_func = self.mock_runtime.submit.call_args[0][0]
+        exec_func()
+
+        record = handle.execution_record
+        self.assertEqual((record.model_name, record.llm_config_version), ("gemma", 1))
+        mock_monitor_class.assert_called_once_with(model_name="gemma")
+
+    def test_context_guard_rejects_oversized_crew_before_kickoff(self):
+        """An oversized prompt fails the execution without submitting the kickoff."""
+        mock_state = MagicMock()
+        mock_state.execution_id = "exec-123"
+        self.mock_state_manager.create_execution.return_value = mock_state
+        guard = MagicMock()
+        guard.apply.side_effect = ContextWindowExceededException(
+            "too large", crew_name="test_crew", estimated_tokens=9000, context_window=8192
+        )
+        self.orchestrator.context_guard = guard
+
+        with self.assertRaises(ContextWindowExceededException):
+            self.orchestrator.run_crew("test_crew", {"doc": "x"}, mode=ExecutionMode.BACKGROUND)
+
+        self.mock_runtime.submit.assert_not_called()
+        self.mock_state_manager.update_status.assert_any_call(
+            "exec-123", ExecutionStatus.FAILED, metadata=unittest.mock.ANY
+        )
+
+    def test_context_guard_trimmed_inputs_reach_kickoff(self):
+        """The inputs returned by the guard are the ones the crew is kicked off with."""
+        mock_state = MagicMock()
+        mock_state.execution_id = "exec-123"
+        self.mock_state_manager.create_execution.return_value = mock_state
+        mock_crew = MagicMock()
+        mock_crew.kickoff.return_value = "Success result"
+        self.mock_manager.build_atomic_crew.return_value = mock_crew
+        guard = MagicMock()
+        guard.apply.return_value = ContextCheckResult({"doc": "trimmed"}, None, None, [])
+        self.orchestrator.context_guard = guard
+
+        self.orchestrator.run_crew("test_crew", {"doc": "x" * 100}, mode=ExecutionMode.BACKGROUND)
+        self.mock_runtime.submit.call_args[0][0]()
+
+        mock_crew.kickoff.assert_called_once_with(inputs={"doc": "trimmed"})
+
+    def test_background_run_does_not_stream(self):
+        """Background crews are kicked off without the streaming path."""
+        mock_state = MagicMock()
+        mock_state.execution_id = "exec-123"
+        self.mock_state_manager.create_execution.return_value = mock_state
+        mock_crew = MagicMock()
+        mock_crew.stream = True
+        self.mock_manager.build_atomic_crew.return_value = mock_crew
+
+        self.orchestrator.run_crew("test_crew", {}, mode=ExecutionMode.BACKGROUND)
+
+        self.assertFalse(mock_crew.stream)
+
+        prepared_crew = MagicMock()
+        prepared_crew.stream = True
+        self.orchestrator.run_prepared_crew("test_crew", prepared_crew, {}, mode=ExecutionMode.BACKGROUND)
+
+        self.assertFalse(prepared_crew.stream)
+
     def test_run_crew_background_success(self):
         """Test successful background crew execution."""
         # Setup mocks
@@ -153,6 +274,79 @@ class TestBaseCrewOrchestrator(unittest.TestCase):
             metadata=unittest.mock.ANY
         )
 
+    def test_run_crew_served_from_result_cache(self):
+        """Test that a result cache hit skips building and kickoff."""
+        mock_state = MagicMock()
+        mock_state.execution_id = "exec-123"
+        self.mock_state_manager.create_execution.return_value = mock_state
+        self.mock_manager.get_crew_fingerprint.return_value = "fingerprint"
+        
+        mock_cache = MagicMock()
+        cached_output = MagicMock(raw="cached result")
+        mock_cache.get.return_value = MagicMock(result=cached_output, output_file="cached.json")
+        self.orchestrator.result_cache = mock_cache
+        
+        self.mock_runtime.submit.side_effect = lambda func, mode: MagicMock(result=lambda: func())
+        
+        result = self.orchestrator.run_crew("test_crew", {"topic": "AI"})
+        
+        self.assertEqual(result, cached_output)
+        self.mock_manager.build_atomic_crew.assert_not_called()
+        self.assertEqual(self.orchestrator.get_last_output_file(), "cached.json")
+        self.mock_state_manager.update_status.assert_any_call(
+            "exec-123",
+            ExecutionStatus.COMPLETED,
+            metadata=unittest.mock.ANY
+        )
+
+    @patch('amsha.crew_forge.service.base_crew_orchestrator.CrewPerformanceMonitor')
+    def test_kickoff_outcomes_feed_crew_metrics(self, mock_monitor_class):
+        """Test that completed and failed kickoffs are counted in the crew metrics."""
+        crew_metrics = CrewMetrics(MetricsRegistry())
+        self.orchestrator.crew_metrics = crew_metrics
+        mock_monitor_class.return_value.get_metrics.return_value = {
+            "general": {"total_tokens": 10, "prompt_tokens": 6, "completion_tokens": 4}
+        }
+        self.mock_state_manager.create_execution.return_value = MagicMock(execution_id="exec-123")
+        mock_crew = MagicMock()
+        mock_crew.kickoff.side_effect = ["ok", Exception("Kickoff failed")]
+        self.mock_manager.build_atomic_crew.return_value = mock_crew
+        self.mock_runtime.submit.side_effect = lambda func, mode: MagicMock(result=lambda: func())
+        
+        self.orchestrator.run_crew("test_crew", {})
+        with self.assertRaises(CrewExecutionException):
+            self.orchestrator.run_crew("test_crew", {})
+        
+        labels = {"crew": "test_crew", "model": "test-model"}
+        self.assertEqual(crew_metrics.executions.value(status="completed", **labels), 1)
+        self.assertEqual(crew_metrics.executions.value(status="failed", **labels), 1)
+        self.assertEqual(crew_metrics.tokens.value(kind="completion", **labels), 4)
+        self.assertEqual(crew_metrics.in_progress.value(**labels), 0)
+
+    @patch('amsha.crew_forge.service.base_crew_orchestrator.CrewPerformanceMonitor')
+    def test_kickoff_outcomes_are_stored_with_fingerprints(self, mock_monitor_class):
+        """Test that executions are appended to the metrics store with crew and config fingerprints."""
+        store = CrewMetricsStore(":memory:")
+        self.orchestrator.metrics_store = store
+        self.mock_manager.get_crew_fingerprint.return_value = "crew-fp"
+        mock_monitor_class.return_value.get_metrics.return_value = {"general": {"total_tokens": 10}}
+        self.mock_state_manager.create_execution.return_value = MagicMock(execution_id="exec-123")
+        mock_crew = MagicMock()
+        mock_crew.kickoff.side_effect = ["ok", Exception("Kickoff failed")]
+        self.mock_manager.build_atomic_crew.return_value = mock_crew
+        self.mock_runtime.submit.side_effect = lambda func, mode: MagicMock(result=lambda: func())
+        
+        self.orchestrator.run_crew("test_crew", {})
+        with self.assertRaises(CrewExecutionException):
+            self.orchestrator.run_crew("test_crew", {})
+        
+        records = store.history("test_crew", status=None)
+        self.assertEqual([record["status"] for record in records], ["completed", "failed"])
+        self.assertEqual(records[0]["total_tokens"], 10)
+        self.assertEqual(records[0]["model_name"], "test-model")
+        self.assertEqual(records[0]["crew_fingerprint"], "crew-fp")
+        self.assertIsNotNone(records[0]["config_fingerprint"])
+
     def test_getters(self):
         """Test getter methods."""
         self.mock_manager.output_file = "output.json"
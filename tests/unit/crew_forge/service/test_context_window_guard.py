@@ -0,0 +1,112 @@
+"""
+Unit tests for ContextWindowGuard.
+"""
+import unittest
+from unittest.mock import MagicMock
+
+from amsha.crew_forge.domain.models.crew_retry_policy import CrewRetryPolicy
+from amsha.crew_forge.exceptions import ContextWindowExceededException
+from amsha.crew_forge.service.context_window_guard import TRIM_MARKER, ContextWindowGuard
+from amsha.llm_factory.service.llm_context_window import TokenEstimator
+
+
+def _llm(context_window=None, max_completion_tokens=None):
+    llm = MagicMock()
+    llm._context_window = context_window
+    llm.max_completion_tokens = max_completion_tokens
+    return llm
+
+
+def _crew(llm):
+    agent = MagicMock(role="Writer", goal="Write about {topic}", backstory="An author.", llm=llm)
+    task = MagicMock(agent=agent, description="Summarise: {document}", expected_output="A summary.")
+    return MagicMock(tasks=[task], agents=[agent])
+
+
+class TestContextWindowGuard(unittest.TestCase):
+    """Test cases for the pre-flight context-window check."""
+
+    def setUp(self):
+        self.estimator = TokenEstimator(chars_per_token=4.0)
+        self.inputs = {"topic": "tea", "document": "word " * 2000}
+
+    def _guard(self, action, **kwargs):
+        return ContextWindowGuard(action=action, overhead_tokens=100, completion_reserve_tokens=200,
+                                  estimator=self.estimator, **kwargs)
+
+    def test_prompt_within_the_window_passes_unchanged(self):
+        result = self._guard("reject").apply("crew", _crew(_llm(8192)), self.inputs)
+
+        self.assertEqual(result.inputs, self.inputs)
+        self.assertIsNone(result.llm)
+        self.assertTrue(result.estimates[0].fits)
+        self.assertGreater(result.estimates[0].prompt_tokens, 2000)
+
+    def test_llms_without_a_configured_window_are_not_checked(self):
+        result = self._guard("reject").apply("crew", _crew(_llm(None)), self.inputs)
+
+        self.assertIsNone(result.estimates[0].context_window)
+        self.assertTrue(result.estimates[0].fits)
+
+    def test_oversized_prompt_is_rejected_as_permanent_failure(self):
+        with self.assertRaises(ContextWindowExceededException) as ctx:
+            self._guard("reject").apply("crew", _crew(_llm(1024, max_completion_tokens=512)), self.inputs)
+
+        self.assertEqual(ctx.exception.context_window, 1024)
+        self.assertGreater(ctx.exception.estimated_tokens, 2512)
+        self.assertFalse(CrewRetryPolicy().is_retryable(ctx.exception))
+
+    def test_trim_shortens_the_largest_input_until_it_fits(self):
+        result = self._guard("trim").apply("crew", _crew(_llm(1024)), self.inputs)
+
+        self.assertTrue(all(estimate.fits for estimate in result.estimates))
+        self.assertTrue(result.inputs["document"].endswith(TRIM_MARKER))
+        self.assertEqual(result.inputs["topic"], "tea")
+        # The caller's inputs are left alone
+        self.assertFalse(self.inputs["document"].endswith(TRIM_MARKER))
+
+    def test_trim_accounts_for_repeated_placeholders(self):
+        crew = _crew(_llm(1024))
+        crew.tasks[0].description = "Summarise: {document}\n\nQuote from: {document}"
+
+        result = self._guard("trim").apply("crew", crew, self.inputs)
+
+        self.assertEqual(result.estimates[0].placeholders.count("document"), 2)
+        self.assertTrue(all(estimate.fits for estimate in result.estimates))
+        self.assertTrue(result.inputs["document"].endswith(TRIM_MARKER))
+
+    def test_trim_rejects_when_nothing_can_be_trimmed(self):
+        with self.assertRaises(ContextWindowExceededException):
+            self._guard("trim").apply("crew", _crew(_llm(1024)), {"topic": "tea", "document": ["x"] * 3000})
+
+    def test_route_moves_the_agents_to_the_bigger_model(self):
+        large = _llm(32768)
+        crew = _crew(_llm(1024))
+        guard = self._guard("route", route_llm=lambda: (large, "gemma-128k", None))
+
+        result = guard.apply("crew", crew, self.inputs)
+
+        self.assertIs(result.llm, large)
+        self.assertEqual(result.model_name, "gemma-128k")
+        self.assertIs(crew.agents[0].llm, large)
+
+    def test_route_rejects_without_a_model_that_fits(self):
+        with self.assertRaises(ContextWindowExceededException):
+            self._guard("route").apply("crew", _crew(_llm(1024)), self.inputs)
+        with self.assertRaises(ContextWindowExceededException):
+            self._guard("route", route_llm=lambda: (_llm(2048), "small", None)).apply(
+                "crew", _crew(_llm(1024)), self.inputs
+            )
+
+    def test_from_config(self):
+        self.assertIsNone(ContextWindowGuard.from_config(None))
+        self.assertIsNone(ContextWindowGuard.from_config({"enabled": False}))
+        guard = ContextWindowGuard.from_config({"enabled": True, "action": "trim", "overhead_tokens": 50})
+
+        self.assertEqual((guard.action, guard.overhead_tokens), ("trim", 50))
+        with self.assertRaises(ValueError):
+            ContextWindowGuard(action="truncate")
+
+
+if __name__ == '__main__':
+    unittest.main()
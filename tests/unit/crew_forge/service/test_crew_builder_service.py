@@ -253,6 +253,18 @@ class TestCrewBuilderService(unittest.TestCase):
         
         self.assertEqual(crew.knowledge_sources, [mock_knowledge])
     
+    def test_build_streams_only_if_the_llm_streams(self):
+        """Test that the crew follows the streaming setting of its LLM unless told otherwise."""
+        service = CrewBuilderService(self.crew_data)
+        service.add_agent(AgentRequest(role="A", goal="G", backstory="S"))
+        service.add_task(TaskRequest(name="t", description="d", expected_output="o"), service.get_last_agent())
+
+        self.mock_llm.stream = False
+        self.assertFalse(service.build().stream)
+        self.assertTrue(service.build(stream=True).stream)
+        self.mock_llm.stream = True
+        self.assertTrue(service.build().stream)
+    
     def test_build_without_agents_raises_error(self):
         """Test that building without agents raises ValueError."""
         service = CrewBuilderService(self.crew_data)
@@ -0,0 +1,83 @@
+"""
+Unit tests for CrewResultCache.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from crewai.crews.crew_output import CrewOutput
+
+from amsha.crew_forge.service.crew_result_cache import CrewResultCache
+
+
+class TestCrewResultCache(unittest.TestCase):
+    """Test cases for CrewResultCache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = CrewResultCache(os.path.join(self.temp_dir, "cache"))
+        self.output_file = os.path.join(self.temp_dir, "out.json")
+        with open(self.output_file, "w") as f:
+            f.write("{}")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_from_config_disabled(self):
+        self.assertIsNone(CrewResultCache.from_config(None))
+        self.assertIsNone(CrewResultCache.from_config({"enabled": False}))
+
+    def test_build_key_changes_with_inputs(self):
+        key_a = CrewResultCache.build_key("crew", "model", {"topic": "AI"})
+        key_b = CrewResultCache.build_key("crew", "model", {"topic": "ML"})
+        self.assertNotEqual(key_a, key_b)
+        self.assertEqual(key_a, CrewResultCache.build_key("crew", "model", {"topic": "AI"}))
+
+    def test_fingerprint_files_tracks_content(self):
+        before = CrewResultCache.fingerprint_files([self.output_file])
+        with open(self.output_file, "w") as f:
+            f.write('{"changed": true}')
+        after = CrewResultCache.fingerprint_files([self.output_file])
+        self.assertNotEqual(before, after)
+
+    def test_fingerprint_llm_uses_model_params(self):
+        llm = MagicMock(model="gpt-4", temperature=0.0)
+        other = MagicMock(model="gpt-4", temperature=0.7)
+        self.assertNotEqual(CrewResultCache.fingerprint_llm(llm), CrewResultCache.fingerprint_llm(other))
+
+    def test_put_and_get_crew_output(self):
+        output = CrewOutput(raw='{"a": 1}', json_dict={"a": 1})
+        self.cache.put("key", "test_crew", output, self.output_file)
+
+        cached = self.cache.get("key")
+
+        self.assertIsInstance(cached.result, CrewOutput)
+        self.assertEqual(cached.result.raw, '{"a": 1}')
+        self.assertEqual(cached.result.json_dict, {"a": 1})
+        self.assertEqual(cached.output_file, self.output_file)
+
+    def test_missing_output_file_is_miss(self):
+        self.cache.put("key", "test_crew", "raw", self.output_file)
+        os.remove(self.output_file)
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_invalidate_by_crew_name(self):
+        self.cache.put("k1", "crew_a", "raw", None)
+        self.cache.put("k2", "crew_b", "raw", None)
+
+        self.assertEqual(self.cache.invalidate(crew_name="crew_a"), 1)
+        self.assertIsNone(self.cache.get("k1"))
+        self.assertIsNotNone(self.cache.get("k2"))
+
+    def test_invalidate_by_key(self):
+        self.cache.put("k1", "crew_a", "raw", None)
+
+        self.assertEqual(self.cache.invalidate(key="k1"), 1)
+        self.assertIsNone(self.cache.get("k1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
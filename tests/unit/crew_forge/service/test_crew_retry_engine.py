@@ -0,0 +1,143 @@
+"""
+Unit tests for CrewRetryEngine.
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.crew_forge.domain.models.crew_retry_policy import CrewRetryPolicy
+from amsha.crew_forge.exceptions import CrewConfigurationException
+from amsha.crew_forge.service.crew_retry_engine import CrewRetryEngine
+from amsha.execution_runtime.domain.execution_mode import ExecutionMode
+from amsha.execution_state.domain.enums import ExecutionStatus
+
+
+class TestCrewRetryEngine(unittest.TestCase):
+    """Test cases for CrewRetryEngine."""
+
+    def setUp(self):
+        self.orchestrator = MagicMock()
+        self.orchestrator.last_crew = None
+        self.orchestrator.get_last_output_file.return_value = "out.json"
+        self.orchestrator.get_last_execution_id.return_value = "exec-1"
+        self.sleep = MagicMock()
+
+    def _engine(self, **policy):
+        return CrewRetryEngine(self.orchestrator, CrewRetryPolicy(**policy), sleep=self.sleep)
+
+    def test_success_without_validator(self):
+        self.orchestrator.run_crew.return_value = "Result"
+
+        result = self._engine(max_retries=2).run("crew", {"topic": "AI"})
+
+        self.assertEqual(result, "Result")
+        self.orchestrator.run_crew.assert_called_once()
+        self.sleep.assert_not_called()
+
+    def test_transient_error_retried_with_backoff(self):
+        self.orchestrator.run_crew.side_effect = [TimeoutError("timeout"), "Result"]
+        engine = self._engine(max_retries=2, backoff_base_seconds=2.0, jitter=0)
+
+        result = engine.run("crew", {"topic": "AI"})
+
+        self.assertEqual(result, "Result")
+        self.sleep.assert_called_once_with(2.0)
+        self.assertEqual([a["outcome"] for a in engine.attempts], ["error", "success"])
+        # Second attempt rebuilds because no crew was built
+        self.assertEqual(self.orchestrator.run_crew.call_args.kwargs["filename_suffix"], "crew_retry_1")
+
+    def test_permanent_error_not_retried(self):
+        self.orchestrator.run_crew.side_effect = CrewConfigurationException("bad config")
+
+        with self.assertRaises(CrewConfigurationException):
+            self._engine(max_retries=3).run("crew", {"topic": "AI"})
+
+        self.orchestrator.run_crew.assert_called_once()
+        self.sleep.assert_not_called()
+
+    def test_validation_failure_marks_state_and_returns_last_result(self):
+        self.orchestrator.run_crew.return_value = "Bad"
+        validator = MagicMock(return_value=(False, "not JSON"))
+
+        result = self._engine(max_retries=1).run("crew", {"topic": "AI"}, validator=validator)
+
+        self.assertEqual(result, "Bad")
+        self.assertEqual(validator.call_count, 2)
+        self.orchestrator.discard_last_cached_result.assert_called()
+        self.orchestrator.state_manager.update_status.assert_called_with(
+            "exec-1",
+            ExecutionStatus.FAILED,
+            metadata={"reason": "Validation failed", "attempt": 2, "validation_error": "not JSON"}
+        )
+
+    @patch('amsha.crew_forge.service.crew_retry_engine.Crew', new=MagicMock)
+    def test_retry_reuses_built_crew(self):
+        built_crew = MagicMock()
+        built_crew.tasks = []
+
+        def run_crew(**kwargs):
+            self.orchestrator.last_crew = built_crew
+            return "Bad"
+
+        self.orchestrator.run_crew.side_effect = run_crew
+        self.orchestrator.run_prepared_crew.return_value = "Good"
+        validator = MagicMock(side_effect=[False, True])
+        copied_crew = MagicMock()
+        copied_crew.tasks = [MagicMock()]
+        engine = self._engine(max_retries=1)
+
+        with patch.object(CrewRetryEngine, 'prepare_retry_crew', return_value=copied_crew) as prepare:
+            result = engine.run("crew", {"topic": "AI"}, validator=validator)
+
+        self.assertEqual(result, "Good")
+        self.orchestrator.run_crew.assert_called_once()
+        prepare.assert_called_once_with(built_crew, "out_retry_1.json")
+        self.orchestrator.run_prepared_crew.assert_called_once_with(
+            "crew", copied_crew, {"topic": "AI"}, "out_retry_1.json", mode=ExecutionMode.INTERACTIVE
+        )
+        self.assertEqual([a["strategy"] for a in engine.attempts], ["build", "rerun"])
+
+    @patch('amsha.crew_forge.service.crew_retry_engine.Crew', new=MagicMock)
+    def test_repair_mode_reruns_last_task(self):
+        built_crew = MagicMock()
+        built_crew.tasks = []
+        retry_crew = MagicMock()
+        retry_crew.tasks = [MagicMock()]
+
+        def run_crew(**kwargs):
+            self.orchestrator.last_crew = built_crew
+            return "Bad"
+
+        self.orchestrator.run_crew.side_effect = run_crew
+        self.orchestrator.run_prepared_crew.return_value = "Good"
+        validator = MagicMock(side_effect=[(False, "missing key"), True])
+        engine = self._engine(max_retries=1, repair_last_task=True)
+
+        with patch.object(CrewRetryEngine, 'prepare_retry_crew', return_value=retry_crew), \
+                patch.object(CrewRetryEngine, 'prepare_repair_crew', return_value="repair_crew") as repair:
+            result = engine.run("crew", {"topic": "AI"}, validator=validator)
+
+        self.assertEqual(result, "Good")
+        repair.assert_called_once_with(retry_crew, [], "Bad", "missing key")
+        self.assertEqual(self.orchestrator.run_prepared_crew.call_args.args[1], "repair_crew")
+        self.assertEqual([a["strategy"] for a in engine.attempts], ["build", "repair"])
+
+    def test_background_mode_submits_retry_loop(self):
+        handle = MagicMock()
+        self.orchestrator.runtime.submit.return_value = handle
+        engine = self._engine(max_retries=1)
+
+        result = engine.run("crew", {"topic": "AI"}, mode=ExecutionMode.BACKGROUND)
+
+        self.assertIs(result, handle)
+        self.assertIs(handle.attempts, engine.attempts)
+        args, kwargs = self.orchestrator.runtime.submit.call_args
+        self.assertEqual(args[0], engine._run_attempts)
+        self.assertEqual(kwargs["mode"], ExecutionMode.BACKGROUND)
+
+    def test_retry_output_file(self):
+        self.assertEqual(CrewRetryEngine.retry_output_file("out/a.json", 2), "out/a_retry_2.json")
+        self.assertIsNone(CrewRetryEngine.retry_output_file(None, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
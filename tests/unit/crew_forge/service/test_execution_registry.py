@@ -0,0 +1,105 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.crew_forge.service.base_crew_orchestrator import BaseCrewOrchestrator
+from amsha.crew_forge.service.execution_registry import ExecutionRegistry
+from amsha.execution_runtime.domain.execution_mode import ExecutionMode
+from amsha.execution_runtime.service.runtime_engine import RuntimeEngine
+
+
+class TestExecutionRegistry(unittest.TestCase):
+    def test_register_and_get(self):
+        registry = ExecutionRegistry(max_entries=4)
+        record = registry.register("exec-1", "crew")
+
+        self.assertIs(registry.get("exec-1"), record)
+        self.assertIsNone(registry.get("missing"))
+        self.assertIsNone(registry.get(None))
+        self.assertIn("exec-1", registry)
+
+    def test_evicts_oldest_finished_record_first(self):
+        registry = ExecutionRegistry(max_entries=2)
+        registry.register("running", "crew")
+        registry.register("done", "crew").finished = True
+        registry.register("new", "crew")
+
+        self.assertEqual([record.execution_id for record in registry.records()], ["running", "new"])
+        self.assertEqual([record.execution_id for record in registry.running()], ["running", "new"])
+
+    def test_evicts_oldest_when_all_running(self):
+        registry = ExecutionRegistry(max_entries=1)
+        registry.register("first", "crew")
+        registry.register("second", "crew")
+
+        self.assertEqual(len(registry), 1)
+        self.assertIsNotNone(registry.get("second"))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ExecutionRegistry(0)
+
+
+class TestOrchestratorPerExecutionTracking(unittest.TestCase):
+    def setUp(self):
+        self.manager = MagicMock()
+        self.manager.model_name = "test-model"
+        self.state_manager = MagicMock()
+        ids = iter(["exec-1", "exec-2"])
+        self.state_manager.create_execution.side_effect = lambda inputs: MagicMock(execution_id=next(ids))
+        self.runtime = RuntimeEngine(max_workers=2)
+        self.orchestrator = BaseCrewOrchestrator(self.manager, runtime=self.runtime, state_manager=self.state_manager)
+
+    def tearDown(self):
+        self.runtime.shutdown()
+
+    @patch("amsha.crew_forge.service.base_crew_orchestrator.CrewPerformanceMonitor")
+    def test_concurrent_background_runs_keep_their_own_monitor_and_output_file(self, mock_monitor_class):
+        mock_monitor_class.side_effect = lambda model_name: MagicMock()
+        # Both kickoffs block until both are running, so their monitors overlap
+        both_running = threading.Barrier(2, timeout=5)
+
+        def build(crew_name, filename_suffix, output_json):
+            def kickoff(inputs):
+                both_running.wait()
+                return f"{crew_name} result"
+
+            self.manager.output_file = f"{crew_name}.json"
+            crew = MagicMock()
+            crew.kickoff.side_effect = kickoff
+            return crew
+
+        self.manager.build_atomic_crew.side_effect = build
+
+        first = self.orchestrator.run_crew("first", {}, mode=ExecutionMode.BACKGROUND)
+        second = self.orchestrator.run_crew("second", {}, mode=ExecutionMode.BACKGROUND)
+
+        self.assertEqual(first.result(timeout=5), "first result")
+        self.assertEqual(second.result(timeout=5), "second result")
+        self.assertEqual(first.execution_record.output_file, "first.json")
+        self.assertEqual(second.execution_record.output_file, "second.json")
+        self.assertIsNot(first.execution_record.monitor, second.execution_record.monitor)
+        self.assertTrue(first.execution_record.finished)
+        self.assertIs(self.orchestrator.get_execution(first.execution_state_id), first.execution_record)
+        self.assertIs(self.orchestrator.get_last_performance_stats(), second.execution_record.monitor)
+
+    def test_last_execution_is_tracked_per_calling_thread(self):
+        self.orchestrator.last_execution_id = "main-run"
+        seen = []
+
+        def other_caller():
+            seen.append(self.orchestrator.get_last_execution_id())
+            self.orchestrator.last_execution_id = "worker-run"
+            seen.append(self.orchestrator.get_last_execution_id())
+
+        worker = threading.Thread(target=other_caller)
+        worker.start()
+        worker.join()
+
+        # A thread without runs of its own sees the latest run overall
+        self.assertEqual(seen, ["main-run", "worker-run"])
+        self.assertEqual(self.orchestrator.get_last_execution_id(), "main-run")
+
+
+if __name__ == "__main__":
+    unittest.main()
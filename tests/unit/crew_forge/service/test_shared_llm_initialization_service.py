@@ -4,12 +4,31 @@ Unit tests for SharedLLMInitializationService class.
 import unittest
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from amsha.crew_forge.service.shared_llm_initialization_service import SharedLLMInitializationService
+from amsha.llm_factory.domain.model.llm_parameters import LLMParameters
 from amsha.llm_factory.domain.model.llm_type import LLMType
 from amsha.crew_forge.exceptions import CrewConfigurationException
 
+METADATA_CONFIG = """
+llm:
+  creative:
+    default: gemma
+    models:
+      gemma:
+        model: "lm_studio/gemma-3-12b-it"
+      gpt:
+        model: "gpt-4o"
+        output_config:
+          alias: "openai-main"
+          folder_name: "openai"
+llm_parameters:
+  creative:
+    temperature: 0.7
+"""
+
 
 class TestSharedLLMInitializationService(unittest.TestCase):
     """Test cases for SharedLLMInitializationService class."""
@@ -29,7 +48,7 @@ class TestSharedLLMInitializationService(unittest.TestCase):
         """Test proper initialization of SharedLLMInitializationService."""
         self.assertIsNotNone(self.service)
         
-    @patch('amsha.crew_forge.service.shared_llm_initialization_service.LLMContainer')
+    @patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
     def test_initialize_llm_creative_success(self, mock_container_class):
         """Test successful LLM initialization for creative use case."""
         # Create a dummy config file
@@ -49,7 +68,7 @@ class TestSharedLLMInitializationService(unittest.TestCase):
         mock_builder.build_creative.return_value = mock_build_result
         
         # Call the service
-        llm, model_name = self.service.initialize_llm(config_path, LLMType.CREATIVE)
+        llm, model_name, _ = self.service.initialize_llm(config_path, LLMType.CREATIVE)
         
         # Verify
         self.assertEqual(llm, mock_llm_instance)
@@ -57,7 +76,7 @@ class TestSharedLLMInitializationService(unittest.TestCase):
         mock_container.config.llm.yaml_path.from_value.assert_called_once_with(config_path)
         mock_builder.build_creative.assert_called_once()
 
-    @patch('amsha.crew_forge.service.shared_llm_initialization_service.LLMContainer')
+    @patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
     def test_initialize_llm_evaluation_success(self, mock_container_class):
         """Test successful LLM initialization for evaluation use case."""
         # Create a dummy config file
@@ -77,7 +96,7 @@ class TestSharedLLMInitializationService(unittest.TestCase):
         mock_builder.build_evaluation.return_value = mock_build_result
         
         # Call the service
-        llm, model_name = self.service.initialize_llm(config_path, LLMType.EVALUATION)
+        llm, model_name, _ = self.service.initialize_llm(config_path, LLMType.EVALUATION)
         
         # Verify
         self.assertEqual(llm, mock_llm_instance)
@@ -91,26 +110,7 @@ class TestSharedLLMInitializationService(unittest.TestCase):
         
         self.assertIn("configuration file not found", str(context.exception))
 
-    @patch('amsha.crew_forge.service.shared_llm_initialization_service.LLMContainer')
-    def test_get_model_name_from_config(self, mock_container_class):
-        """Test get_model_name_from_config helper."""
-        # Create a dummy config file
-        config_path = os.path.join(self.test_dir, "llm_config.yaml")
-        with open(config_path, 'w') as f:
-            f.write("test: config")
-            
-        # Setup mocks
-        mock_container = mock_container_class.return_value
-        mock_builder = mock_container.llm_builder.return_value
-        mock_build_result = MagicMock()
-        mock_build_result.provider.model_name = "test-model"
-        mock_builder.build_creative.return_value = mock_build_result
-        
-        model_name = self.service.get_model_name_from_config(config_path, LLMType.CREATIVE)
-        
-        self.assertEqual(model_name, "test-model")
-
-    @patch('amsha.crew_forge.service.shared_llm_initialization_service.LLMContainer')
+    @patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
     @patch('pathlib.Path.exists')
     def test_initialize_llm_failure(self, mock_exists, mock_container_class):
         """Test initialize_llm failure cases."""
@@ -129,12 +129,176 @@ class TestSharedLLMInitializationService(unittest.TestCase):
         with self.assertRaises(CrewConfigurationException):
             self.service.initialize_llm("test.yaml", LLMType.CREATIVE)
 
-    def test_get_model_name_from_config(self):
-        """Test get_model_name_from_config."""
-        with patch('amsha.crew_forge.service.shared_llm_initialization_service.SharedLLMInitializationService.initialize_llm') as mock_init:
-            mock_init.return_value = (MagicMock(), "test-model")
-            res = self.service.get_model_name_from_config("test.yaml", LLMType.CREATIVE)
-            self.assertEqual(res, "test-model")
+    @patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
+    def test_get_model_name_from_config(self, mock_container_class):
+        """Test get_model_name_from_config reads the name from the settings without building an LLM."""
+        SharedLLMInitializationService.clear_cache()
+        self.addCleanup(SharedLLMInitializationService.clear_cache)
+        config_path = os.path.join(self.test_dir, "llm_config.yaml")
+        with open(config_path, 'w') as f:
+            f.write(METADATA_CONFIG)
+
+        self.assertEqual(self.service.get_model_name_from_config(config_path, LLMType.CREATIVE), "gemma-3-12b-it")
+        self.assertEqual(self.service.get_model_name_from_config(config_path, LLMType.CREATIVE, model_key="gpt"),
+                         "gpt-4o")
+        mock_container_class.assert_not_called()
+        with self.assertRaises(CrewConfigurationException):
+            self.service.get_model_name_from_config(config_path, LLMType.EVALUATION)
+
+    @patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
+    def test_get_model_metadata_shares_parsed_settings(self, mock_container_class):
+        """Test metadata lookups parse the file once and hand the settings to a later initialization."""
+        SharedLLMInitializationService.clear_cache()
+        self.addCleanup(SharedLLMInitializationService.clear_cache)
+        config_path = os.path.join(self.test_dir, "llm_config.yaml")
+        with open(config_path, 'w') as f:
+            f.write(METADATA_CONFIG)
+
+        metadata = self.service.get_model_metadata(config_path, LLMType.CREATIVE)
+        keyed = self.service.get_model_metadata(config_path, LLMType.CREATIVE, model_key="gpt")
+
+        self.assertEqual([m.model_key for m in metadata], ["gemma", "gpt"])
+        self.assertEqual(keyed[0].output_name, "openai-main")
+        self.assertEqual(keyed[0].folder_name, "openai")
+        settings = self.service.load_settings(config_path)
+        self.assertIs(self.service.load_settings(config_path), settings)
+        mock_container_class.assert_not_called()
+
+        self.service.initialize_llm(config_path, LLMType.CREATIVE)
+        settings_override = mock_container_class.return_value.llm_settings.override
+        self.assertIs(settings_override.call_args.args[0].provides, settings)
+
+    @patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
+    def test_initialize_llm_from_settings_uses_the_snapshot(self, mock_container_class):
+        """Test that a reload builds from the validated snapshot, not from the file on disk."""
+        from amsha.llm_factory.settings.llm_settings import LLMSettings
+        from amsha.llm_factory.settings.llm_settings_source import VersionedLLMSettings
+
+        config_path = os.path.join(self.test_dir, "llm_config.yaml")
+        with open(config_path, 'w') as f:
+            f.write("llm: [half, written")
+        import yaml
+        settings = LLMSettings(**yaml.safe_load(METADATA_CONFIG))
+        snapshot = VersionedLLMSettings(2, settings, config_path, "digest", 0.0)
+        mock_build_result = MagicMock()
+        mock_build_result.provider.model_name = "gemma-3-12b-it"
+        mock_container_class.return_value.llm_builder.return_value.build_creative.return_value = mock_build_result
+
+        llm, model_name, _ = self.service.initialize_llm_from_settings(snapshot, LLMType.CREATIVE)
+
+        self.assertEqual(model_name, "gemma-3-12b-it")
+        settings_override = mock_container_class.return_value.llm_settings.override
+        self.assertIs(settings_override.call_args.args[0].provides, settings)
+
+    def test_load_settings_invalid_config(self):
+        """Test an invalid config surfaces as a configuration error."""
+        config_path = os.path.join(self.test_dir, "llm_config.yaml")
+        with open(config_path, 'w') as f:
+            f.write("llm: [not, a, mapping")
+
+        with self.assertRaises(CrewConfigurationException):
+            self.service.load_settings(config_path)
+        with self.assertRaises(CrewConfigurationException):
+            self.service.load_settings(os.path.join(self.test_dir, "missing.yaml"))
+
+
+class TestSharedLLMInitializationCache(unittest.TestCase):
+    """Test cases for the process-wide settings and LLM cache."""
+
+    def setUp(self):
+        SharedLLMInitializationService.clear_cache()
+        self.addCleanup(SharedLLMInitializationService.clear_cache)
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "llm_config.yaml")
+        with open(self.config_path, 'w') as f:
+            f.write("test: config")
+        patcher = patch('amsha.llm_factory.dependency.llm_container.LLMContainer')
+        self.container_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        builder = self.container_class.return_value.llm_builder.return_value
+        builder.build_creative.side_effect = self._build_result
+        builder.build_evaluation.side_effect = self._build_result
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.test_dir)
+
+    @staticmethod
+    def _build_result(**kwargs):
+        result = MagicMock()
+        result.provider.model_name = kwargs.get("model_key") or "default-model"
+        result.provider.get_raw_llm.return_value = MagicMock()
+        return result
+
+    def test_repeated_initialization_shares_settings_and_llm(self):
+        first = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+        second = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+        evaluation = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.EVALUATION)
+
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first[0], evaluation[0])
+        self.assertEqual(self.container_class.call_count, 2)
+        # The second build reuses the settings parsed by the first
+        self.container_class.return_value.llm_settings.override.assert_called_once()
+        self.assertEqual(SharedLLMInitializationService.get_cache_stats(),
+                         {"hits": 1, "misses": 2, "settings": 1, "llms": 2})
+
+    def test_model_key_overrides_and_opt_out_build_new_llms(self):
+        default = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+        keyed = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE, model_key="fast")
+        params = LLMParameters(temperature=0.1)
+        overridden = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE,
+                                                                   llm_params=params)
+        again = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE,
+                                                              llm_params=LLMParameters(temperature=0.1))
+        uncached = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE, use_cache=False)
+
+        self.assertEqual(keyed[1], "fast")
+        self.assertIsNot(default[0], overridden[0])
+        self.assertIs(overridden[0], again[0])
+        self.assertIsNot(default[0], uncached[0])
+        self.assertEqual(self.container_class.call_count, 4)
+
+    def test_config_change_invalidates_cache(self):
+        first = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual(SharedLLMInitializationService.get_cache_stats()["llms"], 1)
+
+    def test_config_change_keeps_build_locks_that_are_held(self):
+        from amsha.crew_forge.service import shared_llm_initialization_service as service_module
+
+        SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+        SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.EVALUATION)
+        stale_keys = list(service_module._build_locks)
+        held = service_module._build_locks[stale_keys[0]]
+        held.acquire()
+        self.addCleanup(held.release)
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+
+        self.assertIs(service_module._build_locks[stale_keys[0]], held)
+        self.assertNotIn(stale_keys[1], service_module._build_locks)
+        self.assertEqual(SharedLLMInitializationService.get_cache_stats()["llms"], 1)
+
+    def test_concurrent_callers_share_one_build(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            SharedLLMInitializationService.initialize_llm(self.config_path, LLMType.CREATIVE)
+        )) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(result[0]) for result in results}), 1)
+        self.assertEqual(self.container_class.call_count, 1)
 
 
 if __name__ == '__main__':
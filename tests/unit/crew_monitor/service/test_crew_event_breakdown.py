@@ -0,0 +1,181 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from crewai.events.types.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+    LLMStreamChunkEvent,
+)
+from crewai.events.types.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+from crewai.tasks.task_output import TaskOutput
+
+from amsha.crew_monitor.service import crew_event_breakdown
+from amsha.crew_monitor.service.crew_event_breakdown import CrewEventBreakdown
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(seconds: float) -> datetime:
+    return _T0 + timedelta(seconds=seconds)
+
+
+def _task(task_id: str, name: str, role: str) -> SimpleNamespace:
+    return SimpleNamespace(id=task_id, name=name, agent=SimpleNamespace(role=role), fingerprint=None)
+
+
+def _started(task, at):
+    event = TaskStartedEvent(context=None, task=task)
+    event.timestamp = _at(at)
+    return event
+
+
+def _completed(task, at):
+    event = TaskCompletedEvent(output=TaskOutput(description="d", agent=task.agent.role, raw="done"), task=task)
+    event.timestamp = _at(at)
+    return event
+
+
+def _llm_started(task_id, at, prompt):
+    event = LLMCallStartedEvent(messages=[{"role": "user", "content": prompt}], model="fake/model", task_id=task_id)
+    event.timestamp = _at(at)
+    return event
+
+
+def _chunk(task_id, at, text):
+    event = LLMStreamChunkEvent(chunk=text, task_id=task_id)
+    event.timestamp = _at(at)
+    return event
+
+
+def _llm_completed(task_id, at, response):
+    event = LLMCallCompletedEvent(messages=[], response=response, call_type=LLMCallType.LLM_CALL,
+                                  model="fake/model", task_id=task_id)
+    event.timestamp = _at(at)
+    return event
+
+
+class TestCrewEventBreakdown(unittest.TestCase):
+    def setUp(self):
+        self.research = _task("t-research", "research", "Researcher")
+        self.write = _task("t-write", "write", "Writer")
+        self.breakdown = CrewEventBreakdown()
+
+    def _feed(self, *events):
+        for event in events:
+            self.breakdown.handle(event)
+
+    def test_aggregates_tasks_agents_and_llm_calls(self):
+        # Events of a task may arrive out of order from CrewAI's handler pool
+        self._feed(
+            _started(self.research, 0.0),
+            _llm_completed("t-research", 1.0, "r" * 40),
+            _llm_started("t-research", 0.5, "p" * 400),
+            _llm_started("t-research", 1.5, "p" * 80),
+            _llm_completed("t-research", 3.5, "r" * 8),
+            _completed(self.research, 4.0),
+            _started(self.write, 4.0),
+            _llm_started("t-write", 4.5, "p" * 40),
+            _llm_completed("t-write", 5.0, "r" * 4),
+            _completed(self.write, 6.0),
+        )
+
+        result = self.breakdown.get_breakdown()
+
+        self.assertEqual([task["task_name"] for task in result["tasks"]], ["research", "write"])
+        research = result["tasks"][0]
+        self.assertEqual(research["agent_role"], "Researcher")
+        self.assertEqual(research["status"], "completed")
+        self.assertEqual(research["seconds"], 4.0)
+        self.assertEqual(research["llm_calls"], 2)
+        self.assertEqual(research["llm_seconds"], 2.5)
+        self.assertEqual(research["prompt_tokens_estimated"], 120)
+        self.assertEqual(research["completion_tokens_estimated"], 12)
+
+        self.assertEqual([call["seconds"] for call in result["llm_calls"]], [0.5, 2.0, 0.5])
+        self.assertEqual({agent["agent_role"]: agent["llm_calls"] for agent in result["agents"]},
+                         {"Researcher": 2, "Writer": 1})
+        self.assertFalse(result["llm_calls_truncated"])
+
+    def test_failed_task_and_listed_call_cap(self):
+        self._feed(_started(self.research, 0.0))
+        for index in range(3):
+            self._feed(_llm_started("t-research", index, "p"), _llm_completed("t-research", index + 0.5, "r"))
+        failed = TaskFailedEvent(error="boom", task=self.research)
+        failed.timestamp = _at(5.0)
+        self._feed(failed)
+
+        original_cap = crew_event_breakdown.MAX_LISTED_LLM_CALLS
+        crew_event_breakdown.MAX_LISTED_LLM_CALLS = 2
+        try:
+            result = self.breakdown.get_breakdown()
+        finally:
+            crew_event_breakdown.MAX_LISTED_LLM_CALLS = original_cap
+
+        self.assertEqual(result["tasks"][0]["status"], "failed")
+        self.assertEqual(result["tasks"][0]["llm_calls"], 3)
+        self.assertEqual(len(result["llm_calls"]), 2)
+        self.assertTrue(result["llm_calls_truncated"])
+
+    def test_dispatch_routes_by_task_and_detach_unregisters(self):
+        crew = SimpleNamespace(tasks=[self.research])
+        other = CrewEventBreakdown().attach(SimpleNamespace(tasks=[self.write]))
+        self.breakdown.attach(crew)
+
+        crew_event_breakdown._dispatch(None, _started(self.research, 0.0))
+        crew_event_breakdown._dispatch(None, _completed(self.research, 1.0))
+        crew_event_breakdown._dispatch(None, _started(self.write, 0.0))
+        crew_event_breakdown._dispatch(None, _completed(self.write, 2.0))
+        self.breakdown.detach(timeout=0.1)
+        other.detach(timeout=0.1)
+        crew_event_breakdown._dispatch(None, _started(self.research, 3.0))
+
+        self.assertEqual([task["seconds"] for task in self.breakdown.get_breakdown()["tasks"]], [1.0])
+        self.assertEqual([task["seconds"] for task in other.get_breakdown()["tasks"]], [2.0])
+        self.assertNotIn("t-research", crew_event_breakdown._breakdowns_by_task)
+
+    def test_detach_gives_up_on_unfinished_task(self):
+        self.breakdown.attach(SimpleNamespace(tasks=[self.research]))
+        self._feed(_started(self.research, 0.0))
+
+        self.breakdown.detach(timeout=0.01)
+
+        self.assertIsNone(self.breakdown.get_breakdown()["tasks"][0]["seconds"])
+        self.assertNotIn("t-research", crew_event_breakdown._breakdowns_by_task)
+
+    def test_streaming_metrics_per_model(self):
+        self._feed(
+            _started(self.research, 0.0),
+            _llm_started("t-research", 1.0, "p"),
+            _chunk("t-research", 1.5, "a" * 40),
+            _chunk("t-research", 1.7, "b" * 40),
+            _chunk("t-research", 2.0, "c" * 40),
+            _llm_completed("t-research", 2.5, "abc"),
+            # A call that did not stream is left out of the streaming metrics
+            _llm_started("t-research", 3.0, "p"),
+            _llm_completed("t-research", 4.0, "abc"),
+            _completed(self.research, 5.0),
+        )
+
+        streaming = self.breakdown.get_streaming_metrics()
+
+        self.assertEqual(streaming["streamed_calls"], 1)
+        self.assertEqual(streaming["chunks"], 3)
+        self.assertEqual(streaming["time_to_first_chunk_seconds"]["p50"], 0.5)
+        self.assertEqual(streaming["inter_chunk_gap_seconds"]["max"], 0.3)
+        self.assertEqual(streaming["inter_chunk_gap_seconds"]["mean"], 0.25)
+        # 30 estimated tokens from the first chunk to the end of the call
+        self.assertEqual(streaming["output_tokens_per_second_estimated"], 30.0)
+        self.assertEqual(list(streaming["models"]), ["fake/model"])
+        self.assertEqual([call["chunks"] for call in self.breakdown.get_breakdown()["llm_calls"]], [3, 0])
+
+    def test_no_streaming_metrics_without_chunks(self):
+        self._feed(_started(self.research, 0.0), _llm_started("t-research", 0.5, "p"),
+                   _llm_completed("t-research", 1.0, "r"), _completed(self.research, 1.0))
+
+        self.assertEqual(self.breakdown.get_streaming_metrics(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from amsha.crew_monitor.service.crew_metrics import CrewMetrics
+from amsha.crew_monitor.service.metrics_registry import MetricsRegistry
+
+
+class TestCrewMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = CrewMetrics(MetricsRegistry())
+
+    def test_completed_execution(self):
+        self.metrics.execution_started("writer", "gpt")
+        self.metrics.execution_finished("writer", "gpt", "completed", 2.0, {
+            "general": {"total_tokens": 150, "prompt_tokens": 100, "completion_tokens": 50},
+            "breakdown": {"llm_calls": [
+                {"model": "gpt", "seconds": 1.2, "status": "completed", "time_to_first_chunk_seconds": 0.3},
+                {"model": "gpt", "seconds": 0.4, "status": "failed", "time_to_first_chunk_seconds": None},
+            ]},
+            "resources": {"rss_mb": {"peak": 100.0}},
+        })
+
+        self.assertEqual(self.metrics.in_progress.value(crew="writer", model="gpt"), 0)
+        self.assertEqual(self.metrics.executions.value(crew="writer", model="gpt", status="completed"), 1)
+        self.assertEqual(self.metrics.tokens.value(crew="writer", model="gpt", kind="prompt"), 100)
+        self.assertEqual(self.metrics.llm_call_duration.snapshot(crew="writer", model="gpt", status="failed")["count"], 1)
+        self.assertEqual(self.metrics.time_to_first_chunk.snapshot(crew="writer", model="gpt")["count"], 1)
+        self.assertEqual(self.metrics.peak_rss.value(crew="writer", model="gpt"), 100 * 1024 * 1024)
+
+    def test_failed_and_cached_executions(self):
+        self.metrics.execution_started("writer", "gpt")
+        self.metrics.execution_finished("writer", "gpt", "failed", 1.0)
+        self.metrics.execution_finished("writer", "gpt", "cached", 0.01, running=False)
+
+        self.assertEqual(self.metrics.in_progress.value(crew="writer", model="gpt"), 0)
+        self.assertEqual(self.metrics.executions.value(crew="writer", model="gpt", status="failed"), 1)
+        self.assertEqual(self.metrics.executions.value(crew="writer", model="gpt", status="cached"), 1)
+        self.assertIn('amsha_crew_execution_duration_seconds_count{crew="writer",model="gpt",status="failed"} 1',
+                      self.metrics.registry.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
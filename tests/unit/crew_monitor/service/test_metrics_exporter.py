@@ -0,0 +1,73 @@
+import os
+import socket
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+
+from amsha.crew_monitor.service import metrics_exporter
+from amsha.crew_monitor.service.metrics_exporter import CONTENT_TYPE, MetricsExporter
+from amsha.crew_monitor.service.metrics_registry import MetricsRegistry
+
+
+class TestMetricsExporter(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.registry.counter("amsha_runs", "Runs").inc()
+
+    def test_http_endpoint_serves_exposition(self):
+        exporter = MetricsExporter(self.registry, port=0).start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/other", timeout=5)
+        finally:
+            exporter.stop()
+
+        self.assertEqual(content_type, CONTENT_TYPE)
+        self.assertIn("amsha_runs_total 1\n", body)
+
+    def test_file_is_written_on_interval_and_stop(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics", "amsha.prom")
+            exporter = MetricsExporter(self.registry, file_path=path, interval_seconds=60).start()
+            self.registry.counter("amsha_runs", "Runs").inc()
+            exporter.stop()
+
+            with open(path, encoding="utf-8") as handle:
+                self.assertIn("amsha_runs_total 2\n", handle.read())
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["amsha.prom"])
+
+    def test_from_config(self):
+        self.assertIsNone(MetricsExporter.from_config(None))
+        self.assertIsNone(MetricsExporter.from_config({"enabled": False, "http_port": 9464}))
+        exporter = MetricsExporter.from_config({"enabled": True, "file_path": "m.prom", "interval_seconds": 5})
+        self.assertEqual((exporter.port, exporter.file_path, exporter.interval_seconds), (None, "m.prom", 5))
+        with self.assertRaises(ValueError):
+            MetricsExporter.from_config({"enabled": True})
+
+    def test_busy_port_does_not_fail_start_from_config(self):
+        busy = socket.socket()
+        busy.bind(("127.0.0.1", 0))
+        busy.listen(1)
+        self.addCleanup(busy.close)
+        self.addCleanup(metrics_exporter._running.clear)
+        port = busy.getsockname()[1]
+
+        self.assertIsNone(MetricsExporter.start_from_config({"enabled": True, "http_port": port}))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "amsha.prom")
+            exporter = MetricsExporter.start_from_config(
+                {"enabled": True, "http_port": port, "file_path": path, "interval_seconds": 60}
+            )
+            exporter.stop()
+
+            self.assertIsNone(exporter.port)
+            self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
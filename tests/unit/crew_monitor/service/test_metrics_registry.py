@@ -0,0 +1,59 @@
+import unittest
+
+from amsha.crew_monitor.service.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge_exposition(self):
+        counter = self.registry.counter("amsha_runs", "Runs", ("crew", "status"))
+        counter.inc(crew="writer", status="completed")
+        counter.inc(2, crew="writer", status="completed")
+        gauge = self.registry.gauge("amsha_running", "Running", ("crew",))
+        gauge.inc(crew='say "hi"')
+
+        text = self.registry.render()
+
+        self.assertIn("# TYPE amsha_runs counter\n# HELP amsha_runs Runs\n", text)
+        self.assertIn('amsha_runs_total{crew="writer",status="completed"} 3\n', text)
+        self.assertIn('amsha_running{crew="say \\"hi\\""} 1\n', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram("amsha_latency_seconds", "Latency", ("model",), buckets=(1, 5))
+        for value in (0.5, 1.0, 3.0, 10.0):
+            histogram.observe(value, model="m")
+
+        snapshot = histogram.snapshot(model="m")
+        text = self.registry.render()
+
+        self.assertEqual(list(snapshot["buckets"].values()), [2, 3, 4])
+        self.assertEqual(snapshot["sum"], 14.5)
+        self.assertIn('amsha_latency_seconds_bucket{model="m",le="1"} 2\n', text)
+        self.assertIn('amsha_latency_seconds_bucket{model="m",le="+Inf"} 4\n', text)
+        self.assertIn('amsha_latency_seconds_count{model="m"} 4\n', text)
+        self.assertIn('amsha_latency_seconds_sum{model="m"} 14.5\n', text)
+
+    def test_lookup_returns_existing_family(self):
+        first = self.registry.counter("amsha_runs", "Runs", ("crew",))
+
+        self.assertIs(self.registry.counter("amsha_runs", "Runs", ("crew",)), first)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("amsha_runs", "Runs", ("crew",))
+
+    def test_invalid_usage(self):
+        counter = self.registry.counter("amsha_runs", "Runs", ("crew",))
+        with self.assertRaises(ValueError):
+            counter.inc(-1, crew="writer")
+        with self.assertRaises(ValueError):
+            counter.inc(model="m")
+        with self.assertRaises(ValueError):
+            self.registry.counter("invalid-name", "Runs")
+        with self.assertRaises(ValueError):
+            self.registry.histogram("amsha_h", "H", ("le",))
+
+
+if __name__ == "__main__":
+    unittest.main()
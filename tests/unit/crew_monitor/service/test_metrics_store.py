@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from amsha.crew_monitor.service.metrics_store import CrewMetricsStore, welch_t_test
+
+
+def _metrics(total_tokens, peak_rss_mb=100.0):
+    return {
+        "general": {"total_tokens": total_tokens, "prompt_tokens": total_tokens - 10, "completion_tokens": 10},
+        "resources": {"rss_mb": {"peak": peak_rss_mb}},
+    }
+
+
+class TestCrewMetricsStore(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "metrics", "crew_metrics.db")
+        self.store = CrewMetricsStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.test_dir)
+
+    def _record_runs(self, tokens, config_fingerprint="cfg-1", start=0):
+        for index, total in enumerate(tokens):
+            self.store.record("writer", "gpt", "completed", 10.0 + index % 2, _metrics(total),
+                              execution_id=f"exec-{start + index}", crew_fingerprint="crew-1",
+                              config_fingerprint=config_fingerprint, recorded_at=float(start + index))
+
+    def test_history_persists_runs_oldest_first(self):
+        self._record_runs([100, 110])
+        self.store.record("writer", "gpt", "failed", 1.0, recorded_at=5.0)
+        self.store.close()
+
+        self.store = CrewMetricsStore(self.path)
+        records = self.store.history("writer")
+
+        self.assertEqual([record["execution_id"] for record in records], ["exec-0", "exec-1"])
+        self.assertEqual(records[0]["peak_rss_mb"], 100.0)
+        self.assertEqual(records[1]["metrics"]["general"]["total_tokens"], 110)
+        self.assertEqual(len(self.store.history("writer", status=None)), 3)
+        self.assertEqual([r["execution_id"] for r in self.store.history("writer", limit=1)], ["exec-1"])
+
+    def test_flags_doubled_tokens_after_config_change(self):
+        self._record_runs([1000, 1020, 990, 1010, 1005, 995, 1015, 1000])
+        self._record_runs([2000, 2040, 1980, 2010], config_fingerprint="cfg-2", start=8)
+
+        comparisons = {c.metric: c for c in self.store.compare("writer", recent_runs=4, baseline_runs=8)}
+
+        tokens = comparisons["total_tokens"]
+        self.assertTrue(tokens.regressed)
+        self.assertEqual(tokens.baseline_runs, 8)
+        self.assertAlmostEqual(tokens.relative_change, 1.0, places=1)
+        self.assertLess(tokens.p_value, 0.001)
+        self.assertTrue(tokens.config_fingerprint_changed)
+        self.assertFalse(tokens.crew_fingerprint_changed)
+        self.assertFalse(comparisons["duration_seconds"].regressed)
+        self.assertFalse(comparisons["completion_tokens"].regressed)
+
+        with self.assertLogs("Amsha.crew_monitor.metrics_store", level="WARNING"):
+            regressions = self.store.detect_regressions("writer", recent_runs=4, baseline_runs=8)
+        self.assertEqual({c.metric for c in regressions}, {"total_tokens", "prompt_tokens"})
+
+    def test_noise_and_small_windows_are_not_regressions(self):
+        self._record_runs([1000, 1200, 900, 1100, 1000, 1150])
+
+        self.assertEqual(self.store.detect_regressions("writer", recent_runs=2, baseline_runs=4), [])
+        single = {c.metric: c for c in self.store.compare("writer", recent_runs=1, baseline_runs=4)}
+        self.assertIsNone(single["total_tokens"].p_value)
+        self.assertFalse(single["total_tokens"].regressed)
+
+    def test_rejects_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            self.store.compare("writer", metrics=("cost",))
+
+    def test_from_config(self):
+        self.assertIsNone(CrewMetricsStore.from_config({"enabled": False}))
+        store = CrewMetricsStore.from_config({
+            "enabled": True, "path": self.path, "check_regressions": True, "comparison": {"recent_runs": 3}
+        })
+        self.assertTrue(store.check_regressions)
+        self.assertEqual(store.comparison, {"recent_runs": 3})
+        store.close()
+
+    def test_welch_t_test_matches_reference_value(self):
+        self.assertAlmostEqual(welch_t_test([1, 2, 3, 4, 5], [3, 4, 5, 6, 7]), 0.0403, places=4)
+        self.assertIsNone(welch_t_test([1, 2], [3]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import time
+import unittest
+
+from amsha.crew_monitor.service.crew_performance_monitor import CrewPerformanceMonitor
+from amsha.crew_monitor.service.resource_sampler import ResourceRingBuffer, ResourceSampler
+
+
+class TestResourceRingBuffer(unittest.TestCase):
+    def test_empty_buffer_has_no_stats(self):
+        self.assertEqual(ResourceRingBuffer(4).stats("rss_bytes"), {})
+
+    def test_wraparound_keeps_exact_peak_and_mean(self):
+        buffer = ResourceRingBuffer(capacity=3)
+        for value in (100, 10, 20, 30):
+            buffer.add(rss_bytes=value)
+
+        stats = buffer.stats("rss_bytes")
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.count, 4)
+        self.assertEqual(stats["peak"], 100)
+        self.assertEqual(stats["mean"], 40)
+        # Percentiles only cover the samples still held
+        self.assertEqual(stats["p50"], 20)
+        self.assertEqual(stats["p99"], 30)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            ResourceRingBuffer(0)
+
+
+class TestResourceSampler(unittest.TestCase):
+    def test_samples_current_process(self):
+        sampler = ResourceSampler(interval_seconds=0.01, capacity=16)
+        sampler.start()
+        time.sleep(0.05)
+        sampler.stop()
+
+        metrics = sampler.get_metrics()
+
+        self.assertGreaterEqual(metrics["samples"], 2)
+        self.assertGreater(metrics["rss_mb"]["peak"], 0)
+        self.assertGreaterEqual(metrics["threads"]["peak"], 1)
+        self.assertGreaterEqual(metrics["open_fds"]["peak"], 1)
+        self.assertGreaterEqual(metrics["cpu_time_seconds"], 0)
+        self.assertIsNone(sampler._thread)
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            ResourceSampler(interval_seconds=0)
+
+
+class TestMonitorResourceMetrics(unittest.TestCase):
+    def test_monitor_reports_sampled_resources(self):
+        monitor = CrewPerformanceMonitor(model_name="test-model", sample_interval_seconds=0.01)
+        monitor.start_monitoring()
+        time.sleep(0.03)
+        monitor.stop_monitoring()
+
+        resources = monitor.get_metrics()["resources"]
+
+        self.assertGreaterEqual(resources["samples"], 1)
+        self.assertIn("p95", resources["cpu_percent"])
+        self.assertIn("Process Resources", monitor.get_summary())
+
+    def test_sampling_disabled(self):
+        monitor = CrewPerformanceMonitor(sample_interval_seconds=None)
+        monitor.start_monitoring()
+        monitor.stop_monitoring()
+
+        self.assertIsNone(monitor.resource_sampler)
+        self.assertEqual(monitor.get_metrics()["resources"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
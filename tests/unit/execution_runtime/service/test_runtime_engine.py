@@ -3,6 +3,7 @@ import time
 from amsha.execution_runtime.service.runtime_engine import RuntimeEngine
 from amsha.execution_runtime.domain.execution_mode import ExecutionMode
 from amsha.execution_state.domain.enums import ExecutionStatus
+from amsha.execution_runtime.domain.endpoint_unavailable_error import EndpointUnavailableError
 
 def dummy_task(x, y):
     return x + y
@@ -67,6 +68,20 @@ class TestRuntimeEngine(unittest.TestCase):
                 handle.result()
         self.assertIsInstance(cancelled, bool)
 
+    def test_endpoint_health_queries(self):
+        down = {"http://localhost:1234/v1"}
+        engine = RuntimeEngine(max_workers=1, endpoint_available=lambda endpoint: endpoint not in down)
+        self.addCleanup(engine.shutdown)
+
+        self.assertEqual(engine.available_endpoints(["http://localhost:1234/v1", "gemini/gemini-2.5-flash"]),
+                         ["gemini/gemini-2.5-flash"])
+        engine.ensure_available([])
+        engine.ensure_available(["http://localhost:1234/v1", "gemini/gemini-2.5-flash"])
+        with self.assertRaises(EndpointUnavailableError):
+            engine.ensure_available(["http://localhost:1234/v1"])
+        # Without a health query every endpoint is available
+        self.engine.ensure_available(["http://localhost:1234/v1"])
+
     def test_cancel_no_future(self):
         handle = self.engine.submit(dummy_task, 1, 2, mode=ExecutionMode.INTERACTIVE)
         self.assertFalse(handle.cancel())
@@ -0,0 +1,77 @@
+"""
+Unit tests for BatchingLLM and batched builds.
+"""
+import asyncio
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.llm_factory.adapters.batching_llm import BatchingLLM
+from amsha.llm_factory.adapters.caching_llm import CachingLLM
+from amsha.llm_factory.service.llm_builder import LLMBuilder
+from amsha.llm_factory.service.llm_micro_batcher import MicroBatcher, reset_micro_batchers
+from amsha.llm_factory.settings.llm_settings import LLMSettings
+
+
+class TestBatchingLLM(unittest.TestCase):
+    """Test cases for routing calls through the micro-batcher."""
+
+    def setUp(self):
+        self.batcher = MicroBatcher("gemma@default", max_wait_seconds=0.0)
+        self.addCleanup(self.batcher.close)
+
+    def test_call_goes_through_batcher(self):
+        inner = MagicMock()
+        inner.call.return_value = "score: 7"
+        llm = BatchingLLM(inner, self.batcher)
+
+        self.assertEqual(llm.call("rate this", from_task="task"), "score: 7")
+        self.assertEqual(inner.call.call_args.kwargs["from_task"], "task")
+        self.assertEqual(self.batcher.get_metrics()["calls"], 1)
+
+    def test_async_call_awaits_batched_result(self):
+        inner = MagicMock()
+        inner.call.side_effect = ConnectionError("down")
+        llm = BatchingLLM(inner, self.batcher)
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(llm.acall("rate this"))
+
+
+class TestBatchedBuild(unittest.TestCase):
+    """Test cases for wrapping the LLMs of batched use cases."""
+
+    def setUp(self):
+        reset_micro_batchers()
+        self.addCleanup(reset_micro_batchers)
+        self.models = {"gemma": {"model": "lm_studio/gemma-3-12b-it",
+                                 "transport": {"mode": "fake", "response": "Final Answer: 7"}}}
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_only_listed_use_cases_are_batched_inside_the_cache(self, mock_bus):
+        settings = LLMSettings(
+            llm={"creative": {"default": "gemma", "models": self.models},
+                 "evaluation": {"default": "gemma", "models": self.models}},
+            llm_parameters={"evaluation": {"temperature": 0.0}},
+            llm_batching={"enabled": True, "max_wait_ms": 1},
+            llm_cache={"enabled": True, "directory": self._cache_dir()}
+        )
+        builder = LLMBuilder(settings)
+
+        evaluation = builder.build_evaluation().provider.get_raw_llm()
+        creative = builder.build_creative().provider.get_raw_llm()
+
+        self.assertIsInstance(evaluation, CachingLLM)
+        self.assertIsInstance(evaluation.inner, BatchingLLM)
+        self.assertNotIsInstance(creative, BatchingLLM)
+        self.assertEqual(evaluation.inner.call("rate this"), "Final Answer: 7")
+
+    def _cache_dir(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        return directory
+
+
+if __name__ == '__main__':
+    unittest.main()
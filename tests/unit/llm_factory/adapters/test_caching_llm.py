@@ -0,0 +1,76 @@
+"""
+Unit tests for CachingLLM.
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.llm_factory.adapters.caching_llm import CachingLLM
+
+
+class TestCachingLLM(unittest.TestCase):
+    """Test cases for the caching LLM wrapper."""
+
+    def setUp(self):
+        self.inner = MagicMock()
+        self.inner.model = "lm_studio/gpt-oss-20b"
+        self.inner.temperature = 0.0
+        self.inner.stream = False
+        self.inner.call.return_value = "scored"
+        self.cache = MagicMock()
+        self.cache.get.return_value = None
+        self.llm = CachingLLM(self.inner, cache=self.cache)
+
+    def test_miss_calls_inner_and_stores(self):
+        result = self.llm.call("evaluate")
+
+        self.assertEqual(result, "scored")
+        self.inner.call.assert_called_once()
+        self.cache.put.assert_called_once_with(unittest.mock.ANY, "scored")
+
+    @patch("amsha.llm_factory.adapters.caching_llm.crewai_event_bus")
+    def test_hit_skips_inner(self, mock_bus):
+        self.cache.get.return_value = "cached"
+
+        result = self.llm.call("evaluate")
+
+        self.assertEqual(result, "cached")
+        self.inner.call.assert_not_called()
+        self.assertEqual(mock_bus.emit.call_count, 2)
+
+    def test_tools_bypass_cache(self):
+        self.llm.call("evaluate", tools=[{"name": "search"}])
+
+        self.cache.get.assert_not_called()
+        self.cache.put.assert_not_called()
+
+    def test_non_deterministic_calls_bypass_cache(self):
+        self.inner.temperature = 0.8
+
+        self.llm.call("write a poem")
+
+        self.cache.get.assert_not_called()
+
+    def test_endpoint_is_part_of_the_key(self):
+        self.inner.base_url = "http://localhost:1234/v1"
+        self.inner.api_base = None
+        self.inner.api_version = None
+        self.llm.call("evaluate")
+        self.inner.base_url = "http://gpu-box:1234/v1"
+        self.llm.call("evaluate")
+        self.inner.api_version = "2024-06-01"
+        self.llm.call("evaluate")
+
+        keys = [call.args[0] for call in self.cache.get.call_args_list]
+        self.assertEqual(len(set(keys)), 3)
+
+    def test_attributes_forward_to_inner(self):
+        self.llm.stop = ["###"]
+        self.llm.stream = True
+
+        self.assertEqual(self.inner.stop, ["###"])
+        self.assertTrue(self.inner.stream)
+        self.assertEqual(self.llm.model, "lm_studio/gpt-oss-20b")
+
+
+if __name__ == '__main__':
+    unittest.main()
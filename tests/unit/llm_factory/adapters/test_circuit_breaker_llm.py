@@ -0,0 +1,125 @@
+"""
+Unit tests for CircuitBreakerLLM and circuit-breaking builds.
+"""
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.llm_factory.adapters.circuit_breaker_llm import CircuitBreakerLLM
+from amsha.llm_factory.adapters.routing_llm import RoutingLLM
+from amsha.llm_factory.service.llm_builder import LLMBuilder
+from amsha.llm_factory.service.llm_circuit_breaker import (
+    OPEN, CircuitBreaker, CircuitOpenError, circuit_endpoints, reset_circuit_breakers
+)
+from amsha.llm_factory.service.llm_router import LLMRouter
+from amsha.llm_factory.settings.llm_settings import LLMSettings
+
+
+class TestCircuitBreakerLLM(unittest.TestCase):
+    """Test cases for call admission and outcome recording."""
+
+    def test_open_circuit_fails_fast(self):
+        inner = MagicMock()
+        inner.call.side_effect = ConnectionError("refused")
+        llm = CircuitBreakerLLM(inner, CircuitBreaker("http://localhost:1234/v1", failure_threshold=2))
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                llm.call("hi")
+        with self.assertRaises(CircuitOpenError):
+            llm.call("hi")
+
+        self.assertEqual(inner.call.call_count, 2)
+        self.assertEqual(llm.breaker.get_metrics()["rejected"], 1)
+
+    def test_request_errors_do_not_open_the_circuit(self):
+        class BadRequestError(Exception):
+            status_code = 400
+
+        inner = MagicMock()
+        inner.call.side_effect = BadRequestError("invalid prompt")
+        breaker = CircuitBreaker("http://localhost:1234/v1", failure_threshold=2, open_seconds=0.0)
+        llm = CircuitBreakerLLM(inner, breaker)
+
+        for _ in range(3):
+            with self.assertRaises(BadRequestError):
+                llm.call("hi")
+
+        self.assertEqual(breaker.get_metrics()["failures"], 0)
+        self.assertNotEqual(breaker.state, OPEN)
+
+        # A half-open trial that fails on the request gives its slot back
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "half_open")
+        with self.assertRaises(BadRequestError):
+            llm.call("hi")
+        self.assertTrue(breaker.allow())
+
+    def test_async_success_is_recorded(self):
+        inner = MagicMock()
+
+        async def answer(*args, **kwargs):
+            return "answer"
+        inner.acall.side_effect = answer
+        breaker = CircuitBreaker("http://localhost:1234/v1")
+        llm = CircuitBreakerLLM(inner, breaker)
+
+        self.assertEqual(asyncio.run(llm.acall("hi")), "answer")
+        self.assertEqual(breaker.get_metrics()["successes"], 1)
+
+    def test_routing_fails_over_past_open_circuit(self):
+        breaker = CircuitBreaker("http://localhost:1234/v1", failure_threshold=1)
+        breaker.record_failure()
+        local = MagicMock()
+        hosted = MagicMock()
+        hosted.call.return_value = "hosted answer"
+        llm = RoutingLLM({"gemma": CircuitBreakerLLM(local, breaker), "gemini": hosted},
+                         LLMRouter(["gemma", "gemini"]))
+
+        self.assertEqual(llm.call("hi"), "hosted answer")
+        local.call.assert_not_called()
+
+
+class TestCircuitBreakerBuild(unittest.TestCase):
+    """Test cases for wrapping built LLMs with their endpoint's breaker."""
+
+    def setUp(self):
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+
+    @patch("amsha.llm_factory.service.llm_builder.LLM")
+    def test_builder_wraps_llm_with_shared_endpoint_breaker(self, mock_llm_class):
+        mock_llm_class.return_value.call.return_value = "answer"
+        settings = LLMSettings(
+            llm={"creative": {"default": "gemma", "models": {
+                "gemma": {"model": "lm_studio/gemma-3-12b-it", "base_url": "http://localhost:1234/v1"},
+                "qwen": {"model": "lm_studio/qwen3-14b", "base_url": "http://localhost:1234/v1"},
+            }}},
+            llm_parameters={},
+            llm_circuit_breaker={"enabled": True, "failure_threshold": 1, "probe_interval_seconds": None}
+        )
+        builder = LLMBuilder(settings)
+
+        gemma = builder.build_creative().provider.get_raw_llm()
+        qwen = builder.build_creative(model_key="qwen").provider.get_raw_llm()
+
+        self.assertIsInstance(gemma, CircuitBreakerLLM)
+        self.assertIs(gemma.breaker, qwen.breaker)
+        self.assertEqual(circuit_endpoints(gemma), ["http://localhost:1234/v1"])
+        self.assertEqual(gemma.call("hi"), "answer")
+
+        gemma.breaker.record_failure()
+        self.assertEqual(qwen.breaker.state, OPEN)
+
+    def test_scripted_transports_are_not_wrapped(self):
+        settings = LLMSettings(llm={"creative": {"default": "gemma", "models": {
+            "gemma": {"model": "lm_studio/gemma-3-12b-it", "transport": {"mode": "fake"}}
+        }}}, llm_parameters={}, llm_circuit_breaker={"enabled": True})
+
+        self.assertNotIsInstance(LLMBuilder(settings).build_creative().provider.get_raw_llm(), CircuitBreakerLLM)
+        self.assertIsNone(LLMSettings(llm={}, llm_parameters={}).get_circuit_breaker_config())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Unit tests for FakeLLM.
+"""
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.llm_factory.adapters.fake_llm import FakeLLM
+from amsha.llm_factory.adapters.scripted_llm import ScriptedLLM
+
+
+class TestFakeLLM(unittest.TestCase):
+    """Test cases for the fake benchmark LLM."""
+
+    def test_scripted_base_is_abstract(self):
+        with self.assertRaises(TypeError):
+            ScriptedLLM(model="scripted")
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_synthetic_answer_is_final_answer_with_json(self, mock_bus):
+        sleep = MagicMock()
+        llm = FakeLLM(model="benchmark-fake", latency_seconds=0.2, completion_tokens=32, sleep=sleep)
+
+        result = llm.call([{"role": "user", "content": "x" * 40}])
+
+        self.assertTrue(result.startswith("Thought:"))
+        document = result.split("```json\n")[1].split("\n```")[0]
+        self.assertEqual(json.loads(document)["status"], "ok")
+        sleep.assert_called_once_with(0.2)
+        usage = llm.get_token_usage_summary()
+        self.assertEqual(usage.completion_tokens, 32)
+        self.assertEqual(usage.prompt_tokens, 11)
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_fixed_response_streams_in_chunks(self, mock_bus):
+        llm = FakeLLM(model="benchmark-fake", response="Final Answer: done", stream=True, chunk_size=4)
+
+        result = llm.call("question")
+
+        self.assertEqual(result, "Final Answer: done")
+        chunks = [call.kwargs["event"].chunk for call in mock_bus.emit.call_args_list
+                  if hasattr(call.kwargs["event"], "chunk")]
+        self.assertEqual("".join(chunks), "Final Answer: done")
+
+
+if __name__ == '__main__':
+    unittest.main()
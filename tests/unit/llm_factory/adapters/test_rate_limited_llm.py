@@ -0,0 +1,43 @@
+"""
+Unit tests for RateLimitedLLM.
+"""
+import unittest
+from unittest.mock import MagicMock
+
+from amsha.llm_factory.adapters.rate_limited_llm import RateLimitedLLM
+
+
+class TestRateLimitedLLM(unittest.TestCase):
+    """Test cases for the rate limited LLM wrapper."""
+
+    def setUp(self):
+        self.inner = MagicMock()
+        self.inner.model = "gemini/gemini-2.5-flash"
+        self.limiter = MagicMock()
+        self.llm = RateLimitedLLM(self.inner, limiter=self.limiter, completion_token_reserve=100, max_wait_seconds=5)
+
+    def test_call_acquires_then_settles(self):
+        self.inner.call.return_value = "x" * 40  # ~11 tokens
+
+        result = self.llm.call([{"role": "user", "content": "y" * 400}])  # ~101 tokens
+
+        self.assertEqual(result, "x" * 40)
+        self.limiter.acquire.assert_called_once_with(201, timeout=5)
+        self.limiter.settle.assert_called_once_with(11 - 100)
+
+    def test_failed_call_refunds_completion_reserve(self):
+        self.inner.call.side_effect = RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.llm.call("prompt")
+
+        self.limiter.settle.assert_called_once_with(-100)
+
+    def test_attributes_forwarded(self):
+        self.llm.stop = ["###"]
+        self.assertEqual(self.inner.stop, ["###"])
+        self.assertEqual(self.llm.model, "gemini/gemini-2.5-flash")
+
+
+if __name__ == '__main__':
+    unittest.main()
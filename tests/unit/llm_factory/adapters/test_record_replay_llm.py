@@ -0,0 +1,90 @@
+"""
+Unit tests for the record-and-replay LLM transport.
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.llm_factory.adapters.recording_llm import RecordingLLM
+from amsha.llm_factory.adapters.replay_llm import ReplayLLM
+from amsha.llm_factory.service.llm_cassette import LLMCassette
+
+
+class TestRecordingLLM(unittest.TestCase):
+    """Test cases for the recording LLM wrapper."""
+
+    def setUp(self):
+        self.inner = MagicMock()
+        self.inner.model = "gemini/gemini-2.5-flash"
+        self.inner.call.return_value = "answer"
+        self.inner.get_token_usage_summary.side_effect = [
+            MagicMock(prompt_tokens=0, completion_tokens=0, total_tokens=0, cached_prompt_tokens=0),
+            MagicMock(prompt_tokens=10, completion_tokens=4, total_tokens=14, cached_prompt_tokens=0),
+        ]
+        self.cassette = MagicMock()
+        self.llm = RecordingLLM(self.inner, cassette=self.cassette)
+
+    def test_call_records_exchange_with_usage(self):
+        result = self.llm.call("question")
+
+        self.assertEqual(result, "answer")
+        args, kwargs = self.cassette.record.call_args
+        self.assertEqual(args, ("gemini/gemini-2.5-flash", "question", "answer"))
+        self.assertEqual(kwargs["usage"]["total_tokens"], 14)
+        self.assertGreaterEqual(kwargs["latency_seconds"], 0)
+
+    def test_tool_calls_are_not_recorded(self):
+        self.llm.call("question", tools=[{"name": "search"}])
+
+        self.cassette.record.assert_not_called()
+
+
+class TestReplayLLM(unittest.TestCase):
+    """Test cases for the replay LLM."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cassette = LLMCassette(os.path.join(self.temp_dir.name, "calls.jsonl"))
+        self.cassette.record("gemini/gemini-2.5-flash", "question", "recorded answer", latency_seconds=0.5,
+                             usage={"prompt_tokens": 10, "completion_tokens": 4})
+        self.sleep = MagicMock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _llm(self, **kwargs):
+        return ReplayLLM(model="gemini/gemini-2.5-flash", cassette=self.cassette, sleep=self.sleep, **kwargs)
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_replays_response_and_usage(self, mock_bus):
+        llm = self._llm()
+
+        result = llm.call("question")
+
+        self.assertEqual(result, "recorded answer")
+        self.assertEqual(llm.get_token_usage_summary().total_tokens, 14)
+        self.sleep.assert_not_called()
+        # started and completed events
+        self.assertEqual(mock_bus.emit.call_count, 2)
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_streaming_replay_emits_chunks_with_recorded_latency(self, mock_bus):
+        llm = self._llm(stream=True, replay_latency=True, chunk_size=5)
+
+        llm.call("question")
+
+        chunks = [call.kwargs["event"].chunk for call in mock_bus.emit.call_args_list
+                  if hasattr(call.kwargs["event"], "chunk")]
+        self.assertEqual("".join(chunks), "recorded answer")
+        self.assertEqual(len(chunks), 3)
+        self.assertAlmostEqual(sum(call.args[0] for call in self.sleep.call_args_list), 0.5)
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_miss_raises(self, mock_bus):
+        with self.assertRaises(ValueError):
+            self._llm().call("unrecorded question")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for RoutingLLM and routed builds.
+"""
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from crewai.types.usage_metrics import UsageMetrics
+
+from amsha.llm_factory.adapters.routing_llm import RoutingLLM
+from amsha.llm_factory.adapters.routing_provider import RoutingProviderAdapter
+from amsha.llm_factory.domain.model.llm_type import LLMType
+from amsha.llm_factory.service.llm_builder import LLMBuilder
+from amsha.llm_factory.service.llm_router import LLMRouter
+from amsha.llm_factory.settings.llm_settings import LLMSettings
+
+
+def _model(response=None, error=None):
+    model = MagicMock()
+    model.call.side_effect = error
+    model.call.return_value = response
+    return model
+
+
+class TestRoutingLLM(unittest.TestCase):
+    """Test cases for call routing and failover."""
+
+    def test_fails_over_to_next_model(self):
+        models = {"gemma": _model(error=ConnectionError("down")), "qwen": _model("answer")}
+        llm = RoutingLLM(models, LLMRouter(list(models)))
+
+        self.assertEqual(llm.call([{"role": "user", "content": "hi"}]), "answer")
+
+        metrics = llm.router.get_metrics()
+        self.assertEqual(metrics["gemma"]["failures"], 1)
+        self.assertEqual(metrics["qwen"]["calls"], 1)
+        # The failed model cools down, so the next call goes straight to the healthy one
+        llm.call("again")
+        self.assertEqual(models["gemma"].call.call_count, 1)
+
+    def test_raises_last_error_without_failover_or_when_all_fail(self):
+        models = {"gemma": _model(error=ConnectionError("gemma down")), "qwen": _model("answer")}
+        with self.assertRaises(ConnectionError):
+            RoutingLLM(models, LLMRouter(list(models)), failover=False).call("hi")
+
+        failing = {"gemma": _model(error=ConnectionError("gemma")), "qwen": _model(error=TimeoutError("qwen"))}
+        with self.assertRaises(TimeoutError):
+            RoutingLLM(failing, LLMRouter(list(failing))).call("hi")
+
+        limited = RoutingLLM(failing, LLMRouter(list(failing)), max_attempts=1)
+        with self.assertRaises(Exception):
+            limited.call("hi")
+        self.assertEqual(failing["gemma"].call.call_count + failing["qwen"].call.call_count, 3)
+
+    def test_async_calls_fail_over(self):
+        gemma = MagicMock()
+        gemma.acall.side_effect = ConnectionError("down")
+        qwen = MagicMock()
+
+        async def answer(*args, **kwargs):
+            return "async answer"
+        qwen.acall.side_effect = answer
+
+        llm = RoutingLLM({"gemma": gemma, "qwen": qwen}, LLMRouter(["gemma", "qwen"]))
+
+        self.assertEqual(asyncio.run(llm.acall("hi")), "async answer")
+
+    def test_attributes_written_to_every_model_and_usage_summed(self):
+        models = {"gemma": MagicMock(), "qwen": MagicMock()}
+        models["gemma"].get_token_usage_summary.return_value = UsageMetrics(total_tokens=10, successful_requests=1)
+        models["qwen"].get_token_usage_summary.return_value = UsageMetrics(total_tokens=5, successful_requests=1)
+        models["gemma"].get_context_window_size.return_value = 32000
+        models["qwen"].get_context_window_size.return_value = 8000
+        llm = RoutingLLM(models, LLMRouter(list(models)))
+
+        llm.stop = ["###"]
+
+        self.assertEqual(models["gemma"].stop, ["###"])
+        self.assertEqual(models["qwen"].stop, ["###"])
+        self.assertEqual(llm.get_token_usage_summary().total_tokens, 15)
+        self.assertEqual(llm.get_context_window_size(), 8000)
+
+
+class TestRoutedBuild(unittest.TestCase):
+    """Test cases for building a routed use case through LLMBuilder."""
+
+    def setUp(self):
+        fake = {"transport": {"mode": "fake", "response": "Final Answer: done"}}
+        self.settings = LLMSettings(
+            llm={"creative": {
+                "default": "gemma",
+                "models": {
+                    "gemma": {"model": "lm_studio/gemma-3-12b-it", **fake},
+                    "qwen": {"model": "lm_studio/qwen3-14b", **fake},
+                    "gemini": {"model": "gemini/gemini-2.5-flash", **fake},
+                },
+                "routing": {"enabled": True, "policy": "least_outstanding", "models": ["gemma", "qwen"]},
+            }},
+            llm_parameters={"creative": {"temperature": 0.7}}
+        )
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_routing_builds_every_routed_model(self, mock_bus):
+        result = LLMBuilder(self.settings).build_creative()
+
+        self.assertIsInstance(result.provider, RoutingProviderAdapter)
+        self.assertEqual(result.provider.model_name, "gemma-3-12b-it+qwen3-14b")
+        routing_llm = result.provider.get_raw_llm()
+        self.assertEqual(list(routing_llm.models), ["gemma", "qwen"])
+
+        for _ in range(4):
+            self.assertEqual(routing_llm.call("hi"), "Final Answer: done")
+        self.assertEqual({key: m["calls"] for key, m in result.provider.get_routing_metrics().items()},
+                         {"gemma": 2, "qwen": 2})
+
+    def test_model_key_bypasses_routing(self):
+        result = LLMBuilder(self.settings).build(LLMType.CREATIVE, model_key="gemini")
+
+        self.assertNotIsInstance(result.provider, RoutingProviderAdapter)
+        self.assertEqual(result.provider.model_name, "gemini-2.5-flash")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -193,6 +193,62 @@ class TestLLMBuilderEnhanced(unittest.TestCase):
         
         self.assertIsNotNone(result.provider)
 
+    @patch('amsha.llm_factory.service.llm_builder.LLMCassette')
+    @patch('amsha.llm_factory.service.llm_builder.LLM')
+    def test_build_with_replay_transport_skips_network_llm(self, mock_llm_class, mock_cassette_class):
+        """Test that a replay transport builds a ReplayLLM instead of a CrewAI LLM."""
+        from amsha.llm_factory.adapters.replay_llm import ReplayLLM
+        from amsha.llm_factory.domain.model.llm_transport_config import LLMTransportConfig
+
+        config = LLMModelConfig(
+            model="gemini/gemini-2.5-flash",
+            transport=LLMTransportConfig(mode="replay", cassette="cassette.jsonl")
+        )
+        self.mock_settings.get_model_config.return_value = config
+
+        result = self.builder.build(LLMType.CREATIVE)
+
+        mock_llm_class.assert_not_called()
+        mock_cassette_class.shared.assert_called_once_with("cassette.jsonl")
+        self.assertIsInstance(result.provider.get_raw_llm(), ReplayLLM)
+
+
+    @patch('amsha.llm_factory.service.llm_builder.LLM')
+    def test_streaming_follows_capabilities_and_interactive_use(self, mock_llm_class):
+        """Test that batch builds do not stream unless the model prefers streaming."""
+        from amsha.llm_factory.domain.model.llm_capabilities import LLMCapabilities
+
+        def stream_of(llm_type, capabilities=None, interactive=None):
+            config = LLMModelConfig(model="gpt-4", api_key="test-key",
+                                    capabilities=capabilities or LLMCapabilities())
+            self.mock_settings.get_model_config.return_value = config
+            self.builder.build(llm_type, interactive=interactive)
+            return mock_llm_class.call_args[1].get('stream', False)
+
+        self.assertTrue(stream_of(LLMType.CREATIVE))
+        self.assertFalse(stream_of(LLMType.EVALUATION))
+        self.assertTrue(stream_of(LLMType.EVALUATION, interactive=True))
+        self.assertFalse(stream_of(LLMType.CREATIVE, interactive=False))
+        self.assertTrue(stream_of(LLMType.EVALUATION, LLMCapabilities(streaming="preferred")))
+        self.assertFalse(stream_of(LLMType.CREATIVE, LLMCapabilities(streaming="unsupported")))
+
+    @patch('amsha.llm_factory.service.llm_builder.LLM')
+    def test_declared_parameters_replace_drop_params(self, mock_llm_class):
+        """Test that only declared parameters are sent when the model lists them."""
+        config = LLMModelConfig(
+            model="lm_studio/gemma", base_url="http://localhost:1234/v1", api_key="lm_studio",
+            capabilities={"supported_params": ["temperature", "max_completion_tokens"]}
+        )
+        self.mock_settings.get_model_config.return_value = config
+
+        self.builder.build(LLMType.CREATIVE)
+
+        call_kwargs = mock_llm_class.call_args[1]
+        self.assertEqual(
+            set(call_kwargs),
+            {"model", "api_key", "api_version", "base_url", "temperature", "max_completion_tokens", "stream"}
+        )
+        self.assertNotIn('drop_params', call_kwargs)
 
 if __name__ == '__main__':
     unittest.main()
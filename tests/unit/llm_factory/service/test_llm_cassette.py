@@ -0,0 +1,67 @@
+"""
+Unit tests for LLMCassette.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from amsha.llm_factory.service.llm_cassette import LLMCassette
+
+
+class TestLLMCassette(unittest.TestCase):
+    """Test cases for the record-and-replay cassette."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cassettes", "calls.jsonl")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_record_appends_and_reloads(self):
+        cassette = LLMCassette(self.path)
+        cassette.record("gemini/gemini-2.5-flash", "hello", "hi", latency_seconds=0.25,
+                        usage={"prompt_tokens": 3, "completion_tokens": 1})
+
+        reloaded = LLMCassette(self.path)
+        entry = reloaded.next_response("gemini/gemini-2.5-flash", [{"role": "user", "content": "hello "}])
+
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(entry["response"], "hi")
+        self.assertEqual(entry["latency_seconds"], 0.25)
+        self.assertEqual(entry["usage"]["prompt_tokens"], 3)
+
+    def test_repeated_calls_replay_in_order_then_repeat_last(self):
+        cassette = LLMCassette(self.path)
+        cassette.record("model", "again", "first")
+        cassette.record("model", "again", "second")
+
+        responses = [cassette.next_response("model", "again")["response"] for _ in range(3)]
+
+        self.assertEqual(responses, ["first", "second", "second"])
+
+    def test_miss_returns_none(self):
+        cassette = LLMCassette(self.path)
+        cassette.record("model", "hello", "hi")
+
+        self.assertIsNone(cassette.next_response("other-model", "hello"))
+        self.assertIsNone(cassette.next_response("model", "goodbye"))
+
+    def test_malformed_lines_are_skipped(self):
+        os.makedirs(os.path.dirname(self.path))
+        entry = {"key": LLMCassette.build_key("model", "hello"), "response": "hi"}
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("not json\n[1, 2]\n{\"response\": \"no key\"}\n" + json.dumps(entry) + "\n")
+
+        cassette = LLMCassette(self.path)
+
+        self.assertEqual(cassette.next_response("model", "hello")["response"], "hi")
+        self.assertEqual(len(cassette), 1)
+
+    def test_shared_returns_same_instance(self):
+        self.assertIs(LLMCassette.shared(self.path), LLMCassette.shared(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
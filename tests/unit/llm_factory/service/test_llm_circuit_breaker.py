@@ -0,0 +1,140 @@
+"""
+Unit tests for the LLM endpoint circuit breakers and health prober.
+"""
+import unittest
+from unittest.mock import MagicMock
+
+from amsha.llm_factory.domain.model.llm_circuit_breaker_config import LLMCircuitBreakerConfig
+from amsha.llm_factory.service.llm_circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, EndpointHealthProber, circuit_endpoints, endpoint_key,
+    get_circuit_breaker, get_circuit_breaker_metrics, is_endpoint_available, reset_circuit_breakers
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the closed / open / half-open state machine."""
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.breaker = CircuitBreaker("http://localhost:1234/v1", failure_threshold=3, open_seconds=10.0,
+                                      clock=self.clock)
+
+    def _open(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+
+    def test_consecutive_failures_open_the_circuit(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertFalse(self.breaker.is_available())
+        metrics = self.breaker.get_metrics()
+        self.assertEqual((metrics["opened"], metrics["rejected"], metrics["failures"]), (1, 1, 5))
+
+    def test_half_open_admits_limited_trials(self):
+        self._open()
+        self.clock.now += 10.0
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_trial_reopens_the_circuit(self):
+        self._open()
+        self.clock.now += 10.0
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.clock.now += 9.0
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_probes_open_and_recover_the_circuit(self):
+        self.breaker.record_probe(False)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.record_probe(False)
+        self.assertEqual(self.breaker.state, OPEN)
+
+        # A healthy probe ends the open period early
+        self.breaker.record_probe(True)
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertEqual(self.breaker.get_metrics()["failed_probes"], 2)
+
+
+class TestSharedBreakers(unittest.TestCase):
+    """Test cases for the process-wide registry and the health prober."""
+
+    def setUp(self):
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+        self.config = LLMCircuitBreakerConfig(enabled=True, failure_threshold=1, probe_interval_seconds=None)
+
+    def test_breakers_are_shared_per_endpoint(self):
+        breaker = CircuitBreaker.shared(self.config, endpoint_key("lm_studio/gemma", "http://localhost:1234/v1/"))
+
+        self.assertIs(breaker, CircuitBreaker.shared(self.config, "http://localhost:1234/v1"))
+        self.assertIs(get_circuit_breaker("http://localhost:1234/v1"), breaker)
+        self.assertEqual(endpoint_key("gemini/gemini-2.5-flash"), "gemini/gemini-2.5-flash")
+
+        breaker.record_failure()
+        self.assertFalse(is_endpoint_available("http://localhost:1234/v1"))
+        self.assertTrue(is_endpoint_available("http://unknown:8000/v1"))
+        self.assertEqual(get_circuit_breaker_metrics()["http://localhost:1234/v1"]["state"], OPEN)
+
+    def test_prober_feeds_probe_results_to_breakers(self):
+        probe = MagicMock(side_effect=[False, False, True])
+        prober = EndpointHealthProber(interval_seconds=60.0, timeout_seconds=0.5, probe=probe)
+        self.addCleanup(prober.stop)
+        breaker = CircuitBreaker("http://localhost:1234/v1", probe_failure_threshold=2)
+        prober.register(breaker, "http://localhost:1234/v1/models")
+
+        prober.probe_once()
+        prober.probe_once()
+        self.assertEqual(breaker.state, OPEN)
+        prober.probe_once()
+
+        self.assertEqual(breaker.state, HALF_OPEN)
+        probe.assert_called_with("http://localhost:1234/v1/models", 0.5)
+
+    def test_circuit_endpoints_walks_wrappers_and_routed_models(self):
+        gemma = CircuitBreaker("http://localhost:1234/v1")
+        gemini = CircuitBreaker("gemini/gemini-2.5-flash")
+
+        class _Wrapper:
+            def __init__(self, **state):
+                self.__dict__.update(state)
+
+        routed = _Wrapper(_inner=None, _models={
+            "gemma": _Wrapper(_inner=_Wrapper(_breaker=gemma, _inner=object())),
+            "gemini": _Wrapper(_breaker=gemini, _inner=object()),
+        })
+
+        self.assertEqual(sorted(circuit_endpoints(_Wrapper(_inner=routed))),
+                         ["gemini/gemini-2.5-flash", "http://localhost:1234/v1"])
+        self.assertEqual(circuit_endpoints(MagicMock()), [])
+        self.assertEqual(circuit_endpoints(None), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
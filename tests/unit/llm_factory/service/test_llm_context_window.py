@@ -0,0 +1,85 @@
+"""
+Unit tests for TokenEstimator and context_window_of.
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from amsha.llm_factory.adapters.caching_llm import CachingLLM
+from amsha.llm_factory.adapters.fake_llm import FakeLLM
+from amsha.llm_factory.adapters.routing_llm import RoutingLLM
+from amsha.llm_factory.service.llm_builder import LLMBuilder
+from amsha.llm_factory.service.llm_context_window import TokenEstimator, context_window_of
+from amsha.llm_factory.service.llm_router import LLMRouter
+from amsha.llm_factory.settings.llm_settings import LLMSettings
+
+
+class TestTokenEstimator(unittest.TestCase):
+    """Test cases for the local prompt size estimate."""
+
+    def setUp(self):
+        self.estimator = TokenEstimator(chars_per_token=4.0)
+
+    def test_count_takes_the_larger_of_characters_and_pieces(self):
+        self.assertEqual(self.estimator.count(""), 0)
+        self.assertEqual(self.estimator.count(None), 0)
+        # 15 characters, but 10 words and punctuation marks
+        self.assertEqual(self.estimator.count("a, b, c, d; e f"), 10)
+        self.assertEqual(self.estimator.count("x" * 400), 100)
+        self.assertEqual(self.estimator.count({"k": 1}), self.estimator.count("{'k': 1}"))
+
+    def test_templates_are_analysed_once_and_inputs_interpolated(self):
+        template = "Write about {topic} for {audience}. Keep {topic} in focus."
+        static_tokens, placeholders = self.estimator.analyse(template)
+
+        self.assertEqual(placeholders, ("topic", "audience", "topic"))
+        topic = "y" * 80
+        tokens = self.estimator.estimate(template, {"topic": topic, "audience": "devs"})
+
+        self.assertEqual(tokens, static_tokens + 2 * 20 + 1)
+        self.assertEqual(self.estimator.get_metrics()["template_misses"], 1)
+        self.assertEqual(self.estimator.get_metrics()["template_hits"], 1)
+
+    def test_missing_inputs_keep_the_placeholder(self):
+        static_tokens, _ = self.estimator.analyse("Summarise {document}")
+
+        self.assertEqual(self.estimator.estimate("Summarise {document}", {}),
+                         static_tokens + self.estimator.count("{document}"))
+
+    def test_template_cache_is_bounded(self):
+        estimator = TokenEstimator(max_templates=2)
+        for template in ("a {x}", "b {x}", "c {x}"):
+            estimator.analyse(template)
+
+        self.assertEqual(estimator.get_metrics()["cached_templates"], 2)
+
+
+class TestContextWindowOf(unittest.TestCase):
+    """Test cases for reading the configured context window of built LLMs."""
+
+    def test_window_is_found_through_wrappers_and_routing(self):
+        small, large, unknown = FakeLLM(model="small"), FakeLLM(model="large"), FakeLLM(model="unknown")
+        small._context_window = 8192
+        large._context_window = 131072
+
+        self.assertIsNone(context_window_of(unknown))
+        self.assertEqual(context_window_of(CachingLLM(large, cache=MagicMock())), 131072)
+        routed = RoutingLLM({"small": small, "large": large, "unknown": unknown},
+                            router=LLMRouter(["small", "large", "unknown"]))
+        self.assertEqual(context_window_of(routed), 8192)
+
+    @patch("crewai.llms.base_llm.crewai_event_bus")
+    def test_builder_records_the_configured_window(self, mock_bus):
+        settings = LLMSettings(
+            llm={"creative": {"default": "gemma", "models": {"gemma": {
+                "model": "lm_studio/gemma-3-12b-it", "context_window": 32768,
+                "transport": {"mode": "fake"}}}}},
+            llm_parameters={"creative": {"temperature": 0.7}}
+        )
+
+        llm = LLMBuilder(settings).build_creative().provider.get_raw_llm()
+
+        self.assertEqual(context_window_of(llm), 32768)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Unit tests for the LLM transport error classifier.
+"""
+import unittest
+
+from amsha.llm_factory.service.llm_error_classifier import exception_chain, is_transient_error
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class AuthenticationError(Exception):
+    pass
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestLLMErrorClassifier(unittest.TestCase):
+    """Test cases for is_transient_error."""
+
+    def test_transport_failures_are_transient(self):
+        self.assertTrue(is_transient_error(TimeoutError("slow")))
+        self.assertTrue(is_transient_error(ConnectionError("refused")))
+        self.assertTrue(is_transient_error(RateLimitError("429")))
+        self.assertTrue(is_transient_error(StatusError(503)))
+
+    def test_request_failures_are_permanent(self):
+        self.assertFalse(is_transient_error(StatusError(400)))
+        self.assertFalse(is_transient_error(AuthenticationError("bad key")))
+        self.assertFalse(is_transient_error(ValueError("bad output")))
+
+    def test_wrapped_errors_are_unwrapped(self):
+        try:
+            try:
+                raise RateLimitError("429")
+            except RateLimitError as e:
+                raise RuntimeError("crew failed") from e
+        except RuntimeError as wrapped:
+            self.assertTrue(is_transient_error(wrapped))
+            self.assertEqual(len(list(exception_chain(wrapped))), 2)
+
+    def test_extra_names_override_the_defaults(self):
+        self.assertTrue(is_transient_error(ValueError("flaky"), transient_names=("ValueError",)))
+        self.assertFalse(is_transient_error(TimeoutError("slow"), permanent_names=("TimeoutError",)))
+
+
+if __name__ == '__main__':
+    unittest.main()
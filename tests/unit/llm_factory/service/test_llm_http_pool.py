@@ -0,0 +1,120 @@
+"""
+Unit tests for the shared LLM HTTP connection pools.
+"""
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+from amsha.llm_factory.domain.model.llm_http_pool_config import LLMHTTPPoolConfig
+from amsha.llm_factory.service.llm_builder import LLMBuilder
+from amsha.llm_factory.service.llm_http_pool import LLMHTTPPool, get_http_pool_metrics, reset_http_pools
+from amsha.llm_factory.settings.llm_settings import LLMSettings
+
+_COMPLETION = {
+    "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "pong"}}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        body = json.dumps(_COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLLMHTTPPool(unittest.TestCase):
+    """Test cases for per-endpoint pooling, limits and reuse metrics."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.origin = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        reset_http_pools()
+        self.addCleanup(reset_http_pools)
+
+    def test_requests_reuse_keep_alive_connections(self):
+        pool = LLMHTTPPool(LLMHTTPPoolConfig(enabled=True))
+        self.addCleanup(pool.close)
+
+        for _ in range(3):
+            self.assertEqual(pool.client.get(f"{self.origin}/v1/models").status_code, 200)
+
+        metrics = pool.get_metrics()[self.origin]
+        self.assertEqual((metrics["requests"], metrics["new_connections"], metrics["reused_connections"]), (3, 1, 2))
+        self.assertEqual(metrics["tls_handshakes"], 0)
+        self.assertEqual(metrics["reuse_ratio"], 0.6667)
+
+    def test_endpoint_overrides_limits(self):
+        config = LLMHTTPPoolConfig(enabled=True, max_connections=50,
+                                   endpoints={self.origin: {"max_connections": 2, "max_keepalive_connections": 1}})
+        pool = LLMHTTPPool(config)
+        self.addCleanup(pool.close)
+        pool.client.get(f"{self.origin}/v1/models")
+
+        metrics = pool.get_metrics()[self.origin]
+        self.assertEqual((metrics["max_connections"], metrics["max_keepalive_connections"]), (2, 1))
+        self.assertEqual(config.limits_for("https://api.openai.com").max_connections, 50)
+
+    def test_llms_on_the_same_endpoint_share_connections(self):
+        settings = LLMSettings(
+            llm={"evaluation": {"default": "gpt", "models": {
+                "gpt": {"model": "openai/gpt-4o-mini", "api_key": "test", "base_url": f"{self.origin}/v1"},
+            }}},
+            llm_parameters={},
+            llm_http_pool={"enabled": True}
+        )
+        builder = LLMBuilder(settings)
+        first = builder.build_evaluation().provider.get_raw_llm()
+        second = builder.build_evaluation().provider.get_raw_llm()
+
+        for llm in (first, second):
+            llm.client.chat.completions.create(model="gpt-4o-mini", messages=[{"role": "user", "content": "ping"}])
+
+        metrics = get_http_pool_metrics()[self.origin]
+        self.assertEqual((metrics["requests"], metrics["new_connections"]), (2, 1))
+        self.assertIs(LLMHTTPPool.shared(settings.llm_http_pool).client, first.client._client)
+
+    def test_unpoolable_llms_are_left_alone(self):
+        pool = LLMHTTPPool(LLMHTTPPoolConfig(enabled=True))
+        self.addCleanup(pool.close)
+        scripted = MagicMock(spec=["model"])
+
+        self.assertFalse(pool.attach(scripted))
+        self.assertIsNone(LLMSettings(llm={}, llm_parameters={}).get_http_pool_config())
+
+    def test_pools_are_shared_per_configuration(self):
+        config = LLMHTTPPoolConfig(enabled=True)
+
+        self.assertIs(LLMHTTPPool.shared(config), LLMHTTPPool.shared(LLMHTTPPoolConfig(enabled=True)))
+        self.assertIsNot(LLMHTTPPool.shared(config), LLMHTTPPool.shared(LLMHTTPPoolConfig(max_connections=5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
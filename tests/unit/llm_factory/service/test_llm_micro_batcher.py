@@ -0,0 +1,88 @@
+"""
+Unit tests for MicroBatcher.
+"""
+import contextvars
+import threading
+import unittest
+
+from amsha.llm_factory.domain.model.llm_batch_config import LLMBatchConfig
+from amsha.llm_factory.service.llm_micro_batcher import MicroBatcher, reset_micro_batchers
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test cases for batch collection and result fan-out."""
+
+    def setUp(self):
+        self.batcher = MicroBatcher("gemma@default", max_batch_size=4, max_wait_seconds=0.2, max_parallel=4)
+        self.addCleanup(self.batcher.close)
+
+    def _run_concurrently(self, calls):
+        results = [None] * len(calls)
+
+        def worker(index, call):
+            try:
+                results[index] = self.batcher.call(call)
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=worker, args=(i, call)) for i, call in enumerate(calls)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_calls_are_batched_and_fanned_out(self):
+        # The calls only complete once all of them run at the same time, i.e. as one batch
+        barrier = threading.Barrier(4, timeout=5)
+
+        def call(value):
+            def run():
+                barrier.wait()
+                return value * 10
+            return run
+
+        results = self._run_concurrently([call(i) for i in range(4)])
+
+        self.assertEqual(results, [0, 10, 20, 30])
+        metrics = self.batcher.get_metrics()
+        self.assertEqual((metrics["calls"], metrics["batches"], metrics["max_batch_size_seen"]), (4, 1, 4))
+        self.assertEqual(metrics["mean_batch_size"], 4.0)
+
+    def test_batches_are_capped_and_errors_reach_their_caller(self):
+        def fail():
+            raise ValueError("bad prompt")
+
+        results = self._run_concurrently([lambda: "ok"] * 5 + [fail])
+
+        self.assertEqual(results.count("ok"), 5)
+        self.assertIsInstance(results[5], ValueError)
+        metrics = self.batcher.get_metrics()
+        self.assertEqual(metrics["calls"], 6)
+        self.assertGreaterEqual(metrics["batches"], 2)
+        self.assertLessEqual(metrics["max_batch_size_seen"], 4)
+
+    def test_calls_run_in_the_callers_context(self):
+        _request_id.set("req-1")
+
+        self.assertEqual(self.batcher.call(_request_id.get), "req-1")
+
+    def test_shared_batcher_per_deployment_and_closed_batcher_rejects_calls(self):
+        reset_micro_batchers()
+        self.addCleanup(reset_micro_batchers)
+        config = LLMBatchConfig(enabled=True, max_wait_ms=5)
+
+        batcher = MicroBatcher.shared(config, "lm_studio/gemma", "http://localhost:1234/v1")
+
+        self.assertIs(batcher, MicroBatcher.shared(config, "lm_studio/gemma", "http://localhost:1234/v1"))
+        self.assertIsNot(batcher, MicroBatcher.shared(config, "lm_studio/qwen", "http://localhost:1234/v1"))
+        self.assertEqual(batcher.max_wait_seconds, 0.005)
+        reset_micro_batchers()
+        with self.assertRaises(RuntimeError):
+            batcher.submit(lambda: None)
+
+
+if __name__ == '__main__':
+    unittest.main()
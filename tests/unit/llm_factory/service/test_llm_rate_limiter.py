@@ -0,0 +1,139 @@
+"""
+Unit tests for the token-bucket rate limiters.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from amsha.llm_factory.domain.model.llm_rate_limit_config import LLMRateLimitConfig
+from amsha.llm_factory.service.llm_rate_limiter import SQLiteTokenBucketRateLimiter, TokenBucketRateLimiter
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+    """Test cases for the in-process limiter."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _limiter(self, rpm=None, tpm=None):
+        return TokenBucketRateLimiter("model@default", rpm, tpm, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_unlimited_never_waits(self):
+        limiter = self._limiter()
+        self.assertEqual(limiter.acquire(10_000), 0.0)
+
+    def test_request_budget_waits_for_refill(self):
+        limiter = self._limiter(rpm=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        waited = limiter.acquire()
+
+        self.assertAlmostEqual(waited, 30.0)
+        metrics = limiter.get_metrics()
+        self.assertEqual(metrics["acquisitions"], 3)
+        self.assertEqual(metrics["throttled"], 1)
+        self.assertAlmostEqual(metrics["max_wait_seconds"], 30.0)
+
+    def test_token_budget_and_settle(self):
+        limiter = self._limiter(tpm=600)
+
+        limiter.acquire(600)
+        limiter.settle(-300)  # call was smaller than reserved
+        waited = limiter.acquire(300)
+
+        self.assertEqual(waited, 0.0)
+        self.assertAlmostEqual(limiter.acquire(60), 6.0)
+
+    def test_oversized_request_is_clamped(self):
+        limiter = self._limiter(tpm=100)
+        self.assertEqual(limiter.acquire(1_000), 0.0)
+
+    def test_timeout(self):
+        limiter = self._limiter(rpm=1)
+        limiter.acquire()
+
+        with self.assertRaises(TimeoutError):
+            limiter.acquire(timeout=5)
+        self.assertEqual(limiter.get_metrics()["timeouts"], 1)
+
+    def test_callers_served_in_arrival_order(self):
+        limiter = TokenBucketRateLimiter("model@default", requests_per_minute=6000)
+        order = []
+
+        def worker(index):
+            limiter.acquire()
+            order.append(index)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(order), list(range(5)))
+        self.assertEqual(limiter.get_metrics()["waiting"], 0)
+
+    def test_shared_limiter_per_deployment(self):
+        config = LLMRateLimitConfig(enabled=True, requests_per_minute=10)
+
+        first = TokenBucketRateLimiter.shared(config, "gpt-4", "https://a")
+        second = TokenBucketRateLimiter.shared(config, "gpt-4", "https://a")
+        other = TokenBucketRateLimiter.shared(config, "gpt-4", "https://b")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+
+class TestSQLiteTokenBucketRateLimiter(unittest.TestCase):
+    """Test cases for the multi-process limiter."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "limits.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_buckets_shared_between_instances(self):
+        first = SQLiteTokenBucketRateLimiter(self.db_path, "model@default", requests_per_minute=1)
+        second = SQLiteTokenBucketRateLimiter(self.db_path, "model@default", requests_per_minute=1)
+
+        first.acquire()
+        with self.assertRaises(TimeoutError):
+            second.acquire(timeout=1)
+
+        first.close()
+        second.close()
+
+    def test_settle_refunds_tokens(self):
+        limiter = SQLiteTokenBucketRateLimiter(self.db_path, "model@default", tokens_per_minute=100)
+
+        limiter.acquire(100)
+        limiter.settle(-50)
+
+        # Without the refund the bucket would be empty and the call would time out
+        limiter.acquire(40, timeout=0.1)
+        self.assertEqual(limiter.get_metrics()["acquisitions"], 2)
+        limiter.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
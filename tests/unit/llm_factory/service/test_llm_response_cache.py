@@ -0,0 +1,79 @@
+"""
+Unit tests for LLMResponseCache.
+"""
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from amsha.llm_factory.service.llm_response_cache import LLMResponseCache
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test cases for the on-disk LLM response cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = LLMResponseCache(self.temp_dir, max_size_mb=1, max_age_hours=1)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_build_key_normalizes_messages(self):
+        """String prompts and equivalent message lists share a key."""
+        params = {"temperature": 0.0}
+        key_from_string = LLMResponseCache.build_key("gpt-4", params, "Score this  \r\n")
+        key_from_list = LLMResponseCache.build_key(
+            "gpt-4", params, [{"role": "user", "content": "Score this"}]
+        )
+        self.assertEqual(key_from_string, key_from_list)
+
+    def test_build_key_depends_on_model_and_params(self):
+        messages = [{"role": "user", "content": "hi"}]
+        base = LLMResponseCache.build_key("gpt-4", {"temperature": 0.0}, messages)
+        self.assertNotEqual(base, LLMResponseCache.build_key("gpt-3.5", {"temperature": 0.0}, messages))
+        self.assertNotEqual(base, LLMResponseCache.build_key("gpt-4", {"temperature": 0.5}, messages))
+
+    def test_get_put_and_metrics(self):
+        self.assertIsNone(self.cache.get("k1"))
+        self.cache.put("k1", "response")
+        self.assertEqual(self.cache.get("k1"), "response")
+
+        metrics = self.cache.get_metrics()
+        self.assertEqual(metrics["hits"], 1)
+        self.assertEqual(metrics["misses"], 1)
+        self.assertEqual(metrics["stores"], 1)
+        self.assertEqual(metrics["entries"], 1)
+        self.assertEqual(metrics["hit_ratio"], 0.5)
+
+    def test_expired_entries_are_misses(self):
+        self.cache.put("k1", "response")
+        with patch("amsha.llm_factory.service.llm_response_cache.time.time", return_value=time.time() + 7200):
+            self.assertIsNone(self.cache.get("k1"))
+            self.assertEqual(self.cache.evict(), 1)
+        self.assertEqual(self.cache.get_metrics()["entries"], 0)
+
+    def test_size_eviction_drops_least_recently_used(self):
+        cache = LLMResponseCache(self.temp_dir + "/small", max_size_mb=0.001, max_age_hours=1)
+        try:
+            cache.put("old", "a" * 600)
+            cache.put("new", "b" * 600)
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(cache.get("new"), "b" * 600)
+            self.assertEqual(cache.get_metrics()["evictions"], 1)
+        finally:
+            cache.close()
+
+    def test_persists_across_instances(self):
+        self.cache.put("k1", "response")
+        reopened = LLMResponseCache(self.temp_dir)
+        try:
+            self.assertEqual(reopened.get("k1"), "response")
+        finally:
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
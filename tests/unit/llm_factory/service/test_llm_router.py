@@ -0,0 +1,95 @@
+"""
+Unit tests for LLMRouter.
+"""
+import unittest
+
+from amsha.llm_factory.domain.model.llm_routing_config import LLMRoutingConfig
+from amsha.llm_factory.service.llm_router import LLMRouter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLLMRouter(unittest.TestCase):
+    """Test cases for the routing policies."""
+
+    def setUp(self):
+        self.clock = _Clock()
+
+    def _call(self, router, key, seconds, success=True):
+        started = router.begin(key)
+        self.clock.now += seconds
+        router.end(key, started, success)
+
+    def test_weighted_round_robin_interleaves_by_weight(self):
+        router = LLMRouter(["gemma", "qwen"], weights={"gemma": 2}, clock=self.clock)
+
+        picks = [router.candidates()[0] for _ in range(6)]
+
+        self.assertEqual(picks, ["gemma", "qwen", "gemma", "gemma", "qwen", "gemma"])
+        self.assertEqual(sorted(router.candidates()), ["gemma", "qwen"])
+
+    def test_least_outstanding_avoids_busy_model(self):
+        router = LLMRouter(["gemma", "qwen", "gpt"], policy="least_outstanding", clock=self.clock)
+        router.begin("gemma")
+        router.begin("gemma")
+        router.begin("qwen")
+
+        self.assertEqual(router.candidates(), ["gpt", "qwen", "gemma"])
+
+    def test_ewma_latency_prefers_faster_model_once_measured(self):
+        router = LLMRouter(["slow", "fast"], policy="ewma_latency", ewma_alpha=0.5, clock=self.clock)
+        self._call(router, "slow", 4.0)
+        # The unmeasured model is probed first
+        self.assertEqual(router.candidates()[0], "fast")
+        self._call(router, "fast", 1.0)
+
+        self.assertEqual(router.candidates(), ["fast", "slow"])
+        self._call(router, "slow", 2.0)
+        self.assertEqual(router.get_metrics()["slow"]["ewma_latency_seconds"], 3.0)
+
+        # Calls in flight scale the average, so a busy fast model yields to an idle slower one
+        for _ in range(3):
+            router.begin("fast")
+        self.assertEqual(router.candidates()[0], "slow")
+
+    def test_failed_model_cools_down_and_recovers(self):
+        router = LLMRouter(["gemma", "qwen"], policy="least_outstanding", failure_cooldown_seconds=10.0,
+                           clock=self.clock)
+        self._call(router, "gemma", 0.1, success=False)
+
+        self.assertEqual(router.candidates(), ["qwen", "gemma"])
+        self.assertEqual(router.get_metrics()["gemma"]["failures"], 1)
+
+        self.clock.now += 10.0
+        self.assertEqual(sorted(router.candidates()), ["gemma", "qwen"])
+        self._call(router, "gemma", 0.1)
+        self.assertEqual(router.get_metrics()["gemma"]["calls"], 2)
+
+    def test_all_models_cooling_are_tried_oldest_failure_first(self):
+        router = LLMRouter(["gemma", "qwen"], clock=self.clock)
+        self._call(router, "qwen", 0.1, success=False)
+        self._call(router, "gemma", 0.1, success=False)
+
+        self.assertEqual(router.candidates(), ["qwen", "gemma"])
+
+    def test_from_config_and_validation(self):
+        config = LLMRoutingConfig(enabled=True, policy="ewma_latency", ewma_alpha=0.5,
+                                  failure_cooldown_seconds=5.0)
+        router = LLMRouter.from_config(config, ["gemma"])
+
+        self.assertEqual((router.policy, router.ewma_alpha, router.failure_cooldown_seconds),
+                         ("ewma_latency", 0.5, 5.0))
+        with self.assertRaises(ValueError):
+            LLMRouter([])
+        with self.assertRaises(ValueError):
+            LLMRouter(["gemma"], policy="random")
+
+
+if __name__ == '__main__':
+    unittest.main()
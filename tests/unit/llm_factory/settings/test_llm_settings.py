@@ -6,6 +6,10 @@ from amsha.llm_factory.settings.llm_settings import LLMSettings
 from amsha.llm_factory.domain.model.llm_use_case_config import LLMUseCaseConfig
 from amsha.llm_factory.domain.model.llm_parameters import LLMParameters
 from amsha.llm_factory.domain.model.llm_model_config import LLMModelConfig
+from amsha.llm_factory.domain.model.llm_cache_config import LLMCacheConfig
+from amsha.llm_factory.domain.model.llm_rate_limit_config import LLMRateLimit, LLMRateLimitConfig
+from amsha.llm_factory.domain.model.llm_output_config import LLMOutputConfig
+from amsha.llm_factory.domain.model.llm_routing_config import LLMRoutingConfig
 
 
 class TestLLMSettings(unittest.TestCase):
@@ -142,6 +146,73 @@ class TestLLMSettings(unittest.TestCase):
         self.assertEqual(alt_config.model, "gpt-3.5-turbo")
         self.assertNotEqual(default_config.api_key, alt_config.api_key)
 
+    def test_get_cache_config_disabled_by_default(self):
+        """Test that the response cache is opt-in."""
+        self.assertIsNone(self.settings.llm_cache)
+        self.assertIsNone(self.settings.get_cache_config("evaluation"))
+
+    def test_get_cache_config_for_enabled_use_case(self):
+        """Test cache config is only returned for the configured use cases."""
+        self.settings.llm_cache = LLMCacheConfig(enabled=True, use_cases=["evaluation"])
+
+        self.assertIsNotNone(self.settings.get_cache_config("evaluation"))
+        self.assertIsNone(self.settings.get_cache_config("creative"))
+
+    def test_get_rate_limit_config(self):
+        """Test rate limit config is opt-in and resolves per-model overrides."""
+        self.assertIsNone(self.settings.get_rate_limit_config())
+
+        self.settings.llm_rate_limit = LLMRateLimitConfig(
+            enabled=True,
+            requests_per_minute=60,
+            models={"gpt-4": LLMRateLimit(requests_per_minute=5, tokens_per_minute=1000)}
+        )
+        config = self.settings.get_rate_limit_config()
+
+        self.assertEqual(config.limits_for("gpt-4").requests_per_minute, 5)
+        self.assertEqual(config.limits_for("gpt-3.5-turbo").requests_per_minute, 60)
+        self.assertIsNone(config.limits_for("gpt-3.5-turbo").tokens_per_minute)
+
+
+    def test_get_model_metadata(self):
+        """Test model metadata resolves names and output settings without building an LLM."""
+        self.creative_model.model = "azure/gpt-4"
+        self.creative_model.context_window = 8192
+        self.creative_model.output_config = LLMOutputConfig(alias="azure-key1", folder_name="azure")
+
+        metadata = self.settings.get_model_metadata("creative")
+        alternative = self.settings.get_model_metadata("creative", "alternative")
+
+        self.assertEqual(metadata.model_key, "default")
+        self.assertEqual(metadata.model_name, "gpt-4")
+        self.assertEqual(metadata.output_name, "azure-key1")
+        self.assertEqual(metadata.folder_name, "azure")
+        self.assertEqual(metadata.context_window, 8192)
+        self.assertTrue(metadata.is_default)
+        self.assertFalse(alternative.is_default)
+        self.assertEqual(alternative.output_name, "gpt-3.5-turbo")
+        self.assertEqual(alternative.capabilities.streaming, "supported")
+
+    def test_list_model_metadata(self):
+        """Test listing the metadata of all models or of one use case."""
+        listed = [(m.use_case, m.model_key) for m in self.settings.list_model_metadata()]
+
+        self.assertEqual(listed, [("creative", "default"), ("creative", "alternative"), ("evaluation", "standard")])
+        self.assertEqual(len(self.settings.list_model_metadata("evaluation")), 1)
+        with self.assertRaises(ValueError):
+            self.settings.list_model_metadata("nonexistent")
+
+    def test_get_model_name_of_routed_use_case(self):
+        """Test the model name matches the one a build reports, including routed use cases."""
+        self.creative_model.model = "lm_studio/gemma"
+        self.assertEqual(self.settings.get_model_name("creative"), "gemma")
+        self.assertEqual(self.settings.get_model_name("creative", "alternative"), "gpt-3.5-turbo")
+
+        self.creative_config.routing = LLMRoutingConfig(enabled=True)
+
+        self.assertEqual(self.settings.get_model_name("creative"), "gemma+gpt-3.5-turbo")
+        self.assertEqual(self.settings.get_model_name("creative", "default"), "gemma")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for LLMSettingsSource.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from pydantic import ValidationError
+
+from amsha.llm_factory.settings.llm_settings_source import LLMSettingsSource, reset_llm_settings_sources
+
+CONFIG = """
+llm:
+  creative:
+    default: {model_key}
+    models:
+      {model_key}:
+        model: "lm_studio/{model_key}"
+        base_url: "http://localhost:1234/v1"
+  evaluation:
+    default: {model_key}
+    models:
+      {model_key}:
+        model: "lm_studio/{model_key}"
+llm_parameters:
+  creative:
+    temperature: 0.7
+  evaluation:
+    temperature: 0.0
+"""
+
+
+class TestLLMSettingsSource(unittest.TestCase):
+    """Test cases for validated, versioned reloads of the LLM config."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, True)
+        self.addCleanup(reset_llm_settings_sources)
+        self.path = os.path.join(self.test_dir, "llm_config.yaml")
+        self._write(CONFIG.format(model_key="gemma"))
+
+    def _write(self, content):
+        with open(self.path, "w") as f:
+            f.write(content)
+        # Make every write visible to the mtime/size check, however fast the tests run
+        stat = os.stat(self.path)
+        self._mtime_ns = max(stat.st_mtime_ns, getattr(self, "_mtime_ns", 0) + 1_000_000)
+        os.utime(self.path, ns=(self._mtime_ns, self._mtime_ns))
+
+    def test_valid_change_is_swapped_in_as_a_new_version(self):
+        source = LLMSettingsSource(self.path)
+        first = source.current()
+        notified = []
+        source.subscribe(notified.append)
+
+        self.assertFalse(source.refresh())
+        self._write(CONFIG.format(model_key="qwen"))
+
+        self.assertTrue(source.refresh())
+        self.assertEqual(source.version, 2)
+        self.assertEqual(source.current().settings.llm["creative"].default, "qwen")
+        self.assertEqual([snapshot.version for snapshot in notified], [2])
+        # Holders of the previous snapshot are unaffected
+        self.assertEqual(first.version, 1)
+        self.assertEqual(first.settings.llm["creative"].default, "gemma")
+
+    def test_invalid_change_keeps_the_current_version(self):
+        source = LLMSettingsSource(self.path)
+        notified = []
+        source.subscribe(notified.append)
+
+        self._write("llm: [not, a, mapping")
+        self.assertFalse(source.refresh())
+        self._write("llm:\n  creative: {}\n")
+        self.assertFalse(source.refresh())
+
+        self.assertEqual(source.version, 1)
+        self.assertEqual(source.current().settings.llm["creative"].default, "gemma")
+        self.assertEqual(notified, [])
+        self.assertEqual(source.get_metrics()["failed_reloads"], 2)
+
+        # A fixed file is accepted again
+        self._write(CONFIG.format(model_key="qwen"))
+        self.assertTrue(source.refresh())
+        self.assertEqual(source.version, 2)
+
+    def test_touch_without_content_change_keeps_the_version(self):
+        source = LLMSettingsSource(self.path)
+
+        self._write(CONFIG.format(model_key="gemma"))
+
+        self.assertFalse(source.refresh())
+        self.assertEqual(source.version, 1)
+
+    def test_initial_load_failure_raises(self):
+        self._write("llm:\n  creative: {}\n")
+
+        with self.assertRaises(ValidationError):
+            LLMSettingsSource(self.path)
+
+    def test_bound_method_listeners_are_held_weakly(self):
+        source = LLMSettingsSource(self.path)
+
+        class Listener:
+            calls = []
+
+            def on_reload(self, snapshot):
+                Listener.calls.append(snapshot.version)
+
+        listener = Listener()
+        source.subscribe(listener.on_reload)
+        del listener
+        self._write(CONFIG.format(model_key="qwen"))
+        source.refresh()
+
+        self.assertEqual(Listener.calls, [])
+
+    def test_watch_from_config(self):
+        self.assertIsNone(LLMSettingsSource.watch_from_config(self.path, None))
+        self.assertIsNone(LLMSettingsSource.watch_from_config(self.path, {"enabled": False}))
+
+        source = LLMSettingsSource.watch_from_config(self.path, {"enabled": True, "poll_interval_seconds": 60})
+
+        self.assertIs(source, LLMSettingsSource.shared(self.path))
+        self.assertIsNotNone(source._watcher)
+        source.stop_watching()
+        self.assertIsNone(source._watcher)
+
+
+if __name__ == '__main__':
+    unittest.main()
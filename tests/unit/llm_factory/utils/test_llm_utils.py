@@ -30,7 +30,7 @@ class TestLLMUtils(unittest.TestCase):
         
         self.assertEqual(os.environ.get("OTEL_SDK_DISABLED"), "true")
     
-    @patch('amsha.llm_factory.utils.llm_utils.Telemetry')
+    @patch('crewai.telemetry.Telemetry')
     def test_disable_telemetry_modifies_telemetry_class(self, mock_telemetry):
         """Test that disable_telemetry modifies Telemetry class methods."""
         # Setup mock Telemetry class with callable methods
@@ -44,6 +44,8 @@ class TestLLMUtils(unittest.TestCase):
         
         # Verify env variable is set
         self.assertEqual(os.environ.get("OTEL_SDK_DISABLED"), "true")
+        self.assertIs(mock_telemetry.method1, LLMUtils.noop)
+        self.assertIs(mock_telemetry.method2, LLMUtils.noop)
     
     def test_extract_model_name_with_lm_studio_prefix(self):
         """Test extracting model name with lm_studio/ prefix."""